@@ -0,0 +1,217 @@
+"""
+Lexing and parsing of pathological inputs of growing size: deep nesting, huge literals, long operator chains,
+unterminated comments and strings and very long lines. Every run is made in a separate process,
+so a hang is stopped at the time budget. The harness fails, with exit status 1, when a run takes longer
+than the budget, raises anything else than LexerError or ParserError, or when its time or peak memory
+grows faster than size ** max-exponent. Garbage collection and caches make time of linear inputs grow
+a little faster than size, still well below the default, while quadratic ones measure about 2.
+
+$ python -m benchmarks.bench_adversarial [--size 100000] [--steps 4] [--budget 10] [--repeat 3]
+    [--max-exponent 1.5] [--inputs deep_parentheses ...]
+"""
+import argparse
+import math
+import multiprocessing
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+from benchmarks.programs import generate_program
+from interpreter.lexer.lexer import Lexer, MAX_STRING, MAX_NUMBER_OF_DIGITS
+from interpreter.lexer.lexer_error import LexerError
+from interpreter.parser.parser import Parser
+from interpreter.parser.parser_error import ParserError
+from interpreter.source.text_source import TextSource
+
+MEGABYTE = 1024 * 1024
+# times below this are too short to tell their growth from noise
+MIN_MEASURED_TIME = 0.005
+# how many times slower lexing and parsing are while tracemalloc traces allocations
+TRACING_SLOWDOWN = 20
+EXPECTED_OUTCOMES = ('ok', 'LexerError', 'ParserError')
+
+
+def repeat_to_size(prefix: str, part: str, suffix: str, size: int) -> str:
+    return prefix + part * max(1, (size - len(prefix) - len(suffix)) // len(part)) + suffix
+
+
+def nest(prefix: str, opening: str, middle: str, closing: str, suffix: str, size: int) -> str:
+    depth = max(1, (size - len(prefix) - len(middle) - len(suffix)) // (len(opening) + len(closing)))
+    return prefix + opening * depth + middle + closing * depth + suffix
+
+
+ADVERSARIAL_INPUTS: Dict[str, Callable[[int], str]] = {
+    'deep_parentheses': lambda size: nest('int main(){return ', '(', '1', ')', ';}', size),
+    'deep_function_calls': lambda size: nest('int main(){return ', 'f(', '1', ')', ';}', size),
+    'deep_blocks': lambda size: nest('int main(){', 'if(true){', 'return 1;', '}', 'return 2;}', size),
+    'long_sum': lambda size: repeat_to_size('int main(){return ', '1 + ', '1;}', size),
+    'long_multiplication': lambda size: repeat_to_size('int main(){return ', '2 * 3 % ', '1;}', size),
+    'long_logical_chain': lambda size: repeat_to_size('bool main(){return ', 'true && false || ', 'true;}', size),
+    'long_argument_list': lambda size: repeat_to_size('int main(){return f(', '1, ', '1);}', size),
+    'huge_int_literals': lambda size: repeat_to_size('int main(){return ', '9' * MAX_NUMBER_OF_DIGITS + ' + ', '1;}',
+                                                     size),
+    'huge_float_literals': lambda size: repeat_to_size(
+        'float main(){return ', '9' * MAX_NUMBER_OF_DIGITS + '.' + '9' * MAX_NUMBER_OF_DIGITS + ' + ', '1.0;}', size
+    ),
+    'too_long_int_literal': lambda size: repeat_to_size('int main(){return ', '9', ';}', size),
+    'huge_string_literals': lambda size: repeat_to_size('string main(){return ', '"' + 'x' * MAX_STRING + '" + ',
+                                                        '"";}', size),
+    'long_identifiers': lambda size: repeat_to_size('int main(){', 'int ' + 'a' * MAX_STRING + ' = 1; ', 'return 1;}',
+                                                    size),
+    'too_long_identifier': lambda size: repeat_to_size('int ', 'a', ' = 1;', size),
+    'unterminated_comment': lambda size: repeat_to_size('int main(){return 1;} /*', 'x', '', size),
+    'comment_of_stars': lambda size: repeat_to_size('int main(){return 1;} /*', '*', '', size),
+    'many_comments': lambda size: repeat_to_size('int main(){', '/* */', 'return 1;}', size),
+    'unterminated_string': lambda size: repeat_to_size('string main(){return "', 'x', '', size),
+    'long_line': lambda size: generate_program(size).replace('\n', ' '),
+    'blank_lines': lambda size: repeat_to_size('', '\n', 'int main(){return 1;}', size),
+    'many_semicolons': lambda size: repeat_to_size('int main(){', ';', '}', size),
+}
+
+
+class Measurement(NamedTuple):
+    outcome: str
+    lex_time: float
+    parse_time: float
+    peak_memory: int
+
+
+def lex_and_parse(text: str) -> str:
+    """
+    Name of the error the input ends with, 'ok' when it is a valid program
+    """
+    try:
+        tokens = Lexer(TextSource(text)).tokenize()
+    except LexerError:
+        return 'LexerError'
+    try:
+        Parser(tokens).parse_program()
+    except ParserError:
+        return 'ParserError'
+    return 'ok'
+
+
+def measure_time(name: str, size: int) -> Tuple[str, float, float]:
+    """
+    Outcome and times of lexing and parsing the input
+    """
+    text = ADVERSARIAL_INPUTS[name](size)
+    start = time.perf_counter()
+    try:
+        tokens = Lexer(TextSource(text)).tokenize()
+    except LexerError:
+        return 'LexerError', time.perf_counter() - start, 0.0
+    lex_time = time.perf_counter() - start
+    start = time.perf_counter()
+    try:
+        Parser(tokens).parse_program()
+    except ParserError:
+        return 'ParserError', lex_time, time.perf_counter() - start
+    return 'ok', lex_time, time.perf_counter() - start
+
+
+def measure_peak_memory(name: str, size: int) -> int:
+    """
+    Peak memory of lexing and parsing the input, measured apart from the times,
+    as tracing allocations slows them down several times
+    """
+    text = ADVERSARIAL_INPUTS[name](size)
+    tracemalloc.start()
+    lex_and_parse(text)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak_memory
+
+
+def measure_in_process(name: str, size: int, budget: float, repeat: int = 1) -> Measurement:
+    """
+    Measurement made in a new process, which is killed when lexing and parsing take longer than budget seconds,
+    times are the best of repeat runs, unexpected errors are given as the outcome
+    """
+    pool = multiprocessing.Pool(1)
+    try:
+        outcome, lex_time, parse_time = pool.apply_async(measure_time, (name, size)).get(budget)
+        if outcome not in EXPECTED_OUTCOMES:
+            return Measurement(outcome, lex_time, parse_time, 0)
+        for _ in range(repeat - 1):
+            _, next_lex_time, next_parse_time = pool.apply_async(measure_time, (name, size)).get(budget)
+            if next_lex_time + next_parse_time < lex_time + parse_time:
+                lex_time, parse_time = next_lex_time, next_parse_time
+        peak_memory = pool.apply_async(measure_peak_memory, (name, size)).get(budget * TRACING_SLOWDOWN)
+        return Measurement(outcome, lex_time, parse_time, peak_memory)
+    except multiprocessing.TimeoutError:
+        return Measurement(f"timed out after {budget:g}s", budget, 0.0, 0)
+    except Exception as error:
+        return Measurement(f"{type(error).__name__}: {error}", 0.0, 0.0, 0)
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def get_growth_exponent(sizes: List[int], values: List[float], minimum: float = 0.0) -> float:
+    """
+    Exponent e of the growth values ~ size ** e, the slope of the least squares line through the points
+    in log-log scale, so a single noisy measurement moves it less than the ratio of the last and first.
+    Values below minimum are raised to it, so the growth of unmeasurably small values is 0
+    """
+    values = [max(value, minimum) for value in values]
+    if min(values) <= 0:
+        return 0.0
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(value) for value in values]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sum((x - mean_x) ** 2 for x in xs)
+
+
+def check_input(name: str, sizes: List[int], budget: float, max_exponent: float, repeat: int = 1) -> List[str]:
+    """
+    Prints measurements of the input and returns its failures
+    """
+    measurements = []
+    for size in sizes:
+        measurement = measure_in_process(name, size, budget, repeat)
+        measurements.append(measurement)
+        print(f"{name:>22} {size:>9} {measurement.outcome[:24]:>24} {measurement.lex_time * 1000:>9.1f}ms "
+              f"{measurement.parse_time * 1000:>9.1f}ms {measurement.peak_memory / MEGABYTE:>8.2f}MB")
+        if measurement.outcome not in EXPECTED_OUTCOMES:
+            return [f"{name} of size {size}: {measurement.outcome}"]
+
+    failures = []
+    time_exponent = get_growth_exponent(
+        sizes, [measurement.lex_time + measurement.parse_time for measurement in measurements], MIN_MEASURED_TIME
+    )
+    memory_exponent = get_growth_exponent(sizes, [measurement.peak_memory for measurement in measurements])
+    if time_exponent > max_exponent:
+        failures.append(f"{name}: time grows as size ** {time_exponent:.2f}")
+    if memory_exponent > max_exponent:
+        failures.append(f"{name}: peak memory grows as size ** {memory_exponent:.2f}")
+    return failures
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    argument_parser.add_argument('--size', type=int, default=100000, help='smallest input size in characters')
+    argument_parser.add_argument('--steps', type=int, default=4, help='number of sizes, each twice the previous')
+    argument_parser.add_argument('--budget', type=float, default=10.0, help='time budget of one run in seconds')
+    argument_parser.add_argument('--repeat', type=int, default=3, help='best of this many runs')
+    argument_parser.add_argument('--max-exponent', type=float, default=1.5,
+                                 help='highest allowed exponent of growth of time and memory with size')
+    argument_parser.add_argument('--inputs', nargs='+', choices=ADVERSARIAL_INPUTS, default=list(ADVERSARIAL_INPUTS),
+                                 help='inputs to check (default: all)')
+    arguments = argument_parser.parse_args()
+
+    sizes = [arguments.size * 2 ** step for step in range(arguments.steps)]
+    print(f"{'input':>22} {'size':>9} {'outcome':>24} {'lex':>11} {'parse':>11} {'peak':>10}")
+    failures = []
+    for name in arguments.inputs:
+        failures += check_input(name, sizes, arguments.budget, arguments.max_exponent, arguments.repeat)
+    for failure in failures:
+        print(f"FAILED {failure}")
+    if failures:
+        sys.exit(1)
+    print(f"all {len(arguments.inputs)} inputs passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Parse tree against TreeArena of a generated program in which main calls every function once:
+memory taken, time of parsing from a token table made in advance, time of a full garbage collection
+while the program is kept, and time of running it by Environment and ArenaEnvironment.
+
+$ python -m benchmarks.bench_arena [--functions 10000] [--repeat 3]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks.programs import generate_evaluation_program
+from interpreter.environment.arena_environment import ArenaEnvironment
+from interpreter.environment.environment import Environment
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.tree_arena import ArenaBuilder
+from interpreter.parser.parser import Parser
+from interpreter.source.text_source import TextSource
+from interpreter.token.token_table import TokenTable
+
+MEGABYTE = 1024 * 1024
+
+
+def parse(tokens: TokenTable, arena: bool):
+    if arena:
+        return Parser(tokens, ArenaBuilder(tokens.line_index)).parse_program()
+    return Parser(tokens).parse_program()
+
+
+def measure_memory(tokens: TokenTable, arena: bool) -> int:
+    gc.collect()
+    tracemalloc.start()
+    program = parse(tokens, arena)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del program
+    return size
+
+
+def measure_parse(tokens: TokenTable, arena: bool) -> float:
+    start = time.perf_counter()
+    parse(tokens, arena)
+    return time.perf_counter() - start
+
+
+def measure_collection(tokens: TokenTable, arena: bool) -> float:
+    program = parse(tokens, arena)
+    start = time.perf_counter()
+    gc.collect()
+    collection_time = time.perf_counter() - start
+    del program
+    return collection_time
+
+
+def measure_evaluation(tokens: TokenTable, arena: bool) -> float:
+    program = parse(tokens, arena)
+    start = time.perf_counter()
+    (ArenaEnvironment if arena else Environment)(program).run_main()
+    return time.perf_counter() - start
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--functions', type=int, default=10000, help='number of functions')
+    argument_parser.add_argument('--repeat', type=int, default=3, help='best of this many runs')
+    arguments = argument_parser.parse_args()
+
+    tokens = Lexer(TextSource(generate_evaluation_program(arguments.functions))).tokenize()
+    nodes = len(parse(tokens, True))
+    print(f"{arguments.functions} functions, {nodes} nodes")
+    print(f"{'tree':>6} {'memory':>9} {'B/node':>7} {'parse':>8} {'gc':>8} {'evaluation':>11}")
+    for name, arena in [('nodes', False), ('arena', True)]:
+        memory = measure_memory(tokens, arena)
+        parse_time = min(measure_parse(tokens, arena) for _ in range(arguments.repeat))
+        collection_time = min(measure_collection(tokens, arena) for _ in range(arguments.repeat))
+        evaluation_time = min(measure_evaluation(tokens, arena) for _ in range(arguments.repeat))
+        print(f"{name:>6} {memory / MEGABYTE:>7.2f}MB {memory / nodes:>7.1f} {parse_time * 1000:>6.0f}ms "
+              f"{collection_time * 1000:>6.1f}ms {evaluation_time * 1000:>9.0f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Size, encode and decode time of the binary parse tree compared to pickle, and the time of workers,
+each of which needs its share of declarations: from the memory-mapped binary tree they decode
+only that share, from pickle they load the whole tree. MB/s is megabytes of source decoded per second.
+Decoding is timed without collections of the garbage collector, the way ProgramCache loads programs.
+
+$ python -m benchmarks.bench_binary_tree [--sizes 1 10] [--workers 4] [--repeat 3]
+"""
+import argparse
+import gc
+import multiprocessing
+import os
+import pickle
+import tempfile
+import time
+
+from benchmarks.programs import generate_program
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.binary_tree import BinaryTree, encode_tree
+from interpreter.parser.parser import Parser
+from interpreter.source.text_source import TextSource
+
+MEGABYTE = 1024 * 1024
+
+
+def run(function, *arguments) -> float:
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        function(*arguments)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def decode_share(path: str, worker: int, workers: int) -> int:
+    with BinaryTree.open(path) as binary_tree:
+        return sum(1 for index in range(worker, len(binary_tree), workers) if binary_tree.get_declaration(index))
+
+
+def load_share(path: str, worker: int, workers: int) -> int:
+    with open(path, 'rb') as file:
+        declarations = pickle.load(file).declarations
+    return len(declarations[worker::workers])
+
+
+def run_workers(pool, function, path: str, workers: int) -> float:
+    start = time.perf_counter()
+    pool.starmap(function, [(path, worker, workers) for worker in range(workers)])
+    return time.perf_counter() - start
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--sizes', type=int, nargs='+', default=[1, 10], help='input sizes in MB')
+    argument_parser.add_argument('--workers', type=int, default=4, help='number of worker processes')
+    argument_parser.add_argument('--repeat', type=int, default=3, help='best of this many runs')
+    arguments = argument_parser.parse_args()
+
+    print(f"{'size':>6} {'format':>7} {'bytes':>10} {'encode':>9} {'decode':>9} {'MB/s':>7} {'one':>9} "
+          f"{'workers':>9}")
+    with tempfile.TemporaryDirectory() as directory, multiprocessing.Pool(arguments.workers) as pool:
+        for size in arguments.sizes:
+            parse_tree = Parser(Lexer(TextSource(generate_program(size * MEGABYTE))).tokenize()).parse_program()
+            binary = encode_tree(parse_tree)
+            pickled = pickle.dumps(parse_tree, pickle.HIGHEST_PROTOCOL)
+            binary_path = os.path.join(directory, f"program_{size}.tree")
+            pickle_path = os.path.join(directory, f"program_{size}.pickle")
+            with open(binary_path, 'wb') as file:
+                file.write(binary)
+            with open(pickle_path, 'wb') as file:
+                file.write(pickled)
+            middle = len(parse_tree.declarations) // 2
+
+            results = {
+                'binary': (binary, encode_tree, lambda: BinaryTree(binary).to_parse_tree(),
+                           lambda: BinaryTree(binary).get_declaration(middle), decode_share, binary_path),
+                'pickle': (pickled, lambda tree: pickle.dumps(tree, pickle.HIGHEST_PROTOCOL),
+                           lambda: pickle.loads(pickled), lambda: pickle.loads(pickled).declarations[middle],
+                           load_share, pickle_path),
+            }
+            for name, (data, encode, decode, decode_one, share, path) in results.items():
+                encode_time = min(run(encode, parse_tree) for _ in range(arguments.repeat))
+                decode_time = min(run(decode) for _ in range(arguments.repeat))
+                one_time = min(run(decode_one) for _ in range(arguments.repeat))
+                workers_time = min(run_workers(pool, share, path, arguments.workers) for _ in range(arguments.repeat))
+                print(f"{size:>4}MB {name:>7} {len(data):>10} {encode_time * 1000:>7.1f}ms "
+                      f"{decode_time * 1000:>7.1f}ms {size / decode_time:>7.1f} "
+                      f"{one_time * 1000:>7.2f}ms {workers_time * 1000:>7.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
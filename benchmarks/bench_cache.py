@@ -0,0 +1,60 @@
+"""
+Startup latency with the compiled program loaded from ProgramCache compared to parsing the file.
+Parse and load are timed in the process, startup is the wall time of the whole `python -m interpreter` run.
+
+$ python -m benchmarks.bench_cache [--sizes 10 100 1000] [--repeat 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.programs import generate_program
+from interpreter.__main__ import parse_file, compile_file
+from interpreter.cache.program_cache import ProgramCache
+
+KILOBYTE = 1024
+
+
+def run(function, *arguments) -> float:
+    start = time.perf_counter()
+    function(*arguments)
+    return time.perf_counter() - start
+
+
+def load(path: str):
+    ProgramCache(path).load()
+
+
+def start_interpreter(*arguments: str):
+    subprocess.run([sys.executable, '-m', 'interpreter', *arguments], check=True, stdout=subprocess.DEVNULL)
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000], help='input sizes in KB')
+    argument_parser.add_argument('--repeat', type=int, default=5, help='best of this many runs')
+    arguments = argument_parser.parse_args()
+
+    print(f"{'size':>8} {'parse':>9} {'load':>9} {'speedup':>8} {'startup':>9} {'cached':>9} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in arguments.sizes:
+            path = os.path.join(directory, f"program_{size}.curr")
+            with open(path, 'w') as file:
+                file.write(generate_program(size * KILOBYTE))
+            compile_file(path)
+
+            parse_time = load_time = startup_time = cached_time = float('inf')
+            for _ in range(arguments.repeat):
+                parse_time = min(parse_time, run(parse_file, path))
+                load_time = min(load_time, run(load, path))
+                startup_time = min(startup_time, run(start_interpreter, path, '--no-cache'))
+                cached_time = min(cached_time, run(start_interpreter, path))
+            print(f"{size:>6}KB {parse_time * 1000:>7.1f}ms {load_time * 1000:>7.1f}ms {parse_time / load_time:>7.2f}x "
+                  f"{startup_time * 1000:>7.1f}ms {cached_time * 1000:>7.1f}ms {startup_time / cached_time:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
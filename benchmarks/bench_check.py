@@ -0,0 +1,54 @@
+"""
+Files per second validated by one `python -m interpreter --check` process per file, the sequential loop,
+and by one --check process given the directory of all files, with files checked by 1 and more processes.
+
+$ python -m benchmarks.bench_check [--files 1000] [--size 10] [--jobs 1 2 4] [--loop-files 100]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List
+
+from benchmarks.programs import generate_program
+
+KILOBYTE = 1024
+
+
+def run_check(arguments: List[str]) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-m', 'interpreter', '--check', *arguments], stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--files', type=int, default=1000, help='number of files')
+    argument_parser.add_argument('--size', type=int, default=10, help='size of a file in KB')
+    argument_parser.add_argument('--jobs', type=int, nargs='+', default=[1, 2, 4], help='numbers of processes')
+    argument_parser.add_argument('--loop-files', type=int, default=100,
+                                 help='number of files checked by the sequential loop, which starts a process for each')
+    arguments = argument_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for index in range(arguments.files):
+            path = os.path.join(directory, f"script_{index}.curr")
+            with open(path, 'w') as file:
+                file.write(generate_program(arguments.size * KILOBYTE))
+            paths.append(path)
+
+        print(f"{arguments.files} files of {arguments.size}KB")
+        loop_files = min(arguments.loop_files, arguments.files)
+        loop_time = sum(run_check([path]) for path in paths[:loop_files])
+        loop_rate = loop_files / loop_time
+        print(f"{'sequential loop':>16} {loop_rate:>9.1f} files/s")
+        for jobs in arguments.jobs:
+            rate = arguments.files / run_check([directory, '--jobs', str(jobs)])
+            print(f"{f'--jobs {jobs}':>16} {rate:>9.1f} files/s {rate / loop_rate:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
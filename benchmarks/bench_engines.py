@@ -0,0 +1,73 @@
+"""
+Time of running inputfile.curr and generated loop-heavy programs, in which main calls every function once and
+each function runs a loop 100 times, by the engines of the interpreter: Environment visiting nodes of the tree,
+ClosureEnvironment running closures compiled from them, VirtualMachine running bytecode and PythonEnvironment
+running Python functions generated from them, also with their code objects loaded from CodeCache (cached).
+Compile is the time of making the engine, with Resolver and TypeChecker, and compiling functions.
+
+$ python -m benchmarks.bench_engines [--functions 10 100] [--repeat 5]
+"""
+import argparse
+import tempfile
+import time
+from typing import Callable, Dict, Tuple
+
+from benchmarks.programs import generate_loop_program
+from interpreter.__main__ import ENGINES
+from interpreter.cache.code_cache import CodeCache
+from interpreter.codegen.python_environment import PythonEnvironment
+from interpreter.environment.environment import Environment
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.declarations import ParseTree
+from interpreter.parser.parser import Parser
+from interpreter.source.text_source import TextSource
+
+
+def evaluate(parse_tree: ParseTree, engine: Callable[[ParseTree], Environment]) -> Tuple[float, float]:
+    """
+    Times of making the engine and of running main
+    """
+    start = time.perf_counter()
+    environment = engine(parse_tree)
+    compiled = time.perf_counter()
+    environment.run_main()
+    return compiled - start, time.perf_counter() - compiled
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--functions', type=int, nargs='+', default=[10, 100],
+                                 help='numbers of functions of generated programs')
+    argument_parser.add_argument('--repeat', type=int, default=5, help='best of this many runs')
+    arguments = argument_parser.parse_args()
+
+    with open('inputfile.curr') as file:
+        programs = [('inputfile.curr', file.read())]
+    programs += [(f"{functions} loops", generate_loop_program(functions)) for functions in arguments.functions]
+
+    with tempfile.TemporaryDirectory() as directory:
+        code_cache = CodeCache(directory)
+        # code objects are stored by the first run and loaded by the others
+        engines = {**ENGINES, 'cached': lambda parse_tree: PythonEnvironment(parse_tree, code_cache)}
+        print(f"{'program':>16} {'engine':>8} {'compile':>11} {'run':>11} {'speedup':>8}")
+        for name, text in programs:
+            print_times(name, Parser(Lexer(TextSource(text)).tokenize()).parse_program(), engines, arguments.repeat)
+
+
+def print_times(name: str, parse_tree: ParseTree, engines: Dict[str, Callable[[ParseTree], Environment]],
+                repeat: int):
+    times = {engine: [] for engine in engines}
+    # engines are run in turns, so all of them are measured under the same load
+    for _ in range(repeat):
+        for engine in engines:
+            times[engine].append(evaluate(parse_tree, engines[engine]))
+    tree_run_time = min(run_time for _, run_time in times['tree'])
+    for engine in engines:
+        compile_time = min(compile_time for compile_time, _ in times[engine])
+        run_time = min(run_time for _, run_time in times[engine])
+        print(f"{name:>16} {engine:>8} {compile_time * 1000:>9.2f}ms {run_time * 1000:>9.2f}ms "
+              f"{tree_run_time / run_time:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Number of parse tree nodes and time of evaluating inputfile.curr and generated programs,
+in which main calls every function once, split into compiling by Resolver, which binds names, and TypeChecker,
+and running main.
+
+$ python -m benchmarks.bench_evaluation [--functions 100 1000] [--repeat 5]
+"""
+import argparse
+import dataclasses
+import time
+from typing import Tuple
+
+from benchmarks.programs import generate_evaluation_program
+from interpreter.environment.environment import Environment
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.base import ParseTreeNode
+from interpreter.models.declarations import ParseTree
+from interpreter.models.statements import Statement, Statements
+from interpreter.parser.parser import Parser
+from interpreter.source.text_source import TextSource
+
+TREE_NODES = (ParseTreeNode, Statement, Statements)
+
+
+def count_nodes(parse_tree: ParseTree) -> int:
+    count = 0
+    nodes = list(parse_tree.declarations)
+    while nodes:
+        node = nodes.pop()
+        count += 1
+        for field in dataclasses.fields(node):
+            value = getattr(node, field.name)
+            if isinstance(value, TREE_NODES):
+                nodes.append(value)
+            elif type(value) is list or type(value) is tuple:
+                # operands of sum and multiply expressions are kept with their operators
+                nodes.extend(item[1] if type(item) is tuple else item for item in value)
+    return count
+
+
+def evaluate(parse_tree: ParseTree) -> Tuple[float, float]:
+    """
+    Times of making the Environment, in which Resolver binds names of the program and TypeChecker proves its types,
+    and of running main
+    """
+    start = time.perf_counter()
+    environment = Environment(parse_tree)
+    compiled = time.perf_counter()
+    environment.run_main()
+    return compiled - start, time.perf_counter() - compiled
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--functions', type=int, nargs='+', default=[100, 1000],
+                                 help='numbers of functions of generated programs')
+    argument_parser.add_argument('--repeat', type=int, default=5, help='best of this many runs')
+    arguments = argument_parser.parse_args()
+
+    with open('inputfile.curr') as file:
+        programs = [('inputfile.curr', file.read())]
+    programs += [(f"{functions} functions", generate_evaluation_program(functions))
+                 for functions in arguments.functions]
+
+    print(f"{'program':>16} {'nodes':>9} {'compile':>11} {'run':>11} {'evaluation':>11}")
+    for name, text in programs:
+        parse_tree = Parser(Lexer(TextSource(text)).tokenize()).parse_program()
+        times = [evaluate(parse_tree) for _ in range(arguments.repeat)]
+        compile_time = min(compile_time for compile_time, _ in times)
+        run_time = min(run_time for _, run_time in times)
+        print(f"{name:>16} {count_nodes(parse_tree):>9} {compile_time * 1000:>9.2f}ms {run_time * 1000:>9.2f}ms "
+              f"{(compile_time + run_time) * 1000:>9.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
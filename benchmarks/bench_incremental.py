@@ -0,0 +1,63 @@
+"""
+Latency of single character edits with IncrementalParser compared to lexing and parsing the whole text again.
+
+$ python -m benchmarks.bench_incremental [--lines 10000] [--repeat 20]
+"""
+import argparse
+import io
+import statistics
+import time
+
+from benchmarks.programs import generate_program, FUNCTION_TEMPLATE
+from interpreter.lexer.lexer import Lexer
+from interpreter.parser.incremental_parser import IncrementalParser
+from interpreter.parser.parser import Parser
+from interpreter.source.source import Source
+
+
+def full_parse(text: str) -> float:
+    start = time.perf_counter()
+    Parser(Lexer(Source(io.StringIO(text))).tokenize()).parse_program()
+    return time.perf_counter() - start
+
+
+def edit_latency(parser: IncrementalParser, start: int, end: int, replacement: str) -> float:
+    """
+    Time of the edit, then the text is brought back with the opposite edit
+    """
+    removed = parser.text[start:end]
+    begin = time.perf_counter()
+    parser.apply_edit(start, end, replacement)
+    latency = time.perf_counter() - begin
+    parser.apply_edit(start, start + len(replacement), removed)
+    return latency
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--lines', type=int, default=10000, help='lines of the edited program')
+    argument_parser.add_argument('--repeat', type=int, default=20, help='edits of every kind, median is shown')
+    arguments = argument_parser.parse_args()
+
+    characters_per_line = len(FUNCTION_TEMPLATE) // FUNCTION_TEMPLATE.count('\n')
+    text = generate_program(arguments.lines * characters_per_line)
+    middle = text.index('sum = sum', len(text) // 2)
+    edits = {
+        'change identifier char': (middle + 1, middle + 2, 'x'),
+        'change digit': (text.index('- 1;', middle) + 2, text.index('- 1;', middle) + 3, '2'),
+        'insert space': (middle, middle, ' '),
+        'type in comment': (text.index('once', middle), text.index('once', middle), 'x'),
+        'insert new line': (middle, middle, '\n'),
+    }
+
+    full_time = min(full_parse(text) for _ in range(3))
+    print(f"{text.count(chr(10)):,} lines, full lex and parse: {full_time * 1000:.1f} ms")
+    print(f"{'edit':>24} {'latency':>10} {'speedup':>8}")
+    parser = IncrementalParser(text)
+    for name, (start, end, replacement) in edits.items():
+        latency = statistics.median(edit_latency(parser, start, end, replacement) for _ in range(arguments.repeat))
+        print(f"{name:>24} {latency * 1000:>7.2f} ms {full_time / latency:>7.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Time of running a generated library, whose main calls only one of its functions, with function bodies
+parsed eagerly and lazily. Lexing is the same in both, so parse and run are also shown without it.
+
+$ python -m benchmarks.bench_lazy_parsing [--sizes 1 10] [--repeat 3]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.programs import generate_program
+from interpreter.__main__ import Interpreter
+from interpreter.environment.environment import Environment
+from interpreter.lexer.lexer import Lexer
+from interpreter.parser.parser import Parser
+from interpreter.source.text_source import TextSource
+from interpreter.token.token_table import TokenTable
+
+MEGABYTE = 1024 * 1024
+
+
+def run(function, *arguments) -> float:
+    start = time.perf_counter()
+    function(*arguments)
+    return time.perf_counter() - start
+
+
+def parse_and_run(tokens: TokenTable, lazy: bool):
+    Environment(Parser(tokens, lazy_functions=lazy).parse_program()).run_main()
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--sizes', type=int, nargs='+', default=[1, 10], help='input sizes in MB')
+    argument_parser.add_argument('--repeat', type=int, default=3, help='best of this many runs')
+    arguments = argument_parser.parse_args()
+
+    print(f"{'size':>6} {'eager':>9} {'lazy':>9} {'speedup':>8} {'parse+run':>10} {'lazy':>9} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in arguments.sizes:
+            text = generate_program(size * MEGABYTE)
+            path = os.path.join(directory, f"program_{size}.curr")
+            with open(path, 'w') as file:
+                file.write(text)
+            tokens = Lexer(TextSource(text)).tokenize()
+
+            eager_time = min(run(Interpreter, path) for _ in range(arguments.repeat))
+            lazy_time = min(run(lambda: Interpreter(path, lazy=True)) for _ in range(arguments.repeat))
+            eager_parse_time = min(run(parse_and_run, tokens, False) for _ in range(arguments.repeat))
+            lazy_parse_time = min(run(parse_and_run, tokens, True) for _ in range(arguments.repeat))
+            print(f"{size:>4}MB {eager_time * 1000:>7.0f}ms {lazy_time * 1000:>7.0f}ms {eager_time / lazy_time:>7.2f}x "
+                  f"{eager_parse_time * 1000:>8.0f}ms {lazy_parse_time * 1000:>7.0f}ms "
+                  f"{eager_parse_time / lazy_parse_time:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Tokens per second of Lexer compared to the character-at-a-time CharLexer.
+
+$ python -m benchmarks.bench_lexer [--sizes 1 10] [--repeat 3]
+"""
+import argparse
+import io
+import time
+
+from benchmarks.programs import generate_program
+from interpreter.lexer.char_lexer import CharLexer
+from interpreter.lexer.lexer import Lexer, tokens_generator
+from interpreter.source.source import Source
+
+MEGABYTE = 1024 * 1024
+
+
+def run(lexer_class, text: str) -> float:
+    start = time.perf_counter()
+    count = sum(1 for _ in tokens_generator(lexer_class(Source(io.StringIO(text)))))
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--sizes', type=int, nargs='+', default=[1, 10], help='input sizes in MB')
+    argument_parser.add_argument('--repeat', type=int, default=3, help='best of this many interleaved runs')
+    arguments = argument_parser.parse_args()
+
+    print(f"{'size':>8} {'CharLexer':>16} {'Lexer':>16} {'speedup':>8}")
+    for size in arguments.sizes:
+        text = generate_program(size * MEGABYTE)
+        char_lexer_speed = lexer_speed = 0.0
+        for _ in range(arguments.repeat):
+            char_lexer_speed = max(char_lexer_speed, run(CharLexer, text))
+            lexer_speed = max(lexer_speed, run(Lexer, text))
+        print(f"{size:>6}MB {char_lexer_speed:>12,.0f} t/s {lexer_speed:>12,.0f} t/s "
+              f"{lexer_speed / char_lexer_speed:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+Tokenization time of ParallelLexer with 1 to N processes compared to one Lexer.
+
+$ python -m benchmarks.bench_parallel_lexer [--size 100] [--workers 1 2 4 8] [--repeat 3]
+"""
+import argparse
+import os
+import time
+
+from benchmarks.programs import generate_program
+from interpreter.lexer.lexer import Lexer
+from interpreter.lexer.parallel_lexer import ParallelLexer
+from interpreter.source.text_source import TextSource
+
+MEGABYTE = 1024 * 1024
+
+
+def run(tokenize) -> float:
+    start = time.perf_counter()
+    tokenize()
+    return time.perf_counter() - start
+
+
+def main():
+    cpu_count = os.cpu_count() or 1
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--size', type=int, default=100, help='input size in MB')
+    argument_parser.add_argument('--workers', type=int, nargs='+',
+                                 default=[2 ** power for power in range(cpu_count.bit_length())],
+                                 help='numbers of processes (default: powers of 2 up to the number of CPUs)')
+    argument_parser.add_argument('--repeat', type=int, default=3, help='best of this many runs')
+    arguments = argument_parser.parse_args()
+
+    text = generate_program(arguments.size * MEGABYTE)
+    sequential_time = min(run(Lexer(TextSource(text)).tokenize) for _ in range(arguments.repeat))
+    print(f"{arguments.size}MB on {cpu_count} CPUs, Lexer: {sequential_time:.2f}s")
+    print(f"{'workers':>8} {'time':>8} {'speedup':>8}")
+    for workers in arguments.workers:
+        parallel_time = min(run(ParallelLexer(text, workers).tokenize) for _ in range(arguments.repeat))
+        print(f"{workers:>8} {parallel_time:>7.2f}s {sequential_time / parallel_time:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
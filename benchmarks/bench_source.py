@@ -0,0 +1,64 @@
+"""
+Throughput of Source implementations (characters per second).
+
+$ python -m benchmarks.bench_source [--sizes 1 10 100]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.programs import generate_program
+from interpreter.source.open_source import open_source
+
+MEGABYTE = 1024 * 1024
+SOURCE_KINDS = ['stream', 'buffered', 'mmap']
+
+
+def walk(source) -> int:
+    count = 0
+    while source.get_char() != 'EOF':
+        source.next_char()
+        count += 1
+    return count
+
+
+def walk_with_positions(source) -> int:
+    """
+    Access pattern of the Lexer, which asks for the position of every character it consumes.
+    """
+    count = 0
+    while source.get_char() != 'EOF':
+        source.get_position()
+        source.next_char()
+        count += 1
+    return count
+
+
+def measure(source_kind: str, path: str, walk_function) -> float:
+    with open_source(path, source_kind) as source:
+        start = time.perf_counter()
+        count = walk_function(source)
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--sizes', type=int, nargs='+', default=[1, 10, 100], help='input sizes in MB')
+    arguments = argument_parser.parse_args()
+
+    print(f"{'size':>8} {'access':>16}" + ''.join(f"{kind:>16}" for kind in SOURCE_KINDS))
+    for size in arguments.sizes:
+        with tempfile.NamedTemporaryFile('w', suffix='.curr', delete=False) as file:
+            file.write(generate_program(size * MEGABYTE))
+        try:
+            for name, walk_function in [('chars', walk), ('chars+positions', walk_with_positions)]:
+                speeds = [measure(kind, file.name, walk_function) for kind in SOURCE_KINDS]
+                print(f"{size:>6}MB {name:>16}" + ''.join(f"{speed:>12,.0f} c/s" for speed in speeds))
+        finally:
+            os.remove(file.name)
+
+
+if __name__ == '__main__':
+    main()
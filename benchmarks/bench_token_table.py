@@ -0,0 +1,62 @@
+"""
+Memory per token and parsing time of a TokenTable compared to a list of Token objects.
+
+$ python -m benchmarks.bench_token_table [--sizes 1 10] [--repeat 3]
+"""
+import argparse
+import gc
+import io
+import time
+import tracemalloc
+
+from benchmarks.programs import generate_program
+from interpreter.lexer.lexer import Lexer, tokens_generator
+from interpreter.parser.parser import Parser
+from interpreter.source.source import Source
+
+MEGABYTE = 1024 * 1024
+
+
+def measure_memory(make_tokens, text: str) -> int:
+    """
+    Bytes still allocated by the tokens once they are all made
+    """
+    gc.collect()
+    tracemalloc.start()
+    tokens = make_tokens(Lexer(Source(io.StringIO(text))))
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tokens
+    return size
+
+
+def run(make_parser, text: str) -> float:
+    start = time.perf_counter()
+    make_parser(Lexer(Source(io.StringIO(text)))).parse_program()
+    return time.perf_counter() - start
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--sizes', type=int, nargs='+', default=[1, 10], help='input sizes in MB')
+    argument_parser.add_argument('--repeat', type=int, default=3, help='best of this many interleaved runs')
+    arguments = argument_parser.parse_args()
+
+    print(f"{'size':>8} {'tokens':>10} {'Token B/t':>10} {'table B/t':>10} "
+          f"{'stream parse':>13} {'table parse':>12} {'speedup':>8}")
+    for size in arguments.sizes:
+        text = generate_program(size * MEGABYTE)
+        count = len(Lexer(Source(io.StringIO(text))).tokenize())
+        token_list_size = measure_memory(lambda lexer: list(tokens_generator(lexer)), text)
+        table_size = measure_memory(Lexer.tokenize, text)
+
+        stream_time = table_time = float('inf')
+        for _ in range(arguments.repeat):
+            stream_time = min(stream_time, run(Parser, text))
+            table_time = min(table_time, run(lambda lexer: Parser(lexer.tokenize()), text))
+        print(f"{size:>6}MB {count:>10,} {token_list_size / count:>10.1f} {table_size / count:>10.1f} "
+              f"{stream_time:>12.2f}s {table_time:>11.2f}s {stream_time / table_time:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Memory taken by the parse tree of a generated program with the given number of statements,
+and time of parsing it from a token table made in advance, with nodes made by ParseTreeBuilder
+and by HashConsingBuilder, which finds identical constants, variables and pure expressions
+and keeps values of constants once. The tree is measured alone and with the builder, which keeps the tables
+of the first occurrences.
+
+$ python -m benchmarks.bench_tree_memory [--statements 50000] [--repeat 3]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks.bench_evaluation import count_nodes
+from benchmarks.programs import FUNCTION_TEMPLATE, HEADER, MAIN_TEMPLATE, identifier
+from interpreter.lexer.lexer import Lexer
+from interpreter.parser.hash_consing_builder import HashConsingBuilder
+from interpreter.parser.parser import Parser
+from interpreter.source.text_source import TextSource
+from interpreter.token.token_table import TokenTable
+
+# declarations of i and sum, the loop with its two assignments and return
+STATEMENTS_PER_FUNCTION = 5
+MEGABYTE = 1024 * 1024
+
+
+def measure_memory(tokens: TokenTable, make_builder=None, keep_builder: bool = False) -> int:
+    """
+    Bytes still allocated by the parse tree once it is made, and by its builder when it is kept
+    """
+    gc.collect()
+    tracemalloc.start()
+    builder = None if make_builder is None else make_builder()
+    parse_tree = Parser(tokens, builder).parse_program()
+    if not keep_builder:
+        del builder
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del parse_tree
+    return size
+
+
+def measure_time(tokens: TokenTable, make_builder=None) -> float:
+    start = time.perf_counter()
+    Parser(tokens, None if make_builder is None else make_builder()).parse_program()
+    return time.perf_counter() - start
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--statements', type=int, default=50000, help='number of statements')
+    argument_parser.add_argument('--repeat', type=int, default=3, help='best of this many runs')
+    arguments = argument_parser.parse_args()
+
+    functions = arguments.statements // STATEMENTS_PER_FUNCTION
+    text = HEADER + ''.join(FUNCTION_TEMPLATE.format(name=identifier(number)) for number in range(functions)) \
+        + MAIN_TEMPLATE.format(name=identifier(0))
+    tokens = Lexer(TextSource(text)).tokenize()
+    nodes = count_nodes(Parser(tokens).parse_program())
+    memory = measure_memory(tokens)
+    parse_time = min(measure_time(tokens) for _ in range(arguments.repeat))
+    print(f"{arguments.statements} statements, {nodes} nodes")
+    print(f"memory: {memory / MEGABYTE:.2f}MB, {memory / nodes:.1f}B/node, parse: {parse_time * 1000:.0f}ms")
+
+    builder = HashConsingBuilder()
+    Parser(tokens, builder).parse_program()
+    shared_memory = measure_memory(tokens, HashConsingBuilder)
+    memory_with_builder = measure_memory(tokens, HashConsingBuilder, keep_builder=True)
+    shared_time = min(measure_time(tokens, HashConsingBuilder) for _ in range(arguments.repeat))
+    print(f"shared: {builder.repeated_nodes} nodes repeated, {len(builder.get_shared_nodes())} shared nodes")
+    print(f"memory: {shared_memory / MEGABYTE:.2f}MB ({(memory - shared_memory) / memory:.0%} saved), "
+          f"with the builder: {memory_with_builder / MEGABYTE:.2f}MB, parse: {shared_time * 1000:.0f}ms")
+
+
+if __name__ == '__main__':
+    main()
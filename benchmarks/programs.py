@@ -0,0 +1,100 @@
+import string
+
+HEADER = """USD := 4.0;
+EUR := 4.5;
+"""
+
+FUNCTION_TEMPLATE = """
+USD {name}(USD capital, float interest_rate, int number_of_times) {{
+    int i = number_of_times;
+    USD sum = capital;
+    /* compound the capital once per period */
+    while(i != 0) {{
+        sum = sum * (1 + interest_rate);
+        i = i - 1;
+    }}
+    return sum;
+}}
+"""
+
+MAIN_TEMPLATE = """
+USD main(){{
+    return {name}(10USD, 0.1, 5);
+}}
+"""
+
+
+def identifier(number: int) -> str:
+    """
+    Identifiers in the language are made only of small letters and '_', so numbers are written in base 26.
+    """
+    letters = ''
+    while True:
+        number, rest = divmod(number, 26)
+        letters = string.ascii_lowercase[rest] + letters
+        if number == 0:
+            break
+    return f"fn_{letters}"
+
+
+def generate_program(size: int) -> str:
+    """
+    Valid program of at least `size` characters made of copies of the compound interest function.
+    """
+    parts = [HEADER]
+    length = len(HEADER)
+    number = 0
+    while length < size:
+        function = FUNCTION_TEMPLATE.format(name=identifier(number))
+        parts.append(function)
+        length += len(function)
+        number += 1
+    parts.append(MAIN_TEMPLATE.format(name=identifier(0)))
+    return ''.join(parts)
+
+
+def generate_evaluation_program(functions: int) -> str:
+    """
+    Valid program with `functions` copies of the compound interest function, all of them called by main,
+    so running it evaluates every function once.
+    """
+    parts = [HEADER]
+    calls = []
+    for number in range(functions):
+        name = identifier(number)
+        parts.append(FUNCTION_TEMPLATE.format(name=name))
+        calls.append(f"    total = total + {name}(10USD, 0.1, 5);\n")
+    parts.append("\nUSD main(){\n    USD total = 0.0USD;\n" + ''.join(calls) + "    return total;\n}\n")
+    return ''.join(parts)
+
+
+LOOP_FUNCTION_TEMPLATE = """
+USD {name}(USD capital, float interest_rate, int number_of_times) {{
+    int i = 0;
+    USD sum = capital;
+    float bonus = 0.0;
+    while(i < number_of_times) {{
+        sum = sum * (1 + interest_rate);
+        if(i % 10 == 0 && !(bonus > 1.0)) {{
+            bonus = bonus + interest_rate / 2;
+        }}
+        i = i + 1;
+    }}
+    return sum * (1 + bonus);
+}}
+"""
+
+
+def generate_loop_program(functions: int, iterations: int = 100) -> str:
+    """
+    Valid program with `functions` functions, all of them called by main, whose loops run `iterations` times,
+    at most 100 which a while statement allows, so running it is spent mostly in loops.
+    """
+    parts = [HEADER]
+    calls = []
+    for number in range(functions):
+        name = identifier(number)
+        parts.append(LOOP_FUNCTION_TEMPLATE.format(name=name))
+        calls.append(f"    total = total + {name}(10USD, 0.1, {iterations});\n")
+    parts.append("\nUSD main(){\n    USD total = 0.0USD;\n" + ''.join(calls) + "    return total;\n}\n")
+    return ''.join(parts)
@@ -1,22 +1,238 @@
+import argparse
+import functools
+import json
+import multiprocessing
+import os
 import sys
+from typing import Iterator, List, Optional, Union
 
+from interpreter.bytecode.disassembler import disassemble_codes
+from interpreter.bytecode.virtual_machine import VirtualMachine
+from interpreter.cache.code_cache import CodeCache
+from interpreter.cache.program_cache import ProgramCache
+from interpreter.codegen.python_environment import PythonEnvironment
+from interpreter.environment.closure_environment import ClosureEnvironment
 from interpreter.environment.environment import Environment
+from interpreter.environment.environment_errors import SemanticError, SemanticTypeError
+from interpreter.environment.resolver import Resolver
+from interpreter.environment.semantic_checker import SemanticChecker
+from interpreter.environment.type_checker import TypeChecker
 from interpreter.lexer.lexer import Lexer
+from interpreter.lexer.lexer_error import LexerError
+from interpreter.lexer.parallel_lexer import ParallelLexer
+from interpreter.models.declarations import ParseTree
 from interpreter.parser.parser import Parser
+from interpreter.parser.parser_error import ParserError
+from interpreter.source.open_source import open_source, SOURCE_KINDS
 from interpreter.source.source import Source
 
+SOURCE_FILE_EXTENSION = '.curr'
+# classes running programs by the names of --engine: visiting nodes of the tree, closures compiled from them,
+# bytecode compiled from them run by a virtual machine, or Python functions generated from them
+ENGINES = {'tree': Environment, 'closure': ClosureEnvironment, 'bytecode': VirtualMachine,
+           'python': PythonEnvironment}
+
+
+def parse_file(path: str, source_kind: str = 'mmap', jobs: int = 1, lazy: bool = False) -> ParseTree:
+    """
+    Parses the file opened as source_kind. With more than one job the file is read whole
+    and lexed by that many processes, see ParallelLexer.
+    With lazy bodies of functions are parsed when they are called for the first time.
+    """
+    if jobs > 1:
+        with open(path, 'r') as file:
+            return Parser(ParallelLexer(file.read(), jobs).tokenize(), lazy_functions=lazy).parse_program()
+    with open_source(path, source_kind) as source:
+        return Parser(Lexer(source).tokenize(), lazy_functions=lazy).parse_program()
+
+
+def check_file(path: str, source_kind: str = 'mmap', jobs: int = 1) \
+        -> Optional[Union[LexerError, ParserError, SemanticError, SemanticTypeError]]:
+    """
+    Syntax, semantic or type error of the file, None when the whole file, with all function bodies, is valid.
+    The program is checked by SemanticChecker and TypeChecker, main is not run.
+    """
+    try:
+        parse_tree = parse_file(path, source_kind, jobs)
+        SemanticChecker(parse_tree).check()
+        TypeChecker(Resolver(parse_tree))
+    except (LexerError, ParserError, SemanticError, SemanticTypeError) as error:
+        return error
+    return None
+
+
+def get_check_result(path: str, source_kind: str = 'mmap') -> dict:
+    """
+    Result of checking the file, written by --check as one JSON line: path and ok,
+    and when the file is not valid, name of the error, its line, column and message.
+    Errors of files which can not be read, or have expressions nested too deeply to be checked,
+    have no line and column.
+    """
+    try:
+        error = check_file(path, source_kind)
+    except (OSError, UnicodeDecodeError, RecursionError) as other_error:
+        return {'path': path, 'ok': False, 'error': type(other_error).__name__, 'message': str(other_error)}
+    if error is None:
+        return {'path': path, 'ok': True}
+    return {'path': path, 'ok': False, 'error': type(error).__name__, 'line': error.position.line,
+            'column': error.position.column, 'message': str(error).replace('\n', ' ').rstrip(', ')}
+
+
+def find_source_files(paths: List[str]) -> List[str]:
+    """
+    Given files and the source files found in the given directories and their subdirectories, sorted
+    """
+    files = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+        files.extend(sorted(
+            os.path.join(directory, name)
+            for directory, _, names in os.walk(path) for name in names if name.endswith(SOURCE_FILE_EXTENSION)
+        ))
+    return files
+
+
+def check_files(paths: List[str], source_kind: str = 'mmap', jobs: int = 1) -> Iterator[dict]:
+    """
+    Results of get_check_result of the files in their order, each file is checked whole by one of jobs processes
+    """
+    if jobs <= 1:
+        for path in paths:
+            yield get_check_result(path, source_kind)
+        return
+    # files are sent to the processes in chunks, as small files take less time to check than to send one by one
+    chunk_size = max(1, min(64, len(paths) // (jobs * 4)))
+    with multiprocessing.Pool(jobs) as pool:
+        yield from pool.imap(functools.partial(get_check_result, source_kind=source_kind), paths, chunk_size)
+
+
+def compile_file(path: str, source_kind: str = 'mmap', jobs: int = 1) -> str:
+    """
+    Parses the file and stores the program in the cache, returns the path of the compiled program
+    """
+    program_cache = ProgramCache(path)
+    program_cache.store(parse_file(path, source_kind, jobs))
+    return program_cache.path
+
+
+def disassemble_file(path: str, source_kind: str = 'mmap', jobs: int = 1) -> str:
+    """
+    Listing of the bytecode of the declarations of global variables and of every function of the file,
+    as compiled by VirtualMachine, which runs the declarations to compile global variables into constants
+    """
+    virtual_machine = VirtualMachine(parse_file(path, source_kind, jobs))
+    return disassemble_codes([virtual_machine.global_code] + virtual_machine.codes)
+
 
 class Interpreter:
-    def __init__(self, source: Source):
-        lexer = Lexer(source)
-        parser = Parser(lexer)
-        self.environment = Environment(parser.parse_program())
+    def __init__(self, source: Union[Source, str], source_kind: str = 'mmap', jobs: int = 1,
+                 use_cache: bool = False, lazy: bool = False, engine: str = 'tree'):
+        """
+        source is either already opened Source or path to the file, which is parsed by parse_file.
+        With use_cache the program compiled from the same file before is loaded from ProgramCache instead,
+        or stored there after parsing.
+        With lazy only bodies of called functions are parsed, so syntax errors of the others are not reported.
+        A lazily parsed program is not stored in the cache, as it would have to be parsed whole.
+        engine is one of ENGINES, which runs the program. With use_cache the python engine also keeps
+        the code objects it compiles in CodeCache next to the file.
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine}, expected one of {list(ENGINES)}")
+        if not isinstance(source, str):
+            parse_tree = Parser(Lexer(source).tokenize(), lazy_functions=lazy).parse_program()
+        elif use_cache:
+            parse_tree = self._load_or_parse(source, source_kind, jobs, lazy)
+        else:
+            parse_tree = parse_file(source, source_kind, jobs, lazy)
+        if engine == 'python' and isinstance(source, str) and use_cache:
+            self.environment = PythonEnvironment(parse_tree, CodeCache.next_to(source))
+        else:
+            self.environment = ENGINES[engine](parse_tree)
         self.result = self.environment.run_main()
 
+    @staticmethod
+    def _load_or_parse(path: str, source_kind: str, jobs: int, lazy: bool) -> ParseTree:
+        program_cache = ProgramCache(path)
+        parse_tree = program_cache.load()
+        if parse_tree is None and lazy:
+            return parse_file(path, source_kind, jobs, lazy)
+        if parse_tree is None:
+            parse_tree = parse_file(path, source_kind, jobs)
+            try:
+                program_cache.store(parse_tree)
+            except (OSError, RecursionError):
+                # same as Python without a writable __pycache__, the program runs without being cached
+                pass
+        return parse_tree
+
+
+def add_file_arguments(argument_parser: argparse.ArgumentParser, nargs: Optional[str] = None,
+                       jobs_help: str = 'number of processes lexing the file, --source is not used above 1'):
+    argument_parser.add_argument('file', nargs=nargs)
+    argument_parser.add_argument('--source', choices=SOURCE_KINDS, default='mmap',
+                                 help='how the file is read (default: mmap)')
+    argument_parser.add_argument('--jobs', type=int, default=1, help=f"{jobs_help} (default: 1)")
+
+
+def main(arguments: Optional[List[str]] = None):
+    arguments = sys.argv[1:] if arguments is None else arguments
+    if arguments[:1] == ['compile']:
+        compile_parser = argparse.ArgumentParser(prog='python -m interpreter compile',
+                                                 description='compile the file into the program cache')
+        add_file_arguments(compile_parser)
+        compile_arguments = compile_parser.parse_args(arguments[1:])
+        try:
+            print(compile_file(compile_arguments.file, compile_arguments.source, compile_arguments.jobs))
+        except RecursionError:
+            # pickle stores the tree recursively, a program run from the file is not cached either
+            compile_parser.exit(1, f"{compile_arguments.file}: program nested too deeply to be stored in the cache\n")
+        return
+    if arguments[:1] == ['disassemble']:
+        disassemble_parser = argparse.ArgumentParser(prog='python -m interpreter disassemble',
+                                                     description='print the bytecode of the file run by '
+                                                                 '--engine bytecode')
+        add_file_arguments(disassemble_parser)
+        disassemble_arguments = disassemble_parser.parse_args(arguments[1:])
+        print(disassemble_file(disassemble_arguments.file, disassemble_arguments.source,
+                               disassemble_arguments.jobs))
+        return
+
+    argument_parser = argparse.ArgumentParser(prog='python -m interpreter',
+                                              epilog='python -m interpreter compile file: compile ahead of time, '
+                                                     'python -m interpreter disassemble file: print its bytecode')
+    add_file_arguments(argument_parser, '+', 'number of processes lexing the file, --source is not used above 1, '
+                                             'with --check number of processes checking the files')
+    argument_parser.add_argument('--no-cache', action='store_true',
+                                 help='always parse the file, without loading or storing the compiled program')
+    argument_parser.add_argument('--lazy', action='store_true',
+                                 help='parse bodies of functions when they are called for the first time')
+    argument_parser.add_argument('--engine', choices=ENGINES, default='tree',
+                                 help='run the program by visiting its nodes, by closures compiled from them, '
+                                      'by bytecode compiled from them or by Python functions generated from them '
+                                      '(default: tree)')
+    argument_parser.add_argument('--check', action='store_true',
+                                 help='only parse and check the files and source files of the directories, '
+                                      'without running them, and write the result of each as a JSON line')
+    run_arguments = argument_parser.parse_args(arguments)
+
+    if run_arguments.check:
+        all_ok = True
+        for result in check_files(find_source_files(run_arguments.file), run_arguments.source, run_arguments.jobs):
+            all_ok &= result['ok']
+            print(json.dumps(result), flush=True)
+        if not all_ok:
+            sys.exit(1)
+        return
+
+    if len(run_arguments.file) > 1:
+        argument_parser.error('only one file can be run, more files and directories are accepted by --check')
+    interpreter = Interpreter(run_arguments.file[0], run_arguments.source, run_arguments.jobs,
+                              use_cache=not run_arguments.no_cache, lazy=run_arguments.lazy,
+                              engine=run_arguments.engine)
+    print(str(interpreter.result))
+
 
 if __name__ == "__main__":
-    if len(sys.argv) == 2:
-        with open(sys.argv[1], 'r') as file:
-            source = Source(file)
-            interpreter = Interpreter(source)
-            print(str(interpreter.result))
+    main()
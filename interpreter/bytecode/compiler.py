@@ -0,0 +1,281 @@
+from typing import Dict, Generator, List, Optional, Union
+
+from interpreter.bytecode.opcodes import CodeObject, LOAD_CONST, LOAD_LOCAL, LOAD_GLOBAL, UNDECLARED_CURRENCY, \
+    BINARY_OP, FOLD, COMPARE, CHECK_BOOL, BINARY_OR, BINARY_AND, NOT, CHECKED_NOT, CAST, PREPARE_DECLARATION, \
+    PREPARE_ASSIGNMENT, PREPARE_TYPED_ASSIGNMENT, CHECK_TYPE, STORE, ASSIGN, STORE_GLOBAL, CALL, TYPED_CALL, RETURN, \
+    TYPED_RETURN, POP_JUMP_IF_FALSE, CHECKED_POP_JUMP_IF_FALSE, POP_JUMP_IF_TRUE, \
+    COUNT_LOOP, EXIT_IF_VALUE, LOOP_EXIT_IF_VALUE, POP_TOP, EXIT
+from interpreter.environment.frame import NOT_DECLARED
+from interpreter.environment.resolver import ResolvedFunction
+from interpreter.models.base import Constant
+from interpreter.models.bound import LocalVariable, GlobalVariable, BoundAssignment, BoundVariableDeclaration, \
+    BoundFunctionCall
+from interpreter.models.constants import PossibleTypes, CurrencyValue, OPERATOR_FUNCTIONS, get_constant_key
+from interpreter.models.declarations import CurrencyDeclaration
+from interpreter.models.expressions import Expression, AndExpression, RelationshipExpression, MultiplyExpression, \
+    SumExpression, TypeCastingFactor, NegationFactor
+from interpreter.models.statements import ReturnStatement, IfStatement, Statements, WhileStatement, \
+    BLOCK_STATEMENTS, run_visit
+from interpreter.models.typed import TypedVariableDeclaration, TypedAssignment, TypedIfStatement, \
+    TypedWhileStatement, TypedReturnStatement, TypedFunctionCall, TypedExpression, TypedAndExpression, \
+    TypedRelationshipExpression, TypedNegationFactor, TypedConstant
+from interpreter.source.source_position import SourcePosition
+
+GLOBAL_CODE_NAME = '<global>'
+
+
+class BytecodeCompiler:
+    """
+    Compiles statements bound by Resolver and TypeChecker into CodeObjects run by VirtualMachine, instructions
+    of a node are emitted in the order Environment visits it, so values are computed and errors are raised
+    in the same order. Typed nodes are compiled without checks of types, and global variables read by functions
+    which keep their frame, see TypeChecker, are compiled into constants, as they never change after their
+    declarations ran.
+    Operands of || and && are all evaluated as in Environment, so they are combined without jumps.
+    A value of a statement which is not None, of a return statement or a call, ends the function, except
+    in the body of a while statement, which ends its iteration with a false one, as it does in Environment.
+    """
+
+    def __init__(self, currency_declarations: Dict[str, CurrencyDeclaration],
+                 global_variables: Optional[List[PossibleTypes]] = None):
+        """
+        global_variables are values of global variables compiled into constants, None when they are not declared yet
+        """
+        self.currency_declarations = currency_declarations
+        self.global_variables = global_variables
+        # code being compiled and offsets of LOOP_EXIT_IF_VALUE of each while statement it is in
+        self.code: Optional[CodeObject] = None
+        self.loops: List[List[int]] = []
+        # whether the function being compiled keeps its frame, see TypeChecker
+        self.keeps_frame = True
+        # indexes of constants of the code by their keys
+        self.constant_indexes: Dict[tuple, int] = {}
+
+    def compile_function(self, function: ResolvedFunction, keeps_frame: bool) -> CodeObject:
+        self.code = CodeObject(function.id, function.return_type, function.params, function.number_of_slots,
+                               function.slots)
+        self.keeps_frame = keeps_frame
+        run_visit(function.statements.accept(self))
+        self.emit(LOAD_CONST, self.add_constant(None), function.declaration.source_position)
+        self.emit(EXIT, 0, function.declaration.source_position)
+        self.keeps_frame = True
+        return self.finish()
+
+    def compile_global_declarations(self, declarations: List[BoundVariableDeclaration]) -> CodeObject:
+        self.code = CodeObject(GLOBAL_CODE_NAME, None, (), 0, {})
+        for declaration in declarations:
+            declaration.expression.accept(self)
+            if type(declaration) is not TypedVariableDeclaration:
+                self.emit(CHECK_TYPE, self.add_constant(declaration.type), declaration.source_position)
+            self.code.global_names[declaration.slot] = declaration.id
+            self.emit(STORE_GLOBAL, declaration.slot, declaration.source_position)
+        self.emit(LOAD_CONST, self.add_constant(None), SourcePosition(0, 0))
+        self.emit(EXIT, 0, SourcePosition(0, 0))
+        return self.finish()
+
+    def compile_call(self, name: str, index: int) -> CodeObject:
+        """
+        Code calling the function without args, the same way as a call in the program
+        """
+        self.code = CodeObject(f"<call of {name}>", None, (), 0, {})
+        self.emit(CALL, self.add_constant((index, 0, name)), SourcePosition(0, 0))
+        self.emit(EXIT, 0, SourcePosition(0, 0))
+        return self.finish()
+
+    def finish(self) -> CodeObject:
+        code = self.code
+        self.code = None
+        self.constant_indexes = {}
+        return code
+
+    def emit(self, opcode: int, argument: int, source_position: SourcePosition) -> int:
+        """
+        Adds the instruction to the code, returns its offset
+        """
+        offset = len(self.code.instructions)
+        self.code.instructions += (opcode, argument)
+        self.code.positions.append(source_position)
+        return offset
+
+    def patch(self, offset: int, target: int):
+        """
+        Sets the target of the jump at offset
+        """
+        self.code.instructions[offset + 1] = target
+
+    def add_constant(self, value) -> int:
+        # 1 == True and 1USD == 1.0USD, so constants are the same only with the same types
+        key = get_constant_key(value)
+        index = self.constant_indexes.get(key)
+        if index is None:
+            index = self.constant_indexes[key] = len(self.code.constants)
+            self.code.constants.append(value)
+        return index
+
+    def emit_exit_if_value(self, source_position: SourcePosition):
+        if self.loops:
+            self.loops[-1].append(self.emit(LOOP_EXIT_IF_VALUE, 0, source_position))
+        else:
+            self.emit(EXIT_IF_VALUE, 0, source_position)
+
+    def add_slot(self, name: str, slot: int, global_slot: int):
+        self.code.slot_names[slot] = name
+        self.code.global_slots[slot] = global_slot
+
+    # statements and blocks are visited by generators, see run_visit
+
+    def visit_statements(self, statements: Statements) -> Generator:
+        for statement in statements.list_of_statements:
+            visit = statement.accept(self)
+            if isinstance(statement, BLOCK_STATEMENTS):
+                yield visit
+            elif isinstance(statement, BoundFunctionCall):
+                # the value of a call as a statement is the value of the statement
+                self.emit_exit_if_value(statement.source_position)
+
+    def visit_bound_variable_declaration(self, declaration: BoundVariableDeclaration,
+                                         global_declaration: bool = False):
+        self.add_slot(declaration.id, declaration.slot, self.code.global_slots[declaration.slot])
+        self.emit(PREPARE_DECLARATION, declaration.slot, declaration.source_position)
+        declaration.expression.accept(self)
+        if type(declaration) is not TypedVariableDeclaration:
+            self.emit(CHECK_TYPE, self.add_constant(declaration.type), declaration.source_position)
+        self.emit(STORE, declaration.slot, declaration.source_position)
+
+    visit_typed_variable_declaration = visit_bound_variable_declaration
+
+    def visit_bound_assignment(self, assignment: BoundAssignment):
+        self.add_slot(assignment.id, assignment.slot, assignment.global_slot)
+        # a typed assignment is in a function which keeps its frame, the other one stores the value into the frame
+        # which is current after the expression, whose calls can change it
+        if type(assignment) is TypedAssignment:
+            self.emit(PREPARE_TYPED_ASSIGNMENT, assignment.slot, assignment.source_position)
+            assignment.expression.accept(self)
+            self.emit(STORE, assignment.slot, assignment.source_position)
+        else:
+            self.emit(PREPARE_ASSIGNMENT, assignment.slot, assignment.source_position)
+            assignment.expression.accept(self)
+            self.emit(ASSIGN, assignment.slot, assignment.source_position)
+
+    visit_typed_assignment = visit_bound_assignment
+
+    def visit_if_statement(self, if_statement: IfStatement) -> Generator:
+        if_statement.expression.accept(self)
+        opcode = POP_JUMP_IF_FALSE if type(if_statement) is TypedIfStatement else CHECKED_POP_JUMP_IF_FALSE
+        jump = self.emit(opcode, 0, if_statement.expression.source_position)
+        yield if_statement.statements.accept(self)
+        self.patch(jump, len(self.code.instructions))
+
+    visit_typed_if_statement = visit_if_statement
+
+    def visit_while_statement(self, while_statement: WhileStatement) -> Generator:
+        typed = type(while_statement) is TypedWhileStatement
+        # counter of iterations
+        self.emit(LOAD_CONST, self.add_constant(0), while_statement.source_position)
+        while_statement.expression.accept(self)
+        jump_over = self.emit(POP_JUMP_IF_FALSE if typed else CHECKED_POP_JUMP_IF_FALSE, 0,
+                              while_statement.expression.source_position)
+        body = len(self.code.instructions)
+        self.loops.append([])
+        yield while_statement.statements.accept(self)
+        for exit_if_value in self.loops.pop():
+            self.patch(exit_if_value, len(self.code.instructions))
+        self.emit(COUNT_LOOP, 0, while_statement.source_position)
+        while_statement.expression.accept(self)
+        # only the first value of the condition is checked, as in Environment
+        self.emit(POP_JUMP_IF_TRUE, body, while_statement.expression.source_position)
+        self.patch(jump_over, len(self.code.instructions))
+        self.emit(POP_TOP, 0, while_statement.source_position)
+
+    visit_typed_while_statement = visit_while_statement
+
+    def visit_return_statement(self, return_statement: ReturnStatement):
+        if return_statement.expression is None:
+            # a return without an expression gives None, which is a wrong type of any function
+            self.emit(LOAD_CONST, self.add_constant(None), return_statement.source_position)
+        else:
+            return_statement.expression.accept(self)
+        opcode = TYPED_RETURN if type(return_statement) is TypedReturnStatement else RETURN
+        self.emit(opcode, 0, return_statement.source_position)
+        self.emit_exit_if_value(return_statement.source_position)
+
+    visit_typed_return_statement = visit_return_statement
+
+    def visit_bound_function_call(self, function_call: BoundFunctionCall):
+        for arg in function_call.args:
+            arg.accept(self)
+        opcode = TYPED_CALL if type(function_call) is TypedFunctionCall else CALL
+        call = (function_call.function, len(function_call.args), function_call.id)
+        self.emit(opcode, self.add_constant(call), function_call.source_position)
+
+    visit_typed_function_call = visit_bound_function_call
+
+    def visit_constant(self, constant: Constant):
+        value = constant.value
+        if isinstance(value, CurrencyValue) and value.name not in self.currency_declarations:
+            self.emit(UNDECLARED_CURRENCY, self.add_constant(value.name), constant.source_position)
+        else:
+            self.emit(LOAD_CONST, self.add_constant(value), constant.source_position)
+
+    def visit_typed_constant(self, constant: TypedConstant):
+        self.emit(LOAD_CONST, self.add_constant(constant.value), constant.source_position)
+
+    def visit_local_variable(self, variable: LocalVariable):
+        self.add_slot(variable.id, variable.slot, variable.global_slot)
+        self.emit(LOAD_LOCAL, variable.slot, variable.source_position)
+
+    def visit_global_variable(self, variable: GlobalVariable):
+        value = NOT_DECLARED if self.global_variables is None else self.global_variables[variable.slot]
+        if value is NOT_DECLARED or value is None or not self.keeps_frame:
+            self.code.global_names[variable.slot] = variable.id
+            self.emit(LOAD_GLOBAL, variable.slot, variable.source_position)
+        else:
+            self.emit(LOAD_CONST, self.add_constant(value), variable.source_position)
+
+    def visit_expression(self, expression: Union[Expression, AndExpression]):
+        if isinstance(expression, Expression):
+            operands, opcode = expression.and_expressions, BINARY_OR
+        else:
+            operands, opcode = expression.relationship_expressions, BINARY_AND
+        typed = type(expression) is TypedExpression or type(expression) is TypedAndExpression
+        for index, operand in enumerate(operands):
+            operand.accept(self)
+            if not typed:
+                self.emit(CHECK_BOOL, 0, operand.source_position)
+            if index > 0:
+                self.emit(opcode, 0, expression.source_position)
+
+    visit_and_expression = visit_expression
+    visit_typed_expression = visit_expression
+    visit_typed_and_expression = visit_expression
+
+    def visit_relationship_expression(self, expression: RelationshipExpression):
+        expression.left_side.accept(self)
+        expression.right_side.accept(self)
+        opcode = BINARY_OP if type(expression) is TypedRelationshipExpression else COMPARE
+        self.emit(opcode, self.add_constant(OPERATOR_FUNCTIONS[expression.operator]),
+                  expression.right_side.source_position)
+
+    visit_typed_relationship_expression = visit_relationship_expression
+
+    def visit_arithmetic_expression(self, expression: Union[SumExpression, MultiplyExpression]):
+        expression.left_side.accept(self)
+        # all operands are evaluated before the first operation, as in Environment
+        for _, right_expression in expression.right_side:
+            right_expression.accept(self)
+        functions = tuple([OPERATOR_FUNCTIONS[operator] for operator, _ in expression.right_side])
+        if len(functions) == 1:
+            self.emit(BINARY_OP, self.add_constant(functions[0]), expression.source_position)
+        elif functions:
+            self.emit(FOLD, self.add_constant(functions), expression.source_position)
+
+    def visit_type_casting_factor(self, factor: TypeCastingFactor):
+        factor.negation_factor.accept(self)
+        self.emit(CAST, self.add_constant(factor.cast_type), factor.source_position)
+
+    def visit_negation_factor(self, negation_factor: NegationFactor):
+        negation_factor.factor.accept(self)
+        opcode = NOT if type(negation_factor) is TypedNegationFactor else CHECKED_NOT
+        self.emit(opcode, 0, negation_factor.source_position)
+
+    visit_typed_negation_factor = visit_negation_factor
@@ -0,0 +1,57 @@
+from typing import List
+
+from interpreter.bytecode.opcodes import CodeObject, OPCODE_NAMES, JUMP_OPCODES, SLOT_OPCODES, GLOBAL_SLOT_OPCODES, \
+    CONSTANT_OPCODES, CALL, TYPED_CALL, BINARY_OP, COMPARE, FOLD, CAST, CHECK_TYPE
+from interpreter.models.constants import OPERATOR_FUNCTIONS, CurrencyType
+
+OPERATOR_SYMBOLS = {function: operator.value for operator, function in OPERATOR_FUNCTIONS.items()}
+
+
+def describe_type(value_type) -> str:
+    if isinstance(value_type, CurrencyType):
+        return value_type.name
+    return value_type.__name__
+
+
+def describe_argument(code: CodeObject, opcode: int, argument: int) -> str:
+    """
+    What the argument of the instruction stands for, empty when the opcode has no argument
+    """
+    if opcode in SLOT_OPCODES:
+        return f"({code.slot_names[argument]})"
+    if opcode in GLOBAL_SLOT_OPCODES:
+        return f"({code.global_names[argument]})"
+    if opcode not in CONSTANT_OPCODES:
+        return ''
+    constant = code.constants[argument]
+    if opcode == CALL or opcode == TYPED_CALL:
+        _, number_of_args, name = constant
+        return f"({name}, {number_of_args} args)"
+    if opcode == BINARY_OP or opcode == COMPARE:
+        return f"({OPERATOR_SYMBOLS[constant]})"
+    if opcode == FOLD:
+        return f"({' '.join([OPERATOR_SYMBOLS[function] for function in constant])})"
+    if opcode == CAST or opcode == CHECK_TYPE:
+        return f"({describe_type(constant)})"
+    return f"({constant!r})" if type(constant) is str else f"({constant})"
+
+
+def disassemble(code: CodeObject) -> str:
+    """
+    Listing of the code, an instruction in each line: its position in the source, offset, opcode, argument
+    and what the argument stands for. Targets of jumps are marked with >>.
+    """
+    targets = {code.instructions[offset + 1] for offset in range(0, len(code.instructions), 2)
+               if code.instructions[offset] in JUMP_OPCODES}
+    lines = [f"Disassembly of {code.name}:"]
+    for offset in range(0, len(code.instructions), 2):
+        opcode, argument = code.instructions[offset], code.instructions[offset + 1]
+        position = code.positions[offset // 2]
+        line = f"{position.line:>5}:{position.column:<4}{'>>' if offset in targets else '  '}{offset:>5} " \
+               f"{OPCODE_NAMES[opcode]:<26}{argument:>4} {describe_argument(code, opcode, argument)}"
+        lines.append(line.rstrip())
+    return '\n'.join(lines)
+
+
+def disassemble_codes(codes: List[CodeObject]) -> str:
+    return '\n\n'.join([disassemble(code) for code in codes])
@@ -0,0 +1,80 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from interpreter.models import bound
+from interpreter.models.constants import CustomTypeOfTypes
+from interpreter.source.source_position import SourcePosition
+
+# Every instruction is an opcode followed by its argument, 0 when the opcode has none, in a flat list of ints.
+# Arguments are slots of local or global variables, indexes of constants of the code or offsets of jumps.
+# The stack is the stack of values of the code being run, every code has its own one.
+
+# values
+LOAD_CONST = 0  # constants[argument]
+LOAD_LOCAL = 1  # local variable at slot argument, the global variable of its name until it is declared
+LOAD_GLOBAL = 2  # global variable at slot argument, or the variable of its name in the frame of another function
+UNDECLARED_CURRENCY = 3  # raises SemanticError of the currency of the constant constants[argument]
+# operators
+BINARY_OP = 4  # function constants[argument] of two values taken from the stack
+FOLD = 5  # folds the values of a sum or multiply expression by the functions in the tuple constants[argument]
+COMPARE = 6  # BINARY_OP whose right value has to be of the type of the left one
+CHECK_BOOL = 7  # checks that the value on top of the stack is bool
+BINARY_OR = 8
+BINARY_AND = 9
+NOT = 10
+CHECKED_NOT = 11
+CAST = 12  # casts the value into the type constants[argument], the same way as Environment.cast
+# statements
+PREPARE_DECLARATION = 13  # pushes the local variables, raises SemanticError when the slot argument is declared
+PREPARE_ASSIGNMENT = 14  # pushes the value of the variable at slot argument
+PREPARE_TYPED_ASSIGNMENT = 15  # pushes the local variables, checks that the variable at slot argument exists
+CHECK_TYPE = 16  # checks that the value on top of the stack is of the type constants[argument]
+STORE = 17  # stores the value into slot argument of the local variables below it
+ASSIGN = 18  # stores into slot argument of the current local variables, checked against PREPARE_ASSIGNMENT
+STORE_GLOBAL = 19
+CALL = 20  # calls the function of constants[argument], a tuple of its index, number of args on the stack and name
+TYPED_CALL = 21  # CALL of args whose types are proven
+RETURN = 22  # checks the value against the return type of the current frame and pops the frame
+TYPED_RETURN = 23
+# jumps and exits of codes
+POP_JUMP_IF_FALSE = 24
+CHECKED_POP_JUMP_IF_FALSE = 25
+POP_JUMP_IF_TRUE = 26
+COUNT_LOOP = 27  # counts an iteration of a while statement, whose counter is on top of the stack
+EXIT_IF_VALUE = 28  # returns the value to the caller, unless it is None
+LOOP_EXIT_IF_VALUE = 29  # EXIT_IF_VALUE of a true value, a false one jumps to the end of the body of the loop
+POP_TOP = 30
+EXIT = 31  # returns the value to the caller
+
+OPCODE_NAMES = {value: name for name, value in list(globals().items()) if name.isupper() and type(value) is int}
+JUMP_OPCODES = {POP_JUMP_IF_FALSE, CHECKED_POP_JUMP_IF_FALSE, POP_JUMP_IF_TRUE, LOOP_EXIT_IF_VALUE}
+SLOT_OPCODES = {LOAD_LOCAL, PREPARE_DECLARATION, PREPARE_ASSIGNMENT, PREPARE_TYPED_ASSIGNMENT, STORE, ASSIGN}
+GLOBAL_SLOT_OPCODES = {LOAD_GLOBAL, STORE_GLOBAL}
+CONSTANT_OPCODES = {LOAD_CONST, UNDECLARED_CURRENCY, BINARY_OP, FOLD, COMPARE, CAST, CHECK_TYPE, CALL, TYPED_CALL}
+
+
+class CodeObject:
+    """
+    Bytecode of a function, or of the declarations of global variables, with the pool of its constants
+    and the position of every instruction, which errors raised by it are reported at.
+    Names and global slots of local variables are kept by their slots, and names of global variables
+    by their global slots, for errors and the disassembler. slots are the slots of local variables by their names,
+    by which frames of the code are read when code of another function runs in them.
+    """
+    __slots__ = ('name', 'return_type', 'params', 'number_of_slots', 'slots', 'instructions', 'constants',
+                 'positions', 'slot_names', 'global_slots', 'global_names')
+
+    def __init__(self, name: str, return_type: Optional[CustomTypeOfTypes],
+                 params: Sequence[Tuple[str, CustomTypeOfTypes]], number_of_slots: int, slots: Dict[str, int]):
+        self.name = name
+        self.return_type = return_type
+        self.params = params
+        self.number_of_slots = number_of_slots
+        self.slots = slots
+        self.instructions: List[int] = []
+        self.constants: list = []
+        # position of the instruction at offset i is positions[i // 2]
+        self.positions: List[SourcePosition] = []
+        self.slot_names: List[Optional[str]] = \
+            [param_name for param_name, _ in params] + [None] * (number_of_slots - len(params))
+        self.global_slots: List[int] = [bound.NO_SLOT] * number_of_slots
+        self.global_names: Dict[int, str] = {}
@@ -0,0 +1,280 @@
+from typing import List, Optional, Union
+
+from interpreter.bytecode.compiler import BytecodeCompiler
+from interpreter.bytecode.opcodes import CodeObject, LOAD_CONST, LOAD_LOCAL, LOAD_GLOBAL, UNDECLARED_CURRENCY, \
+    BINARY_OP, FOLD, COMPARE, CHECK_BOOL, BINARY_OR, BINARY_AND, NOT, CHECKED_NOT, CAST, PREPARE_DECLARATION, \
+    PREPARE_ASSIGNMENT, PREPARE_TYPED_ASSIGNMENT, CHECK_TYPE, STORE, ASSIGN, STORE_GLOBAL, CALL, TYPED_CALL, RETURN, \
+    TYPED_RETURN, POP_JUMP_IF_FALSE, CHECKED_POP_JUMP_IF_FALSE, POP_JUMP_IF_TRUE, \
+    COUNT_LOOP, EXIT_IF_VALUE, LOOP_EXIT_IF_VALUE, POP_TOP, EXIT
+from interpreter.environment.environment import Environment
+from interpreter.environment.environment_errors import SemanticError, SemanticErrorCode, RunTimeEnvError, \
+    RuntimeErrorCode
+from interpreter.environment.frame import NOT_DECLARED, ForeignVariables, check_params, check_return_value
+from interpreter.environment.resolver import Resolver
+from interpreter.environment.type_checker import TypeChecker
+from interpreter.models.constants import PossibleTypes, CurrencyType
+from interpreter.models.declarations import ParseTree
+from interpreter.source.source_position import SourcePosition
+
+
+class MachineFrame:
+    """
+    Frame of a function run by VirtualMachine, its code and its local variables at their slots,
+    NOT_DECLARED in slots of variables which are not declared yet, with the slots of the code by their names,
+    see ForeignVariables
+    """
+    __slots__ = ('code', 'local_variables', 'slots')
+
+    def __init__(self, code: CodeObject, local_variables: List[PossibleTypes]):
+        self.code = code
+        self.local_variables = local_variables
+        self.slots = code.slots
+
+
+class VirtualMachine(Environment):
+    """
+    Environment which runs the bytecode BytecodeCompiler compiled from functions, by a loop dispatching
+    one instruction after another instead of visiting nodes, with the stack of its callers instead of Python calls.
+    Frames are kept the same way as by Environment: a call pushes the current frame onto frames_stack and a return
+    statement pops it, also when the function they are in does not return to its caller, and local variables are
+    always those of the current frame, read by their names when it is a frame of another function. Each function is compiled once, a function parsed lazily at its first call.
+    A return without an expression raises SemanticTypeError, as in ArenaEnvironment.
+    """
+
+    def __init__(self, parse_tree: ParseTree):
+        self.resolver = Resolver(parse_tree)
+        self.type_checker = TypeChecker(self.resolver)
+        self.functions = self.resolver.functions
+        self.currency_declarations = self.resolver.currency_declarations
+        self.global_variables: List[PossibleTypes] = [NOT_DECLARED] * len(self.resolver.global_slots)
+        self.frames_stack: List[MachineFrame] = []
+
+        # globals are compiled into constants once their declarations ran, functions called by the declarations
+        # read them from global_variables
+        self.compiler = BytecodeCompiler(self.currency_declarations, self.global_variables)
+        self.codes: List[Optional[CodeObject]] = [None] * len(self.functions)
+        self.global_code = self.compiler.compile_global_declarations(self.type_checker.global_declarations)
+        self.current_frame = MachineFrame(self.global_code, [])
+        self.execute(self.global_code)
+
+        for index, function in enumerate(self.functions):
+            if function.statements is not None and self.codes[index] is None:
+                self.codes[index] = self.compiler.compile_function(function, self.type_checker.keeps_frames[index])
+        main_index = self.resolver.function_indexes['main']
+        main_code = self.get_code(main_index)
+        check_params(main_code.name, main_code.params, SourcePosition(0, 0), [])
+        self.current_frame = MachineFrame(main_code, [NOT_DECLARED] * main_code.number_of_slots)
+        self.main_call_code = self.compiler.compile_call('main', main_index)
+
+    def run_main(self) -> Optional[PossibleTypes]:
+        return self.execute(self.main_call_code)
+
+    def get_code(self, index: int) -> CodeObject:
+        """
+        Code of the function, which is bound, checked and compiled first when it was parsed lazily
+        """
+        code = self.codes[index]
+        if code is None:
+            function = self.functions[index]
+            self.resolver.resolve_function(function)
+            self.type_checker.check_function(function)
+            code = self.codes[index] = self.compiler.compile_function(function,
+                                                                      self.type_checker.keeps_frames[index])
+        return code
+
+    def get_undeclared_or_empty(self, code: CodeObject, slot: int, value, source_position: SourcePosition):
+        """
+        Value of the local variable which is not declared or has no value, the same as Environment reads it
+        """
+        if value is NOT_DECLARED:
+            value = self.get_global_variable(code.slot_names[slot], code.global_slots[slot], source_position)
+        if value is None:
+            raise RunTimeEnvError(source_position, RuntimeErrorCode.VAR_NOT_INITIALIZED_WITH_VALUE,
+                                  code.slot_names[slot])
+        return value
+
+    def get_undeclared_or_empty_global(self, code: CodeObject, slot: int, source_position: SourcePosition,
+                                       local_variables: Union[List[PossibleTypes], ForeignVariables]):
+        name = code.global_names[slot]
+        value = NOT_DECLARED
+        if type(local_variables) is ForeignVariables:
+            # a variable of the frame of another function hides the global variable
+            value = local_variables.get_variable(name)
+        if value is NOT_DECLARED:
+            value = self.get_global_variable(name, slot, source_position)
+        if value is None:
+            raise RunTimeEnvError(source_position, RuntimeErrorCode.VAR_NOT_INITIALIZED_WITH_VALUE, name)
+        return value
+
+    def execute(self, code: CodeObject) -> Optional[PossibleTypes]:
+        """
+        Runs the code with the codes of functions it calls, until it exits, and returns its value
+        """
+        # code, offset of the next instruction and stack of each caller of the code being run
+        callers = []
+        instructions = code.instructions
+        constants = code.constants
+        stack = []
+        pc = 0
+        frames_stack = self.frames_stack
+        frame = self.current_frame
+        local_variables = frame.local_variables
+        global_variables = self.global_variables
+        codes = self.codes
+        check_type = self.check_type
+
+        # opcodes are compared in the order of how often they run in loops
+        while True:
+            opcode = instructions[pc]
+            argument = instructions[pc + 1]
+            pc += 2
+            if opcode == LOAD_LOCAL:
+                value = local_variables[argument]
+                if value is NOT_DECLARED or value is None:
+                    value = self.get_undeclared_or_empty(code, argument, value, code.positions[pc // 2 - 1])
+                stack.append(value)
+            elif opcode == LOAD_CONST:
+                stack.append(constants[argument])
+            elif opcode == BINARY_OP:
+                right_value = stack.pop()
+                stack[-1] = constants[argument](stack[-1], right_value)
+            elif opcode == STORE:
+                value = stack.pop()
+                stack.pop()[argument] = value
+            elif opcode == PREPARE_TYPED_ASSIGNMENT:
+                if local_variables[argument] is NOT_DECLARED:
+                    self.get_global_variable(code.slot_names[argument], code.global_slots[argument],
+                                             code.positions[pc // 2 - 1])
+                stack.append(local_variables)
+            elif opcode == POP_JUMP_IF_TRUE:
+                if stack.pop():
+                    pc = argument
+            elif opcode == POP_JUMP_IF_FALSE:
+                if not stack.pop():
+                    pc = argument
+            elif opcode == COUNT_LOOP:
+                if stack[-1] == 100:
+                    raise RunTimeEnvError(code.positions[pc // 2 - 1], RuntimeErrorCode.INFINITE_LOOP,
+                                          frame.code.name)
+                stack[-1] += 1
+            elif opcode == COMPARE:
+                right_value = stack.pop()
+                left_value = stack[-1]
+                if type(right_value) is not type(left_value):
+                    check_type(type(left_value), right_value, code.positions[pc // 2 - 1])
+                stack[-1] = constants[argument](left_value, right_value)
+            elif opcode == CHECK_BOOL:
+                if type(stack[-1]) is not bool:
+                    check_type(bool, stack[-1], code.positions[pc // 2 - 1])
+            elif opcode == CHECKED_POP_JUMP_IF_FALSE:
+                value = stack.pop()
+                if type(value) is not bool:
+                    check_type(bool, value, code.positions[pc // 2 - 1])
+                if not value:
+                    pc = argument
+            elif opcode == PREPARE_ASSIGNMENT:
+                variable = local_variables[argument]
+                if variable is NOT_DECLARED:
+                    variable = self.get_global_variable(code.slot_names[argument], code.global_slots[argument],
+                                                        code.positions[pc // 2 - 1])
+                stack.append(variable)
+            elif opcode == ASSIGN:
+                value = stack.pop()
+                variable = stack.pop()
+                if type(value) is not type(variable):
+                    check_type(type(variable), value, code.positions[pc // 2 - 1])
+                local_variables[argument] = value
+            elif opcode == PREPARE_DECLARATION:
+                if local_variables[argument] is not NOT_DECLARED:
+                    raise SemanticError(code.positions[pc // 2 - 1], SemanticErrorCode.DUPLICATE_ID,
+                                        code.slot_names[argument])
+                stack.append(local_variables)
+            elif opcode == CHECK_TYPE:
+                value_type = constants[argument]
+                if type(stack[-1]) is not value_type:
+                    check_type(value_type, stack[-1], code.positions[pc // 2 - 1])
+            elif opcode == BINARY_OR:
+                right_value = stack.pop()
+                stack[-1] = stack[-1] or right_value
+            elif opcode == BINARY_AND:
+                right_value = stack.pop()
+                stack[-1] = stack[-1] and right_value
+            elif opcode == NOT:
+                stack[-1] = not stack[-1]
+            elif opcode == CHECKED_NOT:
+                if type(stack[-1]) is not bool:
+                    check_type(bool, stack[-1], code.positions[pc // 2 - 1])
+                stack[-1] = not stack[-1]
+            elif opcode == FOLD:
+                functions = constants[argument]
+                start = len(stack) - len(functions) - 1
+                accumulator = stack[start]
+                for function, value in zip(functions, stack[start + 1:]):
+                    accumulator = function(accumulator, value)
+                del stack[start:]
+                stack.append(accumulator)
+            elif opcode == CAST:
+                cast_type = constants[argument]
+                if isinstance(cast_type, CurrencyType):
+                    stack[-1] = self.cast(cast_type, stack[-1], code.positions[pc // 2 - 1])
+                else:
+                    stack[-1] = cast_type(stack[-1])
+            elif opcode == CALL or opcode == TYPED_CALL:
+                index, number_of_args, name = constants[argument]
+                source_position = code.positions[pc // 2 - 1]
+                args = stack[len(stack) - number_of_args:]
+                del stack[len(stack) - number_of_args:]
+                function_code = codes[index] or self.get_code(index)
+                if opcode == CALL:
+                    check_params(function_code.name, function_code.params, source_position, args)
+                new_frame = MachineFrame(function_code,
+                                         args + [NOT_DECLARED] * (function_code.number_of_slots - number_of_args))
+                frames_stack.append(frame)
+                if len(frames_stack) == 10:
+                    raise RunTimeEnvError(source_position, RuntimeErrorCode.INFINITE_RECURSION, name)
+                frame = self.current_frame = new_frame
+                local_variables = frame.local_variables
+                callers.append((code, pc, stack))
+                code = function_code
+                instructions = code.instructions
+                constants = code.constants
+                stack = []
+                pc = 0
+            elif opcode == RETURN or opcode == TYPED_RETURN:
+                if opcode == RETURN:
+                    check_return_value(frame.code.return_type, stack[-1], code.positions[pc // 2 - 1])
+                frame = self.current_frame = frames_stack.pop()
+                local_variables = frame.local_variables if frame.slots is code.slots else \
+                    ForeignVariables(frame, code.slot_names)
+            elif opcode == EXIT_IF_VALUE or opcode == LOOP_EXIT_IF_VALUE or opcode == EXIT:
+                value = stack.pop()
+                if value is None and opcode != EXIT:
+                    continue
+                if opcode == LOOP_EXIT_IF_VALUE and not value:
+                    # a false value ends the iteration of the loop
+                    pc = argument
+                    continue
+                if not callers:
+                    return value
+                code, pc, stack = callers.pop()
+                instructions = code.instructions
+                constants = code.constants
+                # a function ending without a return statement leaves its frame current
+                local_variables = frame.local_variables if frame.slots is code.slots else \
+                    ForeignVariables(frame, code.slot_names)
+                stack.append(value)
+            elif opcode == POP_TOP:
+                stack.pop()
+            elif opcode == LOAD_GLOBAL:
+                value = global_variables[argument]
+                if value is NOT_DECLARED or value is None or local_variables is not frame.local_variables:
+                    value = self.get_undeclared_or_empty_global(code, argument, code.positions[pc // 2 - 1],
+                                                                local_variables)
+                stack.append(value)
+            elif opcode == STORE_GLOBAL:
+                global_variables[argument] = stack.pop()
+            elif opcode == UNDECLARED_CURRENCY:
+                raise SemanticError(code.positions[pc // 2 - 1], SemanticErrorCode.CURR_ID_NOT_FOUND,
+                                    constants[argument])
+            else:
+                raise ValueError(f"Unknown opcode {opcode} at {pc - 2} of {code.name}")
@@ -0,0 +1,74 @@
+import hashlib
+import marshal
+import os
+import tempfile
+from types import CodeType
+from typing import Optional
+
+from interpreter.cache.program_cache import CACHE_DIRECTORY, KEY_LENGTH, get_interpreter_version
+
+CODE_SUFFIX = '.code'
+
+
+class CodeCache:
+    """
+    Python code objects compiled from generated Python source, kept in a directory by a hash of the source,
+    its file name and the interpreter version, so compile() runs once for every version of the source.
+    The file name is kept by code objects for tracebacks, so it is a part of the key.
+    Code objects are written by marshal, whose format the interpreter version covers with the Python version.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    @classmethod
+    def next_to(cls, source_path: str) -> 'CodeCache':
+        """
+        Cache in __currcache__ next to the source file, the same directory as of ProgramCache
+        """
+        return cls(os.path.join(os.path.dirname(os.path.abspath(source_path)), CACHE_DIRECTORY))
+
+    def get_path(self, source: str, filename: str) -> str:
+        digest = hashlib.sha256(get_interpreter_version().encode())
+        digest.update(filename.encode() + b'\0')
+        digest.update(source.encode())
+        return os.path.join(self.directory, f"{digest.hexdigest()[:KEY_LENGTH]}{CODE_SUFFIX}")
+
+    def load(self, source: str, filename: str) -> Optional[CodeType]:
+        """
+        Code object compiled from the source, None when there is none or it can not be read
+        """
+        try:
+            with open(self.get_path(source, filename), 'rb') as file:
+                code = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return code if isinstance(code, CodeType) else None
+
+    def store(self, source: str, filename: str, code: CodeType):
+        """
+        Writes the code object atomically, so other processes never load a partly written one
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                marshal.dump(code, file)
+            os.replace(temporary_path, self.get_path(source, filename))
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def compile(self, source: str, filename: str) -> CodeType:
+        """
+        Code object of the source, loaded from the cache or compiled and stored there
+        """
+        code = self.load(source, filename)
+        if code is None:
+            code = compile(source, filename, 'exec')
+            try:
+                self.store(source, filename, code)
+            except OSError:
+                # same as Python without a writable __pycache__, the code runs without being cached
+                pass
+        return code
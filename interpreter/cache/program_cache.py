@@ -0,0 +1,111 @@
+import gc
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from functools import lru_cache
+from typing import Optional
+
+import interpreter
+from interpreter.models.declarations import ParseTree
+
+CACHE_DIRECTORY = '__currcache__'
+PROGRAM_SUFFIX = '.program'
+# length of the hex digest kept in the file name
+KEY_LENGTH = 32
+# errors of unpickling a corrupted file, which can name missing classes or hold broken opcodes
+UNPICKLING_ERRORS = (EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError, IndexError, KeyError,
+                     TypeError)
+
+
+@lru_cache(maxsize=None)
+def get_interpreter_version() -> str:
+    """
+    Digest of the interpreter code and the Python implementation. Compiled programs are pickled objects
+    of the interpreter classes, so they can be loaded only by the same code which made them.
+    """
+    digest = hashlib.sha256(sys.implementation.cache_tag.encode())
+    package_directory = os.path.dirname(os.path.abspath(interpreter.__file__))
+    for directory, directories, files in os.walk(package_directory):
+        directories[:] = sorted(name for name in directories if name != '__pycache__')
+        for name in sorted(files):
+            if name.endswith('.py'):
+                path = os.path.join(directory, name)
+                digest.update(os.path.relpath(path, package_directory).encode())
+                with open(path, 'rb') as file:
+                    digest.update(file.read())
+    return digest.hexdigest()
+
+
+class ProgramCache:
+    """
+    Compiled program of a source file kept in __currcache__ next to it, the same way as Python keeps
+    __pycache__. The file name holds a hash of the source and of the interpreter version,
+    so a changed source or interpreter never loads a stale program.
+    """
+
+    def __init__(self, source_path: str):
+        digest = hashlib.sha256(get_interpreter_version().encode())
+        with open(source_path, 'rb') as file:
+            digest.update(file.read())
+        directory, self.source_name = os.path.split(os.path.abspath(source_path))
+        self.directory = os.path.join(directory, CACHE_DIRECTORY)
+        self.path = os.path.join(
+            self.directory, f"{self.source_name}.{digest.hexdigest()[:KEY_LENGTH]}{PROGRAM_SUFFIX}"
+        )
+
+    def load(self) -> Optional[ParseTree]:
+        """
+        Compiled program, None when there is none or it can not be read, a corrupted one is removed
+        """
+        # the tree is made of many small objects only, so collections started while it is unpickled
+        # take most of the load time and never free anything
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(self.path, 'rb') as file:
+                parse_tree = pickle.load(file)
+        except OSError:
+            return None
+        except UNPICKLING_ERRORS:
+            parse_tree = None
+        finally:
+            if gc_enabled:
+                gc.enable()
+        if not isinstance(parse_tree, ParseTree):
+            self._remove(self.path)
+            return None
+        return parse_tree
+
+    def store(self, parse_tree: ParseTree):
+        """
+        Writes the program atomically, so other processes never load a partly written one,
+        and removes programs compiled from earlier versions of the source.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, prefix=self.source_name + '.', suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                pickle.dump(parse_tree, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self.path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+        self._remove_stale()
+
+    def _remove_stale(self):
+        prefix = self.source_name + '.'
+        for name in os.listdir(self.directory):
+            key = name[len(prefix):-len(PROGRAM_SUFFIX)]
+            path = os.path.join(self.directory, name)
+            if name.startswith(prefix) and name.endswith(PROGRAM_SUFFIX) and len(key) == KEY_LENGTH \
+                    and path != self.path:
+                self._remove(path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
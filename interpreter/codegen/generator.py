@@ -0,0 +1,380 @@
+import math
+from typing import Dict, List, Optional, Union
+
+from interpreter.environment.frame import NOT_DECLARED
+from interpreter.environment.resolver import ResolvedFunction
+from interpreter.models.base import Constant
+from interpreter.models.bound import LocalVariable, GlobalVariable, BoundAssignment, BoundVariableDeclaration, \
+    BoundFunctionCall
+from interpreter.models.constants import PossibleTypes, CurrencyType, CurrencyValue, CustomTypeOfTypes, \
+    OPERATOR_FUNCTIONS, SumOperator, MulOperator, RelationshipOperator
+from interpreter.models.declarations import CurrencyDeclaration
+from interpreter.models.expressions import Expression, AndExpression, RelationshipExpression, MultiplyExpression, \
+    SumExpression, TypeCastingFactor, NegationFactor
+from interpreter.models.statements import ReturnStatement, IfStatement, Statements, WhileStatement
+from interpreter.models.typed import TypedVariableDeclaration, TypedAssignment, TypedIfStatement, \
+    TypedWhileStatement, TypedReturnStatement, TypedExpression, TypedAndExpression, TypedRelationshipExpression, \
+    TypedNegationFactor, TypedConstant
+from interpreter.source.source_position import SourcePosition
+
+PYTHON_OPERATORS = {
+    SumOperator.ADD: '+',
+    SumOperator.SUB: '-',
+    MulOperator.MUL: '*',
+    MulOperator.DIV: '/',
+    MulOperator.MODULO: '%',
+    RelationshipOperator.EQUAL_OPERATOR: '==',
+    RelationshipOperator.NOT_EQUAL_OPERATOR: '!=',
+    RelationshipOperator.LESS_THAN_OPERATOR: '<',
+    RelationshipOperator.GREATER_THAN_OPERATOR: '>',
+    RelationshipOperator.LESS_THAN_OR_EQUAL_OPERATOR: '<=',
+    RelationshipOperator.GREATER_THAN_OPERATOR_OR_EQUAL_OPERATOR: '>=',
+}
+INDENT = '    '
+# Python does not compile lines indented deeper or more nested loops, deeper blocks are run by Environment
+MAX_INDENT = 99
+MAX_NESTED_LOOPS = 20
+
+
+class GeneratedFunction:
+    """
+    Python source of a function, with the tables its code reads: P of positions errors are raised at,
+    N of nodes run by Environment, which only raise errors or are blocks nested too deep, and K of constants which
+    are not Python literals.
+    line_positions are the positions in the program of the lines of the source, by their numbers from 1.
+    """
+    __slots__ = ('name', 'filename', 'source', 'positions', 'nodes', 'constants', 'line_positions')
+
+    def __init__(self, name: str, filename: str, source: str, positions: List[SourcePosition], nodes: list,
+                 constants: list, line_positions: List[SourcePosition]):
+        self.name = name
+        self.filename = filename
+        self.source = source
+        self.positions = positions
+        self.nodes = nodes
+        self.constants = constants
+        self.line_positions = line_positions
+
+    def get_source_position(self, line_number: int) -> Optional[SourcePosition]:
+        if 1 <= line_number <= len(self.line_positions):
+            return self.line_positions[line_number - 1]
+        return None
+
+
+class PythonGenerator:
+    """
+    Translates a function bound by Resolver and TypeChecker into the source of a Python function taking
+    the local variables of its frame, which runs its statements the same way Environment visits them,
+    with errors raised in the same order. Typed nodes become Python operators without checks of types, the others
+    call the functions of runtime, and values of global variables, which never change after their declarations ran,
+    become constants. Operands of || and && are all evaluated as in Environment, so they become | and &.
+    A value of a statement which is not None ends the function, except in the body of a while statement,
+    which ends its iteration with a false one: the body is wrapped in a loop running once, which it breaks.
+    Blocks nested deeper than Python compiles are run by Environment, as statements whose value is the value of
+    the block.
+    Functions whose frame TypeChecker did not prove to stay current read local variables from the current frame,
+    and global variables the same way as Environment.
+    """
+
+    def __init__(self, currency_declarations: Dict[str, CurrencyDeclaration],
+                 global_variables: List[PossibleTypes], keeps_frames: List[bool]):
+        self.currency_declarations = currency_declarations
+        self.global_variables = global_variables
+        self.keeps_frames = keeps_frames
+        # state of the function being generated
+        self.lines: List[str] = []
+        self.line_positions: List[SourcePosition] = []
+        self.positions: List[SourcePosition] = []
+        self.position_indexes: Dict[int, int] = {}
+        self.nodes: list = []
+        self.constants: list = []
+        self.indent = 0
+        self.loop_depth = 0
+        self.nested_loops = 0
+        self.keeps_frame = True
+        self.local_variables = 'L'
+
+    def generate_function(self, function: ResolvedFunction, index: int) -> GeneratedFunction:
+        self.lines, self.line_positions = [], []
+        self.positions, self.position_indexes, self.nodes, self.constants = [], {}, [], []
+        self.keeps_frame = self.keeps_frames[index]
+        self.local_variables = 'L' if self.keeps_frame else 'E.get_local_variables()'
+        name = f"curr_{function.id}"
+        position = function.declaration.source_position
+
+        self.emit(f"def {name}(L):", position)
+        self.indent = 1
+        function.statements.accept(self)
+        self.emit('return None', position)
+        self.indent = 0
+        return GeneratedFunction(name, f"<curr {function.id}>", '\n'.join(self.lines) + '\n', self.positions,
+                                 self.nodes, self.constants, self.line_positions)
+
+    def emit(self, line: str, source_position: SourcePosition):
+        self.lines.append(INDENT * self.indent + line)
+        self.line_positions.append(source_position)
+
+    def position(self, source_position: SourcePosition) -> str:
+        index = self.position_indexes.get(id(source_position))
+        if index is None:
+            index = self.position_indexes[id(source_position)] = len(self.positions)
+            self.positions.append(source_position)
+        return f"P[{index}]"
+
+    def node(self, node) -> str:
+        """
+        Node run by Environment, for nodes which only raise errors when they run and blocks nested too deep
+        """
+        self.nodes.append(node)
+        return f"N[{len(self.nodes) - 1}].accept(E)"
+
+    def constant(self, value) -> str:
+        if type(value) in (int, bool, str) or type(value) is float and math.isfinite(value):
+            return repr(value)
+        self.constants.append(value)
+        return f"K[{len(self.constants) - 1}]"
+
+    def type_name(self, value_type: CustomTypeOfTypes) -> str:
+        if isinstance(value_type, CurrencyType):
+            return self.constant(value_type)
+        return value_type.__name__
+
+    def is_constant(self, expression) -> bool:
+        """
+        Whether the expression becomes a constant, which can be evaluated later than in Environment
+        """
+        if type(expression) is Constant:
+            value = expression.value
+            return not isinstance(value, CurrencyValue) or value.name in self.currency_declarations
+        if type(expression) is TypedConstant:
+            return True
+        if type(expression) is GlobalVariable:
+            if not self.keeps_frame:
+                return False
+            value = self.global_variables[expression.slot]
+            return value is not NOT_DECLARED and value is not None
+        return False
+
+    def has_exit(self, statements: Statements) -> bool:
+        """
+        Whether a value of one of the statements, not in a nested while statement, can end an iteration of a loop
+        """
+        blocks = [statements]
+        while blocks:
+            for statement in blocks.pop().list_of_statements:
+                if isinstance(statement, (ReturnStatement, BoundFunctionCall)):
+                    return True
+                if isinstance(statement, IfStatement):
+                    blocks.append(statement.statements)
+        return False
+
+    def emit_exit_if_value(self, source_position: SourcePosition):
+        if self.loop_depth:
+            self.emit('if _v:', source_position)
+            self.emit(INDENT + 'return _v', source_position)
+            self.emit('if _v is not None:', source_position)
+            self.emit(INDENT + 'break', source_position)
+        else:
+            self.emit('if _v is not None:', source_position)
+            self.emit(INDENT + 'return _v', source_position)
+
+    def visit_statements(self, statements: Statements):
+        if not statements.list_of_statements:
+            # an empty block, at the position of the line opening it
+            self.emit('pass', self.line_positions[-1])
+        for statement in statements.list_of_statements:
+            if isinstance(statement, BoundFunctionCall):
+                # the value of a call as a statement is the value of the statement
+                self.emit(f"_v = {statement.accept(self)}", statement.source_position)
+                self.emit_exit_if_value(statement.source_position)
+            else:
+                statement.accept(self)
+
+    def emit_local_variables(self, source_position: SourcePosition):
+        # the local variables are read before the expression, whose calls can change the current frame
+        if self.local_variables != 'L':
+            self.emit(f"L = {self.local_variables}", source_position)
+
+    def visit_bound_variable_declaration(self, declaration: BoundVariableDeclaration,
+                                         global_declaration: bool = False):
+        position = self.position(declaration.source_position)
+        self.emit_local_variables(declaration.source_position)
+        self.emit(f"if L[{declaration.slot}] is not ND:", declaration.source_position)
+        self.emit(f"{INDENT}raise SemanticError({position}, SemanticErrorCode.DUPLICATE_ID, {declaration.id!r})",
+                  declaration.source_position)
+        expression = declaration.expression.accept(self)
+        if type(declaration) is not TypedVariableDeclaration:
+            expression = f"check_type({self.type_name(declaration.type)}, {expression}, {position})"
+        self.emit(f"L[{declaration.slot}] = {expression}", declaration.source_position)
+
+    visit_typed_variable_declaration = visit_bound_variable_declaration
+
+    def visit_bound_assignment(self, assignment: BoundAssignment):
+        position = self.position(assignment.source_position)
+        get_global_variable = f"E.get_global_variable({assignment.id!r}, {assignment.global_slot}, {position})"
+        self.emit_local_variables(assignment.source_position)
+        if type(assignment) is TypedAssignment:
+            self.emit(f"if L[{assignment.slot}] is ND:", assignment.source_position)
+            self.emit(INDENT + get_global_variable, assignment.source_position)
+            self.emit(f"L[{assignment.slot}] = {assignment.expression.accept(self)}", assignment.source_position)
+        else:
+            self.emit(f"_a = L[{assignment.slot}]", assignment.source_position)
+            self.emit('if _a is ND:', assignment.source_position)
+            self.emit(f"{INDENT}_a = {get_global_variable}", assignment.source_position)
+            # the value is stored into the frame which is current after the expression, as the target is evaluated
+            # after the value
+            self.emit(f"{self.local_variables}[{assignment.slot}] = check_type(type(_a), "
+                      f"{assignment.expression.accept(self)}, {position})", assignment.source_position)
+
+    visit_typed_assignment = visit_bound_assignment
+
+    def interpret_block(self, statement: Union[IfStatement, WhileStatement]):
+        self.emit(f"_v = run_visit({self.node(Statements((statement,)))})", statement.source_position)
+        self.emit_exit_if_value(statement.source_position)
+
+    def visit_if_statement(self, if_statement: IfStatement):
+        if self.indent + 2 > MAX_INDENT:
+            self.interpret_block(if_statement)
+            return
+        condition = if_statement.expression.accept(self)
+        if type(if_statement) is not TypedIfStatement:
+            condition = f"check_bool({condition}, {self.position(if_statement.expression.source_position)})"
+        self.emit(f"if {condition}:", if_statement.source_position)
+        self.indent += 1
+        if_statement.statements.accept(self)
+        self.indent -= 1
+
+    visit_typed_if_statement = visit_if_statement
+
+    def visit_while_statement(self, while_statement: WhileStatement):
+        source_position = while_statement.source_position
+        if self.indent + 3 > MAX_INDENT or self.nested_loops + 2 > MAX_NESTED_LOOPS:
+            self.interpret_block(while_statement)
+            return
+        self.loop_depth += 1
+        self.nested_loops += 1
+        counter = f"_i{self.loop_depth}"
+        condition = while_statement.expression.accept(self)
+        self.emit(f"{counter} = 0", source_position)
+        if type(while_statement) is TypedWhileStatement:
+            self.emit(f"while {condition}:", source_position)
+        else:
+            # only the first value of the condition is checked, as in Environment
+            first_condition = f"check_bool({condition}, {self.position(while_statement.expression.source_position)})"
+            self.emit(f"_c{self.loop_depth} = {first_condition}", source_position)
+            self.emit(f"while _c{self.loop_depth}:", source_position)
+        self.indent += 1
+        wrapped = self.has_exit(while_statement.statements)
+        if wrapped:
+            self.emit('for _ in ONCE:', source_position)
+            self.indent += 1
+            self.nested_loops += 1
+        while_statement.statements.accept(self)
+        if wrapped:
+            self.indent -= 1
+            self.nested_loops -= 1
+        self.emit(f"if {counter} == 100:", source_position)
+        self.emit(f"{INDENT}raise RunTimeEnvError({self.position(source_position)}, RuntimeErrorCode.INFINITE_LOOP, "
+                  f"E.current_frame.function_name)", source_position)
+        if type(while_statement) is not TypedWhileStatement:
+            self.emit(f"_c{self.loop_depth} = {while_statement.expression.accept(self)}", source_position)
+        self.emit(f"{counter} += 1", source_position)
+        self.indent -= 1
+        self.loop_depth -= 1
+        self.nested_loops -= 1
+
+    visit_typed_while_statement = visit_while_statement
+
+    def visit_return_statement(self, return_statement: ReturnStatement):
+        source_position = return_statement.source_position
+        if return_statement.expression is None:
+            self.emit(f"_v = {self.node(return_statement)}", source_position)
+        else:
+            self.emit(f"_v = {return_statement.expression.accept(self)}", source_position)
+            if type(return_statement) is not TypedReturnStatement:
+                self.emit(f"E.current_frame.check_return_value(_v, {self.position(source_position)})",
+                          source_position)
+            self.emit('E.current_frame = S.pop()', source_position)
+        self.emit_exit_if_value(source_position)
+
+    visit_typed_return_statement = visit_return_statement
+
+    def visit_bound_function_call(self, function_call: BoundFunctionCall) -> str:
+        index = len(self.nodes)
+        self.nodes.append(function_call)
+        args = ', '.join([arg.accept(self) for arg in function_call.args])
+        return f"E.call(N[{index}], [{args}])"
+
+    visit_typed_function_call = visit_bound_function_call
+
+    def visit_constant(self, constant: Constant) -> str:
+        if not self.is_constant(constant):
+            return self.node(constant)
+        return self.constant(constant.value)
+
+    def visit_typed_constant(self, constant: TypedConstant) -> str:
+        return self.constant(constant.value)
+
+    def visit_local_variable(self, variable: LocalVariable) -> str:
+        return f"(_t if (_t := {self.local_variables}[{variable.slot}]) is not ND and _t is not None " \
+               f"else {self.node(variable)})"
+
+    def visit_global_variable(self, variable: GlobalVariable) -> str:
+        if not self.is_constant(variable):
+            return self.node(variable)
+        return self.constant(self.global_variables[variable.slot])
+
+    def visit_expression(self, expression: Union[Expression, AndExpression]) -> str:
+        if isinstance(expression, Expression):
+            operands, operator = expression.and_expressions, ' | '
+        else:
+            operands, operator = expression.relationship_expressions, ' & '
+        values = [operand.accept(self) for operand in operands]
+        if type(expression) is not TypedExpression and type(expression) is not TypedAndExpression:
+            values = [f"check_bool({value}, {self.position(operand.source_position)})"
+                      for value, operand in zip(values, operands)]
+        return f"({operator.join(values)})"
+
+    visit_and_expression = visit_expression
+    visit_typed_expression = visit_expression
+    visit_typed_and_expression = visit_expression
+
+    def visit_relationship_expression(self, expression: RelationshipExpression) -> str:
+        if expression.right_side is None:
+            return self.node(expression)
+        left_side = expression.left_side.accept(self)
+        right_side = expression.right_side.accept(self)
+        if type(expression) is TypedRelationshipExpression:
+            return f"({left_side} {PYTHON_OPERATORS[expression.operator]} {right_side})"
+        function = self.constant(OPERATOR_FUNCTIONS[expression.operator])
+        return f"compare({function}, {left_side}, {right_side}, {self.position(expression.right_side.source_position)})"
+
+    visit_typed_relationship_expression = visit_relationship_expression
+
+    def visit_arithmetic_expression(self, expression: Union[SumExpression, MultiplyExpression]) -> str:
+        left_side = expression.left_side.accept(self)
+        right_side = [right_expression.accept(self) for _, right_expression in expression.right_side]
+        # Python evaluates an operand after the operations before it, Environment evaluates all operands first,
+        # so only operands which can not raise errors or call functions can follow the first operation
+        if all(self.is_constant(right_expression) for _, right_expression in expression.right_side[1:]):
+            result = left_side
+            for (operator, _), value in zip(expression.right_side, right_side):
+                result = f"({result} {PYTHON_OPERATORS[operator]} {value})"
+            return result
+        functions = self.constant(tuple([OPERATOR_FUNCTIONS[operator] for operator, _ in expression.right_side]))
+        return f"fold(({left_side}, {', '.join(right_side)}), {functions})"
+
+    def visit_type_casting_factor(self, factor: TypeCastingFactor) -> str:
+        value = factor.negation_factor.accept(self)
+        if isinstance(factor.cast_type, CurrencyType):
+            position = self.position(factor.source_position)
+            return f"cast_currency(C, {self.constant(factor.cast_type)}, {value}, {position})"
+        return f"{factor.cast_type.__name__}({value})"
+
+    def visit_negation_factor(self, negation_factor: NegationFactor) -> str:
+        value = negation_factor.factor.accept(self)
+        if type(negation_factor) is TypedNegationFactor:
+            return f"(not {value})"
+        return f"(not check_bool({value}, {self.position(negation_factor.source_position)}))"
+
+    visit_typed_negation_factor = visit_negation_factor
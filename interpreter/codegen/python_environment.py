@@ -0,0 +1,111 @@
+from types import TracebackType
+from typing import Callable, Dict, List, Optional
+
+from interpreter.cache.code_cache import CodeCache
+from interpreter.codegen import runtime
+from interpreter.codegen.generator import PythonGenerator, GeneratedFunction
+from interpreter.environment.environment import Environment
+from interpreter.environment.environment_errors import SemanticError, SemanticErrorCode, RunTimeEnvError, \
+    RuntimeErrorCode
+from interpreter.environment.frame import NOT_DECLARED, SlotFrame
+from interpreter.environment.resolver import ResolvedFunction
+from interpreter.models.bound import BoundFunctionCall
+from interpreter.models.constants import PossibleTypes
+from interpreter.models.declarations import ParseTree
+from interpreter.models.statements import run_visit
+from interpreter.models.typed import TypedFunctionCall
+from interpreter.source.source_position import SourcePosition
+
+# compiled function, called with the local variables of its frame
+Body = Callable[[List[PossibleTypes]], Optional[PossibleTypes]]
+
+
+class PythonEnvironment(Environment):
+    """
+    Environment which runs Python functions generated by PythonGenerator from functions instead of visiting
+    their nodes, so loops run as Python bytecode. Each function is generated and compiled once, a function parsed
+    lazily at its first call. With a CodeCache compiled code objects are loaded from it by the hash of the generated
+    source, or stored there. Declarations of global variables run once, before functions are generated,
+    so they are visited as in Environment.
+    Errors of Python operations, which have no position in the program, get a note with it on Python 3.11 and later,
+    see get_source_position.
+    """
+
+    def __init__(self, parse_tree: ParseTree, code_cache: Optional[CodeCache] = None):
+        super().__init__(parse_tree)
+        self.code_cache = code_cache
+        self.generator = PythonGenerator(self.currency_declarations, self.global_variables,
+                                         self.type_checker.keeps_frames)
+        self.bodies: List[Optional[Body]] = [None] * len(self.functions)
+        # generated functions by the file names of their code, for mapping lines back to the program
+        self.generated_functions: Dict[str, GeneratedFunction] = {}
+        for index, function in enumerate(self.functions):
+            if function.statements is not None:
+                self.compile_function(index)
+
+    def compile_function(self, index: int) -> Body:
+        generated_function = self.generator.generate_function(self.functions[index], index)
+        if self.code_cache is None:
+            code = compile(generated_function.source, generated_function.filename, 'exec')
+        else:
+            code = self.code_cache.compile(generated_function.source, generated_function.filename)
+        namespace = {
+            'E': self, 'S': self.frames_stack, 'C': self.currency_declarations, 'ND': NOT_DECLARED, 'ONCE': (None,),
+            'P': generated_function.positions, 'N': generated_function.nodes, 'K': generated_function.constants,
+            'SemanticError': SemanticError, 'SemanticErrorCode': SemanticErrorCode,
+            'RunTimeEnvError': RunTimeEnvError, 'RuntimeErrorCode': RuntimeErrorCode,
+            'check_type': runtime.check_type, 'check_bool': runtime.check_bool, 'compare': runtime.compare,
+            'fold': runtime.fold, 'cast_currency': runtime.cast_currency, 'run_visit': run_visit,
+        }
+        exec(code, namespace)
+        self.generated_functions[generated_function.filename] = generated_function
+        self.bodies[index] = namespace[generated_function.name]
+        return self.bodies[index]
+
+    def run_main(self) -> Optional[PossibleTypes]:
+        main_function_call = BoundFunctionCall(SourcePosition(0, 0), 'main', self.resolver.function_indexes['main'],
+                                               ())
+        try:
+            return self.call(main_function_call, [])
+        except Exception as error:
+            source_position = self.get_source_position(error.__traceback__)
+            # notes of exceptions are added by Python 3.11, before it the position is left to get_source_position
+            if source_position is not None and not hasattr(error, 'position') and hasattr(error, 'add_note'):
+                error.add_note(f"at line {source_position.line}, column {source_position.column} of the program")
+            raise
+
+    def call(self, function_call: BoundFunctionCall, args: List[PossibleTypes]) -> Optional[PossibleTypes]:
+        """
+        Value of the call, made the same way as by Environment
+        """
+        function = self.functions[function_call.function]
+        new_frame = self.make_frame(function, function_call.source_position, args,
+                                    type(function_call) is TypedFunctionCall)
+        return self.call_function(function, function_call, new_frame)
+
+    def call_function(self, function: ResolvedFunction, function_call: BoundFunctionCall, new_frame: SlotFrame):
+        self.frames_stack.append(self.current_frame)
+        if len(self.frames_stack) == 10:
+            raise RunTimeEnvError(function_call.source_position, RuntimeErrorCode.INFINITE_RECURSION, function_call.id)
+        self.current_frame = new_frame
+        body = self.bodies[function_call.function]
+        if body is None:
+            # a function parsed lazily was bound by make_frame
+            body = self.compile_function(function_call.function)
+        caller = self.function
+        self.function = function
+        return_value = body(new_frame.local_variables)
+        self.function = caller
+        return return_value
+
+    def get_source_position(self, traceback: Optional[TracebackType]) -> Optional[SourcePosition]:
+        """
+        Position in the program of the line of the innermost generated function in the traceback
+        """
+        source_position = None
+        while traceback is not None:
+            generated_function = self.generated_functions.get(traceback.tb_frame.f_code.co_filename)
+            if generated_function is not None:
+                source_position = generated_function.get_source_position(traceback.tb_lineno)
+            traceback = traceback.tb_next
+        return source_position
@@ -0,0 +1,68 @@
+from typing import Callable, Dict, Optional, Sequence
+
+from interpreter.environment.environment import Environment
+from interpreter.environment.environment_errors import SemanticError, SemanticErrorCode
+from interpreter.models.constants import PossibleTypes, CurrencyType, CurrencyValue, CustomTypeOfTypes
+from interpreter.models.declarations import CurrencyDeclaration
+from interpreter.source.source_position import SourcePosition
+
+# Functions called by the Python code PythonGenerator generates for checks and operations which are not single
+# Python operators. Each of them does what Environment does for the same node, with the same errors.
+
+
+def check_type(value_type: CustomTypeOfTypes, value: PossibleTypes, source_position: SourcePosition) \
+        -> PossibleTypes:
+    """
+    The value, after Environment.check_type checked it, so checks can be a part of expressions
+    """
+    if type(value) is not value_type:
+        Environment.check_type(value_type, value, source_position)
+    return value
+
+
+def check_bool(value: PossibleTypes, source_position: SourcePosition) -> bool:
+    if type(value) is not bool:
+        Environment.check_type(bool, value, source_position)
+    return value
+
+
+def compare(function: Callable, left_value: PossibleTypes, right_value: PossibleTypes,
+            source_position: SourcePosition) -> bool:
+    """
+    Relationship of the values, the right one has to be of the type of the left one
+    """
+    if type(right_value) is not type(left_value):
+        Environment.check_type(type(left_value), right_value, source_position)
+    return function(left_value, right_value)
+
+
+def fold(values: Sequence[PossibleTypes], functions: Sequence[Callable]) -> PossibleTypes:
+    """
+    Result of a sum or multiply expression whose operands were all evaluated first, as in Environment
+    """
+    accumulator = values[0]
+    for function, value in zip(functions, values[1:]):
+        accumulator = function(accumulator, value)
+    return accumulator
+
+
+def get_currency_declaration(currency_declarations: Dict[str, CurrencyDeclaration], name: str,
+                             source_position: SourcePosition) -> CurrencyDeclaration:
+    if name in currency_declarations:
+        return currency_declarations[name]
+    raise SemanticError(source_position, SemanticErrorCode.CURR_ID_NOT_FOUND, name)
+
+
+def cast_currency(currency_declarations: Dict[str, CurrencyDeclaration], currency_type: CurrencyType,
+                  value: PossibleTypes, source_position: SourcePosition) -> Optional[CurrencyValue]:
+    """
+    Value cast into the currency the same way as by Environment.cast: a float becomes a value of the currency,
+    a value of a currency becomes the rate of its currency to the other one, any other value None
+    """
+    if type(value) is float:
+        return CurrencyValue(currency_type.name, value)
+    if isinstance(value, CurrencyType):
+        to_cast_currency = get_currency_declaration(currency_declarations, currency_type.name, source_position)
+        casting_currency = get_currency_declaration(currency_declarations, value.name, source_position)
+        return CurrencyValue(to_cast_currency.name, casting_currency.value / to_cast_currency.value)
+    return None
@@ -0,0 +1,282 @@
+from typing import Dict, List, Optional, Tuple
+
+from interpreter.environment.environment import Environment
+from interpreter.environment.environment_errors import SemanticError, SemanticErrorCode, RunTimeEnvError, \
+    RuntimeErrorCode
+from interpreter.environment.frame import Frame
+from interpreter.models import tree_arena
+from interpreter.models.constants import RELATIONSHIP_OPERAND_INTO_LAMBDA_EXPRESSION, \
+    ARITHMETIC_OPERATOR_INTO_LAMBDA_EXPRESSION, PossibleTypes, CustomTypeOfTypes, CurrencyType, CurrencyValue
+from interpreter.models.tree_arena import TreeArena, RELATIONSHIP_OPERATORS
+from interpreter.source.source_position import SourcePosition
+
+# return type, ids and types of params and the statements node of a declared function
+FunctionDeclarationValues = Tuple[CustomTypeOfTypes, Tuple[Tuple[str, CustomTypeOfTypes], ...], int]
+
+
+class ArenaEnvironment(Environment):
+    """
+    Environment which runs a program kept in a TreeArena, node by node the same way Environment visits nodes
+    of a ParseTree, but without any node objects. Positions of nodes are made only for errors.
+    Currencies are kept as CurrencyValue of their name and value, which is all cast needs of a declaration.
+    """
+
+    def __init__(self, arena: TreeArena):
+        self.arena = arena
+        self.global_variables: Dict[str, PossibleTypes] = {}
+        self.functions_declarations: Dict[str, FunctionDeclarationValues] = {}
+        self.currency_declarations: Dict[str, CurrencyValue] = {}
+        self.frames_stack: List[Frame] = []
+        self._kinds = arena.kinds
+        self._first_child = arena.first_child
+        self._next_sibling = arena.next_sibling
+        self._value_indexes = arena.value_indexes
+        self._values = arena.values
+        evaluators = {
+            tree_arena.CONSTANT: self.evaluate_constant,
+            tree_arena.VARIABLE: self.evaluate_variable,
+            tree_arena.FUNCTION_CALL: self.evaluate_function_call,
+            tree_arena.ASSIGNMENT: self.evaluate_assignment,
+            tree_arena.NEGATION_FACTOR: self.evaluate_negation_factor,
+            tree_arena.TYPE_CASTING_FACTOR: self.evaluate_type_casting_factor,
+            tree_arena.MULTIPLY_EXPRESSION: self.evaluate_arithmetic_expression,
+            tree_arena.SUM_EXPRESSION: self.evaluate_arithmetic_expression,
+            tree_arena.RELATIONSHIP_EXPRESSION: self.evaluate_relationship_expression,
+            tree_arena.AND_EXPRESSION: self.evaluate_and_expression,
+            tree_arena.EXPRESSION: self.evaluate_expression,
+            tree_arena.RETURN_STATEMENT: self.evaluate_return_statement,
+            tree_arena.WHILE_STATEMENT: self.evaluate_while_statement,
+            tree_arena.IF_STATEMENT: self.evaluate_if_statement,
+            tree_arena.STATEMENTS: self.evaluate_statements,
+            tree_arena.VARIABLE_DECLARATION: self.evaluate_local_variable_declaration,
+        }
+        # a list is indexed faster than a dict, declarations of functions and currencies are never evaluated
+        self._evaluators = [evaluators.get(kind) for kind in range(tree_arena.PARSE_TREE + 1)]
+
+        for declaration in arena.children(arena.root):
+            kind = self._kinds[declaration]
+            if kind == tree_arena.FUNCTION_DECLARATION:
+                self.declare_function(declaration)
+            elif kind == tree_arena.CURRENCY_DECLARATION:
+                self.declare_currency(declaration)
+            else:
+                self.evaluate_variable_declaration(declaration, True)
+
+        self.current_frame = self.make_arena_frame('main', self.functions_declarations['main'], SourcePosition(0, 0),
+                                                   [])
+
+    def run_main(self) -> Optional[PossibleTypes]:
+        return self.call_function('main', SourcePosition(0, 0), [])
+
+    def get_global_variables(self) -> Dict[str, PossibleTypes]:
+        return self.global_variables
+
+    def evaluate(self, node: int):
+        return self._evaluators[self._kinds[node]](node)
+
+    def get_position(self, node: int) -> SourcePosition:
+        return self.arena.get_position(node)
+
+    def declare_function(self, declaration: int):
+        return_type, id = self.arena.get_value(declaration), self.arena.get_value(declaration, 1)
+        if id in self.functions_declarations:
+            raise SemanticError(self.get_position(declaration), SemanticErrorCode.DUPLICATE_ID, id)
+        children = list(self.arena.children(declaration))
+        params = tuple((self.arena.get_value(param), self.arena.get_value(param, 1)) for param in children[:-1])
+        self.functions_declarations[id] = return_type, params, children[-1]
+
+    def declare_currency(self, declaration: int):
+        name = self.arena.get_value(declaration)
+        if name in self.currency_declarations:
+            raise SemanticError(self.get_position(declaration), SemanticErrorCode.DUPLICATE_ID, name)
+        self.currency_declarations[name] = CurrencyValue(name, self.arena.get_value(declaration, 1))
+
+    def evaluate_variable_declaration(self, declaration: int, global_declaration: bool):
+        if global_declaration:
+            scope = self.global_variables
+        else:
+            scope = self.current_frame.local_variables
+        value_index = self._value_indexes[declaration]
+        type, id = self._values[value_index], self._values[value_index + 1]
+        if id in scope:
+            raise SemanticError(self.get_position(declaration), SemanticErrorCode.DUPLICATE_ID, id)
+
+        value = self.evaluate(self._first_child[declaration])
+        self._check_type(type, value, declaration)
+        scope[id] = value
+
+    def evaluate_local_variable_declaration(self, declaration: int):
+        self.evaluate_variable_declaration(declaration, False)
+
+    def evaluate_constant(self, constant: int) -> Optional[PossibleTypes]:
+        value = self._values[self._value_indexes[constant]]
+        if isinstance(value, CurrencyValue):
+            currency_name = value.name
+            if currency_name not in self.currency_declarations:
+                raise SemanticError(self.get_position(constant), SemanticErrorCode.CURR_ID_NOT_FOUND, currency_name)
+        return value
+
+    def evaluate_variable(self, variable: int):
+        id = self._values[self._value_indexes[variable]]
+        value = self._get_variable(id, variable)
+        if value is None:
+            raise RunTimeEnvError(self.get_position(variable), RuntimeErrorCode.VAR_NOT_INITIALIZED_WITH_VALUE, id)
+        return value
+
+    def evaluate_function_call(self, function_call: int):
+        id = self._values[self._value_indexes[function_call]]
+        if id not in self.functions_declarations:
+            raise SemanticError(self.get_position(function_call), SemanticErrorCode.FUN_ID_NOT_FOUND, id)
+        args = [self.evaluate(arg) for arg in self.arena.children(function_call)]
+        return self.call_function(id, self.get_position(function_call), args)
+
+    def call_function(self, id: str, source_position: SourcePosition, args: List[PossibleTypes]):
+        function_declaration = self.get_function_declaration(id, source_position)
+        new_frame = self.make_arena_frame(id, function_declaration, source_position, args)
+        self.frames_stack.append(self.current_frame)
+        if len(self.frames_stack) == 10:
+            raise RunTimeEnvError(source_position, RuntimeErrorCode.INFINITE_RECURSION, id)
+        self.current_frame = new_frame
+        return self.evaluate(function_declaration[2])
+
+    def get_function_declaration(self, name: str, source_position: SourcePosition) -> FunctionDeclarationValues:
+        if name in self.functions_declarations:
+            return self.functions_declarations[name]
+        raise SemanticError(source_position, SemanticErrorCode.FUN_ID_NOT_FOUND, name)
+
+    @staticmethod
+    def make_arena_frame(id: str, function_declaration: FunctionDeclarationValues, source_position: SourcePosition,
+                         params_values_list: List[PossibleTypes]) -> Frame:
+        return_type, params, _ = function_declaration
+        return Frame(id, return_type, params, source_position, params_values_list)
+
+    def evaluate_statements(self, statements: int):
+        # evaluate is inlined in the most visited nodes, it saves a call for every child
+        evaluators = self._evaluators
+        kinds = self._kinds
+        statement = self._first_child[statements]
+        next_sibling = self._next_sibling
+        while statement != tree_arena.NO_NODE:
+            return_value = evaluators[kinds[statement]](statement)
+            if return_value is not None:
+                return return_value
+            statement = next_sibling[statement]
+        return None
+
+    def evaluate_assignment(self, assignment: int):
+        var_id = self._values[self._value_indexes[assignment]]
+        var = self._get_variable(var_id, assignment)
+        expression = self._first_child[assignment]
+        value = self._evaluators[self._kinds[expression]](expression)
+
+        self._check_type(type(var), value, assignment)
+        self.current_frame.local_variables[var_id] = value
+
+    def evaluate_if_statement(self, if_statement: int):
+        expression = self._first_child[if_statement]
+        condition = self.evaluate(expression)
+        self._check_type(bool, condition, expression)
+        if condition:
+            return self.evaluate(self._next_sibling[expression])
+
+    def evaluate_while_statement(self, while_statement: int):
+        expression = self._first_child[while_statement]
+        statements = self._next_sibling[expression]
+        condition = self.evaluate(expression)
+        self._check_type(bool, condition, expression)
+        i = 0
+
+        while condition:
+            return_value = self.evaluate(statements)
+            if return_value:
+                return return_value
+            if i == 100:
+                raise RunTimeEnvError(self.get_position(while_statement),
+                                      RuntimeErrorCode.INFINITE_LOOP,
+                                      self.current_frame.function_name)
+
+            condition = self.evaluate(expression)
+            i += 1
+
+    def evaluate_return_statement(self, return_statement: int):
+        expression = self._first_child[return_statement]
+        # a return without an expression gives None, which is a wrong type of any function
+        return_value = None if expression == tree_arena.NO_NODE else self.evaluate(expression)
+
+        self.current_frame.check_return_value(return_value, self.get_position(return_statement))
+
+        frame = self.frames_stack.pop()
+        self.current_frame = frame
+        return return_value
+
+    def evaluate_expression(self, expression: int) -> Optional[PossibleTypes]:
+        return any(self._evaluate_conditions(expression))
+
+    def evaluate_and_expression(self, expression: int) -> Optional[PossibleTypes]:
+        return all(self._evaluate_conditions(expression))
+
+    def _evaluate_conditions(self, expression: int) -> List[bool]:
+        """
+        Values of all operands, every one has to be bool
+        """
+        results = []
+        for exp in self.arena.children(expression):
+            exp_result = self.evaluate(exp)
+            self._check_type(bool, exp_result, exp)
+            results.append(exp_result)
+        return results
+
+    def evaluate_relationship_expression(self, expression: int) -> Optional[PossibleTypes]:
+        left_node = self._first_child[expression]
+        right_node = self._next_sibling[left_node]
+        evaluators = self._evaluators
+        kinds = self._kinds
+        left_side = evaluators[kinds[left_node]](left_node)
+        right_side = evaluators[kinds[right_node]](right_node)
+
+        self._check_type(type(left_side), right_side, right_node)
+        operator = RELATIONSHIP_OPERATORS[self.arena.operators[expression]]
+        return RELATIONSHIP_OPERAND_INTO_LAMBDA_EXPRESSION[operator](left_side, right_side)
+
+    def evaluate_arithmetic_expression(self, expression: int) -> Optional[PossibleTypes]:
+        evaluators = self._evaluators
+        kinds = self._kinds
+        next_sibling = self._next_sibling
+        left_node = self._first_child[expression]
+        accumulator = evaluators[kinds[left_node]](left_node)
+        right_side = []
+        node = next_sibling[left_node]
+        while node != tree_arena.NO_NODE:
+            right_side.append(evaluators[kinds[node]](node))
+            node = next_sibling[node]
+
+        for operator, value in zip(self._values[self._value_indexes[expression]], right_side):
+            accumulator = ARITHMETIC_OPERATOR_INTO_LAMBDA_EXPRESSION[operator](accumulator, value)
+        return accumulator
+
+    def evaluate_type_casting_factor(self, factor: int) -> Optional[PossibleTypes]:
+        cast_type = self._values[self._value_indexes[factor]]
+        value = self.evaluate(self._first_child[factor])
+        if isinstance(cast_type, CurrencyType):
+            return self.cast(cast_type, value, self.get_position(factor))
+        return cast_type(value)
+
+    def evaluate_negation_factor(self, negation_factor: int):
+        value = self.evaluate(self._first_child[negation_factor])
+        self._check_type(bool, value, negation_factor)
+        return not value
+
+    def _get_variable(self, name: str, node: int) -> PossibleTypes:
+        local_variables = self.current_frame.local_variables
+        if name in local_variables:
+            return local_variables[name]
+        elif name in self.global_variables:
+            return self.global_variables[name]
+        raise SemanticError(self.get_position(node), SemanticErrorCode.VAR_ID_NOT_FOUND, name)
+
+    def _check_type(self, value_type: CustomTypeOfTypes, value, node: int):
+        """
+        check_type with the position of node, which is made only when the type is not the same
+        """
+        if type(value) != value_type:
+            self.check_type(value_type, value, self.get_position(node))
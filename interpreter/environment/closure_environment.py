@@ -0,0 +1,417 @@
+from typing import Callable, List, Optional, Union
+
+from interpreter.environment.environment import Environment
+from interpreter.environment.environment_errors import SemanticError, SemanticErrorCode, RunTimeEnvError, \
+    RuntimeErrorCode
+from interpreter.environment.frame import NOT_DECLARED, SlotFrame
+from interpreter.environment.resolver import ResolvedFunction
+from interpreter.models.base import Constant
+from interpreter.models.bound import LocalVariable, GlobalVariable, BoundAssignment, BoundVariableDeclaration, \
+    BoundFunctionCall
+from interpreter.models.constants import PossibleTypes, CurrencyType, CurrencyValue, OPERATOR_FUNCTIONS
+from interpreter.models.declarations import ParseTree
+from interpreter.models.expressions import Expression, AndExpression, RelationshipExpression, MultiplyExpression, \
+    SumExpression, TypeCastingFactor, NegationFactor
+from interpreter.models.statements import ReturnStatement, IfStatement, Statements, WhileStatement, run_visit
+from interpreter.models.typed import TypedVariableDeclaration, TypedAssignment, TypedIfStatement, \
+    TypedWhileStatement, TypedReturnStatement, TypedFunctionCall, TypedExpression, TypedAndExpression, \
+    TypedRelationshipExpression, TypedNegationFactor, TypedConstant
+from interpreter.source.source_position import SourcePosition
+
+# compiled node, called with the local variables of the frame of its function
+Closure = Callable[[List[PossibleTypes]], Optional[PossibleTypes]]
+# blocks nested deeper are run by Environment, as each nested closure takes Python stack
+MAX_COMPILED_DEPTH = 32
+
+
+class ClosureCompiler:
+    """
+    Compiles the statements of a function bound by Resolver and TypeChecker into nested closures, which run them
+    the same way Environment visits their nodes, with errors raised in the same order. Operators, slots,
+    constants and values of global variables, which never change after their declarations ran, are bound
+    when the function is compiled, and typed nodes are compiled without checks of types.
+    Closures of functions whose frame TypeChecker proved to stay current use the local variables they are called
+    with, the others read them from the current frame of Environment, as a call of a function which does not
+    return to its caller changes it, and read global variables the same way as Environment.
+    Blocks nested deeper than MAX_COMPILED_DEPTH are visited by Environment, which takes no Python stack for them.
+    """
+
+    def __init__(self, environment: 'ClosureEnvironment'):
+        self.environment = environment
+        # whether the function being compiled keeps its frame, see TypeChecker
+        self.keeps_frame = False
+        # number of blocks around the statement being compiled, in its function
+        self.block_depth = 0
+
+    def compile_function(self, index: int) -> Closure:
+        self.keeps_frame = self.environment.type_checker.keeps_frames[index]
+        body = self.environment.functions[index].statements.accept(self)
+        self.keeps_frame = False
+        return body
+
+    def interpret(self, node) -> Closure:
+        """
+        Closure visiting the node by Environment, for nodes which only raise errors when they run
+        """
+        environment = self.environment
+        return lambda local_variables: node.accept(environment)
+
+    def interpret_block(self, statement: Union[IfStatement, WhileStatement]) -> Closure:
+        """
+        Closure visiting the statement by Environment, for blocks nested deeper than MAX_COMPILED_DEPTH
+        """
+        environment = self.environment
+        block = Statements((statement,))
+        return lambda local_variables: run_visit(block.accept(environment))
+
+    def compile_block(self, statements: Statements) -> Closure:
+        self.block_depth += 1
+        body = statements.accept(self)
+        self.block_depth -= 1
+        return body
+
+    def visit_statements(self, statements: Statements) -> Closure:
+        closures = tuple([statement.accept(self) for statement in statements.list_of_statements])
+        if len(closures) == 1:
+            return closures[0]
+
+        def run_statements(local_variables):
+            for closure in closures:
+                return_value = closure(local_variables)
+                if return_value is not None:
+                    return return_value
+            return None
+        return run_statements
+
+    def visit_bound_variable_declaration(self, declaration: BoundVariableDeclaration,
+                                         global_declaration: bool = False) -> Closure:
+        environment = self.environment
+        check_type = environment.check_type
+        declared_type = declaration.type
+        slot = declaration.slot
+        expression = declaration.expression.accept(self)
+        checked = type(declaration) is not TypedVariableDeclaration
+
+        def declare(local_variables):
+            if local_variables[slot] is not NOT_DECLARED:
+                raise SemanticError(declaration.source_position, SemanticErrorCode.DUPLICATE_ID, declaration.id)
+            value = expression(local_variables)
+            if checked and type(value) != declared_type:
+                check_type(declared_type, value, declaration.source_position)
+            local_variables[slot] = value
+
+        if self.keeps_frame:
+            return declare
+        return lambda local_variables: declare(environment.get_local_variables())
+
+    visit_typed_variable_declaration = visit_bound_variable_declaration
+
+    def visit_bound_assignment(self, assignment: BoundAssignment) -> Closure:
+        environment = self.environment
+        check_type = environment.check_type
+        slot = assignment.slot
+        expression = assignment.expression.accept(self)
+        checked = type(assignment) is not TypedAssignment
+        keeps_frame = self.keeps_frame
+
+        def assign(local_variables):
+            variable = local_variables[slot]
+            if variable is NOT_DECLARED:
+                variable = environment.get_global_variable(assignment.id, assignment.global_slot,
+                                                           assignment.source_position)
+            value = expression(local_variables)
+            if checked and type(value) is not type(variable):
+                check_type(type(variable), value, assignment.source_position)
+            if not keeps_frame:
+                # the value is stored into the frame which is current after the expression, whose calls can change it
+                local_variables = environment.get_local_variables()
+            local_variables[slot] = value
+
+        if self.keeps_frame:
+            return assign
+        return lambda local_variables: assign(environment.get_local_variables())
+
+    visit_typed_assignment = visit_bound_assignment
+
+    def visit_if_statement(self, if_statement: IfStatement) -> Closure:
+        if self.block_depth == MAX_COMPILED_DEPTH:
+            return self.interpret_block(if_statement)
+        check_type = self.environment.check_type
+        expression = if_statement.expression.accept(self)
+        statements = self.compile_block(if_statement.statements)
+        position = if_statement.expression.source_position
+
+        def run_if_statement(local_variables):
+            condition = expression(local_variables)
+            if type(condition) is not bool:
+                check_type(bool, condition, position)
+            if condition:
+                return statements(local_variables)
+        return run_if_statement
+
+    def visit_typed_if_statement(self, if_statement: TypedIfStatement) -> Closure:
+        if self.block_depth == MAX_COMPILED_DEPTH:
+            return self.interpret_block(if_statement)
+        expression = if_statement.expression.accept(self)
+        statements = self.compile_block(if_statement.statements)
+
+        def run_if_statement(local_variables):
+            if expression(local_variables):
+                return statements(local_variables)
+        return run_if_statement
+
+    def visit_while_statement(self, while_statement: WhileStatement) -> Closure:
+        if self.block_depth == MAX_COMPILED_DEPTH:
+            return self.interpret_block(while_statement)
+        environment = self.environment
+        check_type = environment.check_type
+        expression = while_statement.expression.accept(self)
+        statements = self.compile_block(while_statement.statements)
+        checked = type(while_statement) is not TypedWhileStatement
+        position = while_statement.expression.source_position
+
+        def run_while_statement(local_variables):
+            condition = expression(local_variables)
+            if checked and type(condition) is not bool:
+                check_type(bool, condition, position)
+            i = 0
+
+            while condition:
+                return_value = statements(local_variables)
+                if return_value:
+                    return return_value
+                if i == 100:
+                    raise RunTimeEnvError(while_statement.source_position,
+                                          RuntimeErrorCode.INFINITE_LOOP,
+                                          environment.current_frame.function_name)
+
+                # only the first value of the condition is checked, as in Environment
+                condition = expression(local_variables)
+                i += 1
+        return run_while_statement
+
+    visit_typed_while_statement = visit_while_statement
+
+    def visit_return_statement(self, return_statement: ReturnStatement) -> Closure:
+        if return_statement.expression is None:
+            return self.interpret(return_statement)
+        environment = self.environment
+        frames_stack = environment.frames_stack
+        expression = return_statement.expression.accept(self)
+        checked = type(return_statement) is not TypedReturnStatement
+
+        def run_return_statement(local_variables):
+            return_value = expression(local_variables)
+            if checked:
+                environment.current_frame.check_return_value(return_value, return_statement.source_position)
+            environment.current_frame = frames_stack.pop()
+            return return_value
+        return run_return_statement
+
+    visit_typed_return_statement = visit_return_statement
+
+    def visit_bound_function_call(self, function_call: BoundFunctionCall) -> Closure:
+        environment = self.environment
+        frames_stack = environment.frames_stack
+        bodies = environment.bodies
+        index = function_call.function
+        function = environment.functions[index]
+        args = tuple([arg.accept(self) for arg in function_call.args])
+        params_checked = type(function_call) is TypedFunctionCall
+        source_position = function_call.source_position
+
+        def call(local_variables):
+            new_frame = environment.make_frame(function, source_position, [arg(local_variables) for arg in args],
+                                               params_checked)
+            frames_stack.append(environment.current_frame)
+            if len(frames_stack) == 10:
+                raise RunTimeEnvError(source_position, RuntimeErrorCode.INFINITE_RECURSION, function_call.id)
+            environment.current_frame = new_frame
+            body = bodies[index]
+            if body is None:
+                # a function parsed lazily was bound by make_frame
+                body = environment.compile_function(index)
+            caller = environment.function
+            environment.function = function
+            return_value = body(new_frame.local_variables)
+            environment.function = caller
+            return return_value
+        return call
+
+    visit_typed_function_call = visit_bound_function_call
+
+    def visit_constant(self, constant: Constant) -> Closure:
+        value = constant.value
+        if isinstance(value, CurrencyValue) and value.name not in self.environment.currency_declarations:
+            return self.interpret(constant)
+        return lambda local_variables: value
+
+    def visit_typed_constant(self, constant: TypedConstant) -> Closure:
+        value = constant.value
+        return lambda local_variables: value
+
+    def visit_local_variable(self, variable: LocalVariable) -> Closure:
+        environment = self.environment
+        slot = variable.slot
+
+        def get_undeclared_or_empty(value):
+            if value is NOT_DECLARED:
+                value = environment.get_global_variable(variable.id, variable.global_slot, variable.source_position)
+            if value is None:
+                raise RunTimeEnvError(variable.source_position, RuntimeErrorCode.VAR_NOT_INITIALIZED_WITH_VALUE,
+                                      variable.id)
+            return value
+
+        if self.keeps_frame:
+            def get_variable(local_variables):
+                value = local_variables[slot]
+                if value is NOT_DECLARED or value is None:
+                    return get_undeclared_or_empty(value)
+                return value
+        else:
+            def get_variable(local_variables):
+                value = environment.get_local_variables()[slot]
+                if value is NOT_DECLARED or value is None:
+                    return get_undeclared_or_empty(value)
+                return value
+        return get_variable
+
+    def visit_global_variable(self, variable: GlobalVariable) -> Closure:
+        value = self.environment.global_variables[variable.slot]
+        if value is NOT_DECLARED or value is None or not self.keeps_frame:
+            return self.interpret(variable)
+        return lambda local_variables: value
+
+    def visit_expression(self, expression: Union[Expression, AndExpression]) -> Closure:
+        check_type = self.environment.check_type
+        if isinstance(expression, Expression):
+            operands, reduce_values = expression.and_expressions, any
+        else:
+            operands, reduce_values = expression.relationship_expressions, all
+        closures = tuple([operand.accept(self) for operand in operands])
+        positions = tuple([operand.source_position for operand in operands])
+
+        if type(expression) is TypedExpression or type(expression) is TypedAndExpression:
+            # all operands are evaluated, as in Environment
+            return lambda local_variables: reduce_values([closure(local_variables) for closure in closures])
+
+        def evaluate(local_variables):
+            values = []
+            for closure, position in zip(closures, positions):
+                value = closure(local_variables)
+                if type(value) is not bool:
+                    check_type(bool, value, position)
+                values.append(value)
+            return reduce_values(values)
+        return evaluate
+
+    visit_and_expression = visit_expression
+    visit_typed_expression = visit_expression
+    visit_typed_and_expression = visit_expression
+
+    def visit_relationship_expression(self, expression: RelationshipExpression) -> Closure:
+        if expression.right_side is None:
+            return self.interpret(expression)
+        check_type = self.environment.check_type
+        left_side = expression.left_side.accept(self)
+        right_side = expression.right_side.accept(self)
+        function = OPERATOR_FUNCTIONS[expression.operator]
+        position = expression.right_side.source_position
+
+        def compare(local_variables):
+            left_value = left_side(local_variables)
+            right_value = right_side(local_variables)
+            if type(right_value) is not type(left_value):
+                check_type(type(left_value), right_value, position)
+            return function(left_value, right_value)
+        return compare
+
+    def visit_typed_relationship_expression(self, expression: TypedRelationshipExpression) -> Closure:
+        left_side = expression.left_side.accept(self)
+        right_side = expression.right_side.accept(self)
+        function = OPERATOR_FUNCTIONS[expression.operator]
+        return lambda local_variables: function(left_side(local_variables), right_side(local_variables))
+
+    def visit_arithmetic_expression(self, expression: Union[SumExpression, MultiplyExpression]) -> Closure:
+        left_side = expression.left_side.accept(self)
+        if len(expression.right_side) == 1:
+            (operator, right_expression), = expression.right_side
+            function = OPERATOR_FUNCTIONS[operator]
+            right_side = right_expression.accept(self)
+            return lambda local_variables: function(left_side(local_variables), right_side(local_variables))
+
+        functions = tuple([OPERATOR_FUNCTIONS[operator] for operator, _ in expression.right_side])
+        right_side = tuple([right_expression.accept(self) for _, right_expression in expression.right_side])
+
+        def calculate(local_variables):
+            accumulator = left_side(local_variables)
+            # all operands are evaluated before the first operation, as in Environment
+            values = [closure(local_variables) for closure in right_side]
+            for function, value in zip(functions, values):
+                accumulator = function(accumulator, value)
+            return accumulator
+        return calculate
+
+    def visit_type_casting_factor(self, factor: TypeCastingFactor) -> Closure:
+        cast_type = factor.cast_type
+        negation_factor = factor.negation_factor.accept(self)
+        if isinstance(cast_type, CurrencyType):
+            cast = self.environment.cast
+            return lambda local_variables: cast(cast_type, negation_factor(local_variables), factor.source_position)
+        return lambda local_variables: cast_type(negation_factor(local_variables))
+
+    def visit_negation_factor(self, negation_factor: NegationFactor) -> Closure:
+        check_type = self.environment.check_type
+        factor = negation_factor.factor.accept(self)
+
+        def negate(local_variables):
+            value = factor(local_variables)
+            if type(value) is not bool:
+                check_type(bool, value, negation_factor.source_position)
+            return not value
+        return negate
+
+    def visit_typed_negation_factor(self, negation_factor: TypedNegationFactor) -> Closure:
+        factor = negation_factor.factor.accept(self)
+        return lambda local_variables: not factor(local_variables)
+
+
+class ClosureEnvironment(Environment):
+    """
+    Environment which runs functions compiled by ClosureCompiler instead of visiting their nodes,
+    each function is compiled once, a function parsed lazily at its first call.
+    Declarations of global variables run once, before functions are compiled, so they are visited as in Environment.
+    """
+
+    def __init__(self, parse_tree: ParseTree):
+        super().__init__(parse_tree)
+        self.compiler = ClosureCompiler(self)
+        self.bodies: List[Optional[Closure]] = [None] * len(self.functions)
+        for index, function in enumerate(self.functions):
+            if function.statements is not None:
+                self.compile_function(index)
+
+    def compile_function(self, index: int) -> Closure:
+        self.bodies[index] = self.compiler.compile_function(index)
+        return self.bodies[index]
+
+    def run_main(self) -> Optional[PossibleTypes]:
+        main_function_call = BoundFunctionCall(SourcePosition(0, 0), 'main', self.resolver.function_indexes['main'],
+                                               ())
+        return main_function_call.accept(self.compiler)(self.current_frame.local_variables)
+
+    def call_function(self, function: ResolvedFunction, function_call: BoundFunctionCall, new_frame: SlotFrame):
+        # calls in blocks visited by Environment run the compiled function as well
+        self.frames_stack.append(self.current_frame)
+        if len(self.frames_stack) == 10:
+            raise RunTimeEnvError(function_call.source_position, RuntimeErrorCode.INFINITE_RECURSION, function_call.id)
+        self.current_frame = new_frame
+        body = self.bodies[function_call.function]
+        if body is None:
+            # a function parsed lazily was bound by make_frame
+            body = self.compile_function(function_call.function)
+        caller = self.function
+        self.function = function
+        return_value = body(new_frame.local_variables)
+        self.function = caller
+        return return_value
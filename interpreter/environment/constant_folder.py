@@ -0,0 +1,328 @@
+from typing import Dict, Generator, List, Optional, Set, Tuple, Union
+
+from interpreter.environment.resolver import ResolvedFunction
+from interpreter.models.base import Constant
+from interpreter.models.bound import LocalVariable, GlobalVariable, BoundAssignment, BoundVariableDeclaration, \
+    BoundFunctionCall
+from interpreter.models.constants import OPERATOR_FUNCTIONS, PossibleTypes, CustomTypeOfTypes, CurrencyType, \
+    CurrencyValue, MulOperator, SumOperator, RelationshipOperator
+from interpreter.models.declarations import CurrencyDeclaration
+from interpreter.models.expressions import Expression, AndExpression, RelationshipExpression, MultiplyExpression, \
+    SumExpression, TypeCastingFactor, NegationFactor, ExpressionTypes
+from interpreter.models.statements import ReturnStatement, IfStatement, Statements, WhileStatement, \
+    BLOCK_STATEMENTS, run_visit
+from interpreter.models.typed import TypedVariableDeclaration, TypedConstant, TypedRelationshipExpression
+
+# errors of operations on values, an operation which raises one of them is left to raise it when it runs
+FOLDING_ERRORS = (ArithmeticError, TypeError, ValueError, AttributeError)
+# longest string an operation is folded into, the same limit as of the optimizer of CPython
+MAX_STRING_LENGTH = 4096
+# result of an operation which is not folded
+NOT_FOLDED = object()
+
+
+def fold_operation(operator: Union[SumOperator, MulOperator, RelationshipOperator], left_value: PossibleTypes,
+                   right_value: PossibleTypes) -> PossibleTypes:
+    """
+    Result of the operation, NOT_FOLDED when it raises an error or makes a too long string
+    """
+    if operator is MulOperator.MUL:
+        # a string is not repeated before the length of the result is known
+        string, times = (left_value, right_value) if type(left_value) is str else (right_value, left_value)
+        if type(string) is str and type(times) in (int, bool) and len(string) * times > MAX_STRING_LENGTH:
+            return NOT_FOLDED
+    try:
+        value = OPERATOR_FUNCTIONS[operator](left_value, right_value)
+    except FOLDING_ERRORS:
+        return NOT_FOLDED
+    if type(value) is str and len(value) > MAX_STRING_LENGTH:
+        return NOT_FOLDED
+    return value
+
+
+def is_checked(value_type: CustomTypeOfTypes, value: PossibleTypes) -> bool:
+    """
+    Whether Environment.check_type of the value passes
+    """
+    if type(value) == value_type:
+        return True
+    return isinstance(value, CurrencyValue) and isinstance(value_type, CurrencyType) and value.name == value_type.name
+
+
+class ConstantFolder:
+    """
+    Pass after TypeChecker, which folds expressions whose operands are constants into TypedConstants, with casts
+    into currencies by rates of their declarations, and replaces constants of declared currencies by TypedConstants,
+    which Environment returns without looking currencies up.
+    Values of global variables declared by constants are propagated into declarations below their own, and into
+    functions when no declaration of a global variable calls one, as global variables never change after their
+    declarations ran, unless the functions do not keep their frame. Values of local variables are propagated
+    only in functions which keep their frame, when a variable is declared once, by a constant, by a statement
+    of the function outside of any block, and never assigned, into the statements following it.
+    Operations which raise errors, checks of types which fail and constants of currencies which are not declared
+    stay in the tree, so they raise the same errors at the same positions when they run.
+    """
+
+    def __init__(self, currency_declarations: Dict[str, CurrencyDeclaration]):
+        self.currency_declarations = currency_declarations
+        self.global_values: Dict[int, PossibleTypes] = {}
+        # values of local variables of the function being folded, propagated into the statements which follow
+        # their declarations
+        self.local_values: Dict[int, PossibleTypes] = {}
+        # whether folded statements call functions
+        self.has_calls = False
+
+    def fold_global_declarations(self, declarations: List[BoundVariableDeclaration]) \
+            -> List[BoundVariableDeclaration]:
+        folded_declarations = []
+        for declaration in declarations:
+            folded_declaration = declaration.accept(self, True)
+            self.propagate(folded_declaration, self.global_values)
+            folded_declarations.append(folded_declaration)
+        if self.has_calls:
+            # functions called by the declarations run before global variables below them are declared
+            self.global_values = {}
+        return folded_declarations
+
+    def fold_function(self, function: ResolvedFunction, keeps_frame: bool, declared_slots: List[int],
+                      assignments: List[BoundAssignment]):
+        """
+        Folds the statements of a function checked by TypeChecker, with the slots of its declarations
+        and its assignments
+        """
+        propagated_slots: Set[int] = set()
+        if keeps_frame:
+            assigned_slots = {assignment.slot for assignment in assignments}
+            propagated_slots = {slot for slot in declared_slots
+                                if slot >= len(function.params) and declared_slots.count(slot) == 1
+                                and slot not in assigned_slots}
+        global_values = self.global_values
+        if not keeps_frame:
+            # a variable of the frame of another function can hide a global variable
+            self.global_values = {}
+        list_of_statements = []
+        for statement in function.statements.list_of_statements:
+            folded_statement = statement.accept(self)
+            if isinstance(statement, BLOCK_STATEMENTS):
+                folded_statement = run_visit(folded_statement)
+            elif isinstance(folded_statement, BoundVariableDeclaration) and folded_statement.slot in propagated_slots:
+                self.propagate(folded_statement, self.local_values)
+            list_of_statements.append(folded_statement)
+        self.local_values = {}
+        self.global_values = global_values
+        if any(folded is not statement
+               for folded, statement in zip(list_of_statements, function.statements.list_of_statements)):
+            function.statements = Statements(tuple(list_of_statements))
+
+    @staticmethod
+    def propagate(declaration: BoundVariableDeclaration, values: Dict[int, PossibleTypes]):
+        """
+        Keeps the value of the declared variable, when the declaration stores a constant into it
+        """
+        if type(declaration.expression) is not TypedConstant or declaration.slot in values:
+            return
+        value = declaration.expression.value
+        if type(declaration) is TypedVariableDeclaration or is_checked(declaration.type, value):
+            values[declaration.slot] = value
+
+    def visit_bound_variable_declaration(self, declaration: BoundVariableDeclaration,
+                                         global_declaration: bool) -> BoundVariableDeclaration:
+        expression = declaration.expression.accept(self)
+        if expression is declaration.expression:
+            return declaration
+        return type(declaration)(declaration.source_position, declaration.type, declaration.id, declaration.slot,
+                                 expression)
+
+    visit_typed_variable_declaration = visit_bound_variable_declaration
+
+    # statements and blocks are visited by generators, see run_visit
+
+    def visit_statements(self, statements: Statements) -> Generator:
+        list_of_statements = []
+        for statement in statements.list_of_statements:
+            folded_statement = statement.accept(self)
+            if isinstance(statement, BLOCK_STATEMENTS):
+                folded_statement = yield folded_statement
+            list_of_statements.append(folded_statement)
+        if all(folded is statement for folded, statement in zip(list_of_statements, statements.list_of_statements)):
+            return statements
+        return Statements(tuple(list_of_statements))
+
+    def visit_bound_assignment(self, assignment: BoundAssignment) -> BoundAssignment:
+        expression = assignment.expression.accept(self)
+        if expression is assignment.expression:
+            return assignment
+        return type(assignment)(assignment.source_position, assignment.id, assignment.slot, assignment.global_slot,
+                                expression)
+
+    visit_typed_assignment = visit_bound_assignment
+
+    def visit_if_statement(self, if_statement: Union[IfStatement, WhileStatement]) -> Generator:
+        expression = if_statement.expression.accept(self)
+        statements = yield if_statement.statements.accept(self)
+        if expression is if_statement.expression and statements is if_statement.statements:
+            return if_statement
+        return type(if_statement)(if_statement.source_position, expression, statements)
+
+    visit_typed_if_statement = visit_if_statement
+    visit_while_statement = visit_if_statement
+    visit_typed_while_statement = visit_if_statement
+
+    def visit_return_statement(self, return_statement: ReturnStatement) -> ReturnStatement:
+        if return_statement.expression is None:
+            return return_statement
+        expression = return_statement.expression.accept(self)
+        if expression is return_statement.expression:
+            return return_statement
+        return type(return_statement)(return_statement.source_position, expression)
+
+    visit_typed_return_statement = visit_return_statement
+
+    def visit_bound_function_call(self, function_call: BoundFunctionCall) -> BoundFunctionCall:
+        self.has_calls = True
+        args = tuple([arg.accept(self) for arg in function_call.args])
+        if all(folded is arg for folded, arg in zip(args, function_call.args)):
+            return function_call
+        return type(function_call)(function_call.source_position, function_call.id, function_call.function, args)
+
+    visit_typed_function_call = visit_bound_function_call
+
+    def visit_constant(self, constant: Constant) -> Constant:
+        value = constant.value
+        # a constant of a currency which is not declared fails when it is evaluated
+        if isinstance(value, CurrencyValue) and value.name not in self.currency_declarations:
+            return constant
+        return TypedConstant(constant.source_position, value)
+
+    def visit_typed_constant(self, constant: TypedConstant) -> TypedConstant:
+        return constant
+
+    def visit_local_variable(self, variable: LocalVariable) -> Union[LocalVariable, TypedConstant]:
+        if variable.slot in self.local_values:
+            return TypedConstant(variable.source_position, self.local_values[variable.slot])
+        return variable
+
+    def visit_global_variable(self, variable: GlobalVariable) -> Union[GlobalVariable, TypedConstant]:
+        if variable.slot in self.global_values:
+            return TypedConstant(variable.source_position, self.global_values[variable.slot])
+        return variable
+
+    def visit_expression(self, expression: Union[Expression, AndExpression]) \
+            -> Union[Expression, AndExpression, TypedConstant]:
+        if isinstance(expression, Expression):
+            operands = expression.and_expressions
+        else:
+            operands = expression.relationship_expressions
+        folded_operands = self.fold_operands(operands)
+        # all operands are evaluated and checked, so the expression is folded when all of them are bool constants
+        if all(type(operand) is TypedConstant and type(operand.value) is bool for operand in folded_operands):
+            values = [operand.value for operand in folded_operands]
+            return TypedConstant(expression.source_position,
+                                 any(values) if isinstance(expression, Expression) else all(values))
+        if folded_operands is operands:
+            return expression
+        return type(expression)(expression.source_position, folded_operands)
+
+    visit_typed_expression = visit_expression
+    visit_and_expression = visit_expression
+    visit_typed_and_expression = visit_expression
+
+    def fold_operands(self, operands: Tuple[ExpressionTypes, ...]) -> Tuple[ExpressionTypes, ...]:
+        """
+        Folded operands, the same tuple when none of them changed
+        """
+        folded_operands = tuple([operand.accept(self) for operand in operands])
+        if all(folded is operand for folded, operand in zip(folded_operands, operands)):
+            return operands
+        return folded_operands
+
+    def visit_relationship_expression(self, expression: RelationshipExpression) \
+            -> Union[RelationshipExpression, TypedConstant]:
+        left_side = expression.left_side.accept(self)
+        right_side = expression.right_side.accept(self)
+        if type(left_side) is TypedConstant and type(right_side) is TypedConstant and \
+                (type(expression) is TypedRelationshipExpression
+                 or is_checked(type(left_side.value), right_side.value)):
+            value = fold_operation(expression.operator, left_side.value, right_side.value)
+            if value is not NOT_FOLDED:
+                return TypedConstant(expression.source_position, value)
+        if left_side is expression.left_side and right_side is expression.right_side:
+            return expression
+        return type(expression)(expression.source_position, left_side, expression.operator, right_side)
+
+    visit_typed_relationship_expression = visit_relationship_expression
+
+    def visit_arithmetic_expression(self, expression: Union[SumExpression, MultiplyExpression]) \
+            -> Union[SumExpression, MultiplyExpression, TypedConstant]:
+        """
+        Folds the constant operands at the start of the expression, the operations after them run on values
+        of operands evaluated before all operations, as in Environment
+        """
+        left_side = expression.left_side.accept(self)
+        right_side = tuple([(operator, operand.accept(self)) for operator, operand in expression.right_side])
+        folded = 0
+        if type(left_side) is TypedConstant:
+            value = left_side.value
+            for operator, operand in right_side:
+                if type(operand) is not TypedConstant:
+                    break
+                folded_value = fold_operation(operator, value, operand.value)
+                if folded_value is NOT_FOLDED:
+                    break
+                value = folded_value
+                folded += 1
+            if folded == len(right_side):
+                return TypedConstant(expression.source_position, value)
+            if folded > 0:
+                left_side = TypedConstant(left_side.source_position, value)
+                right_side = right_side[folded:]
+        if left_side is expression.left_side and \
+                all(folded_operand is operand
+                    for (_, folded_operand), (_, operand) in zip(right_side, expression.right_side)):
+            return expression
+        return type(expression)(expression.source_position, left_side, right_side)
+
+    def visit_type_casting_factor(self, factor: TypeCastingFactor) -> Union[TypeCastingFactor, TypedConstant]:
+        negation_factor = factor.negation_factor.accept(self)
+        if type(negation_factor) is TypedConstant:
+            value = self.cast(factor.cast_type, negation_factor.value)
+            if value is not None:
+                return TypedConstant(factor.source_position, value)
+        if negation_factor is factor.negation_factor:
+            return factor
+        return TypeCastingFactor(factor.source_position, negation_factor, factor.cast_type)
+
+    def cast(self, casting_type: CustomTypeOfTypes, value: PossibleTypes) -> Optional[PossibleTypes]:
+        """
+        Value cast the same way as by Environment.cast, None when the cast raises an error or makes None
+        """
+        if isinstance(casting_type, CurrencyType):
+            if type(value) is float:
+                return CurrencyValue(casting_type.name, value)
+            if isinstance(value, CurrencyType) and casting_type.name in self.currency_declarations \
+                    and value.name in self.currency_declarations:
+                # a value of a currency becomes the rate of its currency to the other one
+                to_cast_currency = self.currency_declarations[casting_type.name]
+                casting_currency = self.currency_declarations[value.name]
+                try:
+                    return CurrencyValue(to_cast_currency.name, casting_currency.value / to_cast_currency.value)
+                except FOLDING_ERRORS:
+                    return None
+            return None
+        try:
+            value = casting_type(value)
+        except FOLDING_ERRORS:
+            return None
+        if type(value) is str and len(value) > MAX_STRING_LENGTH:
+            return None
+        return value
+
+    def visit_negation_factor(self, negation_factor: NegationFactor) -> Union[NegationFactor, TypedConstant]:
+        factor = negation_factor.factor.accept(self)
+        if type(factor) is TypedConstant and type(factor.value) is bool:
+            return TypedConstant(negation_factor.source_position, not factor.value)
+        if factor is negation_factor.factor:
+            return negation_factor
+        return type(negation_factor)(negation_factor.source_position, factor, negation_factor.is_negated)
+
+    visit_typed_negation_factor = visit_negation_factor
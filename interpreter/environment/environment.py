@@ -1,62 +1,84 @@
 from functools import reduce
-from typing import Union, Optional, Dict, List
-
-from interpreter.environment.frame import Frame
-from interpreter.models.base import Constant, Variable, FunctionCall, Assignment
+from typing import Union, Optional, Dict, List, Generator
+
+from interpreter.environment.frame import Frame, SlotFrame, ForeignVariables, NOT_DECLARED
+from interpreter.environment.resolver import Resolver, ResolvedFunction
+from interpreter.environment.type_checker import TypeChecker
+from interpreter.models.base import Constant
+from interpreter.models.bound import NO_SLOT, LocalVariable, GlobalVariable, BoundAssignment, \
+    BoundVariableDeclaration, BoundFunctionCall
 from interpreter.models.constants import RELATIONSHIP_OPERAND_INTO_LAMBDA_EXPRESSION, \
     ARITHMETIC_OPERATOR_INTO_LAMBDA_EXPRESSION, PossibleTypes, CustomTypeOfTypes, CurrencyType, CurrencyValue
-from interpreter.models.declarations import ParseTree, VariableDeclaration, CurrencyDeclaration, FunctionDeclaration
+from interpreter.models.declarations import ParseTree, CurrencyDeclaration
 from interpreter.models.expressions import Expression, AndExpression, RelationshipExpression, MultiplyExpression, \
     SumExpression, TypeCastingFactor, NegationFactor
 from interpreter.environment.environment_errors import SemanticError, SemanticErrorCode, SemanticTypeError, \
     RunTimeEnvError, RuntimeErrorCode
-from interpreter.models.statements import ReturnStatement, IfStatement, Statements, WhileStatement
+from interpreter.models.statements import ReturnStatement, IfStatement, Statements, WhileStatement, \
+    BLOCK_STATEMENTS, run_visit
+from interpreter.models.typed import TypedVariableDeclaration, TypedAssignment, TypedIfStatement, \
+    TypedWhileStatement, TypedReturnStatement, TypedFunctionCall, TypedExpression, TypedAndExpression, \
+    TypedRelationshipExpression, TypedNegationFactor, TypedConstant
 from interpreter.source.source_position import SourcePosition
 
 
 class Environment:
+    """
+    Runs a program by visiting its nodes, after Resolver bound its variables to slots and calls to functions
+    and TypeChecker replaced nodes whose type checks it proved by typed ones, which are run without checking types
+    """
+
     def __init__(self, parse_tree: ParseTree):
-        self.global_variables: Dict[str, PossibleTypes] = {}
-        self.functions_declarations: Dict[str, FunctionDeclaration] = {}
-        self.currency_declarations: Dict[str, CurrencyDeclaration] = {}
+        self.resolver = Resolver(parse_tree)
+        self.type_checker = TypeChecker(self.resolver)
+        self.functions: List[ResolvedFunction] = self.resolver.functions
+        self.currency_declarations: Dict[str, CurrencyDeclaration] = self.resolver.currency_declarations
+        self.global_variables: List[PossibleTypes] = [NOT_DECLARED] * len(self.resolver.global_slots)
         self.frames_stack: List[Frame] = []
+        # function whose statements run, None in declarations of global variables
+        self.function: Optional[ResolvedFunction] = None
 
-        for declaration in parse_tree.declarations:
+        for declaration in self.type_checker.global_declarations:
             declaration.accept(self, True)
 
-        self.current_frame = Frame(
-            self.functions_declarations['main'],
+        self.current_frame = self.make_frame(
+            self.functions[self.resolver.function_indexes['main']],
             SourcePosition(0, 0),
             []
         )
 
     def run_main(self) -> Optional[PossibleTypes]:
-        main_function = self.functions_declarations['main']
-        main_function_call = FunctionCall(SourcePosition(0, 0), 'main', [])
+        main_function_call = BoundFunctionCall(SourcePosition(0, 0), 'main', self.resolver.function_indexes['main'],
+                                               ())
 
         return main_function_call.accept(self)
 
-    def visit_variable_declaration(self, declaration: VariableDeclaration, global_declaration: bool):
+    def get_global_variables(self) -> Dict[str, PossibleTypes]:
+        """
+        Values of global variables by their names
+        """
+        return {name: self.global_variables[slot] for name, slot in self.resolver.global_slots.items()}
+
+    def visit_bound_variable_declaration(self, declaration: BoundVariableDeclaration, global_declaration: bool):
         if global_declaration:
             scope = self.global_variables
         else:
-            scope = self.current_frame.local_variables
-        if declaration.id in scope:
+            scope = self.get_local_variables()
+        if scope[declaration.slot] is not NOT_DECLARED:
             raise SemanticError(declaration.source_position, SemanticErrorCode.DUPLICATE_ID, declaration.id)
 
         value = declaration.expression.accept(self)
         self.check_type(declaration.type, value, declaration.source_position)
-        scope[declaration.id] = value
+        scope[declaration.slot] = value
 
-    def visit_currency_declaration(self, declaration: CurrencyDeclaration):
-        if declaration.name in self.currency_declarations:
-            raise SemanticError(declaration.source_position, SemanticErrorCode.DUPLICATE_ID, declaration.name)
-        self.currency_declarations[declaration.name] = declaration
-
-    def visit_function_declaration(self, declaration: FunctionDeclaration):
-        if declaration.id in self.functions_declarations:
+    def visit_typed_variable_declaration(self, declaration: TypedVariableDeclaration, global_declaration: bool):
+        if global_declaration:
+            scope = self.global_variables
+        else:
+            scope = self.get_local_variables()
+        if scope[declaration.slot] is not NOT_DECLARED:
             raise SemanticError(declaration.source_position, SemanticErrorCode.DUPLICATE_ID, declaration.id)
-        self.functions_declarations[declaration.id] = declaration
+        scope[declaration.slot] = declaration.expression.accept(self)
 
     def visit_constant(self, constant: Constant) -> Optional[PossibleTypes]:
         value = constant.value
@@ -66,62 +88,124 @@ class Environment:
                 raise SemanticError(constant.source_position, SemanticErrorCode.CURR_ID_NOT_FOUND, currency_name)
         return constant.value
 
-    def visit_variable(self, variable: Variable):
-        value = self.get_variable(variable.id, variable.source_position)
+    def visit_typed_constant(self, constant: TypedConstant) -> PossibleTypes:
+        return constant.value
+
+    def visit_local_variable(self, variable: LocalVariable):
+        value = self.get_local_variables()[variable.slot]
+        if value is NOT_DECLARED:
+            value = self.get_global_variable(variable.id, variable.global_slot, variable.source_position)
         if value is None:
             raise RunTimeEnvError(variable.source_position, RuntimeErrorCode.VAR_NOT_INITIALIZED_WITH_VALUE,
                                   variable.id)
         return value
 
-    def visit_function_call(self, function_call: FunctionCall):
-        function_declaration = self.get_function_declaration(function_call.id, function_call.source_position)
-        new_frame = Frame(function_declaration,
-                          function_call.source_position,
-                          [exp.accept(self) for exp in function_call.args])
+    def visit_global_variable(self, variable: GlobalVariable):
+        value = NOT_DECLARED
+        if self.function is not None:
+            local_variables = self.get_local_variables()
+            if type(local_variables) is ForeignVariables:
+                # a variable of the frame of another function hides the global variable
+                value = local_variables.get_variable(variable.id)
+        if value is NOT_DECLARED:
+            value = self.get_global_variable(variable.id, variable.slot, variable.source_position)
+        if value is None:
+            raise RunTimeEnvError(variable.source_position, RuntimeErrorCode.VAR_NOT_INITIALIZED_WITH_VALUE,
+                                  variable.id)
+        return value
+
+    def visit_bound_function_call(self, function_call: BoundFunctionCall):
+        function = self.functions[function_call.function]
+        new_frame = self.make_frame(function,
+                                    function_call.source_position,
+                                    [exp.accept(self) for exp in function_call.args])
+        return self.call_function(function, function_call, new_frame)
+
+    def visit_typed_function_call(self, function_call: TypedFunctionCall):
+        function = self.functions[function_call.function]
+        new_frame = self.make_frame(function,
+                                    function_call.source_position,
+                                    [exp.accept(self) for exp in function_call.args],
+                                    params_checked=True)
+        return self.call_function(function, function_call, new_frame)
+
+    def call_function(self, function: ResolvedFunction, function_call: BoundFunctionCall, new_frame: SlotFrame):
         self.frames_stack.append(self.current_frame)
         if len(self.frames_stack) == 10:
             raise RunTimeEnvError(function_call.source_position, RuntimeErrorCode.INFINITE_RECURSION, function_call.id)
         self.current_frame = new_frame
-        return function_declaration.statements.accept(self)
+        caller = self.function
+        self.function = function
+        return_value = run_visit(function.statements.accept(self))
+        self.function = caller
+        return return_value
+
+    # statements and while statements are visited by generators, see run_visit, and the visit of an if statement
+    # is the visit of its block, None when its condition is false
 
-    def visit_statements(self, statements: Statements):
+    def visit_statements(self, statements: Statements) -> Generator:
         for statement in statements.list_of_statements:
             return_value = statement.accept(self)
+            if return_value is not None and isinstance(statement, BLOCK_STATEMENTS):
+                return_value = yield return_value
             if return_value is not None:
                 return return_value
         return None
 
-    def visit_assignment(self, assignment: Assignment):
-        var_id = assignment.id
-        var = self.get_variable(var_id, assignment.source_position)
+    def visit_bound_assignment(self, assignment: BoundAssignment):
+        var = self.get_local_variables()[assignment.slot]
+        if var is NOT_DECLARED:
+            var = self.get_global_variable(assignment.id, assignment.global_slot, assignment.source_position)
         value = assignment.expression.accept(self)
 
         self.check_type(type(var), value, assignment.source_position)
-        self.current_frame.local_variables[var_id] = value
+        # the value is stored into the frame which is current after the expression, whose calls can change it
+        self.get_local_variables()[assignment.slot] = value
 
-    def visit_if_statement(self, if_statement: IfStatement):
+    def visit_typed_assignment(self, assignment: TypedAssignment):
+        local_variables = self.get_local_variables()
+        if local_variables[assignment.slot] is NOT_DECLARED:
+            self.get_global_variable(assignment.id, assignment.global_slot, assignment.source_position)
+        local_variables[assignment.slot] = assignment.expression.accept(self)
+
+    def visit_if_statement(self, if_statement: IfStatement) -> Optional[Generator]:
         condition = if_statement.expression.accept(self)
         self.check_type(bool, condition, if_statement.expression.source_position)
         if condition:
             return if_statement.statements.accept(self)
 
-    def visit_while_statement(self, while_statement: WhileStatement):
+    def visit_typed_if_statement(self, if_statement: TypedIfStatement) -> Optional[Generator]:
+        if if_statement.expression.accept(self):
+            return if_statement.statements.accept(self)
+
+    def visit_while_statement(self, while_statement: WhileStatement) -> Generator:
+        checked = type(while_statement) is not TypedWhileStatement
         condition = while_statement.expression.accept(self)
-        self.check_type(bool, condition, while_statement.expression.source_position)
+        if checked:
+            self.check_type(bool, condition, while_statement.expression.source_position)
         i = 0
 
         while condition:
-            return_value = while_statement.statements.accept(self)
-            if return_value:
-                return return_value
+            # the statements of the body are visited here, so that an iteration makes no generator
+            for statement in while_statement.statements.list_of_statements:
+                return_value = statement.accept(self)
+                if return_value is not None and isinstance(statement, BLOCK_STATEMENTS):
+                    return_value = yield return_value
+                if return_value is not None:
+                    if return_value:
+                        return return_value
+                    break
             if i == 100:
                 raise RunTimeEnvError(while_statement.source_position,
                                       RuntimeErrorCode.INFINITE_LOOP,
                                       self.current_frame.function_name)
 
+            # only the first value of the condition is checked
             condition = while_statement.expression.accept(self)
             i += 1
 
+    visit_typed_while_statement = visit_while_statement
+
     def visit_return_statement(self, return_statement: ReturnStatement):
         return_value = return_statement.expression.accept(self)
 
@@ -131,11 +215,12 @@ class Environment:
         self.current_frame = frame
         return return_value
 
-    def visit_expression(self, expression: Expression) -> Optional[PossibleTypes]:
-        if len(expression.and_expressions) == 1:
-            and_expression = expression.and_expressions[0]
-            return and_expression.accept(self)
+    def visit_typed_return_statement(self, return_statement: TypedReturnStatement):
+        return_value = return_statement.expression.accept(self)
+        self.current_frame = self.frames_stack.pop()
+        return return_value
 
+    def visit_expression(self, expression: Expression) -> Optional[PossibleTypes]:
         and_expressions = []
         for exp in expression.and_expressions:
             exp_result = exp.accept(self)
@@ -144,10 +229,6 @@ class Environment:
         return reduce(lambda acc, x: acc or x, and_expressions)
 
     def visit_and_expression(self, expression: AndExpression) -> Optional[PossibleTypes]:
-        if len(expression.relationship_expressions) == 1:
-            relationship_expression = expression.relationship_expressions[0]
-            return relationship_expression.accept(self)
-
         relationship_expressions = []
         for exp in expression.relationship_expressions:
             exp_result = exp.accept(self)
@@ -155,10 +236,14 @@ class Environment:
             relationship_expressions.append(exp_result)
         return reduce(lambda acc, x: acc and x, relationship_expressions)
 
-    def visit_relationship_expression(self, expression: RelationshipExpression) -> Optional[PossibleTypes]:
-        if expression.right_side is None:
-            return expression.left_side.accept(self)
+    def visit_typed_expression(self, expression: TypedExpression) -> bool:
+        # all operands are evaluated, as in visit_expression
+        return any([exp.accept(self) for exp in expression.and_expressions])
 
+    def visit_typed_and_expression(self, expression: TypedAndExpression) -> bool:
+        return all([exp.accept(self) for exp in expression.relationship_expressions])
+
+    def visit_relationship_expression(self, expression: RelationshipExpression) -> Optional[PossibleTypes]:
         left_side = expression.left_side.accept(self)
         right_side = expression.right_side.accept(self)
 
@@ -168,11 +253,13 @@ class Environment:
         relationship_function = RELATIONSHIP_OPERAND_INTO_LAMBDA_EXPRESSION[operator]
         return relationship_function(left_side, right_side)
 
+    def visit_typed_relationship_expression(self, expression: TypedRelationshipExpression) -> bool:
+        left_side = expression.left_side.accept(self)
+        return RELATIONSHIP_OPERAND_INTO_LAMBDA_EXPRESSION[expression.operator](left_side,
+                                                                               expression.right_side.accept(self))
+
     def visit_arithmetic_expression(self, expression: Union[SumExpression, MultiplyExpression]) \
             -> Optional[PossibleTypes]:
-        if expression.right_side is None:
-            return expression.left_side.accept(self)
-
         left_side = expression.left_side.accept(self)
         right_side = []
         for operator, expression in expression.right_side:
@@ -186,17 +273,15 @@ class Environment:
         return accumulator
 
     def visit_type_casting_factor(self, factor: TypeCastingFactor) -> Optional[PossibleTypes]:
-        if not factor.cast_type:
-            return factor.negation_factor.accept(self)
-
         return self.cast(factor.cast_type, factor.negation_factor.accept(self), factor.source_position)
 
     def visit_negation_factor(self, negation_factor: NegationFactor):
-        if negation_factor.is_negated:
-            value = negation_factor.factor.accept(self)
-            self.check_type(bool, value, negation_factor.source_position)
-            return not value
-        return negation_factor.factor.accept(self)
+        value = negation_factor.factor.accept(self)
+        self.check_type(bool, value, negation_factor.source_position)
+        return not value
+
+    def visit_typed_negation_factor(self, negation_factor: TypedNegationFactor) -> bool:
+        return not negation_factor.factor.accept(self)
 
     def cast(self, casting_type: CustomTypeOfTypes, value: PossibleTypes, source_position: SourcePosition) \
             -> PossibleTypes:
@@ -213,17 +298,33 @@ class Environment:
         else:
             return casting_type(value)
 
-    def get_function_declaration(self, name: str, source_position: SourcePosition):
-        if name in self.functions_declarations:
-            return self.functions_declarations[name]
-        raise SemanticError(source_position, SemanticErrorCode.FUN_ID_NOT_FOUND, name)
-
-    def get_variable(self, name: str, source_position: SourcePosition) -> PossibleTypes:
-        if name in self.current_frame.local_variables:
-            return self.current_frame.local_variables[name]
-        elif name in self.global_variables:
-            return self.global_variables[name]
-        raise SemanticError(source_position, SemanticErrorCode.VAR_ID_NOT_FOUND, name)
+    def make_frame(self, function: ResolvedFunction, source_position: SourcePosition,
+                   params_values_list: List[PossibleTypes], params_checked: bool = False) -> SlotFrame:
+        if function.statements is None:
+            self.resolver.resolve_function(function)
+            self.type_checker.check_function(function)
+        return SlotFrame(function.id, function.return_type, function.params, source_position, params_values_list,
+                         function.number_of_slots, function.slots, params_checked)
+
+    def get_local_variables(self) -> Union[List[PossibleTypes], ForeignVariables]:
+        """
+        Local variables of the function being run, those of the current frame, read by the names of their slots
+        when it is the frame of another function
+        """
+        frame = self.current_frame
+        if frame.slots is self.function.slots:
+            return frame.local_variables
+        return ForeignVariables(frame, self.function.slot_names)
+
+    def get_global_variable(self, name: str, slot: int, source_position: SourcePosition) -> PossibleTypes:
+        """
+        Value of the global variable at slot, which is not declared when it is read by a declaration
+        of a global variable above its own, or when there is no global variable of the name
+        """
+        value = NOT_DECLARED if slot == NO_SLOT else self.global_variables[slot]
+        if value is NOT_DECLARED:
+            raise SemanticError(source_position, SemanticErrorCode.VAR_ID_NOT_FOUND, name)
+        return value
 
     def get_currency_declaration(self, name: str, source_position: SourcePosition):
         if name in self.currency_declarations:
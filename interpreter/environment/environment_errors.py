@@ -43,5 +43,12 @@ class SemanticTypeError(Exception):
         self.expected = expected_type
         self.actual = actual_type
 
+    @property
+    def position(self) -> SourcePosition:
+        """
+        Position of the error, the same as of other errors of the environment
+        """
+        return self.source_position
+
     def __str__(self):
         return f"Wrong type: Expected {self.expected}, but get {self.actual}"
@@ -1,37 +1,112 @@
-from typing import List, Dict
+from typing import List, Dict, Sequence, Tuple, Optional
 
 from interpreter.environment.environment_errors import SemanticError, SemanticErrorCode, SemanticTypeError
-from interpreter.models.constants import PossibleTypes, CurrencyValue, CurrencyType
-from interpreter.models.declarations import FunctionDeclaration
+from interpreter.models.constants import PossibleTypes, CurrencyValue, CurrencyType, CustomTypeOfTypes
 from interpreter.source.source_position import SourcePosition
 
+# value of a slot of a variable which is not declared yet, None is the value of a variable without one
+NOT_DECLARED = object()
+
+
+def check_params(function_name: str, params: Sequence[Tuple[str, CustomTypeOfTypes]],
+                 source_position: SourcePosition, params_values_list: List[PossibleTypes]):
+    if len(params) != len(params_values_list):
+        raise SemanticError(source_position, SemanticErrorCode.WRONG_NUMBER_OF_PARAMS, function_name)
+
+    for (_, param_type), param_value in zip(params, params_values_list):
+        if isinstance(param_value, CurrencyValue) and isinstance(param_type, CurrencyType):
+            if param_value.name != param_type.name:
+                raise SemanticTypeError(source_position, param_type, type(param_value))
+        elif param_type != type(param_value):
+            raise SemanticTypeError(source_position, param_type, type(param_value))
+
+
+def check_return_value(return_value_type: CustomTypeOfTypes, value: PossibleTypes, source_position: SourcePosition):
+    if isinstance(value, CurrencyValue) and isinstance(return_value_type, CurrencyType):
+        if value.name != return_value_type.name:
+            raise SemanticTypeError(source_position, return_value_type, value)
+    elif type(value) != return_value_type:
+        raise SemanticTypeError(source_position, return_value_type, type(value))
+
 
 class Frame:
-    def __init__(self, function_declaration: FunctionDeclaration, source_position: SourcePosition,
+    def __init__(self, function_name: str, return_value_type: CustomTypeOfTypes,
+                 params: Sequence[Tuple[str, CustomTypeOfTypes]], source_position: SourcePosition,
                  params_values_list: List[PossibleTypes]):
-        self.local_variables: Dict[str, PossibleTypes] = {}
-        self.function_name = function_declaration.id
-        self.return_value_type = function_declaration.return_type
+        """
+        params are ids and types of params of the function
+        """
+        check_params(function_name, params, source_position, params_values_list)
+        self.local_variables: Dict[str, PossibleTypes] = {
+            param_id: param_value for (param_id, _), param_value in zip(params, params_values_list)
+        }
+        self.function_name = function_name
+        self.return_value_type = return_value_type
         self.return_value = None
 
-        if len(function_declaration.params) != len(params_values_list):
-            raise SemanticError(source_position, SemanticErrorCode.WRONG_NUMBER_OF_PARAMS, function_declaration.id)
-
-        for param, param_value in zip(function_declaration.params, params_values_list):
-            if isinstance(param_value, CurrencyValue) and isinstance(param.type, CurrencyType):
-                if param_value.name != param.type.name:
-                    raise SemanticTypeError(source_position, param.type, type(param_value))
-            elif param.type != type(param_value):
-                raise SemanticTypeError(source_position, param.type, type(param_value))
-            self.local_variables[param.id] = param_value
-
     def check_return_value(self, value: PossibleTypes, source_position: SourcePosition) -> bool:
-        if isinstance(value, CurrencyValue) and isinstance(self.return_value_type, CurrencyType):
-            if value.name != self.return_value_type.name:
-                raise SemanticTypeError(source_position, self.return_value_type, value)
-            self.return_value = value
-            return True
-        elif type(value) != self.return_value_type:
-            raise SemanticTypeError(source_position, self.return_value_type, type(value))
+        check_return_value(self.return_value_type, value, source_position)
         self.return_value = value
         return True
+
+
+class SlotFrame(Frame):
+    """
+    Frame of a function bound by Resolver, which keeps local variables in a list of number_of_slots values
+    at slots given by the resolver, params in the first ones, instead of a dict of their names.
+    Slots of variables which are not declared yet hold NOT_DECLARED.
+    slots are the slots of the variables of the function by their names, which other functions read the frame by,
+    see ForeignVariables.
+    params_checked tells that TypeChecker proved the values of params, so they are not checked again.
+    """
+
+    def __init__(self, function_name: str, return_value_type: CustomTypeOfTypes,
+                 params: Sequence[Tuple[str, CustomTypeOfTypes]], source_position: SourcePosition,
+                 params_values_list: List[PossibleTypes], number_of_slots: int, slots: Dict[str, int],
+                 params_checked: bool = False):
+        if not params_checked:
+            check_params(function_name, params, source_position, params_values_list)
+        self.local_variables: List[PossibleTypes] = \
+            params_values_list + [NOT_DECLARED] * (number_of_slots - len(params_values_list))
+        self.slots = slots
+        self.function_name = function_name
+        self.return_value_type = return_value_type
+        self.return_value = None
+
+
+class ForeignVariables:
+    """
+    Local variables of a function in the current frame when it is the frame of another function: a return statement
+    in a loop pops the frame of the function it is in, and a function ending without one leaves its frame current
+    for its caller. Slots of the function are read and written by their names, with the slots of the frame,
+    the same way as variables were looked up in the dict of a Frame, so a variable the frame has no slot for
+    is NOT_DECLARED until it is written. Writing it gives the frame a new slot in a copy of its slots,
+    so the frame is not taken for a frame of its function any more.
+    """
+    __slots__ = ('frame', 'names')
+
+    def __init__(self, frame, names: Sequence[Optional[str]]):
+        """
+        frame is a frame with slots, names are the names of the slots of the function
+        """
+        self.frame = frame
+        self.names = names
+
+    def get_variable(self, name: str) -> PossibleTypes:
+        slot = self.frame.slots.get(name)
+        return NOT_DECLARED if slot is None else self.frame.local_variables[slot]
+
+    def set_variable(self, name: str, value: PossibleTypes):
+        frame = self.frame
+        slot = frame.slots.get(name)
+        if slot is None:
+            frame.slots = {**frame.slots, name: len(frame.local_variables)}
+            frame.local_variables.append(value)
+        else:
+            frame.local_variables[slot] = value
+
+    def __getitem__(self, slot: int) -> PossibleTypes:
+        return self.get_variable(self.names[slot])
+
+    def __setitem__(self, slot: int, value: PossibleTypes):
+        self.set_variable(self.names[slot], value)
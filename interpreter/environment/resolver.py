@@ -0,0 +1,243 @@
+from typing import Dict, Generator, List, Optional, Set, Tuple, Union
+
+from interpreter.environment.environment_errors import SemanticError, SemanticErrorCode
+from interpreter.models.base import Constant, Variable, FunctionCall, Assignment
+from interpreter.models.bound import NO_SLOT, LocalVariable, GlobalVariable, BoundAssignment, \
+    BoundVariableDeclaration, BoundFunctionCall
+from interpreter.models.constants import CustomTypeOfTypes
+from interpreter.models.declarations import ParseTree, VariableDeclaration, CurrencyDeclaration, FunctionDeclaration
+from interpreter.models.expressions import Expression, AndExpression, RelationshipExpression, MultiplyExpression, \
+    SumExpression, TypeCastingFactor, NegationFactor, ExpressionTypes
+from interpreter.models.statements import ReturnStatement, IfStatement, Statements, WhileStatement, \
+    BLOCK_STATEMENTS, run_visit
+from interpreter.parser.parser import FunctionBody
+from interpreter.source.source_position import SourcePosition
+
+
+class ResolvedFunction:
+    """
+    Declared function with its statements bound by Resolver, the number of slots of its frames, the slots
+    of its variables by their names and their names by their slots, all None until the statements of a function
+    parsed lazily are bound at its first call
+    """
+    __slots__ = ('declaration', 'id', 'return_type', 'params', 'statements', 'number_of_slots', 'slots',
+                 'slot_names')
+
+    def __init__(self, declaration: FunctionDeclaration):
+        self.declaration = declaration
+        self.id = declaration.id
+        self.return_type = declaration.return_type
+        self.params: Tuple[Tuple[str, CustomTypeOfTypes], ...] = tuple(
+            (param.id, param.type) for param in declaration.params
+        )
+        self.statements: Optional[Statements] = None
+        self.number_of_slots: Optional[int] = None
+        self.slots: Optional[Dict[str, int]] = None
+        self.slot_names: Optional[List[Optional[str]]] = None
+
+
+class Resolver:
+    """
+    Pass between parsing and running a program, which binds every variable, assignment and declaration
+    of a variable to a slot of the frame of its function or of global variables, and every function call
+    to the function it calls, so Environment never looks names up. Names which are not declared anywhere
+    are reported before the program runs.
+    Variables keep the scoping of lookups by name: all blocks of a function share its variables, a local
+    variable is visible after its declaration runs, before that a global variable of the same name is,
+    and an assignment writes the variable of the function, also when it assigns a global one.
+    So a function has a slot for each param, each variable it declares and each global variable it assigns.
+    Bodies of functions parsed lazily are bound when they are called for the first time.
+    """
+
+    def __init__(self, parse_tree: ParseTree):
+        self.global_slots: Dict[str, int] = {}
+        self.function_indexes: Dict[str, int] = {}
+        self.functions: List[ResolvedFunction] = []
+        self.currency_declarations: Dict[str, CurrencyDeclaration] = {}
+        # slots of variables of the function being bound, None in declarations of global variables
+        self.local_slots: Optional[Dict[str, int]] = None
+
+        global_declarations = []
+        for declaration in parse_tree.declarations:
+            if isinstance(declaration, FunctionDeclaration):
+                self.declare(self.function_indexes, declaration.id, len(self.functions), declaration.source_position)
+                self.functions.append(ResolvedFunction(declaration))
+            elif isinstance(declaration, CurrencyDeclaration):
+                self.declare(self.currency_declarations, declaration.name, declaration, declaration.source_position)
+            else:
+                self.declare(self.global_slots, declaration.id, len(self.global_slots), declaration.source_position)
+                global_declarations.append(declaration)
+
+        self.global_declarations: List[BoundVariableDeclaration] = [
+            declaration.accept(self, True) for declaration in global_declarations
+        ]
+        for function in self.functions:
+            statements = function.declaration.statements
+            if not isinstance(statements, FunctionBody) or statements.is_parsed():
+                self.resolve_function(function)
+
+    @staticmethod
+    def declare(declarations: dict, name: str, value, source_position: SourcePosition):
+        if name in declarations:
+            raise SemanticError(source_position, SemanticErrorCode.DUPLICATE_ID, name)
+        declarations[name] = value
+
+    def resolve_function(self, function: ResolvedFunction) -> Statements:
+        """
+        Binds the statements of the function, parsing them first when they are parsed lazily
+        """
+        declaration = function.declaration
+        statements = declaration.statements
+        if isinstance(statements, FunctionBody):
+            statements = statements.get_statements()
+        declared: Set[str] = set()
+        assigned: Set[str] = set()
+        self.collect_names(statements, declared, assigned)
+
+        # params take the first slots, a repeated param takes the slot of its last occurrence, as its value is set last
+        self.local_slots = {param.id: index for index, param in enumerate(declaration.params)}
+        number_of_slots = len(declaration.params)
+        for name in sorted(declared | (assigned & self.global_slots.keys())):
+            if name not in self.local_slots:
+                self.local_slots[name] = number_of_slots
+                number_of_slots += 1
+        function.statements = run_visit(statements.accept(self))
+        function.number_of_slots = number_of_slots
+        function.slots = self.local_slots
+        function.slot_names = [None] * number_of_slots
+        for name, slot in self.local_slots.items():
+            function.slot_names[slot] = name
+        self.local_slots = None
+        return function.statements
+
+    def collect_names(self, statements: Statements, declared: Set[str], assigned: Set[str]):
+        """
+        Adds names of variables declared and assigned by statements, also in their blocks
+        """
+        blocks = [statements]
+        while blocks:
+            for statement in blocks.pop().list_of_statements:
+                if isinstance(statement, VariableDeclaration):
+                    declared.add(statement.id)
+                elif isinstance(statement, Assignment):
+                    assigned.add(statement.id)
+                elif isinstance(statement, BLOCK_STATEMENTS):
+                    blocks.append(statement.statements)
+
+    def get_slots(self, name: str, source_position: SourcePosition) -> Tuple[int, int]:
+        """
+        Local and global slot of the variable, NO_SLOT when it has none of them
+        """
+        global_slot = self.global_slots.get(name, NO_SLOT)
+        slot = NO_SLOT if self.local_slots is None else self.local_slots.get(name, NO_SLOT)
+        if slot == NO_SLOT and global_slot == NO_SLOT:
+            raise SemanticError(source_position, SemanticErrorCode.VAR_ID_NOT_FOUND, name)
+        return slot, global_slot
+
+    def visit_variable_declaration(self, declaration: VariableDeclaration,
+                                   global_declaration: bool) -> BoundVariableDeclaration:
+        slots = self.global_slots if global_declaration else self.local_slots
+        return BoundVariableDeclaration(declaration.source_position, declaration.type, declaration.id,
+                                        slots[declaration.id], declaration.expression.accept(self))
+
+    # statements and blocks are visited by generators, see run_visit
+
+    def visit_statements(self, statements: Statements) -> Generator:
+        list_of_statements = []
+        for statement in statements.list_of_statements:
+            resolved_statement = statement.accept(self)
+            if isinstance(statement, BLOCK_STATEMENTS):
+                resolved_statement = yield resolved_statement
+            list_of_statements.append(resolved_statement)
+        return Statements(tuple(list_of_statements))
+
+    def visit_assignment(self, assignment: Assignment) -> BoundAssignment:
+        slot, global_slot = self.get_slots(assignment.id, assignment.source_position)
+        return BoundAssignment(assignment.source_position, assignment.id, slot, global_slot,
+                               assignment.expression.accept(self))
+
+    def visit_if_statement(self, if_statement: IfStatement) -> Generator:
+        expression = if_statement.expression.accept(self)
+        return IfStatement(if_statement.source_position, expression, (yield if_statement.statements.accept(self)))
+
+    def visit_while_statement(self, while_statement: WhileStatement) -> Generator:
+        expression = while_statement.expression.accept(self)
+        return WhileStatement(while_statement.source_position, expression,
+                              (yield while_statement.statements.accept(self)))
+
+    def visit_return_statement(self, return_statement: ReturnStatement) -> ReturnStatement:
+        if return_statement.expression is None:
+            return return_statement
+        return ReturnStatement(return_statement.source_position, return_statement.expression.accept(self))
+
+    def visit_function_call(self, function_call: FunctionCall) -> BoundFunctionCall:
+        function = self.function_indexes.get(function_call.id)
+        if function is None:
+            raise SemanticError(function_call.source_position, SemanticErrorCode.FUN_ID_NOT_FOUND, function_call.id)
+        return BoundFunctionCall(function_call.source_position, function_call.id, function,
+                                 tuple(argument.accept(self) for argument in function_call.args))
+
+    def visit_constant(self, constant: Constant) -> Constant:
+        return constant
+
+    def visit_variable(self, variable: Variable) -> Union[LocalVariable, GlobalVariable]:
+        slot, global_slot = self.get_slots(variable.id, variable.source_position)
+        if slot == NO_SLOT:
+            return GlobalVariable(variable.source_position, variable.id, global_slot)
+        return LocalVariable(variable.source_position, variable.id, slot, global_slot)
+
+    # expressions without variables and function calls are kept, so they stay the occurrences HashConsingBuilder found
+
+    def visit_expression(self, expression: Expression) -> Expression:
+        operands = self.resolve_operands(expression.and_expressions)
+        if operands is expression.and_expressions:
+            return expression
+        return Expression(expression.source_position, operands)
+
+    def visit_and_expression(self, expression: AndExpression) -> AndExpression:
+        operands = self.resolve_operands(expression.relationship_expressions)
+        if operands is expression.relationship_expressions:
+            return expression
+        return AndExpression(expression.source_position, operands)
+
+    def resolve_operands(self, operands: Tuple[ExpressionTypes, ...]) -> Tuple[ExpressionTypes, ...]:
+        """
+        Bound operands, the same tuple when none of them changed
+        """
+        resolved_operands = tuple([operand.accept(self) for operand in operands])
+        for resolved_operand, operand in zip(resolved_operands, operands):
+            if resolved_operand is not operand:
+                return resolved_operands
+        return operands
+
+    def visit_relationship_expression(self, expression: RelationshipExpression) -> RelationshipExpression:
+        left_side = expression.left_side.accept(self)
+        right_side = None if expression.right_side is None else expression.right_side.accept(self)
+        if left_side is expression.left_side and right_side is expression.right_side:
+            return expression
+        return RelationshipExpression(expression.source_position, left_side, expression.operator, right_side)
+
+    def visit_arithmetic_expression(self, expression: Union[SumExpression, MultiplyExpression]) \
+            -> Union[SumExpression, MultiplyExpression]:
+        left_side = expression.left_side.accept(self)
+        changed = left_side is not expression.left_side
+        right_side = []
+        for operator, operand in expression.right_side:
+            resolved_operand = operand.accept(self)
+            changed = changed or resolved_operand is not operand
+            right_side.append((operator, resolved_operand))
+        if not changed:
+            return expression
+        return type(expression)(expression.source_position, left_side, tuple(right_side))
+
+    def visit_type_casting_factor(self, factor: TypeCastingFactor) -> TypeCastingFactor:
+        negation_factor = factor.negation_factor.accept(self)
+        if negation_factor is factor.negation_factor:
+            return factor
+        return TypeCastingFactor(factor.source_position, negation_factor, factor.cast_type)
+
+    def visit_negation_factor(self, negation_factor: NegationFactor) -> NegationFactor:
+        factor = negation_factor.factor.accept(self)
+        if factor is negation_factor.factor:
+            return negation_factor
+        return NegationFactor(negation_factor.source_position, factor, negation_factor.is_negated)
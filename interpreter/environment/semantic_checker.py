@@ -0,0 +1,148 @@
+from typing import Dict, Generator, Set, Union
+
+from interpreter.environment.environment_errors import SemanticError, SemanticErrorCode
+from interpreter.models.base import Constant, Variable, FunctionCall, Assignment
+from interpreter.models.constants import CurrencyValue
+from interpreter.models.declarations import ParseTree, VariableDeclaration, CurrencyDeclaration, FunctionDeclaration
+from interpreter.models.expressions import Expression, AndExpression, RelationshipExpression, MultiplyExpression, \
+    SumExpression, TypeCastingFactor, NegationFactor
+from interpreter.models.statements import ReturnStatement, IfStatement, Statements, WhileStatement, \
+    BLOCK_STATEMENTS, run_visit
+from interpreter.source.source_position import SourcePosition
+
+
+class SemanticChecker:
+    """
+    Finds semantic errors of a program without running it: duplicate declarations, missing main,
+    calls of undeclared functions or with a wrong number of arguments, and variables and currencies used
+    without a declaration. The first one found is raised as the SemanticError Environment raises
+    when it runs the erroneous code.
+    Variables of a function are visible after their declaration until its end, the same as in Environment,
+    where blocks share the variables of the function. Every function is checked, also the ones never called,
+    so errors Environment would raise only on a path which is not taken are reported as well.
+    """
+
+    def __init__(self, parse_tree: ParseTree):
+        self.parse_tree = parse_tree
+        self.global_variables: Set[str] = set()
+        self.functions_declarations: Dict[str, FunctionDeclaration] = {}
+        self.currency_declarations: Dict[str, CurrencyDeclaration] = {}
+        self.local_variables: Set[str] = set()
+
+    def check(self):
+        """
+        Raises the first semantic error of the program
+        """
+        for declaration in self.parse_tree.declarations:
+            if isinstance(declaration, FunctionDeclaration):
+                self.add_declaration(self.functions_declarations, declaration.id, declaration)
+            elif isinstance(declaration, CurrencyDeclaration):
+                self.add_declaration(self.currency_declarations, declaration.name, declaration)
+            elif isinstance(declaration, VariableDeclaration):
+                # all global variables are declared before main runs, so functions see also the ones below them
+                if declaration.id in self.global_variables:
+                    raise SemanticError(declaration.source_position, SemanticErrorCode.DUPLICATE_ID, declaration.id)
+                self.global_variables.add(declaration.id)
+        main_function = self.functions_declarations.get('main')
+        if main_function is None:
+            raise SemanticError(SourcePosition(0, 0), SemanticErrorCode.FUN_ID_NOT_FOUND, 'main')
+        if main_function.params:
+            raise SemanticError(SourcePosition(0, 0), SemanticErrorCode.WRONG_NUMBER_OF_PARAMS, 'main')
+
+        for declaration in self.parse_tree.declarations:
+            declaration.accept(self, True)
+
+    @staticmethod
+    def add_declaration(declarations: dict, name: str, declaration: Union[FunctionDeclaration, CurrencyDeclaration]):
+        if name in declarations:
+            raise SemanticError(declaration.source_position, SemanticErrorCode.DUPLICATE_ID, name)
+        declarations[name] = declaration
+
+    def visit_variable_declaration(self, declaration: VariableDeclaration, global_declaration: bool):
+        declaration.expression.accept(self)
+        if global_declaration:
+            return
+        if declaration.id in self.local_variables:
+            raise SemanticError(declaration.source_position, SemanticErrorCode.DUPLICATE_ID, declaration.id)
+        self.local_variables.add(declaration.id)
+
+    def visit_currency_declaration(self, declaration: CurrencyDeclaration):
+        pass
+
+    def visit_function_declaration(self, declaration: FunctionDeclaration):
+        self.local_variables = set()
+        for param in declaration.params:
+            if param.id in self.local_variables:
+                raise SemanticError(param.source_position, SemanticErrorCode.DUPLICATE_ID, param.id)
+            self.local_variables.add(param.id)
+        run_visit(declaration.statements.accept(self))
+
+    # statements and blocks are visited by generators, see run_visit
+
+    def visit_statements(self, statements: Statements) -> Generator:
+        for statement in statements.list_of_statements:
+            visit = statement.accept(self)
+            if isinstance(statement, BLOCK_STATEMENTS):
+                yield visit
+
+    def visit_assignment(self, assignment: Assignment):
+        self.check_variable(assignment.id, assignment.source_position)
+        assignment.expression.accept(self)
+
+    def visit_if_statement(self, if_statement: IfStatement) -> Generator:
+        if_statement.expression.accept(self)
+        yield if_statement.statements.accept(self)
+
+    def visit_while_statement(self, while_statement: WhileStatement) -> Generator:
+        while_statement.expression.accept(self)
+        yield while_statement.statements.accept(self)
+
+    def visit_return_statement(self, return_statement: ReturnStatement):
+        if return_statement.expression is not None:
+            return_statement.expression.accept(self)
+
+    def visit_function_call(self, function_call: FunctionCall):
+        function_declaration = self.functions_declarations.get(function_call.id)
+        if function_declaration is None:
+            raise SemanticError(function_call.source_position, SemanticErrorCode.FUN_ID_NOT_FOUND, function_call.id)
+        for argument in function_call.args:
+            argument.accept(self)
+        if len(function_call.args) != len(function_declaration.params):
+            raise SemanticError(function_call.source_position, SemanticErrorCode.WRONG_NUMBER_OF_PARAMS,
+                                function_call.id)
+
+    def visit_constant(self, constant: Constant):
+        value = constant.value
+        if isinstance(value, CurrencyValue) and value.name not in self.currency_declarations:
+            raise SemanticError(constant.source_position, SemanticErrorCode.CURR_ID_NOT_FOUND, value.name)
+
+    def visit_variable(self, variable: Variable):
+        self.check_variable(variable.id, variable.source_position)
+
+    def check_variable(self, name: str, source_position: SourcePosition):
+        if name not in self.local_variables and name not in self.global_variables:
+            raise SemanticError(source_position, SemanticErrorCode.VAR_ID_NOT_FOUND, name)
+
+    def visit_expression(self, expression: Expression):
+        for and_expression in expression.and_expressions:
+            and_expression.accept(self)
+
+    def visit_and_expression(self, expression: AndExpression):
+        for relationship_expression in expression.relationship_expressions:
+            relationship_expression.accept(self)
+
+    def visit_relationship_expression(self, expression: RelationshipExpression):
+        expression.left_side.accept(self)
+        if expression.right_side is not None:
+            expression.right_side.accept(self)
+
+    def visit_arithmetic_expression(self, expression: Union[SumExpression, MultiplyExpression]):
+        expression.left_side.accept(self)
+        for _, operand in expression.right_side:
+            operand.accept(self)
+
+    def visit_type_casting_factor(self, factor: TypeCastingFactor):
+        factor.negation_factor.accept(self)
+
+    def visit_negation_factor(self, negation_factor: NegationFactor):
+        negation_factor.factor.accept(self)
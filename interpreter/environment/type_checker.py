@@ -0,0 +1,498 @@
+from typing import Dict, Generator, List, Optional, Set, Tuple, Type, Union
+
+from interpreter.environment.constant_folder import ConstantFolder
+from interpreter.environment.environment_errors import SemanticTypeError
+from interpreter.environment.resolver import Resolver, ResolvedFunction
+from interpreter.models.base import Constant
+from interpreter.models.bound import NO_SLOT, LocalVariable, GlobalVariable, BoundAssignment, \
+    BoundVariableDeclaration, BoundFunctionCall
+from interpreter.models.constants import CurrencyType, CurrencyValue, CustomTypeOfTypes, SumOperator, MulOperator
+from interpreter.models.expressions import Expression, AndExpression, RelationshipExpression, MultiplyExpression, \
+    SumExpression, TypeCastingFactor, NegationFactor, ExpressionTypes
+from interpreter.models.statements import ReturnStatement, IfStatement, Statements, WhileStatement, \
+    BLOCK_STATEMENTS, run_visit
+from interpreter.models.typed import TypedVariableDeclaration, TypedAssignment, TypedIfStatement, \
+    TypedWhileStatement, TypedReturnStatement, TypedFunctionCall, TypedExpression, TypedAndExpression, \
+    TypedRelationshipExpression, TypedNegationFactor
+from interpreter.source.source_position import SourcePosition
+
+# static type of the values of an expression: int, float, str, bool or CurrencyType of the currency of them,
+# CurrencyValue when they are of any currency, and None when their type is not known
+StaticType = Optional[Union[Type, CurrencyType]]
+# type of a slot no value is written to
+NO_VALUES = object()
+NUMBER_TYPES = (int, float, bool)
+
+
+def get_value_class(static_type: StaticType) -> Optional[Type]:
+    """
+    Class of the values of the static type, which Environment compares in type checks of assignments
+    """
+    if type(static_type) is CurrencyType:
+        return CurrencyValue
+    return static_type
+
+
+def join_types(first: StaticType, second: StaticType) -> StaticType:
+    """
+    Static type of the values of both types
+    """
+    if first is NO_VALUES or first == second:
+        return second
+    if second is NO_VALUES:
+        return first
+    if first is not None and get_value_class(first) is CurrencyValue and get_value_class(second) is CurrencyValue:
+        return CurrencyValue
+    return None
+
+
+def is_proven(expected: CustomTypeOfTypes, actual: StaticType) -> bool:
+    """
+    Whether Environment.check_type of the expected type passes for every value of the static type
+    """
+    if actual is None:
+        return False
+    if isinstance(expected, CurrencyType):
+        return actual == expected
+    return get_value_class(actual) is expected
+
+
+def is_mismatch(expected: CustomTypeOfTypes, actual: StaticType) -> bool:
+    """
+    Whether Environment.check_type of the expected type fails for every value of the static type
+    """
+    if actual is None:
+        return False
+    if get_value_class(actual) is not get_value_class(expected):
+        return True
+    return isinstance(expected, CurrencyType) and isinstance(actual, CurrencyType) and actual != expected
+
+
+def get_arithmetic_type(operator: Union[SumOperator, MulOperator], left_type: StaticType,
+                        right_type: StaticType) -> StaticType:
+    """
+    Static type of the result of the operator, the same as Python gives for the values of the types
+    """
+    if get_value_class(left_type) is CurrencyValue:
+        # operators of CurrencyValue keep the currency of the left side, there is no modulo of currencies
+        return None if operator is MulOperator.MODULO else left_type
+    if left_type in NUMBER_TYPES and right_type in NUMBER_TYPES:
+        if operator is MulOperator.DIV or float in (left_type, right_type):
+            return float
+        return int
+    if operator is SumOperator.ADD and left_type is str and right_type is str:
+        return str
+    if operator is MulOperator.MUL and (left_type is str and right_type in (int, bool)
+                                        or right_type is str and left_type in (int, bool)):
+        return str
+    return None
+
+
+class CallCollector:
+    """
+    Collects the functions called by bound statements of a function, its declarations and assignments,
+    and whether its statements have calls as statements, returns inside of while statements and a return
+    outside of any block
+    """
+
+    def __init__(self, statements: Statements):
+        self.called: Set[int] = set()
+        self.has_call_statement = False
+        self.has_return_in_loop = False
+        self.has_return = any(type(statement) is ReturnStatement for statement in statements.list_of_statements)
+        self.declared_types: List[Tuple[int, CustomTypeOfTypes]] = []
+        self.assignments: List[BoundAssignment] = []
+        self.loop_depth = 0
+        run_visit(statements.accept(self))
+
+    # statements and blocks are visited by generators, see run_visit
+
+    def visit_statements(self, statements: Statements) -> Generator:
+        for statement in statements.list_of_statements:
+            if type(statement) is BoundFunctionCall:
+                self.has_call_statement = True
+            visit = statement.accept(self)
+            if isinstance(statement, BLOCK_STATEMENTS):
+                yield visit
+
+    def visit_bound_variable_declaration(self, declaration: BoundVariableDeclaration, global_declaration: bool):
+        self.declared_types.append((declaration.slot, declaration.type))
+        declaration.expression.accept(self)
+
+    def visit_bound_assignment(self, assignment: BoundAssignment):
+        self.assignments.append(assignment)
+        assignment.expression.accept(self)
+
+    def visit_if_statement(self, if_statement: IfStatement) -> Generator:
+        if_statement.expression.accept(self)
+        yield if_statement.statements.accept(self)
+
+    def visit_while_statement(self, while_statement: WhileStatement) -> Generator:
+        while_statement.expression.accept(self)
+        self.loop_depth += 1
+        yield while_statement.statements.accept(self)
+        self.loop_depth -= 1
+
+    def visit_return_statement(self, return_statement: ReturnStatement):
+        if self.loop_depth > 0:
+            self.has_return_in_loop = True
+        if return_statement.expression is not None:
+            return_statement.expression.accept(self)
+
+    def visit_bound_function_call(self, function_call: BoundFunctionCall):
+        self.called.add(function_call.function)
+        for argument in function_call.args:
+            argument.accept(self)
+
+    def visit_constant(self, constant: Constant):
+        pass
+
+    def visit_local_variable(self, variable: LocalVariable):
+        pass
+
+    def visit_global_variable(self, variable: GlobalVariable):
+        pass
+
+    def visit_expression(self, expression: Expression):
+        for operand in expression.and_expressions:
+            operand.accept(self)
+
+    def visit_and_expression(self, expression: AndExpression):
+        for operand in expression.relationship_expressions:
+            operand.accept(self)
+
+    def visit_relationship_expression(self, expression: RelationshipExpression):
+        expression.left_side.accept(self)
+        expression.right_side.accept(self)
+
+    def visit_arithmetic_expression(self, expression: Union[SumExpression, MultiplyExpression]):
+        expression.left_side.accept(self)
+        for _, operand in expression.right_side:
+            operand.accept(self)
+
+    def visit_type_casting_factor(self, factor: TypeCastingFactor):
+        factor.negation_factor.accept(self)
+
+    def visit_negation_factor(self, negation_factor: NegationFactor):
+        negation_factor.factor.accept(self)
+
+
+class TypeChecker:
+    """
+    Pass after Resolver, which infers static types of expressions of the bound tree and proves type checks
+    of Environment before the program runs: of declarations, assignments, conditions of if and while statements,
+    operands of ||, && and relationship operators, params of calls and returned values, with names of currencies.
+    Nodes whose checks are proven are replaced by typed ones, which Environment runs without checking types,
+    and a check which fails for every value of its expression is reported as SemanticTypeError, also in functions
+    which are not called. Checks which are not proven stay in the tree.
+    Values of local variables and returned values are typed only in functions whose frame stays the current frame
+    while their statements run, which a call as a statement, a return inside of a while statement, or a call
+    of a function ending without a return would break. An assignment can change the currency of a variable.
+    Bodies of functions parsed lazily are checked when they are bound at their first call.
+    Checked declarations of global variables and statements of functions are folded by ConstantFolder.
+    """
+
+    def __init__(self, resolver: Resolver):
+        self.resolver = resolver
+        self.functions: List[ResolvedFunction] = resolver.functions
+        self.global_types: List[StaticType] = [None] * len(resolver.global_slots)
+        for declaration in resolver.global_declarations:
+            self.global_types[declaration.slot] = declaration.type
+
+        # state of the function being checked, or of declarations of global variables
+        self.function: Optional[ResolvedFunction] = None
+        self.keeps_frame = False
+        self.slot_types: List[StaticType] = []
+        # while types of slots are inferred errors are not reported, as the types are not known yet
+        self.inferring = False
+
+        collectors: Dict[int, CallCollector] = {
+            index: CallCollector(function.statements)
+            for index, function in enumerate(self.functions) if function.statements is not None
+        }
+        # whether a call of the function returns a value of its return type and makes the frame of the caller current
+        self.returns_to_caller: List[bool] = [False] * len(self.functions)
+        # whether the frame of the function stays the current frame while its statements run
+        self.keeps_frames: List[bool] = [False] * len(self.functions)
+        for index, collector in collectors.items():
+            self.returns_to_caller[index] = self.returns_by_itself(collector)
+        changed = True
+        while changed:
+            changed = False
+            for index, collector in collectors.items():
+                if self.returns_to_caller[index] and not self.calls_returning_functions(collector):
+                    self.returns_to_caller[index] = False
+                    changed = True
+
+        self.constant_folder = ConstantFolder(resolver.currency_declarations)
+        self.global_declarations: List[BoundVariableDeclaration] = self.constant_folder.fold_global_declarations([
+            declaration.accept(self, True) for declaration in resolver.global_declarations
+        ])
+        for index, collector in collectors.items():
+            self.check_statements(self.functions[index], collector)
+
+    @staticmethod
+    def returns_by_itself(collector: CallCollector) -> bool:
+        return collector.has_return and not collector.has_return_in_loop and not collector.has_call_statement
+
+    def calls_returning_functions(self, collector: CallCollector) -> bool:
+        return all(self.returns_to_caller[function] for function in collector.called)
+
+    def check_function(self, function: ResolvedFunction):
+        """
+        Checks the statements of a function bound lazily, a function called by it which is not bound yet
+        is assumed not to return to its caller
+        """
+        collector = CallCollector(function.statements)
+        index = self.resolver.function_indexes[function.id]
+        self.returns_to_caller[index] = self.returns_by_itself(collector)
+        self.returns_to_caller[index] = self.returns_to_caller[index] and self.calls_returning_functions(collector)
+        self.check_statements(function, collector)
+
+    def check_statements(self, function: ResolvedFunction, collector: CallCollector):
+        self.function = function
+        self.keeps_frame = not collector.has_return_in_loop and self.calls_returning_functions(collector)
+        self.keeps_frames[self.resolver.function_indexes[function.id]] = self.keeps_frame
+        self.slot_types = [NO_VALUES] * function.number_of_slots
+        for slot, (_, param_type) in enumerate(function.params):
+            self.slot_types[slot] = param_type
+        for slot, declared_type in collector.declared_types:
+            self.slot_types[slot] = join_types(self.slot_types[slot], declared_type)
+
+        if self.keeps_frame:
+            self.infer_assigned_types(collector.assignments)
+        function.statements = run_visit(function.statements.accept(self))
+        self.constant_folder.fold_function(function, self.keeps_frame,
+                                           [slot for slot, _ in collector.declared_types], collector.assignments)
+        self.function = None
+        self.keeps_frame = False
+
+    def infer_assigned_types(self, assignments: List[BoundAssignment]):
+        """
+        Joins types of values assigned to slots into their types, until none of them changes.
+        An assignment keeps the class of the value of its variable, but can change its currency.
+        """
+        self.inferring = True
+        changed = True
+        while changed:
+            changed = False
+            for assignment in assignments:
+                _, expression_type = assignment.expression.accept(self)
+                variable_class = get_value_class(self.get_variable_type(assignment.slot, assignment.global_slot))
+                if expression_type is None:
+                    # the value keeps the class of the variable when the check passes
+                    expression_type = variable_class
+                elif variable_class is not None and get_value_class(expression_type) is not variable_class:
+                    # the check fails, so the value is never assigned
+                    continue
+                slot_type = join_types(self.slot_types[assignment.slot], expression_type)
+                if slot_type != self.slot_types[assignment.slot]:
+                    self.slot_types[assignment.slot] = slot_type
+                    changed = True
+        self.inferring = False
+
+    def check(self, expected: CustomTypeOfTypes, actual: StaticType, source_position: SourcePosition) -> bool:
+        """
+        Whether the check of the expected type is proven, raises SemanticTypeError when it always fails
+        """
+        if is_proven(expected, actual):
+            return True
+        if not self.inferring and is_mismatch(expected, actual):
+            raise SemanticTypeError(source_position, expected, get_value_class(actual))
+        return False
+
+    def get_variable_type(self, slot: int, global_slot: int) -> StaticType:
+        """
+        Static type of the local variable at slot, which is the global variable at global_slot until it is declared
+        """
+        if not self.keeps_frame:
+            return None
+        slot_type = self.slot_types[slot]
+        if slot >= len(self.function.params) and global_slot != NO_SLOT:
+            slot_type = join_types(slot_type, self.global_types[global_slot])
+        return None if slot_type is NO_VALUES else slot_type
+
+    def visit_bound_variable_declaration(self, declaration: BoundVariableDeclaration,
+                                         global_declaration: bool) -> BoundVariableDeclaration:
+        expression, expression_type = declaration.expression.accept(self)
+        if self.check(declaration.type, expression_type, declaration.source_position):
+            return TypedVariableDeclaration(declaration.source_position, declaration.type, declaration.id,
+                                            declaration.slot, expression)
+        if expression is declaration.expression:
+            return declaration
+        return BoundVariableDeclaration(declaration.source_position, declaration.type, declaration.id,
+                                        declaration.slot, expression)
+
+    # statements and blocks are visited by generators, see run_visit
+
+    def visit_statements(self, statements: Statements) -> Generator:
+        list_of_statements = []
+        for statement in statements.list_of_statements:
+            checked_statement = statement.accept(self)
+            if isinstance(statement, BLOCK_STATEMENTS):
+                checked_statement = yield checked_statement
+            elif type(statement) is BoundFunctionCall:
+                # a call as a statement is checked as an expression, its value is returned by Environment
+                checked_statement, _ = checked_statement
+            list_of_statements.append(checked_statement)
+        list_of_statements = tuple(list_of_statements)
+        for checked_statement, statement in zip(list_of_statements, statements.list_of_statements):
+            if checked_statement is not statement:
+                return Statements(list_of_statements)
+        return statements
+
+    def visit_bound_assignment(self, assignment: BoundAssignment) -> BoundAssignment:
+        expression, expression_type = assignment.expression.accept(self)
+        variable_type = self.get_variable_type(assignment.slot, assignment.global_slot)
+        if variable_type is not None and \
+                self.check(get_value_class(variable_type), expression_type, assignment.source_position):
+            return TypedAssignment(assignment.source_position, assignment.id, assignment.slot,
+                                   assignment.global_slot, expression)
+        if expression is assignment.expression:
+            return assignment
+        return BoundAssignment(assignment.source_position, assignment.id, assignment.slot, assignment.global_slot,
+                               expression)
+
+    def visit_if_statement(self, if_statement: IfStatement) -> Generator:
+        expression, expression_type = if_statement.expression.accept(self)
+        statements = yield if_statement.statements.accept(self)
+        if self.check(bool, expression_type, if_statement.expression.source_position):
+            return TypedIfStatement(if_statement.source_position, expression, statements)
+        if expression is if_statement.expression and statements is if_statement.statements:
+            return if_statement
+        return IfStatement(if_statement.source_position, expression, statements)
+
+    def visit_while_statement(self, while_statement: WhileStatement) -> Generator:
+        expression, expression_type = while_statement.expression.accept(self)
+        statements = yield while_statement.statements.accept(self)
+        if self.check(bool, expression_type, while_statement.expression.source_position):
+            return TypedWhileStatement(while_statement.source_position, expression, statements)
+        if expression is while_statement.expression and statements is while_statement.statements:
+            return while_statement
+        return WhileStatement(while_statement.source_position, expression, statements)
+
+    def visit_return_statement(self, return_statement: ReturnStatement) -> ReturnStatement:
+        if return_statement.expression is None:
+            return return_statement
+        expression, expression_type = return_statement.expression.accept(self)
+        # without the frame of the function the value is checked against the return type of another one
+        if self.keeps_frame and self.check(self.function.return_type, expression_type,
+                                           return_statement.source_position):
+            return TypedReturnStatement(return_statement.source_position, expression)
+        if expression is return_statement.expression:
+            return return_statement
+        return ReturnStatement(return_statement.source_position, expression)
+
+    def visit_bound_function_call(self, function_call: BoundFunctionCall) -> Tuple[BoundFunctionCall, StaticType]:
+        args = [argument.accept(self) for argument in function_call.args]
+        arg_nodes = tuple([node for node, _ in args])
+        function = self.functions[function_call.function]
+        return_type = function.return_type if self.returns_to_caller[function_call.function] else None
+        # with a wrong number of args the call fails before params are checked
+        if len(args) == len(function.params) and all([
+            self.check(param_type, arg_type, function_call.source_position)
+            for (_, param_type), (_, arg_type) in zip(function.params, args)
+        ]):
+            return TypedFunctionCall(function_call.source_position, function_call.id, function_call.function,
+                                     arg_nodes), return_type
+        if all(node is argument for node, argument in zip(arg_nodes, function_call.args)):
+            return function_call, return_type
+        return BoundFunctionCall(function_call.source_position, function_call.id, function_call.function,
+                                 arg_nodes), return_type
+
+    def visit_constant(self, constant: Constant) -> Tuple[Constant, StaticType]:
+        value = constant.value
+        if isinstance(value, CurrencyValue):
+            # a constant of a currency which is not declared fails when it is evaluated
+            if value.name not in self.resolver.currency_declarations:
+                return constant, None
+            return constant, CurrencyType(value.name)
+        return constant, type(value)
+
+    def visit_local_variable(self, variable: LocalVariable) -> Tuple[LocalVariable, StaticType]:
+        return variable, self.get_variable_type(variable.slot, variable.global_slot)
+
+    def visit_global_variable(self, variable: GlobalVariable) -> Tuple[GlobalVariable, StaticType]:
+        if self.function is not None and not self.keeps_frame:
+            # a variable of the frame of another function can hide the global variable
+            return variable, None
+        return variable, self.global_types[variable.slot]
+
+    def visit_expression(self, expression: Expression) -> Tuple[Expression, StaticType]:
+        operands, proven = self.check_bool_operands(expression.and_expressions)
+        if proven:
+            return TypedExpression(expression.source_position, operands), bool
+        if operands is expression.and_expressions:
+            return expression, bool
+        return Expression(expression.source_position, operands), bool
+
+    def visit_and_expression(self, expression: AndExpression) -> Tuple[AndExpression, StaticType]:
+        operands, proven = self.check_bool_operands(expression.relationship_expressions)
+        if proven:
+            return TypedAndExpression(expression.source_position, operands), bool
+        if operands is expression.relationship_expressions:
+            return expression, bool
+        return AndExpression(expression.source_position, operands), bool
+
+    def check_bool_operands(self, operands: Tuple[ExpressionTypes, ...]) -> Tuple[Tuple[ExpressionTypes, ...], bool]:
+        """
+        Checked operands, the same tuple when none of them changed, and whether all of them are bool
+        """
+        checked_operands = [operand.accept(self) for operand in operands]
+        proven = all([
+            self.check(bool, operand_type, operand.source_position)
+            for operand, (_, operand_type) in zip(operands, checked_operands)
+        ])
+        nodes = tuple([node for node, _ in checked_operands])
+        if all(node is operand for node, operand in zip(nodes, operands)):
+            return operands, proven
+        return nodes, proven
+
+    def visit_relationship_expression(self, expression: RelationshipExpression) \
+            -> Tuple[RelationshipExpression, StaticType]:
+        left_side, left_type = expression.left_side.accept(self)
+        right_side, right_type = expression.right_side.accept(self)
+        # the right side is checked against the class of the left one, so currencies of both can differ
+        if left_type is not None and \
+                self.check(get_value_class(left_type), right_type, expression.right_side.source_position):
+            return TypedRelationshipExpression(expression.source_position, left_side, expression.operator,
+                                               right_side), bool
+        if left_side is expression.left_side and right_side is expression.right_side:
+            return expression, bool
+        return RelationshipExpression(expression.source_position, left_side, expression.operator, right_side), bool
+
+    def visit_arithmetic_expression(self, expression: Union[SumExpression, MultiplyExpression]) \
+            -> Tuple[Union[SumExpression, MultiplyExpression], StaticType]:
+        left_side, expression_type = expression.left_side.accept(self)
+        changed = left_side is not expression.left_side
+        right_side = []
+        for operator, operand in expression.right_side:
+            checked_operand, operand_type = operand.accept(self)
+            changed = changed or checked_operand is not operand
+            expression_type = get_arithmetic_type(operator, expression_type, operand_type)
+            right_side.append((operator, checked_operand))
+        if not changed:
+            return expression, expression_type
+        return type(expression)(expression.source_position, left_side, tuple(right_side)), expression_type
+
+    def visit_type_casting_factor(self, factor: TypeCastingFactor) -> Tuple[TypeCastingFactor, StaticType]:
+        negation_factor, negation_factor_type = factor.negation_factor.accept(self)
+        cast_type = factor.cast_type
+        if not isinstance(cast_type, CurrencyType):
+            factor_type = cast_type
+        elif negation_factor_type is float or get_value_class(negation_factor_type) is CurrencyValue:
+            factor_type = cast_type
+        else:
+            # other values are not cast into currencies
+            factor_type = None
+        if negation_factor is factor.negation_factor:
+            return factor, factor_type
+        return TypeCastingFactor(factor.source_position, negation_factor, cast_type), factor_type
+
+    def visit_negation_factor(self, negation_factor: NegationFactor) -> Tuple[NegationFactor, StaticType]:
+        factor, factor_type = negation_factor.factor.accept(self)
+        if self.check(bool, factor_type, negation_factor.source_position):
+            return TypedNegationFactor(negation_factor.source_position, factor, negation_factor.is_negated), bool
+        if factor is negation_factor.factor:
+            return negation_factor, bool
+        return NegationFactor(negation_factor.source_position, factor, negation_factor.is_negated), bool
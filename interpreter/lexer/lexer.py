@@ -1,20 +1,86 @@
 import math
-from typing import Tuple, Optional
+import re
+import sys
+from itertools import islice, repeat
+from operator import itemgetter
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from interpreter.lexer.lexer_error import LexerError
+from interpreter.lexer.symbol_table import SymbolTable
 from interpreter.source.source import Source
 from interpreter.source.source_position import SourcePosition
+from interpreter.token import token_kind as kind
 from interpreter.token.token import Token
+from interpreter.token.token_kind import TOKEN_TYPES
+from interpreter.token.token_table import TokenTable, TokenValue
 from interpreter.token.token_type import TokenType
 
 MAX_STRING = 1000
 MAX_NUMBER_OF_DIGITS = 100
+# every lexeme is checked against the limits above within this many characters
+LOOKAHEAD = 4 * MAX_STRING
+# number of tokens built ahead at once
+SCAN_BATCH_SIZE = 256
+
+WHITESPACE = re.compile(r'\s*')
+IDENTIFIER = re.compile(r'[a-z_]*')
+DIGITS = re.compile(r'\d*')
+# quantifiers are possessive where Python supports them, no token gives back the characters it matched
+POSSESSIVE = '+' if sys.version_info >= (3, 11) else ''
+# matches only ordinary tokens, everything else (comments, end of file, errors, non ASCII identifiers)
+# is left to the builders chosen by the dispatch table
+TOKEN = re.compile(
+    rf'\s*{POSSESSIVE}(?:'
+    rf'(?P<word>&&|\|\||:=|[!=<>]=?|[-+*%(){{}};,]|/(?!\*)'
+    rf'|[a-z_]{{1,{MAX_STRING}}}{POSSESSIVE}(?![a-z_]|[^\x00-\x7f]))'
+    rf'|(?P<int>\d{{1,{MAX_NUMBER_OF_DIGITS}}}{POSSESSIVE}(?![\d.]))'
+    rf'|(?P<float>\d{{1,{MAX_NUMBER_OF_DIGITS}}}{POSSESSIVE}\.\d{{1,{MAX_NUMBER_OF_DIGITS}}}{POSSESSIVE}(?!\d))'
+    r'|(?P<currency>[A-Z]{3})'
+    rf'|(?P<string>"[^"]{{0,{MAX_STRING}}}{POSSESSIVE}")'
+    r')'
+)
+WORD, INT, FLOAT, CURRENCY, STRING = range(1, 6)
 
 
 class Lexer:
-    def __init__(self, source: Source):
+    """
+    Reads the source in blocks and builds every token from a slice of the current block.
+    Builder is chosen by the first character of the token through a dispatch table.
+    """
+
+    def __init__(self, source: Source, symbol_table: Optional[SymbolTable] = None):
+        """
+        symbol_table interns identifiers and currency names, a new one is made when it is not given
+        """
         self._source = source
-        self._previous_position = SourcePosition(0, 0)
+        self.symbol_table = symbol_table if symbol_table is not None else SymbolTable()
+        self._line_index = source.line_index
+        self._text = ''
+        self._position = 0
+        self._text_offset = source.get_offset()
+        self._exhausted = False
+        # tokens built ahead by _scan_ordinary_tokens, in reversed order
+        self._pending_tokens: List[Token] = []
+        # kind and value of every word scanned so far, identifiers are interned once
+        self._words: Dict[str, Tuple[int, TokenValue]] = dict(self.fixed_tokens)
+
+        self._dispatch_table: Dict[str, Callable[[str, int], Token]] = {
+            '"': self._build_string,
+            '/': self._build_div_operator,
+            '&': self._build_two_char_operator,
+            '|': self._build_two_char_operator,
+            ':': self._build_two_char_operator,
+        }
+        for char in 'abcdefghijklmnopqrstuvwxyz_':
+            self._dispatch_table[char] = self._build_alpha_keywords_or_identifier
+        for char in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
+            self._dispatch_table[char] = self._build_currency_type_name
+        for char in '0123456789':
+            self._dispatch_table[char] = self._build_one_of_number_value
+        for char in self.one_or_two_char_operators:
+            self._dispatch_table[char] = self._build_one_or_two_char_operator
+        for char in self.non_conflict_one_line_operators:
+            self._dispatch_table[char] = self._build_one_char_token
 
     non_conflict_one_line_operators = {
         "+": TokenType.ADD_OPERATOR,
@@ -29,6 +95,19 @@ class Lexer:
         ",": TokenType.COMMA
     }
 
+    one_or_two_char_operators = {
+        "!": (TokenType.NEGATION_OPERATOR, TokenType.NOT_EQUAL_OPERATOR),
+        "=": (TokenType.ASSIGN_OPERATOR, TokenType.EQUAL_OPERATOR),
+        "<": (TokenType.LESS_THAN_OPERATOR, TokenType.LESS_THAN_OR_EQUAL_OPERATOR),
+        ">": (TokenType.GREATER_THAN_OPERATOR, TokenType.GREATER_THAN_OPERATOR_OR_EQUAL),
+    }
+
+    two_char_operators = {
+        "&&": TokenType.AND_OPERATOR,
+        "||": TokenType.OR_OPERATOR,
+        ":=": TokenType.CURRENCY_DECLARATION_OPERATOR,
+    }
+
     keywords_dict = {
         'if': TokenType.IF_NAME,
         'else': TokenType.ELSE_NAME,
@@ -43,248 +122,280 @@ class Lexer:
         'false': TokenType.BOOL_VALUE
     }
 
-    def get_next_token(self) -> Token:
-        self._skip_whitespace()
-        token = \
-            self._skip_comment_or_build_div_operator() \
-            or self._build_eof() \
-            or self._build_one_of_number_value() \
-            or self._build_string() \
-            or self._build_operators() \
-            or self._build_one_char_tokens() \
-            or self._build_alpha_keywords_or_identifier() \
-            or self._build_currency_type_name()
-
-        if token:
-            return token
-
-        raise LexerError("Can't match any token", self._previous_position)
-
-    def _get_char(self) -> str:
-        return self._source.get_char()
-
-    def _next_char(self):
-        self._previous_position = self._get_position()
-        self._source.next_char()
-
-    def _get_position(self) -> SourcePosition:
-        return self._source.get_position()
-
-    def _skip_comment_or_build_div_operator(self) -> Optional[Token]:
-        char = self._get_char()
-
-        if char == "/":
-            self._next_char()
-            char = self._get_char()
-            if char == "*":
-                self._skip_comment()
-                self._next_char()
-                self._skip_whitespace()
-            else:
-                token = Token(TokenType.DIV_OPERATOR, '', self._previous_position)
-                self._next_char()
-                return token
-
-        return None
-
-    def _build_eof(self) -> Optional[Token]:
-        if self._get_char() == 'EOF':
-            return Token(TokenType.EOF, '', self._get_position())
-        return None
-
-    def _build_alpha_keywords_or_identifier(self) -> Optional[Token]:
-        buffer = ''
-        char = self._get_char()
-
-        i = 0
-        while char.isalpha() and char.islower() or char == '_':
-            if i == MAX_STRING:
-                raise LexerError("Too many chars in ID", self._get_position())
-            i += 1
-            buffer += char
-            self._next_char()
-            char = self._get_char()
-
-        if buffer == '':
-            return None
-        elif buffer in self.keywords_dict:
-            if buffer in ['true', 'false']:
-                if buffer == 'true':
-                    return Token(TokenType.BOOL_VALUE, True, self._previous_position)
-                else:
-                    return Token(TokenType.BOOL_VALUE, False, self._previous_position)
-            return Token(self.keywords_dict[buffer], '', self._previous_position)
-        else:
-            return Token(TokenType.ID, buffer, self._previous_position)
-
-    def _build_currency_type_name(self) -> Optional[Token]:
-        buffer = ''
-        char = self._get_char()
-
-        if not char.isupper():
-            return None
-
-        for i in range(3):
-            buffer += char
-            self._next_char()
-            char = self._get_char()
-
-        if len([char for char in buffer if char.isupper()]) == 3:
-            return Token(TokenType.CURRENCY, buffer, self._previous_position)
-        return None
-
-    def _build_one_char_tokens(self) -> Optional[Token]:
-        char = self._get_char()
-
-        if char in self.non_conflict_one_line_operators:
-            token = Token(self.non_conflict_one_line_operators[char], '', self._get_position())
-            self._next_char()
-            return token
-        return None
-
-    def _build_operators(self) -> Optional[Token]:
-        token = \
-            self.build_two_char_operators('&&', TokenType.AND_OPERATOR) \
-            or self.build_two_char_operators('||', TokenType.OR_OPERATOR) \
-            or self.build_two_char_operators(':=', TokenType.CURRENCY_DECLARATION_OPERATOR) \
-            or self.build_one_char_token_or_two_char_token(
-                ("!", TokenType.NEGATION_OPERATOR),
-                ("!=", TokenType.NOT_EQUAL_OPERATOR)
-            ) or self.build_one_char_token_or_two_char_token(
-                ("=", TokenType.ASSIGN_OPERATOR),
-                ("==", TokenType.EQUAL_OPERATOR)
-            ) or self.build_one_char_token_or_two_char_token(
-                ("<", TokenType.LESS_THAN_OPERATOR),
-                ("<=", TokenType.LESS_THAN_OR_EQUAL_OPERATOR)
-            ) or self.build_one_char_token_or_two_char_token(
-                (">", TokenType.GREATER_THAN_OPERATOR),
-                (">=", TokenType.GREATER_THAN_OPERATOR_OR_EQUAL)
-            )
-        if token:
-            return token
-        return None
-
-    def _build_string(self) -> Optional[Token]:
-        string = ''
-
-        char = self._get_char()
-        if char != '"':
-            return None
-
-        i = 0
-        self._next_char()
-        char = self._get_char()
-
-        while char != '"':
-            if i == MAX_STRING:
-                raise LexerError(f"Too many char in string (above {MAX_STRING})", self._get_position())
-            if char == 'EOF':
-                raise LexerError("Can't match any token, unterminated string", self._get_position())
-            i += 1
-
-            string += char
-            self._next_char()
-            char = self._get_char()
-
-        token = Token(TokenType.STRING_VALUE, string, self._get_position())
-        self._next_char()
-        return token
+    # kind and value of every token built from the WORD group, other words are identifiers
+    fixed_tokens = {
+        **{operator: (token_type.value, '') for operator, token_type in non_conflict_one_line_operators.items()},
+        **{operator: (token_types[0].value, '') for operator, token_types in one_or_two_char_operators.items()},
+        **{operator + '=': (token_types[1].value, '') for operator, token_types in one_or_two_char_operators.items()},
+        **{operator: (token_type.value, '') for operator, token_type in two_char_operators.items()},
+        '/': (kind.DIV_OPERATOR, ''),
+        **{keyword: (token_type.value, '') for keyword, token_type in keywords_dict.items()},
+        'true': (kind.BOOL_VALUE, True),
+        'false': (kind.BOOL_VALUE, False),
+    }
 
-    def _build_one_of_number_value(self) -> Optional[Token]:
-        if not self._get_char().isdigit():
+    def get_next_token(self) -> Token:
+        try:
+            return self._pending_tokens.pop()
+        except IndexError:
+            tokens = self.get_next_tokens()
+            tokens.reverse()
+            self._pending_tokens = tokens
+            return tokens.pop()
+
+    def get_next_tokens(self) -> List[Token]:
+        """
+        Returns the tokens built ahead at once, in order, or the next token alone when it comes from the builders.
+        """
+        if self._pending_tokens:
+            tokens = self._pending_tokens[::-1]
+            self._pending_tokens = []
+            return tokens
+        scanned = self._scan_ordinary_tokens(SCAN_BATCH_SIZE)
+        if scanned is None:
+            return [self._get_next_token_from_builders()]
+        kinds_and_values, offsets = scanned
+        return list(map(Token, map(TOKEN_TYPES.__getitem__, map(itemgetter(0), kinds_and_values)),
+                        map(itemgetter(1), kinds_and_values), offsets, repeat(self._line_index)))
+
+    def tokenize(self) -> TokenTable:
+        """
+        Reads the rest of the source at once into a token table, without making Token objects.
+        """
+        table = TokenTable(self._line_index)
+        while True:
+            scanned = self._scan_ordinary_tokens(sys.maxsize)
+            if scanned is not None:
+                kinds_and_values, offsets = scanned
+                table.kinds.extend(map(itemgetter(0), kinds_and_values))
+                table.values.extend(map(itemgetter(1), kinds_and_values))
+                table.offsets.extend(offsets)
+                continue
+            token = self._get_next_token_from_builders()
+            table.append_token(token)
+            if token.type == TokenType.EOF:
+                return table
+
+    def _scan_ordinary_tokens(self, limit: int) -> Optional[Tuple[List[Tuple[int, TokenValue]], Iterator[int]]]:
+        """
+        Scans at most limit tokens matched by the TOKEN expression from the current position on, until the first
+        piece of text which has to go through the builders or the end of the current block.
+        Returns kind and value of every token together with their offsets, None when no token was scanned.
+        """
+        text = self._text
+        matches = list(islice(iter(TOKEN.scanner(text, self._position).match, None), limit))
+        # the last token can go on in the next block
+        if matches and matches[-1].end() == len(text) and not self._exhausted:
+            matches.pop()
+        if not matches:
             return None
 
-        base = self.build_integer_part_of_the_number()
-
-        if self._get_char() == '.':
-            return self._build_float(base)
-        return Token(TokenType.INT_VALUE, base, self._previous_position)
-
-    def _build_float(self, integer_part: int) -> Optional[Token]:
-        self._next_char()
-        if not self._get_char().isdigit():
-            raise LexerError(f"No digit after dot in float", self._get_position())
-
-        fractional_part = self.build_integer_part_of_the_number()
-        if fractional_part == 0:
-            return Token(TokenType.FLOAT_VALUE, float(integer_part), self._previous_position)
-        digits = int(math.log10(fractional_part)) + 1
-        number = float(integer_part) + fractional_part * 10 ** -digits
-        return Token(TokenType.FLOAT_VALUE, number, self._previous_position)
-
-    def _build_currency(self, previous_base: float) -> Optional[Token]:
-        number = previous_base
-        currency_name = ''
-
-        for i in range(3):
-            if self._get_char().isupper() and self._get_char() != 'EOF':
-                currency_name += self._get_char()
-                self._next_char()
-
+        kinds_and_values = []
+        append = kinds_and_values.append
+        words = self._words
+        intern = self.symbol_table.names.setdefault
+        for match in matches:
+            group = match.lastindex
+            lexeme = match[group]
+
+            if group == WORD:
+                word = words.get(lexeme)
+                if word is None:
+                    word = words[lexeme] = (kind.ID, intern(lexeme, lexeme))
+                append(word)
+            elif group == INT:
+                append((kind.INT_VALUE, int(lexeme)))
+            elif group == FLOAT:
+                integer_part, fractional_part = lexeme.split('.')
+                append((kind.FLOAT_VALUE, self._float_value(int(integer_part), int(fractional_part))))
+            elif group == CURRENCY:
+                append((kind.CURRENCY, intern(lexeme, lexeme)))
             else:
-                return None
-        return Token(TokenType.CURRENCY_VALUE, f"{number}{currency_name}", self._previous_position)
-
-    def _skip_whitespace(self):
-        char = self._get_char()
-        while char.isspace():
-            self._next_char()
-            char = self._get_char()
-
-    def _skip_comment(self):
+                append((kind.STRING_VALUE, lexeme[1:-1]))
+
+        self._position = matches[-1].end()
+        return kinds_and_values, map((self._text_offset - 1).__add__, map(re.Match.end, matches))
+
+    def _get_next_token_from_builders(self) -> Token:
+        self._skip_whitespace_and_comments()
+        text = self._text
+        position = self._position
+
+        if position == len(text):
+            return Token(TokenType.EOF, '', self._get_position(position))
+
+        char = text[position]
+        build = self._dispatch_table.get(char) or self._get_unicode_builder(char)
+        return build(text, position)
+
+    def _get_position(self, index: int) -> SourcePosition:
+        return SourcePosition.from_offset(self._text_offset + index, self._line_index)
+
+    def _get_previous_position(self, index: int) -> SourcePosition:
+        """
+        Position of the last consumed character before text[index]
+        """
+        if self._text_offset + index == 0:
+            return SourcePosition(0, 0)
+        return self._get_position(index - 1)
+
+    def _fill(self) -> bool:
+        """
+        Drops consumed text and appends the next block of the source to the rest.
+        """
+        block = self._source.read_block()
+        if not block:
+            self._exhausted = True
+            return False
+        position = self._position
+        self._text = self._text[position:] + block
+        self._text_offset += position
+        self._position = 0
+        return True
+
+    def _skip_whitespace_and_comments(self):
         while True:
-            if self._get_char() == "*":
-                self._next_char()
-                if self._get_char() == "/":
-                    break
-
-            self._next_char()
-
-    def build_one_char_token_or_two_char_token(self,
-                                               one_char_token: Tuple[str, TokenType],
-                                               two_chars_token: Tuple[str, TokenType]) -> Optional[Token]:
-        one_char_token_value, one_char_token_type = one_char_token
-        two_chars_token_value, two_chars_token_type = two_chars_token
-
-        if self._get_char() != one_char_token_value:
-            return None
-
-        self._next_char()
-        if self._get_char() == two_chars_token_value[1]:
-            token = Token(two_chars_token_type, '', self._get_position())
-            self._next_char()
-            return token
-        else:
-            return Token(one_char_token_type, '', self._previous_position)
-
-    def build_two_char_operators(self, token_value: str, token_type: TokenType) -> Optional[Token]:
-        if self._get_char() != token_value[0]:
-            return None
+            text = self._text
+            position = WHITESPACE.match(text, self._position).end()
+            self._position = position
+
+            if len(text) - position < LOOKAHEAD and not self._exhausted:
+                self._fill()
+                continue
+            if text.startswith('/*', position):
+                self._skip_comment(position + 2)
+            else:
+                return
 
-        self._next_char()
-        if self._get_char() == token_value[1]:
-            token = Token(token_type, '', self._get_position())
-            self._next_char()
-            return token
+    def _skip_comment(self, position: int):
+        while True:
+            end = self._text.find('*/', position)
+            if end != -1:
+                self._position = end + 2
+                return
+            if self._exhausted:
+                raise LexerError("Can't match any token, unterminated comment", self._get_position(len(self._text)))
+            # last character is kept, it can be the '*' of the closing '*/'
+            self._position = max(len(self._text) - 1, position)
+            if self._fill():
+                position = 0
+
+    def _build_alpha_keywords_or_identifier(self, text: str, position: int) -> Token:
+        end = position
+        length = len(text)
+        while True:
+            end = IDENTIFIER.match(text, end).end()
+            if end < length and text[end] >= '\x80' and text[end].isalpha() and text[end].islower():
+                end += 1
+            else:
+                break
+
+        if end - position > MAX_STRING:
+            raise LexerError("Too many chars in ID", self._get_position(position + MAX_STRING))
+
+        self._position = end
+        buffer = text[position:end]
+        token_type = self.keywords_dict.get(buffer)
+        if token_type is None:
+            return Token(TokenType.ID, self.symbol_table.intern(buffer), self._get_position(end - 1))
+        elif token_type == TokenType.BOOL_VALUE:
+            return Token(TokenType.BOOL_VALUE, buffer == 'true', self._get_position(end - 1))
+        return Token(token_type, '', self._get_position(end - 1))
+
+    def _build_currency_type_name(self, text: str, position: int) -> Token:
+        buffer = text[position:position + 3]
+        if len(buffer) == 3 and buffer[0].isupper() and buffer[1].isupper() and buffer[2].isupper():
+            self._position = position + 3
+            return Token(TokenType.CURRENCY, self.symbol_table.intern(buffer), self._get_position(position + 2))
+        raise LexerError("Can't match any token", self._get_position(min(position + 2, len(text))))
+
+    def _build_one_char_token(self, text: str, position: int) -> Token:
+        self._position = position + 1
+        return Token(self.non_conflict_one_line_operators[text[position]], '', self._get_position(position))
+
+    def _build_one_or_two_char_operator(self, text: str, position: int) -> Token:
+        one_char_token_type, two_chars_token_type = self.one_or_two_char_operators[text[position]]
+        if text.startswith('=', position + 1):
+            self._position = position + 2
+            return Token(two_chars_token_type, '', self._get_position(position + 1))
+        self._position = position + 1
+        return Token(one_char_token_type, '', self._get_position(position))
+
+    def _build_two_char_operator(self, text: str, position: int) -> Token:
+        token_type = self.two_char_operators.get(text[position:position + 2])
+        if token_type is None:
+            raise LexerError("Can't match any token", self._get_position(position))
+        self._position = position + 2
+        return Token(token_type, '', self._get_position(position + 1))
+
+    def _build_div_operator(self, text: str, position: int) -> Token:
+        self._position = position + 1
+        return Token(TokenType.DIV_OPERATOR, '', self._get_position(position))
+
+    def _build_string(self, text: str, position: int) -> Token:
+        limit = position + 1 + MAX_STRING
+        end = text.find('"', position + 1, limit + 1)
+
+        if end == -1:
+            if limit <= len(text):
+                raise LexerError(f"Too many char in string (above {MAX_STRING})", self._get_position(limit))
+            raise LexerError("Can't match any token, unterminated string", self._get_position(len(text)))
+
+        self._position = end + 1
+        return Token(TokenType.STRING_VALUE, text[position + 1:end], self._get_position(end))
+
+    def _build_one_of_number_value(self, text: str, position: int) -> Token:
+        end = self._match_digits(text, position)
+        integer_part = int(text[position:end])
+
+        if not text.startswith('.', end):
+            self._position = end
+            return Token(TokenType.INT_VALUE, integer_part, self._get_position(end - 1))
+
+        fraction_start = end + 1
+        if fraction_start == len(text) or not text[fraction_start].isdecimal():
+            raise LexerError("No digit after dot in float", self._get_position(fraction_start))
+
+        end = self._match_digits(text, fraction_start)
+        fractional_part = int(text[fraction_start:end])
+        self._position = end
+        return Token(TokenType.FLOAT_VALUE, self._float_value(integer_part, fractional_part), self._get_position(end - 1))
+
+    @staticmethod
+    def _float_value(integer_part: int, fractional_part: int) -> float:
+        if fractional_part == 0:
+            return float(integer_part)
+        digits = int(math.log10(fractional_part)) + 1
+        return float(integer_part) + fractional_part * 10 ** -digits
 
-        return None
+    def _match_digits(self, text: str, position: int) -> int:
+        end = DIGITS.match(text, position).end()
+        if end - position > MAX_NUMBER_OF_DIGITS:
+            raise LexerError(f"Too many digits in number (above {MAX_NUMBER_OF_DIGITS})",
+                             self._get_position(position + MAX_NUMBER_OF_DIGITS))
+        return end
 
-    def build_integer_part_of_the_number(self) -> int:
-        char = self._get_char()
-        base = 0
-        i = 0
-        while char.isdigit():
-            if i == MAX_NUMBER_OF_DIGITS:
-                raise LexerError(f"Too many digits in number (above {MAX_NUMBER_OF_DIGITS})", self._get_position())
-            i += 1
+    def _get_unicode_builder(self, char: str) -> Callable[[str, int], Token]:
+        if char.isdecimal():
+            return self._build_one_of_number_value
+        elif char.isalpha() and char.islower():
+            return self._build_alpha_keywords_or_identifier
+        elif char.isupper():
+            return self._build_currency_type_name
+        return self._raise_no_token_matched
 
-            base = base * 10 + int(char)
-            self._next_char()
-            char = self._get_char()
-        return base
+    def _raise_no_token_matched(self, text: str, position: int) -> Token:
+        raise LexerError("Can't match any token", self._get_previous_position(position))
 
 
 def tokens_generator(lexer):
+    if isinstance(lexer, Lexer):
+        # tokens are taken a batch at a time, only the token from the builders can be EOF
+        while True:
+            tokens = lexer.get_next_tokens()
+            yield from tokens
+            if tokens[-1].type == TokenType.EOF:
+                return
     while (new_token := lexer.get_next_token()).type != TokenType.EOF:
         yield new_token
     yield new_token
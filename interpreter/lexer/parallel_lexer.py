@@ -0,0 +1,102 @@
+import os
+import re
+from array import array
+from typing import List, Optional, Tuple
+
+from interpreter.lexer.lexer import Lexer
+from interpreter.lexer.lexer_error import LexerError
+from interpreter.source.line_index import LineIndex
+from interpreter.source.text_source import TextSource
+from interpreter.token.token_table import TokenTable, TokenValue
+
+# strings and comments are the only lexemes which can hold a new line, they are found from left to right
+# the same way the lexer finds them, unterminated ones go on to the end of the text
+STRING_OR_COMMENT = re.compile(r'"[^"]*"?|/\*.*?(?:\*/|\Z)', re.DOTALL)
+
+ChunkTokens = Tuple[array, array, List[TokenValue], List[int]]
+
+
+def find_chunk_starts(text: str, count: int) -> List[int]:
+    """
+    Offsets at which text can be split into about count chunks lexed apart from each other.
+    Every chunk but the first starts just after a new line which is outside strings and comments,
+    so no token or comment goes over the split.
+    """
+    starts = [0]
+    strings_and_comments = STRING_OR_COMMENT.finditer(text)
+    string_or_comment = next(strings_and_comments, None)
+    for chunk in range(1, count):
+        target = max(len(text) * chunk // count, starts[-1])
+        while True:
+            new_line = text.find('\n', target)
+            if new_line == -1:
+                return starts
+            while string_or_comment is not None and string_or_comment.end() <= new_line:
+                string_or_comment = next(strings_and_comments, None)
+            if string_or_comment is not None and string_or_comment.start() <= new_line:
+                target = string_or_comment.end()
+            else:
+                break
+        if new_line + 1 < len(text):
+            starts.append(new_line + 1)
+    return starts
+
+
+def tokenize_chunk(chunk: str, offset: int) -> Optional[ChunkTokens]:
+    """
+    Kinds, offsets, values and line starts of tokens of a chunk which starts at offset in the whole text,
+    None when the chunk can not be lexed.
+    """
+    try:
+        table = Lexer(TextSource(chunk)).tokenize()
+    except LexerError:
+        return None
+    offsets = array('I', map(offset.__add__, table.offsets))
+    line_starts = [offset + line_start for line_start in table.line_index.line_starts[1:]]
+    return table.kinds, offsets, table.values, line_starts
+
+
+class ParallelLexer:
+    """
+    Lexes text split by find_chunk_starts in a pool of processes and joins the chunks into one token table,
+    the same as Lexer.tokenize gives for the whole text. When any chunk can not be lexed, the whole text
+    is lexed again by one Lexer, so the error is the same as well.
+    """
+
+    def __init__(self, text: str, workers: Optional[int] = None, chunks_per_worker: int = 4):
+        self.text = text
+        self.workers = workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+
+    def tokenize(self) -> TokenTable:
+        text = self.text
+        if self.workers == 1:
+            return Lexer(TextSource(text)).tokenize()
+
+        # imported only here, it takes a good part of the interpreter startup time
+        from concurrent.futures import ProcessPoolExecutor
+
+        starts = find_chunk_starts(text, self.workers * self.chunks_per_worker)
+        ends = starts[1:] + [len(text)]
+        with ProcessPoolExecutor(self.workers) as executor:
+            chunks = list(executor.map(
+                tokenize_chunk, (text[start:end] for start, end in zip(starts, ends)), starts
+            ))
+        if None in chunks:
+            return Lexer(TextSource(text)).tokenize()
+
+        line_index = LineIndex()
+        line_index.end_offset = len(text)
+        table = TokenTable(line_index)
+        last = len(chunks) - 1
+        for index, (kinds, offsets, values, line_starts) in enumerate(chunks):
+            # every chunk ends with the EOF token, only the one of the last chunk is kept
+            if index != last:
+                kinds = kinds[:-1]
+                offsets = offsets[:-1]
+                values = values[:-1]
+            table.kinds.extend(kinds)
+            table.offsets.extend(offsets)
+            table.values.extend(values)
+            line_index.line_starts.extend(line_starts)
+        return table
@@ -0,0 +1,21 @@
+from typing import Dict
+
+
+class SymbolTable:
+    """
+    Names of identifiers and currencies met during one compilation.
+    Every occurrence of a name is given the same string object, so tokens and tree nodes share it
+    and dictionaries keyed by names compare them by identity.
+    """
+
+    def __init__(self):
+        self.names: Dict[str, str] = {}
+
+    def intern(self, name: str) -> str:
+        return self.names.setdefault(name, name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names
+
+    def __len__(self) -> int:
+        return len(self.names)
@@ -1,17 +1,23 @@
 from abc import ABC
 from dataclasses import dataclass
-from typing import Union, List
+from typing import Union, Tuple
 
-from interpreter.models.constants import CustomTypeOfTypes, PossibleTypes
+from interpreter.models.constants import CustomTypeOfTypes, PossibleTypes, reduce_by_fields
 from interpreter.source.source_position import SourcePosition
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParseTreeNode(ABC):
+    """
+    Nodes are frozen, have slots and keep their children in tuples, so trees take less memory
+    and can be shared between threads and cached
+    """
     source_position: SourcePosition
 
+    __reduce__ = reduce_by_fields
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Constant(ParseTreeNode):
     value: PossibleTypes
 
@@ -19,7 +25,7 @@ class Constant(ParseTreeNode):
         return visitor.visit_constant(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Variable(ParseTreeNode):
     id: str
 
@@ -27,25 +33,25 @@ class Variable(ParseTreeNode):
         return visitor.visit_variable(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FunctionCall(ParseTreeNode):
     id: str
-    args: List['Expression']
+    args: Tuple['ExpressionTypes', ...]
 
     def accept(self, visitor: 'Environment'):
         return visitor.visit_function_call(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Param(ParseTreeNode):
     id: str
     type: CustomTypeOfTypes
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Assignment(ParseTreeNode):
     id: str
-    expression: 'Expression'
+    expression: 'ExpressionTypes'
 
     def accept(self, visitor: 'Environment'):
         return visitor.visit_assignment(self)
@@ -0,0 +1,501 @@
+import mmap
+import struct
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from interpreter.models.base import Constant, Variable, FunctionCall, Param, Assignment
+from interpreter.models.constants import SumOperator, MulOperator, CurrencyType, CurrencyValue, CustomTypeOfTypes, \
+    PossibleTypes
+from interpreter.models.declarations import Declaration, FunctionDeclaration, VariableDeclaration, \
+    CurrencyDeclaration, ParseTree
+from interpreter.models.expressions import Expression, AndExpression, RelationshipExpression, SumExpression, \
+    MultiplyExpression, TypeCastingFactor, NegationFactor
+from interpreter.models.statements import ReturnStatement, WhileStatement, IfStatement, Statements
+from interpreter.models.tree_arena import RELATIONSHIP_OPERATORS, RELATIONSHIP_OPERATOR_CODES, CONSTANT, VARIABLE, \
+    FUNCTION_CALL, PARAM, ASSIGNMENT, NEGATION_FACTOR, TYPE_CASTING_FACTOR, MULTIPLY_EXPRESSION, SUM_EXPRESSION, \
+    RELATIONSHIP_EXPRESSION, AND_EXPRESSION, EXPRESSION, RETURN_STATEMENT, WHILE_STATEMENT, IF_STATEMENT, STATEMENTS, \
+    FUNCTION_DECLARATION, VARIABLE_DECLARATION, CURRENCY_DECLARATION
+from interpreter.source.source_position import SourcePosition
+
+MAGIC = b'CURT'
+VERSION = 2
+DOUBLE = struct.Struct('<d')
+
+# codes of types, a currency type is CURRENCY_TYPE plus the index of its name in the string table
+NO_TYPE = 0
+TYPE_CODES = {int: 1, float: 2, str: 3, bool: 4}
+CURRENCY_TYPE = 5
+TYPES = [None, int, float, str, bool]
+# tags of constant values
+INT_TAG = 0
+FLOAT_TAG = 1
+STRING_TAG = 2
+FALSE_TAG = 3
+TRUE_TAG = 4
+CURRENCY_TAG = 5
+SUM_OPERATORS = list(SumOperator)
+SUM_OPERATOR_CODES = {operator: code for code, operator in enumerate(SUM_OPERATORS)}
+MUL_OPERATORS = list(MulOperator)
+MUL_OPERATOR_CODES = {operator: code for code, operator in enumerate(MUL_OPERATORS)}
+
+
+class BinaryTreeError(Exception):
+    pass
+
+
+def write_varint(output: bytearray, number: int):
+    while number >= 0x80:
+        output.append(number & 0x7F | 0x80)
+        number >>= 7
+    output.append(number)
+
+
+def zigzag(number: int) -> int:
+    """
+    Signed number as an unsigned one, small negative numbers stay small
+    """
+    return number << 1 if number >= 0 else (-number << 1) - 1
+
+
+def unzigzag(number: int) -> int:
+    return number >> 1 if not number & 1 else -((number + 1) >> 1)
+
+
+class TreeEncoder:
+    """
+    Writes a parse tree in the binary format read by BinaryTree:
+
+        magic "CURT", version
+        string table: count, then the length and UTF-8 bytes of every string
+        declarations: count, then the size in bytes of every declaration
+        every declaration as node records in pre-order
+
+    All numbers are varints. A record is the kind of the node (the kinds of TreeArena), the line
+    relative to the line of the previous record and the column, and then what the node has besides children,
+    followed by the records of its children. Identifiers, names and string constants are indexes
+    into the string table, so every one of them is kept once.
+    Declarations can be decoded one by one, because their sizes are known before any of them is read.
+    """
+
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self._line = 1
+
+    def encode(self, parse_tree: ParseTree) -> bytes:
+        declarations = [self.encode_declaration(declaration) for declaration in parse_tree.declarations]
+        output = bytearray(MAGIC)
+        write_varint(output, VERSION)
+        write_varint(output, len(self.strings))
+        for string in self.strings:
+            encoded = string.encode('utf-8')
+            write_varint(output, len(encoded))
+            output += encoded
+        write_varint(output, len(declarations))
+        for declaration in declarations:
+            write_varint(output, len(declaration))
+        for declaration in declarations:
+            output += declaration
+        return bytes(output)
+
+    def encode_declaration(self, declaration: Declaration) -> bytearray:
+        output = bytearray()
+        self._line = 1
+        # pre-order walk without recursion, so nesting of any depth can be written
+        stack = [declaration]
+        while stack:
+            node = stack.pop()
+            stack.extend(reversed(self._write_record(output, node)))
+        return output
+
+    def _string(self, string: str) -> int:
+        index = self.strings.get(string)
+        if index is None:
+            index = self.strings[string] = len(self.strings)
+        return index
+
+    def _write_type(self, output: bytearray, type: Optional[CustomTypeOfTypes]):
+        if type is None:
+            write_varint(output, NO_TYPE)
+        elif isinstance(type, CurrencyType):
+            write_varint(output, CURRENCY_TYPE + self._string(type.name))
+        else:
+            write_varint(output, TYPE_CODES[type])
+
+    def _write_value(self, output: bytearray, value: PossibleTypes):
+        if value is True or value is False:
+            output.append(TRUE_TAG if value else FALSE_TAG)
+        elif isinstance(value, int):
+            output.append(INT_TAG)
+            write_varint(output, zigzag(value))
+        elif isinstance(value, float):
+            output.append(FLOAT_TAG)
+            output += DOUBLE.pack(value)
+        elif isinstance(value, str):
+            output.append(STRING_TAG)
+            write_varint(output, self._string(value))
+        elif isinstance(value, CurrencyValue):
+            output.append(CURRENCY_TAG)
+            write_varint(output, self._string(value.name))
+            # the amount keeps its type, a currency constant of an int literal holds an int
+            self._write_value(output, value.value)
+        else:
+            raise BinaryTreeError(f"Constant {value!r} can not be encoded")
+
+    def _write_header(self, output: bytearray, kind: int, source_position: SourcePosition):
+        output.append(kind)
+        line = source_position.line
+        write_varint(output, zigzag(line - self._line))
+        write_varint(output, source_position.column)
+        self._line = line
+
+    def _write_record(self, output: bytearray, node) -> tuple:
+        """
+        Writes the record of node and gives its children, which are written after it
+        """
+        if isinstance(node, Statements):
+            output.append(STATEMENTS)
+            write_varint(output, len(node.list_of_statements))
+            return node.list_of_statements
+        if isinstance(node, Constant):
+            self._write_header(output, CONSTANT, node.source_position)
+            self._write_value(output, node.value)
+            return ()
+        if isinstance(node, Variable):
+            self._write_header(output, VARIABLE, node.source_position)
+            write_varint(output, self._string(node.id))
+            return ()
+        if isinstance(node, FunctionCall):
+            self._write_header(output, FUNCTION_CALL, node.source_position)
+            write_varint(output, self._string(node.id))
+            write_varint(output, len(node.args))
+            return node.args
+        if isinstance(node, Param):
+            self._write_header(output, PARAM, node.source_position)
+            write_varint(output, self._string(node.id))
+            self._write_type(output, node.type)
+            return ()
+        if isinstance(node, Assignment):
+            self._write_header(output, ASSIGNMENT, node.source_position)
+            write_varint(output, self._string(node.id))
+            return node.expression,
+        if isinstance(node, NegationFactor):
+            self._write_header(output, NEGATION_FACTOR, node.source_position)
+            output.append(node.is_negated)
+            return node.factor,
+        if isinstance(node, TypeCastingFactor):
+            self._write_header(output, TYPE_CASTING_FACTOR, node.source_position)
+            self._write_type(output, node.cast_type)
+            return node.negation_factor,
+        if isinstance(node, (MultiplyExpression, SumExpression)):
+            if isinstance(node, MultiplyExpression):
+                kind, codes = MULTIPLY_EXPRESSION, MUL_OPERATOR_CODES
+            else:
+                kind, codes = SUM_EXPRESSION, SUM_OPERATOR_CODES
+            self._write_header(output, kind, node.source_position)
+            write_varint(output, len(node.right_side))
+            output += bytes(codes[operator] for operator, _ in node.right_side)
+            return (node.left_side,) + tuple(expression for _, expression in node.right_side)
+        if isinstance(node, RelationshipExpression):
+            self._write_header(output, RELATIONSHIP_EXPRESSION, node.source_position)
+            output.append(RELATIONSHIP_OPERATOR_CODES[node.operator])
+            if node.right_side is None:
+                return node.left_side,
+            return node.left_side, node.right_side
+        if isinstance(node, (Expression, AndExpression)):
+            if isinstance(node, Expression):
+                kind, children = EXPRESSION, node.and_expressions
+            else:
+                kind, children = AND_EXPRESSION, node.relationship_expressions
+            self._write_header(output, kind, node.source_position)
+            write_varint(output, len(children))
+            return children
+        if isinstance(node, ReturnStatement):
+            self._write_header(output, RETURN_STATEMENT, node.source_position)
+            if node.expression is None:
+                output.append(0)
+                return ()
+            output.append(1)
+            return node.expression,
+        if isinstance(node, (WhileStatement, IfStatement)):
+            kind = WHILE_STATEMENT if isinstance(node, WhileStatement) else IF_STATEMENT
+            self._write_header(output, kind, node.source_position)
+            return node.expression, node.statements
+        if isinstance(node, FunctionDeclaration):
+            self._write_header(output, FUNCTION_DECLARATION, node.source_position)
+            self._write_type(output, node.return_type)
+            write_varint(output, self._string(node.id))
+            write_varint(output, len(node.params))
+            return node.params + (node.statements,)
+        if isinstance(node, VariableDeclaration):
+            self._write_header(output, VARIABLE_DECLARATION, node.source_position)
+            self._write_type(output, node.type)
+            write_varint(output, self._string(node.id))
+            return node.expression,
+        if isinstance(node, CurrencyDeclaration):
+            self._write_header(output, CURRENCY_DECLARATION, node.source_position)
+            write_varint(output, self._string(node.name))
+            output += DOUBLE.pack(node.value)
+            return ()
+        raise BinaryTreeError(f"Node {type(node).__name__} can not be encoded")
+
+
+class BinaryTree:
+    """
+    Parse tree in the binary format of TreeEncoder, read from bytes or a memory-mapped file.
+    Only the offsets of strings and declarations are read when it is opened, strings are decoded
+    the first time they are used and declarations when they are asked for, so a worker which runs
+    a part of the program decodes only that part.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self._file = None
+        if bytes(buffer[:len(MAGIC)]) != MAGIC:
+            raise BinaryTreeError("Not a binary parse tree")
+        self._position = len(MAGIC)
+        version = self._read_varint()
+        if version != VERSION:
+            raise BinaryTreeError(f"Binary parse tree of version {version}, version {VERSION} expected")
+
+        # start and end of every string
+        self._string_bounds: List[Tuple[int, int]] = []
+        for _ in range(self._read_varint()):
+            length = self._read_varint()
+            self._string_bounds.append((self._position, self._position + length))
+            self._position += length
+        self._strings: List[Optional[str]] = [None] * len(self._string_bounds)
+
+        sizes = [self._read_varint() for _ in range(self._read_varint())]
+        self._declaration_offsets = []
+        offset = self._position
+        for size in sizes:
+            self._declaration_offsets.append(offset)
+            offset += size
+        if offset != len(buffer):
+            raise BinaryTreeError("Binary parse tree is truncated")
+        self._declarations: List[Optional[Declaration]] = [None] * len(sizes)
+        self._currency_types: Dict[str, CurrencyType] = {}
+
+    @classmethod
+    def open(cls, path: str) -> 'BinaryTree':
+        file = open(path, 'rb')
+        try:
+            binary_tree = cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        except (ValueError, BinaryTreeError):
+            file.close()
+            raise
+        binary_tree._file = file
+        return binary_tree
+
+    def close(self):
+        """
+        Closes the mapped file, declarations decoded before stay usable
+        """
+        if self._file is not None:
+            self.buffer.close()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'BinaryTree':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._declarations)
+
+    def get_declaration(self, index: int) -> Declaration:
+        declaration = self._declarations[index]
+        if declaration is None:
+            declaration = self._declarations[index] = self._decode_declaration(self._declaration_offsets[index])
+        return declaration
+
+    def declarations(self) -> Iterator[Declaration]:
+        for index in range(len(self._declarations)):
+            yield self.get_declaration(index)
+
+    def to_parse_tree(self) -> ParseTree:
+        return ParseTree(tuple(self.declarations()))
+
+    def get_string(self, index: int) -> str:
+        string = self._strings[index]
+        if string is None:
+            start, end = self._string_bounds[index]
+            string = self._strings[index] = bytes(self.buffer[start:end]).decode('utf-8')
+        return string
+
+    def _read_varint(self) -> int:
+        buffer = self.buffer
+        position = self._position
+        number = shift = 0
+        while True:
+            byte = buffer[position]
+            position += 1
+            number |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                self._position = position
+                return number
+            shift += 7
+
+    def _read_type(self) -> Optional[CustomTypeOfTypes]:
+        code = self._read_varint()
+        if code < CURRENCY_TYPE:
+            return TYPES[code]
+        name = self.get_string(code - CURRENCY_TYPE)
+        currency = self._currency_types.get(name)
+        if currency is None:
+            currency = self._currency_types[name] = CurrencyType(name)
+        return currency
+
+    def _read_double(self) -> float:
+        value, = DOUBLE.unpack_from(self.buffer, self._position)
+        self._position += DOUBLE.size
+        return value
+
+    def _read_value(self) -> PossibleTypes:
+        tag = self.buffer[self._position]
+        self._position += 1
+        if tag == INT_TAG:
+            return unzigzag(self._read_varint())
+        if tag == FLOAT_TAG:
+            return self._read_double()
+        if tag == STRING_TAG:
+            return self.get_string(self._read_varint())
+        if tag == CURRENCY_TAG:
+            name = self.get_string(self._read_varint())
+            return CurrencyValue(name, self._read_value())
+        return tag == TRUE_TAG
+
+    def _decode_declaration(self, offset: int) -> Declaration:
+        """
+        Reads records in pre-order without recursion, every node waits on the stack with the values
+        read from its record until all its children are made
+        """
+        self._position = offset
+        buffer = self.buffer
+        read_varint = self._read_varint
+        get_string = self.get_string
+        line = 1
+        # kind, position, values of the record, number of children and children made so far
+        stack: List[Tuple[int, Optional[SourcePosition], tuple, int, list]] = []
+        while True:
+            kind = buffer[self._position]
+            self._position += 1
+            position = None
+            if kind != STATEMENTS:
+                line += unzigzag(read_varint())
+                position = SourcePosition(line, read_varint())
+
+            if kind == STATEMENTS:
+                count = read_varint()
+                values = ()
+            elif kind == CONSTANT:
+                values, count = (self._read_value(),), 0
+            elif kind == VARIABLE:
+                values, count = (get_string(read_varint()),), 0
+            elif kind == FUNCTION_CALL:
+                values = (get_string(read_varint()),)
+                count = read_varint()
+            elif kind == PARAM:
+                values, count = (get_string(read_varint()), self._read_type()), 0
+            elif kind == ASSIGNMENT:
+                values, count = (get_string(read_varint()),), 1
+            elif kind == NEGATION_FACTOR or kind == RELATIONSHIP_EXPRESSION:
+                operator = buffer[self._position]
+                self._position += 1
+                values = (operator,)
+                count = 1 if kind == NEGATION_FACTOR or operator == 0 else 2
+            elif kind == TYPE_CASTING_FACTOR:
+                values, count = (self._read_type(),), 1
+            elif kind == MULTIPLY_EXPRESSION or kind == SUM_EXPRESSION:
+                operators_count = read_varint()
+                values = (bytes(buffer[self._position:self._position + operators_count]),)
+                self._position += operators_count
+                count = operators_count + 1
+            elif kind == AND_EXPRESSION or kind == EXPRESSION:
+                values, count = (), read_varint()
+            elif kind == RETURN_STATEMENT:
+                count = buffer[self._position]
+                self._position += 1
+                values = ()
+            elif kind == WHILE_STATEMENT or kind == IF_STATEMENT:
+                values, count = (), 2
+            elif kind == FUNCTION_DECLARATION:
+                values = (self._read_type(), get_string(read_varint()))
+                count = read_varint() + 1
+            elif kind == VARIABLE_DECLARATION:
+                values, count = (self._read_type(), get_string(read_varint())), 1
+            elif kind == CURRENCY_DECLARATION:
+                values, count = (get_string(read_varint()), self._read_double()), 0
+            else:
+                raise BinaryTreeError(f"Unknown kind of node {kind}")
+
+            if count:
+                stack.append((kind, position, values, count, []))
+                continue
+            node = _make_node(kind, position, values, [])
+            # finished nodes become children of their parents, which may finish them in turn
+            while stack:
+                parent = stack[-1]
+                children = parent[4]
+                children.append(node)
+                if len(children) < parent[3]:
+                    break
+                stack.pop()
+                node = _make_node(parent[0], parent[1], parent[2], children)
+            if not stack:
+                return node
+
+
+def _make_node(kind: int, position: Optional[SourcePosition], values: tuple, children: list):
+    if kind == STATEMENTS:
+        return Statements(tuple(children))
+    if kind == CONSTANT:
+        return Constant(position, values[0])
+    if kind == VARIABLE:
+        return Variable(position, values[0])
+    if kind == FUNCTION_CALL:
+        return FunctionCall(position, values[0], tuple(children))
+    if kind == PARAM:
+        return Param(position, values[0], values[1])
+    if kind == ASSIGNMENT:
+        return Assignment(position, values[0], children[0])
+    if kind == NEGATION_FACTOR:
+        return NegationFactor(position, children[0], bool(values[0]))
+    if kind == TYPE_CASTING_FACTOR:
+        return TypeCastingFactor(position, children[0], values[0])
+    if kind == MULTIPLY_EXPRESSION:
+        return MultiplyExpression(
+            position, children[0], tuple(zip((MUL_OPERATORS[code] for code in values[0]), children[1:]))
+        )
+    if kind == SUM_EXPRESSION:
+        return SumExpression(
+            position, children[0], tuple(zip((SUM_OPERATORS[code] for code in values[0]), children[1:]))
+        )
+    if kind == RELATIONSHIP_EXPRESSION:
+        right_side = children[1] if len(children) > 1 else None
+        return RelationshipExpression(position, children[0], RELATIONSHIP_OPERATORS[values[0]], right_side)
+    if kind == AND_EXPRESSION:
+        return AndExpression(position, tuple(children))
+    if kind == EXPRESSION:
+        return Expression(position, tuple(children))
+    if kind == RETURN_STATEMENT:
+        return ReturnStatement(position, children[0] if children else None)
+    if kind == WHILE_STATEMENT:
+        return WhileStatement(position, children[0], children[1])
+    if kind == IF_STATEMENT:
+        return IfStatement(position, children[0], children[1])
+    if kind == FUNCTION_DECLARATION:
+        return FunctionDeclaration(position, values[0], values[1], tuple(children[:-1]), children[-1])
+    if kind == VARIABLE_DECLARATION:
+        return VariableDeclaration(position, values[0], values[1], children[0])
+    return CurrencyDeclaration(position, values[0], values[1])
+
+
+def encode_tree(parse_tree: ParseTree) -> bytes:
+    return TreeEncoder().encode(parse_tree)
+
+
+def write_tree(parse_tree: ParseTree, path: str):
+    with open(path, 'wb') as file:
+        file.write(encode_tree(parse_tree))
@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from interpreter.models.base import ParseTreeNode
+from interpreter.models.constants import CustomTypeOfTypes
+from interpreter.models.declarations import Declaration
+
+# global slot of a local variable without a global variable of the same name
+NO_SLOT = -1
+
+
+@dataclass(frozen=True, slots=True)
+class LocalVariable(ParseTreeNode):
+    """
+    Variable bound by Resolver to a slot of the frame of its function. Until the local variable is declared
+    the global variable at global_slot is read instead, the same as a lookup of the name would find it.
+    """
+    id: str
+    slot: int
+    global_slot: int = NO_SLOT
+
+    def accept(self, visitor: 'Environment'):
+        return visitor.visit_local_variable(self)
+
+
+@dataclass(frozen=True, slots=True)
+class GlobalVariable(ParseTreeNode):
+    """
+    Variable bound by Resolver to a slot of global variables, a function has no local variable of its name
+    """
+    id: str
+    slot: int
+
+    def accept(self, visitor: 'Environment'):
+        return visitor.visit_global_variable(self)
+
+
+@dataclass(frozen=True, slots=True)
+class BoundAssignment(ParseTreeNode):
+    """
+    Assignment bound by Resolver, which always writes to the slot of the frame, also when the variable it
+    assigns is global, and checks the type of the value against the variable read the same way as LocalVariable
+    """
+    id: str
+    slot: int
+    global_slot: int
+    expression: 'ExpressionTypes'
+
+    def accept(self, visitor: 'Environment'):
+        return visitor.visit_bound_assignment(self)
+
+
+@dataclass(frozen=True, slots=True)
+class BoundVariableDeclaration(Declaration):
+    """
+    Declaration of a variable at a slot of the frame, or of global variables in a global declaration
+    """
+    type: CustomTypeOfTypes
+    id: str
+    slot: int
+    expression: 'ExpressionTypes'
+
+    def accept(self, visitor: 'Environment', global_declaration: bool = False):
+        return visitor.visit_bound_variable_declaration(self, global_declaration)
+
+
+@dataclass(frozen=True, slots=True)
+class BoundFunctionCall(ParseTreeNode):
+    """
+    Call of the function at the index function of functions of Resolver
+    """
+    id: str
+    function: int
+    args: Tuple['ExpressionTypes', ...]
+
+    def accept(self, visitor: 'Environment'):
+        return visitor.visit_bound_function_call(self)
@@ -1,3 +1,4 @@
+import operator
 from dataclasses import dataclass
 from enum import Enum
 from typing import Union, Type
@@ -5,12 +6,22 @@ from typing import Union, Type
 from interpreter.token.token_type import TokenType
 
 
-@dataclass
+def reduce_by_fields(instance):
+    """
+    __reduce__ of frozen dataclasses with slots, they are unpickled by their constructor,
+    which is much faster than the __setstate__ made by dataclass
+    """
+    return type(instance), tuple(getattr(instance, name) for name in instance.__match_args__)
+
+
+@dataclass(frozen=True, slots=True)
 class CurrencyType:
     name: str
 
+    __reduce__ = reduce_by_fields
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CurrencyValue(CurrencyType):
     value: float
 
@@ -48,6 +59,17 @@ class CurrencyValue(CurrencyType):
 CustomTypeOfTypes = Union[Type, CurrencyType]
 PossibleTypes = Union[int, float, str, bool, CurrencyValue]
 
+
+def get_constant_key(value: PossibleTypes) -> tuple:
+    """
+    Key of a constant value which tells apart equal values of different types, like 1 and True,
+    also as amounts of a currency, like 1USD and 1.0USD
+    """
+    if isinstance(value, CurrencyValue):
+        return type(value), type(value.value), value
+    return type(value), value
+
+
 TOKEN_TYPES_INTO_TYPES = {
     TokenType.INT: int,
     TokenType.FLOAT: float,
@@ -115,3 +137,19 @@ ARITHMETIC_OPERATOR_INTO_LAMBDA_EXPRESSION = {
     MulOperator.DIV: lambda x, y: x / y,
     MulOperator.MODULO: lambda x, y: x % y
 }
+
+# the same operations as ARITHMETIC_OPERATOR_INTO_LAMBDA_EXPRESSION and RELATIONSHIP_OPERAND_INTO_LAMBDA_EXPRESSION,
+# without calling a lambda for every operation
+OPERATOR_FUNCTIONS = {
+    SumOperator.ADD: operator.add,
+    SumOperator.SUB: operator.sub,
+    MulOperator.MUL: operator.mul,
+    MulOperator.DIV: operator.truediv,
+    MulOperator.MODULO: operator.mod,
+    RelationshipOperator.EQUAL_OPERATOR: operator.eq,
+    RelationshipOperator.NOT_EQUAL_OPERATOR: operator.ne,
+    RelationshipOperator.LESS_THAN_OPERATOR: operator.lt,
+    RelationshipOperator.GREATER_THAN_OPERATOR: operator.gt,
+    RelationshipOperator.LESS_THAN_OR_EQUAL_OPERATOR: operator.le,
+    RelationshipOperator.GREATER_THAN_OPERATOR_OR_EQUAL_OPERATOR: operator.ge,
+}
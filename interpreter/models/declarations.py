@@ -1,39 +1,39 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 
 from interpreter.models.base import Param, ParseTreeNode
-from interpreter.models.constants import CustomTypeOfTypes
+from interpreter.models.constants import CustomTypeOfTypes, reduce_by_fields
 from interpreter.models.statements import Statements
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Declaration(ParseTreeNode):
     def accept(self, visitor: 'Environment', global_declaration: bool):
         pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FunctionDeclaration(Declaration):
     return_type: CustomTypeOfTypes
     id: str
-    params: List[Param]
+    params: Tuple[Param, ...]
     statements: Statements
 
     def accept(self, visitor: 'Environment', global_declaration: bool):
         return visitor.visit_function_declaration(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VariableDeclaration(Declaration):
     type: CustomTypeOfTypes
     id: str
-    expression: 'Expression'
+    expression: 'ExpressionTypes'
 
     def accept(self, visitor: 'Environment', global_declaration: bool = False):
         return visitor.visit_variable_declaration(self, global_declaration)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CurrencyDeclaration(Declaration):
     name: str
     value: float
@@ -42,6 +42,8 @@ class CurrencyDeclaration(Declaration):
         return visitor.visit_currency_declaration(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParseTree:
-    declarations: List[Declaration]
+    declarations: Tuple[Declaration, ...]
+
+    __reduce__ = reduce_by_fields
@@ -1,67 +1,72 @@
-from dataclasses import dataclass, field
-from typing import List, Tuple, Optional
+from dataclasses import dataclass
+from typing import Tuple, Optional, Union
 
 from interpreter.models.constants import RelationshipOperator, SumOperator, MulOperator, CustomTypeOfTypes
 from interpreter.models.base import Factor, ParseTreeNode
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NegationFactor(ParseTreeNode):
-    factor: Factor
+    factor: 'ExpressionTypes'
     is_negated: bool = False
 
     def accept(self, visitor: 'Environment'):
         return visitor.visit_negation_factor(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TypeCastingFactor(ParseTreeNode):
-    negation_factor: NegationFactor
+    negation_factor: 'ExpressionTypes'
     cast_type: CustomTypeOfTypes = None
 
     def accept(self, visitor: 'Environment'):
         return visitor.visit_type_casting_factor(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MultiplyExpression(ParseTreeNode):
-    left_side: TypeCastingFactor
-    right_side: List[Tuple[MulOperator, TypeCastingFactor]] = field(default_factory=lambda: [])
+    left_side: 'ExpressionTypes'
+    right_side: Tuple[Tuple[MulOperator, 'ExpressionTypes'], ...] = ()
 
     def accept(self, visitor: 'Environment'):
         return visitor.visit_arithmetic_expression(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SumExpression(ParseTreeNode):
-    left_side: MultiplyExpression
-    right_side: List[Tuple[SumOperator, MultiplyExpression]] = field(default_factory=lambda: [])
+    left_side: 'ExpressionTypes'
+    right_side: Tuple[Tuple[SumOperator, 'ExpressionTypes'], ...] = ()
 
     def accept(self, visitor: 'Environment'):
         return visitor.visit_arithmetic_expression(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RelationshipExpression(ParseTreeNode):
-    left_side: SumExpression
+    left_side: 'ExpressionTypes'
     operator: Optional[RelationshipOperator] = None
-    right_side: Optional[SumExpression] = None
+    right_side: Optional['ExpressionTypes'] = None
 
     def accept(self, visitor: 'Environment'):
         return visitor.visit_relationship_expression(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AndExpression(ParseTreeNode):
-    relationship_expressions: List[RelationshipExpression]
+    relationship_expressions: Tuple['ExpressionTypes', ...]
 
     def accept(self, visitor: 'Environment'):
         return visitor.visit_and_expression(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Expression(ParseTreeNode):
-    and_expressions: List[AndExpression]
+    and_expressions: Tuple['ExpressionTypes', ...]
 
     def accept(self, visitor: 'Environment'):
         return visitor.visit_expression(self)
+
+
+# the parser makes only nodes with an operator, a cast or a negation, any of them can be an operand of another one
+ExpressionTypes = Union[Expression, AndExpression, RelationshipExpression, SumExpression, MultiplyExpression,
+                        TypeCastingFactor, NegationFactor, Factor]
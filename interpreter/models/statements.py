@@ -1,38 +1,40 @@
 from abc import ABC
 from dataclasses import dataclass
-from typing import Optional, List, Union
+from typing import Generator, Optional, Tuple, Union
 
 from interpreter.models.base import Assignment, FunctionCall
-from interpreter.models.constants import PossibleTypes
-from interpreter.models.expressions import Expression
+from interpreter.models.constants import PossibleTypes, reduce_by_fields
+from interpreter.models.expressions import ExpressionTypes
 from interpreter.source.source_position import SourcePosition
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Statement(ABC):
     source_position: SourcePosition
 
+    __reduce__ = reduce_by_fields
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ReturnStatement(Statement):
-    expression: Optional['Expression']
+    expression: Optional['ExpressionTypes']
 
     def accept(self, visitor: 'Environment') -> Optional[PossibleTypes]:
         return visitor.visit_return_statement(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WhileStatement(Statement):
-    expression: 'Expression'
+    expression: 'ExpressionTypes'
     statements: 'Statements'
 
     def accept(self, visitor: 'Environment') -> Optional[PossibleTypes]:
         return visitor.visit_while_statement(self)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IfStatement(Statement):
-    expression: 'Expression'
+    expression: 'ExpressionTypes'
     statements: 'Statements'
 
     def accept(self, visitor: 'Environment') -> Optional[PossibleTypes]:
@@ -43,9 +45,37 @@ StatementsTypes = Union['VariableDeclaration', Assignment, FunctionCall, ReturnS
                         WhileStatement, IfStatement]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Statements:
-    list_of_statements: List[StatementsTypes]
+    list_of_statements: Tuple[StatementsTypes, ...]
+
+    __reduce__ = reduce_by_fields
 
     def accept(self, visitor: 'Environment'):
         return visitor.visit_statements(self)
+
+
+# statements with a block, whose visits are generators, see run_visit
+BLOCK_STATEMENTS = (WhileStatement, IfStatement)
+
+
+def run_visit(visit: Generator):
+    """
+    Result of a visit of statements made by generators, so that blocks nested to any depth take no Python stack:
+    the visit of statements and of while and if statements yields the visit of every nested block,
+    which is run on a stack of visits, and gets its result back.
+    """
+    stack = []
+    result = None
+    while True:
+        try:
+            nested_visit = visit.send(result)
+        except StopIteration as stop:
+            if not stack:
+                return stop.value
+            visit = stack.pop()
+            result = stop.value
+        else:
+            stack.append(visit)
+            visit = nested_visit
+            result = None
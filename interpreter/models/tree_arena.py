@@ -0,0 +1,377 @@
+from array import array
+from typing import Iterator, List, Optional, Tuple
+
+from interpreter.models.base import Constant, Variable, FunctionCall, Param, Assignment
+from interpreter.models.constants import RelationshipOperator, SumOperator, MulOperator, CustomTypeOfTypes, \
+    PossibleTypes
+from interpreter.models.declarations import FunctionDeclaration, VariableDeclaration, CurrencyDeclaration, ParseTree
+from interpreter.models.expressions import Expression, AndExpression, RelationshipExpression, SumExpression, \
+    MultiplyExpression, TypeCastingFactor, NegationFactor
+from interpreter.models.statements import ReturnStatement, WhileStatement, IfStatement, Statements
+from interpreter.source.line_index import LineIndex
+from interpreter.source.source_position import SourcePosition
+
+# kinds of nodes, one for every class of the parse tree
+CONSTANT = 0
+VARIABLE = 1
+FUNCTION_CALL = 2
+PARAM = 3
+ASSIGNMENT = 4
+NEGATION_FACTOR = 5
+TYPE_CASTING_FACTOR = 6
+MULTIPLY_EXPRESSION = 7
+SUM_EXPRESSION = 8
+RELATIONSHIP_EXPRESSION = 9
+AND_EXPRESSION = 10
+EXPRESSION = 11
+RETURN_STATEMENT = 12
+WHILE_STATEMENT = 13
+IF_STATEMENT = 14
+STATEMENTS = 15
+FUNCTION_DECLARATION = 16
+VARIABLE_DECLARATION = 17
+CURRENCY_DECLARATION = 18
+PARSE_TREE = 19
+
+NO_NODE = -1
+NO_VALUE = -1
+# operator codes of relationship expressions, 0 is an expression without an operator
+RELATIONSHIP_OPERATORS: List[Optional[RelationshipOperator]] = [None] + list(RelationshipOperator)
+RELATIONSHIP_OPERATOR_CODES = {operator: code for code, operator in enumerate(RELATIONSHIP_OPERATORS)}
+
+
+class TreeArena:
+    """
+    Parse tree kept in parallel arrays instead of one object per node, a node is an index into all of them.
+    Children of a node are linked by first_child and next_sibling, and they are always added before their parent,
+    so the root is the last node.
+    operators keeps the code of the relationship operator, or 1 for a negated factor.
+    values keeps everything else a node has besides children: constants, identifiers and types.
+    A node with two of them keeps them one after the other, e.g. id and type of a param, and sum and
+    multiply expressions keep the operators of their right side in one tuple.
+    Offsets are turned into positions by line_index only when they are needed.
+    """
+
+    def __init__(self, line_index: LineIndex):
+        self.kinds = array('B')
+        self.first_child = array('i')
+        self.next_sibling = array('i')
+        self.operators = array('B')
+        self.offsets = array('I')
+        self.value_indexes = array('i')
+        self.values: List[object] = []
+        self.line_index = line_index
+        self.root = NO_NODE
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def add_node(self, kind: int, offset: int, operator: int, value_index: int, children: Tuple[int, ...]) -> int:
+        index = len(self.kinds)
+        self.kinds.append(kind)
+        self.offsets.append(offset)
+        self.operators.append(operator)
+        self.value_indexes.append(value_index)
+        self.next_sibling.append(NO_NODE)
+        if children:
+            self.first_child.append(children[0])
+            next_sibling = self.next_sibling
+            previous = children[0]
+            for child in children[1:]:
+                next_sibling[previous] = child
+                previous = child
+        else:
+            self.first_child.append(NO_NODE)
+        return index
+
+    def add_values(self, *values) -> int:
+        """
+        Index of the first of values
+        """
+        index = len(self.values)
+        self.values.extend(values)
+        return index
+
+    def children(self, node: int) -> Iterator[int]:
+        child = self.first_child[node]
+        next_sibling = self.next_sibling
+        while child != NO_NODE:
+            yield child
+            child = next_sibling[child]
+
+    def get_value(self, node: int, number: int = 0):
+        return self.values[self.value_indexes[node] + number]
+
+    def get_position(self, node: int) -> SourcePosition:
+        return SourcePosition.from_offset(self.offsets[node], self.line_index)
+
+    @classmethod
+    def from_parse_tree(cls, parse_tree: ParseTree, line_index: LineIndex) -> 'TreeArena':
+        """
+        Arena with the same nodes as parse_tree. Positions made from line and column, not by the lexer,
+        are turned into offsets by line_index, so it has to be the one of the source of the tree.
+        """
+        builder = ArenaBuilder(line_index)
+        # post-order walk without recursion, indexes of finished children wait on results for their parent
+        results: List[int] = []
+        stack: List[Tuple[object, bool]] = [(parse_tree, False)]
+        while stack:
+            node, visited = stack.pop()
+            if node is None:
+                continue
+            if not visited:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(_get_children(node)))
+                continue
+            count = sum(child is not None for child in _get_children(node))
+            children = tuple(results[len(results) - count:])
+            del results[len(results) - count:]
+            results.append(_add_node(builder, node, children))
+        return builder.arena
+
+    def to_parse_tree(self) -> ParseTree:
+        """
+        Makes node objects of all nodes, children first, so it takes no recursion either
+        """
+        kinds = self.kinds
+        operators = self.operators
+        nodes: List[object] = []
+        for index in range(len(kinds)):
+            kind = kinds[index]
+            children = [nodes[child] for child in self.children(index)]
+            if kind == STATEMENTS:
+                node = Statements(tuple(children))
+            elif kind == PARSE_TREE:
+                node = ParseTree(tuple(children))
+            else:
+                position = self.get_position(index)
+                if kind == CONSTANT:
+                    node = Constant(position, self.get_value(index))
+                elif kind == VARIABLE:
+                    node = Variable(position, self.get_value(index))
+                elif kind == FUNCTION_CALL:
+                    node = FunctionCall(position, self.get_value(index), tuple(children))
+                elif kind == PARAM:
+                    node = Param(position, self.get_value(index), self.get_value(index, 1))
+                elif kind == ASSIGNMENT:
+                    node = Assignment(position, self.get_value(index), children[0])
+                elif kind == NEGATION_FACTOR:
+                    node = NegationFactor(position, children[0], bool(operators[index]))
+                elif kind == TYPE_CASTING_FACTOR:
+                    node = TypeCastingFactor(position, children[0], self.get_value(index))
+                elif kind == MULTIPLY_EXPRESSION or kind == SUM_EXPRESSION:
+                    right_side = tuple(zip(self.get_value(index), children[1:]))
+                    node_class = MultiplyExpression if kind == MULTIPLY_EXPRESSION else SumExpression
+                    node = node_class(position, children[0], right_side)
+                elif kind == RELATIONSHIP_EXPRESSION:
+                    right_side = children[1] if len(children) > 1 else None
+                    node = RelationshipExpression(
+                        position, children[0], RELATIONSHIP_OPERATORS[operators[index]], right_side
+                    )
+                elif kind == AND_EXPRESSION:
+                    node = AndExpression(position, tuple(children))
+                elif kind == EXPRESSION:
+                    node = Expression(position, tuple(children))
+                elif kind == RETURN_STATEMENT:
+                    node = ReturnStatement(position, children[0] if children else None)
+                elif kind == WHILE_STATEMENT:
+                    node = WhileStatement(position, children[0], children[1])
+                elif kind == IF_STATEMENT:
+                    node = IfStatement(position, children[0], children[1])
+                elif kind == FUNCTION_DECLARATION:
+                    node = FunctionDeclaration(
+                        position, self.get_value(index), self.get_value(index, 1), tuple(children[:-1]), children[-1]
+                    )
+                elif kind == VARIABLE_DECLARATION:
+                    node = VariableDeclaration(position, self.get_value(index), self.get_value(index, 1), children[0])
+                else:
+                    node = CurrencyDeclaration(position, self.get_value(index), self.get_value(index, 1))
+            nodes.append(node)
+        return nodes[self.root]
+
+
+class ArenaBuilder:
+    """
+    Builder of the parser which adds nodes to a TreeArena, its methods take the same arguments
+    as constructors of the nodes, with indexes of nodes in place of child nodes, see ParseTreeBuilder.
+    parse_tree gives the whole arena.
+    """
+
+    def __init__(self, line_index: LineIndex):
+        self.arena = TreeArena(line_index)
+        self._add_node = self.arena.add_node
+        self._add_values = self.arena.add_values
+
+    def _get_offset(self, source_position: SourcePosition) -> int:
+        if source_position.offset is not None:
+            return source_position.offset
+        return self.arena.line_index.get_offset(source_position.line, source_position.column)
+
+    def constant(self, source_position: SourcePosition, value: PossibleTypes) -> int:
+        return self._add_node(CONSTANT, self._get_offset(source_position), 0, self._add_values(value), ())
+
+    def variable(self, source_position: SourcePosition, id: str) -> int:
+        return self._add_node(VARIABLE, self._get_offset(source_position), 0, self._add_values(id), ())
+
+    def function_call(self, source_position: SourcePosition, id: str, args: Tuple[int, ...]) -> int:
+        return self._add_node(FUNCTION_CALL, self._get_offset(source_position), 0, self._add_values(id), args)
+
+    def param(self, source_position: SourcePosition, id: str, type: CustomTypeOfTypes) -> int:
+        return self._add_node(PARAM, self._get_offset(source_position), 0, self._add_values(id, type), ())
+
+    def assignment(self, source_position: SourcePosition, id: str, expression: int) -> int:
+        return self._add_node(ASSIGNMENT, self._get_offset(source_position), 0, self._add_values(id), (expression,))
+
+    def negation_factor(self, source_position: SourcePosition, factor: int, is_negated: bool = False) -> int:
+        return self._add_node(NEGATION_FACTOR, self._get_offset(source_position), is_negated, NO_VALUE, (factor,))
+
+    def type_casting_factor(self, source_position: SourcePosition, negation_factor: int,
+                            cast_type: CustomTypeOfTypes = None) -> int:
+        return self._add_node(
+            TYPE_CASTING_FACTOR, self._get_offset(source_position), 0, self._add_values(cast_type), (negation_factor,)
+        )
+
+    def multiply_expression(self, source_position: SourcePosition, left_side: int,
+                            right_side: Tuple[Tuple[MulOperator, int], ...] = ()) -> int:
+        return self._add_arithmetic_expression(MULTIPLY_EXPRESSION, source_position, left_side, right_side)
+
+    def sum_expression(self, source_position: SourcePosition, left_side: int,
+                       right_side: Tuple[Tuple[SumOperator, int], ...] = ()) -> int:
+        return self._add_arithmetic_expression(SUM_EXPRESSION, source_position, left_side, right_side)
+
+    def _add_arithmetic_expression(self, kind: int, source_position: SourcePosition, left_side: int,
+                                   right_side: tuple) -> int:
+        operators = tuple(operator for operator, _ in right_side)
+        children = (left_side,) + tuple(expression for _, expression in right_side)
+        return self._add_node(kind, self._get_offset(source_position), 0, self._add_values(operators), children)
+
+    def relationship_expression(self, source_position: SourcePosition, left_side: int,
+                                operator: Optional[RelationshipOperator] = None,
+                                right_side: Optional[int] = None) -> int:
+        children = (left_side,) if right_side is None else (left_side, right_side)
+        return self._add_node(
+            RELATIONSHIP_EXPRESSION, self._get_offset(source_position), RELATIONSHIP_OPERATOR_CODES[operator],
+            NO_VALUE, children
+        )
+
+    def and_expression(self, source_position: SourcePosition, relationship_expressions: Tuple[int, ...]) -> int:
+        return self._add_node(AND_EXPRESSION, self._get_offset(source_position), 0, NO_VALUE, relationship_expressions)
+
+    def expression(self, source_position: SourcePosition, and_expressions: Tuple[int, ...]) -> int:
+        return self._add_node(EXPRESSION, self._get_offset(source_position), 0, NO_VALUE, and_expressions)
+
+    def return_statement(self, source_position: SourcePosition, expression: Optional[int]) -> int:
+        children = () if expression is None else (expression,)
+        return self._add_node(RETURN_STATEMENT, self._get_offset(source_position), 0, NO_VALUE, children)
+
+    def while_statement(self, source_position: SourcePosition, expression: int, statements: int) -> int:
+        return self._add_node(
+            WHILE_STATEMENT, self._get_offset(source_position), 0, NO_VALUE, (expression, statements)
+        )
+
+    def if_statement(self, source_position: SourcePosition, expression: int, statements: int) -> int:
+        return self._add_node(IF_STATEMENT, self._get_offset(source_position), 0, NO_VALUE, (expression, statements))
+
+    def statements(self, list_of_statements: Tuple[int, ...]) -> int:
+        return self._add_node(STATEMENTS, 0, 0, NO_VALUE, list_of_statements)
+
+    def function_declaration(self, source_position: SourcePosition, return_type: CustomTypeOfTypes, id: str,
+                             params: Tuple[int, ...], statements: int) -> int:
+        return self._add_node(
+            FUNCTION_DECLARATION, self._get_offset(source_position), 0, self._add_values(return_type, id),
+            params + (statements,)
+        )
+
+    def variable_declaration(self, source_position: SourcePosition, type: CustomTypeOfTypes, id: str,
+                             expression: int) -> int:
+        return self._add_node(
+            VARIABLE_DECLARATION, self._get_offset(source_position), 0, self._add_values(type, id), (expression,)
+        )
+
+    def currency_declaration(self, source_position: SourcePosition, name: str, value: float) -> int:
+        return self._add_node(
+            CURRENCY_DECLARATION, self._get_offset(source_position), 0, self._add_values(name, value), ()
+        )
+
+    def parse_tree(self, declarations: Tuple[int, ...]) -> TreeArena:
+        self.arena.root = self._add_node(PARSE_TREE, 0, 0, NO_VALUE, declarations)
+        return self.arena
+
+
+def _get_children(node) -> tuple:
+    """
+    Child nodes in the order they are kept in the arena, None stands for a missing optional child
+    """
+    if isinstance(node, ParseTree):
+        return node.declarations
+    if isinstance(node, Statements):
+        return node.list_of_statements
+    if isinstance(node, FunctionDeclaration):
+        return node.params + (node.statements,)
+    if isinstance(node, FunctionCall):
+        return node.args
+    if isinstance(node, (Assignment, VariableDeclaration, ReturnStatement)):
+        return node.expression,
+    if isinstance(node, (WhileStatement, IfStatement)):
+        return node.expression, node.statements
+    if isinstance(node, NegationFactor):
+        return node.factor,
+    if isinstance(node, TypeCastingFactor):
+        return node.negation_factor,
+    if isinstance(node, (MultiplyExpression, SumExpression)):
+        return (node.left_side,) + tuple(expression for _, expression in node.right_side)
+    if isinstance(node, RelationshipExpression):
+        return node.left_side, node.right_side
+    if isinstance(node, AndExpression):
+        return node.relationship_expressions
+    if isinstance(node, Expression):
+        return node.and_expressions
+    return ()
+
+
+def _add_node(builder: ArenaBuilder, node, children: Tuple[int, ...]) -> int:
+    """
+    Adds node with children already in the arena
+    """
+    if isinstance(node, ParseTree):
+        return builder.parse_tree(children).root
+    if isinstance(node, Statements):
+        return builder.statements(children)
+    if isinstance(node, FunctionDeclaration):
+        return builder.function_declaration(node.source_position, node.return_type, node.id, children[:-1],
+                                            children[-1])
+    if isinstance(node, (MultiplyExpression, SumExpression)):
+        right_side = tuple(zip((operator for operator, _ in node.right_side), children[1:]))
+        if isinstance(node, MultiplyExpression):
+            return builder.multiply_expression(node.source_position, children[0], right_side)
+        return builder.sum_expression(node.source_position, children[0], right_side)
+    if isinstance(node, Constant):
+        return builder.constant(node.source_position, node.value)
+    if isinstance(node, Variable):
+        return builder.variable(node.source_position, node.id)
+    if isinstance(node, FunctionCall):
+        return builder.function_call(node.source_position, node.id, children)
+    if isinstance(node, Param):
+        return builder.param(node.source_position, node.id, node.type)
+    if isinstance(node, Assignment):
+        return builder.assignment(node.source_position, node.id, children[0])
+    if isinstance(node, NegationFactor):
+        return builder.negation_factor(node.source_position, children[0], node.is_negated)
+    if isinstance(node, TypeCastingFactor):
+        return builder.type_casting_factor(node.source_position, children[0], node.cast_type)
+    if isinstance(node, RelationshipExpression):
+        return builder.relationship_expression(node.source_position, children[0], node.operator,
+                                               children[1] if len(children) > 1 else None)
+    if isinstance(node, AndExpression):
+        return builder.and_expression(node.source_position, children)
+    if isinstance(node, Expression):
+        return builder.expression(node.source_position, children)
+    if isinstance(node, ReturnStatement):
+        return builder.return_statement(node.source_position, children[0] if children else None)
+    if isinstance(node, WhileStatement):
+        return builder.while_statement(node.source_position, children[0], children[1])
+    if isinstance(node, IfStatement):
+        return builder.if_statement(node.source_position, children[0], children[1])
+    if isinstance(node, VariableDeclaration):
+        return builder.variable_declaration(node.source_position, node.type, node.id, children[0])
+    return builder.currency_declaration(node.source_position, node.name, node.value)
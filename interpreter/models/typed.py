@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+
+from interpreter.models.base import Constant
+from interpreter.models.bound import BoundAssignment, BoundVariableDeclaration, BoundFunctionCall
+from interpreter.models.expressions import Expression, AndExpression, RelationshipExpression, NegationFactor
+from interpreter.models.statements import ReturnStatement, IfStatement, WhileStatement
+
+# nodes of the bound tree whose checks of types TypeChecker proved, Environment runs them without checking types,
+# and constants made by ConstantFolder
+
+
+@dataclass(frozen=True, slots=True)
+class TypedVariableDeclaration(BoundVariableDeclaration):
+    """
+    Declaration whose expression has the declared type
+    """
+
+    def accept(self, visitor: 'Environment', global_declaration: bool = False):
+        return visitor.visit_typed_variable_declaration(self, global_declaration)
+
+
+@dataclass(frozen=True, slots=True)
+class TypedAssignment(BoundAssignment):
+    """
+    Assignment whose expression has the type of the value of the variable it assigns
+    """
+
+    def accept(self, visitor: 'Environment'):
+        return visitor.visit_typed_assignment(self)
+
+
+@dataclass(frozen=True, slots=True)
+class TypedIfStatement(IfStatement):
+    """
+    If statement whose condition is bool
+    """
+
+    def accept(self, visitor: 'Environment'):
+        return visitor.visit_typed_if_statement(self)
+
+
+@dataclass(frozen=True, slots=True)
+class TypedWhileStatement(WhileStatement):
+    """
+    While statement whose condition is bool
+    """
+
+    def accept(self, visitor: 'Environment'):
+        return visitor.visit_typed_while_statement(self)
+
+
+@dataclass(frozen=True, slots=True)
+class TypedReturnStatement(ReturnStatement):
+    """
+    Return statement whose expression has the return type of its function
+    """
+
+    def accept(self, visitor: 'Environment'):
+        return visitor.visit_typed_return_statement(self)
+
+
+@dataclass(frozen=True, slots=True)
+class TypedFunctionCall(BoundFunctionCall):
+    """
+    Call with as many args as the function has params, each of the type of its param
+    """
+
+    def accept(self, visitor: 'Environment'):
+        return visitor.visit_typed_function_call(self)
+
+
+@dataclass(frozen=True, slots=True)
+class TypedExpression(Expression):
+    """
+    Expression whose operands are bool
+    """
+
+    def accept(self, visitor: 'Environment'):
+        return visitor.visit_typed_expression(self)
+
+
+@dataclass(frozen=True, slots=True)
+class TypedAndExpression(AndExpression):
+    """
+    And expression whose operands are bool
+    """
+
+    def accept(self, visitor: 'Environment'):
+        return visitor.visit_typed_and_expression(self)
+
+
+@dataclass(frozen=True, slots=True)
+class TypedRelationshipExpression(RelationshipExpression):
+    """
+    Relationship expression whose sides have values of the same type
+    """
+
+    def accept(self, visitor: 'Environment'):
+        return visitor.visit_typed_relationship_expression(self)
+
+
+@dataclass(frozen=True, slots=True)
+class TypedNegationFactor(NegationFactor):
+    """
+    Negation of a bool factor
+    """
+
+    def accept(self, visitor: 'Environment'):
+        return visitor.visit_typed_negation_factor(self)
+
+
+@dataclass(frozen=True, slots=True)
+class TypedConstant(Constant):
+    """
+    Constant of a declared currency or of no currency, or a value ConstantFolder folded an expression into
+    """
+
+    def accept(self, visitor: 'Environment'):
+        return visitor.visit_typed_constant(self)
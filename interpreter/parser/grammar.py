@@ -0,0 +1,283 @@
+import re
+from typing import Dict, FrozenSet, List, Set, Tuple, Union
+
+from interpreter.lexer.lexer import Lexer
+from interpreter.token import token_kind as kind
+from interpreter.token.token_kind import TOKEN_TYPES
+
+# rules of the grammar read by the lexer as one token, their definitions only document the tokens
+TOKEN_RULES = {
+    'ID': kind.ID,
+    'currency_ID': kind.CURRENCY,
+    'int': kind.INT_VALUE,
+    'float': kind.FLOAT_VALUE,
+    'string': kind.STRING_VALUE,
+    'bool': kind.BOOL_VALUE,
+    'currency': kind.CURRENCY_VALUE,
+}
+START_RULE = 'program'
+
+EBNF_TOKEN = re.compile(r'\s*(?:\(\*.*?\*\)\s*)*(?:([A-Za-z_][A-Za-z0-9_]*)|"([^"]*)"|\'([^\']*)\'|([=,|;\[\]{}()]))',
+                        re.DOTALL)
+END_OF_TEXT = re.compile(r'\s*(?:\(\*.*?\*\)\s*)*\Z', re.DOTALL)
+
+# terminals are token kinds, nonterminals are names of rules
+Symbol = Union[int, str]
+Production = Tuple[str, Tuple[Symbol, ...]]
+
+
+class GrammarError(Exception):
+    pass
+
+
+class Grammar:
+    """
+    Grammar read from EBNF and turned into productions of BNF, from which FIRST and FOLLOW sets
+    and the table of a predictive parser are computed.
+    Options, repetitions and groups become nonterminals named after their rule, e.g. program_1.
+    Only rules reachable from the start rule are kept, tokens are taken by TOKEN_RULES
+    and quoted terminals by the fixed tokens of the lexer.
+    """
+
+    def __init__(self, text: str, start: str = START_RULE):
+        self.rules = read_ebnf(text)
+        self.start = start
+        self.productions: List[Production] = []
+        # indexes of productions of every rule, in the order of its alternatives
+        self.rule_productions: Dict[str, List[int]] = {}
+        self._counters: Dict[str, int] = {}
+
+        to_convert = [start]
+        while to_convert:
+            name = to_convert.pop(0)
+            if name not in self.rules:
+                raise GrammarError(f"Rule {name} is not defined")
+            first_new = len(self.productions)
+            self.rule_productions[name] = []
+            for sequence in self.rules[name]:
+                # the production is placed before productions of its parts, which are added while it is converted
+                index = len(self.productions)
+                self.rule_productions[name].append(index)
+                self.productions.append((name, ()))
+                self.productions[index] = (name, self._convert_sequence(name, sequence))
+            for _, symbols in self.productions[first_new:]:
+                for symbol in symbols:
+                    if type(symbol) is str and symbol in self.rules and symbol not in self.rule_productions \
+                            and symbol not in to_convert:
+                        to_convert.append(symbol)
+
+        self.nonterminals = list(dict.fromkeys(name for name, _ in self.productions))
+        undefined = [symbol for _, symbols in self.productions for symbol in symbols
+                     if type(symbol) is str and symbol not in self.nonterminals]
+        if undefined:
+            raise GrammarError(f"Rule {undefined[0]} is not defined")
+        self.nullable = self._compute_nullable()
+        self.first = self._compute_first()
+        self.follow = self._compute_follow()
+
+    def _new_nonterminal(self, rule: str) -> str:
+        self._counters[rule] = self._counters.get(rule, 0) + 1
+        nonterminal = f"{rule}_{self._counters[rule]}"
+        if nonterminal in self.rules:
+            raise GrammarError(f"Rule {nonterminal} has the name of a part of rule {rule}")
+        return nonterminal
+
+    def _convert_sequence(self, rule: str, sequence: list) -> Tuple[Symbol, ...]:
+        symbols: List[Symbol] = []
+        for term_type, value in sequence:
+            if term_type == 'name':
+                symbols.append(TOKEN_RULES.get(value, value))
+            elif term_type == 'terminal':
+                if value not in Lexer.fixed_tokens:
+                    raise GrammarError(f"Terminal \"{value}\" of rule {rule} is not a token")
+                symbols.append(Lexer.fixed_tokens[value][0])
+            elif term_type == 'group' and len(value) == 1:
+                symbols.extend(self._convert_sequence(rule, value[0]))
+            else:
+                nonterminal = self._new_nonterminal(rule)
+                alternatives = [self._convert_sequence(rule, alternative) for alternative in value]
+                if term_type == 'repetition':
+                    alternatives = [alternative + (nonterminal,) for alternative in alternatives]
+                if term_type != 'group':
+                    alternatives.append(())
+                self.productions.extend((nonterminal, alternative) for alternative in alternatives)
+                symbols.append(nonterminal)
+        return tuple(symbols)
+
+    def _compute_nullable(self) -> Set[str]:
+        nullable: Set[str] = set()
+        changed = True
+        while changed:
+            changed = False
+            for name, symbols in self.productions:
+                if name not in nullable and all(symbol in nullable for symbol in symbols):
+                    nullable.add(name)
+                    changed = True
+        return nullable
+
+    def first_of(self, symbols: Tuple[Symbol, ...], first: Dict[str, Set[int]] = None) -> Set[int]:
+        """
+        Kinds of tokens which can begin symbols
+        """
+        first = self.first if first is None else first
+        kinds: Set[int] = set()
+        for symbol in symbols:
+            if type(symbol) is int:
+                kinds.add(symbol)
+                return kinds
+            kinds |= first[symbol]
+            if symbol not in self.nullable:
+                return kinds
+        return kinds
+
+    def _compute_first(self) -> Dict[str, Set[int]]:
+        first: Dict[str, Set[int]] = {name: set() for name in self.nonterminals}
+        changed = True
+        while changed:
+            changed = False
+            for name, symbols in self.productions:
+                kinds = self.first_of(symbols, first)
+                if not kinds <= first[name]:
+                    first[name] |= kinds
+                    changed = True
+        return first
+
+    def _compute_follow(self) -> Dict[str, Set[int]]:
+        follow: Dict[str, Set[int]] = {name: set() for name in self.nonterminals}
+        follow[self.start].add(kind.EOF)
+        changed = True
+        while changed:
+            changed = False
+            for name, symbols in self.productions:
+                for index, symbol in enumerate(symbols):
+                    if type(symbol) is int:
+                        continue
+                    rest = symbols[index + 1:]
+                    kinds = self.first_of(rest)
+                    if all(type(rest_symbol) is str and rest_symbol in self.nullable for rest_symbol in rest):
+                        kinds = kinds | follow[name]
+                    if not kinds <= follow[symbol]:
+                        follow[symbol] |= kinds
+                        changed = True
+        return follow
+
+    def _predict(self, production: int) -> Set[int]:
+        """
+        Kinds of tokens at which the production is chosen
+        """
+        name, symbols = self.productions[production]
+        kinds = self.first_of(symbols)
+        if all(type(symbol) is str and symbol in self.nullable for symbol in symbols):
+            kinds = kinds | self.follow[name]
+        return kinds
+
+    def predict_table(self) -> Dict[str, Dict[int, int]]:
+        """
+        Index of the production of a nonterminal to use at each kind of token,
+        raises GrammarError when the grammar is not LL(1)
+        """
+        table: Dict[str, Dict[int, int]] = {name: {} for name in self.nonterminals}
+        for index, (name, _) in enumerate(self.productions):
+            for token_kind in sorted(self._predict(index)):
+                if token_kind in table[name]:
+                    raise GrammarError(
+                        f"Grammar is not LL(1), {name} has more than one production for {TOKEN_TYPES[token_kind]}"
+                    )
+                table[name][token_kind] = index
+        return table
+
+    def alternatives_table(self, rule: str) -> Dict[int, str]:
+        """
+        Name of the rule, with which the chosen alternative of rule begins, at each kind of token.
+        Every alternative of rule has to begin with a rule.
+        """
+        table: Dict[int, str] = {}
+        for number, production in enumerate(self.rule_productions[rule]):
+            symbols = self.productions[production][1]
+            if not symbols or type(symbols[0]) is not str or symbols[0] not in self.rules:
+                raise GrammarError(f"Alternative {number + 1} of {rule} does not begin with a rule")
+            for token_kind in sorted(self._predict(production)):
+                if token_kind in table:
+                    raise GrammarError(
+                        f"Grammar is not LL(1), {rule} has more than one alternative for {TOKEN_TYPES[token_kind]}"
+                    )
+                table[token_kind] = symbols[0]
+        return table
+
+    def get_first_sets(self) -> Dict[str, FrozenSet[int]]:
+        """
+        FIRST sets of rules, without nonterminals made of their parts
+        """
+        return {name: frozenset(self.first[name]) for name in self.nonterminals if name in self.rules}
+
+
+def read_ebnf(text: str) -> Dict[str, List[list]]:
+    """
+    Rules of the grammar: lists of alternatives, which are lists of terms (type, value).
+    Terms are ('name', rule), ('terminal', text), and ('option' | 'repetition' | 'group', alternatives).
+    """
+    tokens = []
+    position = 0
+    while not END_OF_TEXT.match(text, position):
+        match = EBNF_TOKEN.match(text, position)
+        if match is None:
+            raise GrammarError(f"Invalid EBNF at: {text[position:position + 20]!r}")
+        name, double_quoted, single_quoted, punctuation = match.groups()
+        if name is not None:
+            tokens.append(('name', name))
+        elif punctuation is not None:
+            tokens.append(('punctuation', punctuation))
+        else:
+            tokens.append(('terminal', double_quoted if double_quoted is not None else single_quoted))
+        position = match.end()
+    tokens.append(('punctuation', None))
+
+    rules: Dict[str, List[list]] = {}
+    index = 0
+
+    def expect(punctuation: str):
+        nonlocal index
+        if tokens[index] != ('punctuation', punctuation):
+            raise GrammarError(f"Expected '{punctuation}' in EBNF, got {tokens[index][1]!r}")
+        index += 1
+
+    def read_alternatives() -> List[list]:
+        nonlocal index
+        alternatives = [read_sequence()]
+        while tokens[index] == ('punctuation', '|'):
+            index += 1
+            alternatives.append(read_sequence())
+        return alternatives
+
+    def read_sequence() -> list:
+        nonlocal index
+        sequence = [read_term()]
+        while tokens[index] == ('punctuation', ','):
+            index += 1
+            sequence.append(read_term())
+        return sequence
+
+    def read_term() -> tuple:
+        nonlocal index
+        token_type, value = tokens[index]
+        index += 1
+        if token_type != 'punctuation':
+            return token_type, value
+        for opening, closing, term_type in (('[', ']', 'option'), ('{', '}', 'repetition'), ('(', ')', 'group')):
+            if value == opening:
+                alternatives = read_alternatives()
+                expect(closing)
+                return term_type, alternatives
+        raise GrammarError(f"Unexpected {value!r} in EBNF")
+
+    while tokens[index][1] is not None:
+        token_type, name = tokens[index]
+        if token_type != 'name':
+            raise GrammarError(f"Expected name of a rule in EBNF, got {name!r}")
+        index += 1
+        expect('=')
+        if name in rules:
+            raise GrammarError(f"Rule {name} is defined twice")
+        rules[name] = read_alternatives()
+        expect(';')
+    return rules
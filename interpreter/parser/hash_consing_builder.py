@@ -0,0 +1,135 @@
+from typing import Dict, List, Optional, Tuple, Union
+
+from interpreter.models.base import Constant, Variable
+from interpreter.models.constants import PossibleTypes, CustomTypeOfTypes, MulOperator, SumOperator, \
+    RelationshipOperator, get_constant_key
+from interpreter.models.expressions import Expression, AndExpression, RelationshipExpression, SumExpression, \
+    MultiplyExpression, TypeCastingFactor, NegationFactor, ExpressionTypes
+from interpreter.parser.tree_builder import ParseTreeBuilder
+from interpreter.source.source_position import SourcePosition
+
+
+class HashConsingBuilder(ParseTreeBuilder):
+    """
+    Builder which finds constants, variables and pure expressions with the same structure,
+    e.g. every (1 + interest_rate) of a program. An expression is pure when all its operands are,
+    so expressions with function calls are never shared.
+    Structures are compared without positions. Every occurrence is a node of its own with its own position,
+    so errors point at the place where they happen, and only values of constants are kept once.
+    The builder keeps what it shared: the first occurrence of every structure and how many places of the program
+    have it, which later passes can use to work on a shared subtree once.
+    """
+
+    def __init__(self):
+        # first occurrences of structures by their kind, values and the first occurrences of their children,
+        # which the table keeps alive, so their ids are never reused
+        self._nodes: Dict[tuple, ExpressionTypes] = {}
+        self._occurrences: Dict[int, int] = {}
+        # first occurrence of the structure of every occurrence by the id of the occurrence, with the occurrence
+        # kept alive as well
+        self._first_occurrences: Dict[int, Tuple[ExpressionTypes, ExpressionTypes]] = {}
+        self.repeated_nodes = 0
+
+    def _share(self, key: tuple, node: ExpressionTypes) -> ExpressionTypes:
+        """
+        Records node as an occurrence of the structure of key
+        """
+        first_occurrence = self._nodes.setdefault(key, node)
+        if first_occurrence is node:
+            self._occurrences[id(node)] = 1
+        else:
+            self._occurrences[id(first_occurrence)] += 1
+            self.repeated_nodes += 1
+        self._first_occurrences[id(node)] = (first_occurrence, node)
+        return node
+
+    def _get_key(self, node: ExpressionTypes) -> Optional[int]:
+        """
+        Id of the first occurrence of the structure of node, None when its structure is not shared
+        """
+        first_occurrence = self._first_occurrences.get(id(node))
+        return None if first_occurrence is None else id(first_occurrence[0])
+
+    def get_first_occurrence(self, node: ExpressionTypes) -> ExpressionTypes:
+        """
+        Node standing for the structure of node, the node itself when it is not shared
+        """
+        first_occurrence = self._first_occurrences.get(id(node))
+        return node if first_occurrence is None else first_occurrence[0]
+
+    def get_occurrences(self, node: ExpressionTypes) -> int:
+        """
+        Number of places of the program which have the structure of node, 1 for nodes which are not shared
+        """
+        return self._occurrences.get(id(self.get_first_occurrence(node)), 1)
+
+    def get_shared_nodes(self) -> List[ExpressionTypes]:
+        """
+        First occurrences of structures which more than one place of the program has, in the order they were made
+        """
+        return [node for node in self._nodes.values() if self._occurrences[id(node)] > 1]
+
+    def constant(self, source_position: SourcePosition, value: PossibleTypes) -> Constant:
+        key = (Constant, *get_constant_key(value))
+        first_occurrence = self._nodes.get(key)
+        if first_occurrence is not None:
+            value = first_occurrence.value
+        return self._share(key, Constant(source_position, value))
+
+    def variable(self, source_position: SourcePosition, id: str) -> Variable:
+        return self._share((Variable, id), Variable(source_position, id))
+
+    def negation_factor(self, source_position: SourcePosition, factor: ExpressionTypes,
+                        is_negated: bool = False) -> NegationFactor:
+        node = NegationFactor(source_position, factor, is_negated)
+        key = self._get_key(factor)
+        if key is None:
+            return node
+        return self._share((NegationFactor, key, is_negated), node)
+
+    def type_casting_factor(self, source_position: SourcePosition, negation_factor: ExpressionTypes,
+                            cast_type: CustomTypeOfTypes = None) -> TypeCastingFactor:
+        node = TypeCastingFactor(source_position, negation_factor, cast_type)
+        key = self._get_key(negation_factor)
+        if key is None:
+            return node
+        return self._share((TypeCastingFactor, key, cast_type), node)
+
+    def multiply_expression(self, source_position: SourcePosition, left_side: ExpressionTypes,
+                            right_side: Tuple[Tuple[MulOperator, ExpressionTypes], ...] = ()) -> MultiplyExpression:
+        return self._share_arithmetic_expression(MultiplyExpression(source_position, left_side, right_side))
+
+    def sum_expression(self, source_position: SourcePosition, left_side: ExpressionTypes,
+                       right_side: Tuple[Tuple[SumOperator, ExpressionTypes], ...] = ()) -> SumExpression:
+        return self._share_arithmetic_expression(SumExpression(source_position, left_side, right_side))
+
+    def _share_arithmetic_expression(self, node: Union[MultiplyExpression, SumExpression]):
+        keys = [self._get_key(node.left_side), *(self._get_key(operand) for _, operand in node.right_side)]
+        if None in keys:
+            return node
+        operators = tuple(operator for operator, _ in node.right_side)
+        return self._share((type(node), tuple(keys), operators), node)
+
+    def relationship_expression(self, source_position: SourcePosition, left_side: ExpressionTypes,
+                                operator: Optional[RelationshipOperator] = None,
+                                right_side: Optional[ExpressionTypes] = None) -> RelationshipExpression:
+        node = RelationshipExpression(source_position, left_side, operator, right_side)
+        left_key = self._get_key(left_side)
+        right_key = None if right_side is None else self._get_key(right_side)
+        if left_key is None or right_side is not None and right_key is None:
+            return node
+        return self._share((RelationshipExpression, left_key, operator, right_key), node)
+
+    def and_expression(self, source_position: SourcePosition,
+                       relationship_expressions: Tuple[ExpressionTypes, ...]) -> AndExpression:
+        return self._share_logical_expression(AndExpression(source_position, relationship_expressions))
+
+    def expression(self, source_position: SourcePosition, and_expressions: Tuple[ExpressionTypes, ...]) -> Expression:
+        return self._share_logical_expression(Expression(source_position, and_expressions))
+
+    def _share_logical_expression(self, node: Union[AndExpression, Expression]):
+        operands = node.relationship_expressions if type(node) is AndExpression else node.and_expressions
+        keys = tuple(self._get_key(operand) for operand in operands)
+        if None in keys:
+            return node
+        return self._share((type(node), keys), node)
@@ -0,0 +1,200 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import fields
+from typing import List, Optional, Dict, Union
+
+from interpreter.lexer.lexer import Lexer
+from interpreter.lexer.symbol_table import SymbolTable
+from interpreter.models.base import ParseTreeNode
+from interpreter.models.declarations import ParseTree, Declaration
+from interpreter.models.statements import Statement, Statements
+from interpreter.parser.parser import Parser
+from interpreter.source.line_index import LineIndex
+from interpreter.source.source_position import SourcePosition
+from interpreter.source.text_source import TextSource
+from interpreter.token import token_kind as kind
+from interpreter.token.token_table import TokenTable
+
+TREE_NODES = (ParseTreeNode, Statement, Statements)
+TreeNode = Union[ParseTreeNode, Statement, Statements]
+
+
+class IncrementalParser:
+    """
+    Keeps the text, tokens and parse tree of a program and brings them up to date after every edit.
+    Tokens are lexed again only from the last safe boundary before the edit up to the first unchanged token,
+    and only the top-level declarations made of changed tokens are parsed again. Other declarations are reused,
+    or copied with new positions when lines before them are added or removed. Nodes are immutable,
+    so the previous tree is still valid after an edit and shares nodes with the new one.
+    """
+
+    def __init__(self, text: str):
+        self.symbol_table = SymbolTable()
+        self.text = text
+        self.tokens: Optional[TokenTable] = None
+        self.tree: Optional[ParseTree] = None
+        # index of the first token of every declaration in the tree
+        self.declaration_starts: List[int] = []
+        self._parse_all()
+
+    def apply_edit(self, start: int, end: int, replacement: str) -> ParseTree:
+        """
+        Replaces text[start:end] with replacement and returns the parse tree of the new text,
+        the same as a full parse would give. When the new text does not compile, the error is raised
+        and the next edit parses the whole text again.
+        """
+        if not 0 <= start <= end <= len(self.text):
+            raise ValueError(f"Edit {start}:{end} out of text of length {len(self.text)}")
+        text = self.text
+        self.text = text[:start] + replacement + text[end:]
+        tokens = self.tokens
+        tree = self.tree
+        self.tokens = None
+        self.tree = None
+
+        if tree is None:
+            self._parse_all()
+        else:
+            line_delta = replacement.count('\n') - text.count('\n', start, end)
+            self._parse_edit(tokens, tree, start, end, replacement, line_delta)
+        return self.tree
+
+    def _parse_all(self):
+        self.tokens = Lexer(TextSource(self.text), self.symbol_table).tokenize()
+        declarations = []
+        self.declaration_starts = []
+        self._parse_declarations(Parser(self.tokens), declarations, self.declaration_starts, {})
+        self.tree = ParseTree(tuple(declarations))
+
+    def _parse_edit(self, tokens: TokenTable, old_tree: ParseTree, start: int, end: int, replacement: str,
+                    line_delta: int):
+        """
+        Brings tokens, which are changed in place, and the tree of the text before the edit up to date.
+        """
+        delta = len(replacement) - (end - start)
+        kinds = tokens.kinds
+        values = tokens.values
+        offsets = tokens.offsets
+        old_line_index = tokens.line_index
+        line_index = self._edit_line_index(old_line_index, start, end, replacement, len(self.text))
+
+        # where a token ends depends on one character after it, so the last kept token ends before start - 1
+        kept = bisect_left(offsets, start - 1)
+        restart = offsets[kept - 1] + 1 if kept else 0
+        lexer = Lexer(TextSource(self.text, restart, line_index), self.symbol_table)
+        new_kinds = []
+        new_values = []
+        new_offsets = []
+        # first old token after the edit which new tokens come back to
+        resumed = len(kinds)
+        while True:
+            token = lexer.get_next_token()
+            token_kind = token.type.value
+            offset = token.offset
+            old_offset = offset - delta
+            if token_kind != kind.EOF and old_offset >= end:
+                index = bisect_left(offsets, old_offset, kept)
+                # the old token has to lie wholly after the edit
+                if 0 < index < len(offsets) and offsets[index] == old_offset and offsets[index - 1] >= end - 1 \
+                        and kinds[index] == token_kind and values[index] == token.value:
+                    resumed = index
+                    break
+            new_kinds.append(token_kind)
+            new_values.append(token.value)
+            new_offsets.append(offset)
+            if token_kind == kind.EOF:
+                break
+
+        # declarations which start on a line after the edit are reused, when new tokens come back to their start
+        old_starts = self.declaration_starts
+        old_declarations = old_tree.declarations
+        first_changed = bisect_right(old_starts, kept) - 1
+        reusable = bisect_left(old_starts, resumed)
+        last_edited_line = old_line_index.get_line_and_column(end)[0]
+        while reusable < len(old_starts) and \
+                old_line_index.get_line_and_column(offsets[old_starts[reusable]])[0] <= last_edited_line:
+            reusable += 1
+        index_shift = kept + len(new_kinds) - resumed
+
+        kinds[kept:resumed] = array('B', new_kinds)
+        values[kept:resumed] = new_values
+        moved_offsets = offsets[resumed:]
+        if delta:
+            moved_offsets = array('I', map(delta.__add__, moved_offsets))
+        offsets[kept:] = array('I', new_offsets) + moved_offsets
+        tokens.line_index = line_index
+        self.tokens = tokens
+
+        declarations = list(old_declarations[:first_changed])
+        starts = old_starts[:first_changed]
+        parser = Parser(tokens)
+        parser.cursor.seek(old_starts[first_changed])
+        reused_from = self._parse_declarations(parser, declarations, starts, {
+            old_starts[index] + index_shift: index for index in range(reusable, len(old_starts))
+        })
+        if reused_from is not None:
+            reused = old_declarations[reused_from:]
+            if line_delta:
+                shifted_positions: Dict[int, SourcePosition] = {}
+                reused = [self._shift_lines(declaration, line_delta, shifted_positions) for declaration in reused]
+            declarations.extend(reused)
+            starts.extend(old_start + index_shift for old_start in old_starts[reused_from:])
+        self.tree = ParseTree(tuple(declarations))
+        self.declaration_starts = starts
+
+    @staticmethod
+    def _parse_declarations(parser: Parser, declarations: List[Declaration], starts: List[int],
+                            reusable_starts: Dict[int, int]) -> Optional[int]:
+        """
+        Parses declarations the same way as Parser.parse_program, until the end of tokens or until the cursor
+        gets to the start of a reusable old declaration. Returns the index of that old declaration, if any,
+        it and all after it are the same as before the edit.
+        """
+        cursor = parser.cursor
+        while True:
+            if cursor.kind == kind.EOF and declarations:
+                return None
+            if cursor.index in reusable_starts:
+                return reusable_starts[cursor.index]
+            starts.append(cursor.index)
+            declarations.append(parser.parse_declaration())
+
+    @staticmethod
+    def _edit_line_index(old_line_index: LineIndex, start: int, end: int, replacement: str, length: int) \
+            -> LineIndex:
+        old_line_starts = old_line_index.line_starts
+        line_index = LineIndex()
+        # lines start after new line characters, so starts up to start are before the edit and after end are after it
+        kept = bisect_right(old_line_starts, start)
+        line_index.line_starts = old_line_starts[:kept]
+        line_index.add_line_starts(replacement, start)
+        delta = len(replacement) - (end - start)
+        line_index.line_starts.extend(map(delta.__add__, old_line_starts[bisect_right(old_line_starts, end, kept):]))
+        line_index.end_offset = length
+        return line_index
+
+    def _shift_lines(self, node: TreeNode, line_delta: int, shifted_positions: Dict[int, SourcePosition]) \
+            -> TreeNode:
+        """
+        Copy of the node and all nodes below it with positions moved by line_delta lines, nodes are immutable
+        """
+        values = []
+        for field in fields(node):
+            value = getattr(node, field.name)
+            if type(value) is SourcePosition:
+                position = shifted_positions.get(id(value))
+                if position is None:
+                    position = SourcePosition(value.line + line_delta, value.column)
+                    shifted_positions[id(value)] = position
+                value = position
+            elif type(value) is tuple:
+                # operands of sum and multiply expressions are kept with their operators
+                value = tuple(
+                    (item[0], self._shift_lines(item[1], line_delta, shifted_positions)) if type(item) is tuple
+                    else self._shift_lines(item, line_delta, shifted_positions)
+                    for item in value
+                )
+            elif isinstance(value, TREE_NODES):
+                value = self._shift_lines(value, line_delta, shifted_positions)
+            values.append(value)
+        return type(node)(*values)
@@ -0,0 +1,466 @@
+"""
+Tables of the predictive parser generated from docs/grammar.ebnf by
+$ python -m interpreter.parser.parser_generator
+Do not edit them, change the grammar and generate them again.
+"""
+from interpreter.token import token_kind as kind
+
+START = 'program'
+
+# productions of the grammar in BNF, terminals are kinds of tokens and nonterminals are names
+PRODUCTIONS = (
+    ('program', ('declaration', 'program_1')),  # 0
+    ('program_1', ('declaration', 'program_1')),  # 1
+    ('program_1', ()),  # 2
+    ('declaration', ('type', 'restOfDeclaration')),  # 3
+    ('type', (kind.INT,)),  # 4
+    ('type', (kind.FLOAT,)),  # 5
+    ('type', (kind.STRING,)),  # 6
+    ('type', (kind.BOOL,)),  # 7
+    ('type', (kind.CURRENCY,)),  # 8
+    ('restOfDeclaration', ('restOfCurrencyDeclaration',)),  # 9
+    ('restOfDeclaration', ('restOfFunctionOrVariableDeclaration',)),  # 10
+    ('restOfCurrencyDeclaration', (kind.CURRENCY_DECLARATION_OPERATOR, kind.FLOAT_VALUE, kind.SEMICOLON)),  # 11
+    ('restOfFunctionOrVariableDeclaration', (kind.ID, 'restOfFunctionOrVariableDeclaration_1')),  # 12
+    ('restOfFunctionOrVariableDeclaration_1', ('restOfFunctionDeclaration',)),  # 13
+    ('restOfFunctionOrVariableDeclaration_1', ('restOfVariableDeclaration', kind.SEMICOLON)),  # 14
+    ('restOfFunctionDeclaration', (  # 15
+        kind.LEFT_BRACKET, 'params', kind.RIGHT_BRACKET, kind.LEFT_CURLY_BRACKET, 'statements',
+        kind.RIGHT_CURLY_BRACKET,
+    )),
+    ('restOfVariableDeclaration', (kind.ASSIGN_OPERATOR, 'expression')),  # 16
+    ('params', ('params_1',)),  # 17
+    ('params_2', (kind.COMMA, 'type', kind.ID, 'params_2')),  # 18
+    ('params_2', ()),  # 19
+    ('params_1', ('type', kind.ID, 'params_2')),  # 20
+    ('params_1', ()),  # 21
+    ('statements', ('statements_1',)),  # 22
+    ('statements_1', ('statement', 'statements_1')),  # 23
+    ('statements_1', ()),  # 24
+    ('expression', ('andExpression', 'expression_1')),  # 25
+    ('expression_1', (kind.OR_OPERATOR, 'andExpression', 'expression_1')),  # 26
+    ('expression_1', ()),  # 27
+    ('statement', ('simpleStatement', kind.SEMICOLON)),  # 28
+    ('statement', ('whileStatement',)),  # 29
+    ('statement', ('ifStatement',)),  # 30
+    ('andExpression', ('relationshipExpression', 'andExpression_1')),  # 31
+    ('andExpression_1', (kind.AND_OPERATOR, 'relationshipExpression', 'andExpression_1')),  # 32
+    ('andExpression_1', ()),  # 33
+    ('simpleStatement', ('variableDeclaration',)),  # 34
+    ('simpleStatement', ('assignmentOrFunctionCall',)),  # 35
+    ('simpleStatement', ('returnStatement',)),  # 36
+    ('whileStatement', (  # 37
+        kind.WHILE_NAME, kind.LEFT_BRACKET, 'expression', kind.RIGHT_BRACKET, kind.LEFT_CURLY_BRACKET, 'statements',
+        kind.RIGHT_CURLY_BRACKET,
+    )),
+    ('ifStatement', (  # 38
+        kind.IF_NAME, kind.LEFT_BRACKET, 'expression', kind.RIGHT_BRACKET, kind.LEFT_CURLY_BRACKET, 'statements',
+        kind.RIGHT_CURLY_BRACKET,
+    )),
+    ('relationshipExpression', ('sumExpression', 'relationshipExpression_1')),  # 39
+    ('relationshipExpression_1', ('relationshipOperator', 'sumExpression')),  # 40
+    ('relationshipExpression_1', ()),  # 41
+    ('variableDeclaration', ('type', kind.ID, 'restOfVariableDeclaration')),  # 42
+    ('assignmentOrFunctionCall', (kind.ID, 'assignmentOrFunctionCall_1')),  # 43
+    ('assignmentOrFunctionCall_1', ('restOfAssignment',)),  # 44
+    ('assignmentOrFunctionCall_1', ('restOfFunctionCall',)),  # 45
+    ('returnStatement', (kind.RETURN_NAME, 'returnStatement_1')),  # 46
+    ('returnStatement_1', ('expression',)),  # 47
+    ('returnStatement_1', ()),  # 48
+    ('sumExpression', ('multiplyExpression', 'sumExpression_1')),  # 49
+    ('sumExpression_1', ('sumOperator', 'multiplyExpression', 'sumExpression_1')),  # 50
+    ('sumExpression_1', ()),  # 51
+    ('relationshipOperator', (kind.LESS_THAN_OR_EQUAL_OPERATOR,)),  # 52
+    ('relationshipOperator', (kind.LESS_THAN_OPERATOR,)),  # 53
+    ('relationshipOperator', (kind.GREATER_THAN_OPERATOR,)),  # 54
+    ('relationshipOperator', (kind.GREATER_THAN_OPERATOR_OR_EQUAL,)),  # 55
+    ('relationshipOperator', (kind.EQUAL_OPERATOR,)),  # 56
+    ('relationshipOperator', (kind.NOT_EQUAL_OPERATOR,)),  # 57
+    ('restOfAssignment', (kind.ASSIGN_OPERATOR, 'expression')),  # 58
+    ('restOfFunctionCall', (kind.LEFT_BRACKET, 'args', kind.RIGHT_BRACKET)),  # 59
+    ('multiplyExpression', ('typeCastingFactor', 'multiplyExpression_1')),  # 60
+    ('multiplyExpression_1', ('multiplyOperator', 'typeCastingFactor', 'multiplyExpression_1')),  # 61
+    ('multiplyExpression_1', ()),  # 62
+    ('sumOperator', (kind.ADD_OPERATOR,)),  # 63
+    ('sumOperator', (kind.SUB_OPERATOR,)),  # 64
+    ('args', ('args_1',)),  # 65
+    ('args_2', (kind.COMMA, 'expression', 'args_2')),  # 66
+    ('args_2', ()),  # 67
+    ('args_1', ('expression', 'args_2')),  # 68
+    ('args_1', ()),  # 69
+    ('typeCastingFactor', ('typeCastingFactor_1', 'negationFactor')),  # 70
+    ('typeCastingFactor_1', ('type',)),  # 71
+    ('typeCastingFactor_1', ()),  # 72
+    ('multiplyOperator', (kind.MUL_OPERATOR,)),  # 73
+    ('multiplyOperator', (kind.DIV_OPERATOR,)),  # 74
+    ('multiplyOperator', (kind.MODULO_OPERATOR,)),  # 75
+    ('negationFactor', ('negationFactor_1', 'factor')),  # 76
+    ('negationFactor_1', (kind.NEGATION_OPERATOR,)),  # 77
+    ('negationFactor_1', ()),  # 78
+    ('factor', ('nestedExpression',)),  # 79
+    ('factor', ('functionCallOrVariable',)),  # 80
+    ('factor', ('constant',)),  # 81
+    ('nestedExpression', (kind.LEFT_BRACKET, 'expression', kind.RIGHT_BRACKET)),  # 82
+    ('functionCallOrVariable', (kind.ID, 'functionCallOrVariable_1')),  # 83
+    ('functionCallOrVariable_1', ('restOfFunctionCall',)),  # 84
+    ('functionCallOrVariable_1', ()),  # 85
+    ('constant', ('value', 'constant_1')),  # 86
+    ('constant_1', (kind.CURRENCY,)),  # 87
+    ('constant_1', ()),  # 88
+    ('value', (kind.INT_VALUE,)),  # 89
+    ('value', (kind.FLOAT_VALUE,)),  # 90
+    ('value', (kind.STRING_VALUE,)),  # 91
+    ('value', (kind.BOOL_VALUE,)),  # 92
+    ('value', (kind.CURRENCY_VALUE,)),  # 93
+)
+
+# index of the production of every nonterminal chosen at each kind of token
+PREDICT = {
+    'program': {
+        kind.INT: 0, kind.FLOAT: 0, kind.STRING: 0, kind.BOOL: 0, kind.CURRENCY: 0,
+    },
+    'program_1': {
+        kind.INT: 1, kind.FLOAT: 1, kind.STRING: 1, kind.BOOL: 1, kind.CURRENCY: 1, kind.EOF: 2,
+    },
+    'declaration': {
+        kind.INT: 3, kind.FLOAT: 3, kind.STRING: 3, kind.BOOL: 3, kind.CURRENCY: 3,
+    },
+    'type': {
+        kind.INT: 4, kind.FLOAT: 5, kind.STRING: 6, kind.BOOL: 7, kind.CURRENCY: 8,
+    },
+    'restOfDeclaration': {
+        kind.CURRENCY_DECLARATION_OPERATOR: 9, kind.ID: 10,
+    },
+    'restOfCurrencyDeclaration': {
+        kind.CURRENCY_DECLARATION_OPERATOR: 11,
+    },
+    'restOfFunctionOrVariableDeclaration': {
+        kind.ID: 12,
+    },
+    'restOfFunctionOrVariableDeclaration_1': {
+        kind.LEFT_BRACKET: 13, kind.ASSIGN_OPERATOR: 14,
+    },
+    'restOfFunctionDeclaration': {
+        kind.LEFT_BRACKET: 15,
+    },
+    'restOfVariableDeclaration': {
+        kind.ASSIGN_OPERATOR: 16,
+    },
+    'params': {
+        kind.INT: 17, kind.FLOAT: 17, kind.STRING: 17, kind.BOOL: 17, kind.CURRENCY: 17, kind.RIGHT_BRACKET: 17,
+    },
+    'params_2': {
+        kind.COMMA: 18, kind.RIGHT_BRACKET: 19,
+    },
+    'params_1': {
+        kind.INT: 20, kind.FLOAT: 20, kind.STRING: 20, kind.BOOL: 20, kind.CURRENCY: 20, kind.RIGHT_BRACKET: 21,
+    },
+    'statements': {
+        kind.ID: 22, kind.INT: 22, kind.FLOAT: 22, kind.STRING: 22, kind.BOOL: 22, kind.CURRENCY: 22,
+        kind.RIGHT_CURLY_BRACKET: 22, kind.IF_NAME: 22, kind.RETURN_NAME: 22, kind.WHILE_NAME: 22,
+    },
+    'statements_1': {
+        kind.ID: 23, kind.INT: 23, kind.FLOAT: 23, kind.STRING: 23, kind.BOOL: 23, kind.CURRENCY: 23, kind.IF_NAME: 23,
+        kind.RETURN_NAME: 23, kind.WHILE_NAME: 23, kind.RIGHT_CURLY_BRACKET: 24,
+    },
+    'expression': {
+        kind.ID: 25, kind.NEGATION_OPERATOR: 25, kind.INT: 25, kind.FLOAT: 25, kind.STRING: 25, kind.BOOL: 25,
+        kind.CURRENCY: 25, kind.INT_VALUE: 25, kind.FLOAT_VALUE: 25, kind.STRING_VALUE: 25, kind.BOOL_VALUE: 25,
+        kind.CURRENCY_VALUE: 25, kind.LEFT_BRACKET: 25,
+    },
+    'expression_1': {
+        kind.OR_OPERATOR: 26, kind.RIGHT_BRACKET: 27, kind.COMMA: 27, kind.SEMICOLON: 27,
+    },
+    'statement': {
+        kind.ID: 28, kind.INT: 28, kind.FLOAT: 28, kind.STRING: 28, kind.BOOL: 28, kind.CURRENCY: 28,
+        kind.RETURN_NAME: 28, kind.WHILE_NAME: 29, kind.IF_NAME: 30,
+    },
+    'andExpression': {
+        kind.ID: 31, kind.NEGATION_OPERATOR: 31, kind.INT: 31, kind.FLOAT: 31, kind.STRING: 31, kind.BOOL: 31,
+        kind.CURRENCY: 31, kind.INT_VALUE: 31, kind.FLOAT_VALUE: 31, kind.STRING_VALUE: 31, kind.BOOL_VALUE: 31,
+        kind.CURRENCY_VALUE: 31, kind.LEFT_BRACKET: 31,
+    },
+    'andExpression_1': {
+        kind.AND_OPERATOR: 32, kind.OR_OPERATOR: 33, kind.RIGHT_BRACKET: 33, kind.COMMA: 33, kind.SEMICOLON: 33,
+    },
+    'simpleStatement': {
+        kind.INT: 34, kind.FLOAT: 34, kind.STRING: 34, kind.BOOL: 34, kind.CURRENCY: 34, kind.ID: 35,
+        kind.RETURN_NAME: 36,
+    },
+    'whileStatement': {
+        kind.WHILE_NAME: 37,
+    },
+    'ifStatement': {
+        kind.IF_NAME: 38,
+    },
+    'relationshipExpression': {
+        kind.ID: 39, kind.NEGATION_OPERATOR: 39, kind.INT: 39, kind.FLOAT: 39, kind.STRING: 39, kind.BOOL: 39,
+        kind.CURRENCY: 39, kind.INT_VALUE: 39, kind.FLOAT_VALUE: 39, kind.STRING_VALUE: 39, kind.BOOL_VALUE: 39,
+        kind.CURRENCY_VALUE: 39, kind.LEFT_BRACKET: 39,
+    },
+    'relationshipExpression_1': {
+        kind.EQUAL_OPERATOR: 40, kind.NOT_EQUAL_OPERATOR: 40, kind.LESS_THAN_OPERATOR: 40,
+        kind.GREATER_THAN_OPERATOR: 40, kind.LESS_THAN_OR_EQUAL_OPERATOR: 40, kind.GREATER_THAN_OPERATOR_OR_EQUAL: 40,
+        kind.AND_OPERATOR: 41, kind.OR_OPERATOR: 41, kind.RIGHT_BRACKET: 41, kind.COMMA: 41, kind.SEMICOLON: 41,
+    },
+    'variableDeclaration': {
+        kind.INT: 42, kind.FLOAT: 42, kind.STRING: 42, kind.BOOL: 42, kind.CURRENCY: 42,
+    },
+    'assignmentOrFunctionCall': {
+        kind.ID: 43,
+    },
+    'assignmentOrFunctionCall_1': {
+        kind.ASSIGN_OPERATOR: 44, kind.LEFT_BRACKET: 45,
+    },
+    'returnStatement': {
+        kind.RETURN_NAME: 46,
+    },
+    'returnStatement_1': {
+        kind.ID: 47, kind.NEGATION_OPERATOR: 47, kind.INT: 47, kind.FLOAT: 47, kind.STRING: 47, kind.BOOL: 47,
+        kind.CURRENCY: 47, kind.INT_VALUE: 47, kind.FLOAT_VALUE: 47, kind.STRING_VALUE: 47, kind.BOOL_VALUE: 47,
+        kind.CURRENCY_VALUE: 47, kind.LEFT_BRACKET: 47, kind.SEMICOLON: 48,
+    },
+    'sumExpression': {
+        kind.ID: 49, kind.NEGATION_OPERATOR: 49, kind.INT: 49, kind.FLOAT: 49, kind.STRING: 49, kind.BOOL: 49,
+        kind.CURRENCY: 49, kind.INT_VALUE: 49, kind.FLOAT_VALUE: 49, kind.STRING_VALUE: 49, kind.BOOL_VALUE: 49,
+        kind.CURRENCY_VALUE: 49, kind.LEFT_BRACKET: 49,
+    },
+    'sumExpression_1': {
+        kind.ADD_OPERATOR: 50, kind.SUB_OPERATOR: 50, kind.AND_OPERATOR: 51, kind.OR_OPERATOR: 51,
+        kind.EQUAL_OPERATOR: 51, kind.NOT_EQUAL_OPERATOR: 51, kind.LESS_THAN_OPERATOR: 51,
+        kind.GREATER_THAN_OPERATOR: 51, kind.LESS_THAN_OR_EQUAL_OPERATOR: 51, kind.GREATER_THAN_OPERATOR_OR_EQUAL: 51,
+        kind.RIGHT_BRACKET: 51, kind.COMMA: 51, kind.SEMICOLON: 51,
+    },
+    'relationshipOperator': {
+        kind.LESS_THAN_OR_EQUAL_OPERATOR: 52, kind.LESS_THAN_OPERATOR: 53, kind.GREATER_THAN_OPERATOR: 54,
+        kind.GREATER_THAN_OPERATOR_OR_EQUAL: 55, kind.EQUAL_OPERATOR: 56, kind.NOT_EQUAL_OPERATOR: 57,
+    },
+    'restOfAssignment': {
+        kind.ASSIGN_OPERATOR: 58,
+    },
+    'restOfFunctionCall': {
+        kind.LEFT_BRACKET: 59,
+    },
+    'multiplyExpression': {
+        kind.ID: 60, kind.NEGATION_OPERATOR: 60, kind.INT: 60, kind.FLOAT: 60, kind.STRING: 60, kind.BOOL: 60,
+        kind.CURRENCY: 60, kind.INT_VALUE: 60, kind.FLOAT_VALUE: 60, kind.STRING_VALUE: 60, kind.BOOL_VALUE: 60,
+        kind.CURRENCY_VALUE: 60, kind.LEFT_BRACKET: 60,
+    },
+    'multiplyExpression_1': {
+        kind.MUL_OPERATOR: 61, kind.DIV_OPERATOR: 61, kind.MODULO_OPERATOR: 61, kind.AND_OPERATOR: 62,
+        kind.OR_OPERATOR: 62, kind.ADD_OPERATOR: 62, kind.SUB_OPERATOR: 62, kind.EQUAL_OPERATOR: 62,
+        kind.NOT_EQUAL_OPERATOR: 62, kind.LESS_THAN_OPERATOR: 62, kind.GREATER_THAN_OPERATOR: 62,
+        kind.LESS_THAN_OR_EQUAL_OPERATOR: 62, kind.GREATER_THAN_OPERATOR_OR_EQUAL: 62, kind.RIGHT_BRACKET: 62,
+        kind.COMMA: 62, kind.SEMICOLON: 62,
+    },
+    'sumOperator': {
+        kind.ADD_OPERATOR: 63, kind.SUB_OPERATOR: 64,
+    },
+    'args': {
+        kind.ID: 65, kind.NEGATION_OPERATOR: 65, kind.INT: 65, kind.FLOAT: 65, kind.STRING: 65, kind.BOOL: 65,
+        kind.CURRENCY: 65, kind.INT_VALUE: 65, kind.FLOAT_VALUE: 65, kind.STRING_VALUE: 65, kind.BOOL_VALUE: 65,
+        kind.CURRENCY_VALUE: 65, kind.LEFT_BRACKET: 65, kind.RIGHT_BRACKET: 65,
+    },
+    'args_2': {
+        kind.COMMA: 66, kind.RIGHT_BRACKET: 67,
+    },
+    'args_1': {
+        kind.ID: 68, kind.NEGATION_OPERATOR: 68, kind.INT: 68, kind.FLOAT: 68, kind.STRING: 68, kind.BOOL: 68,
+        kind.CURRENCY: 68, kind.INT_VALUE: 68, kind.FLOAT_VALUE: 68, kind.STRING_VALUE: 68, kind.BOOL_VALUE: 68,
+        kind.CURRENCY_VALUE: 68, kind.LEFT_BRACKET: 68, kind.RIGHT_BRACKET: 69,
+    },
+    'typeCastingFactor': {
+        kind.ID: 70, kind.NEGATION_OPERATOR: 70, kind.INT: 70, kind.FLOAT: 70, kind.STRING: 70, kind.BOOL: 70,
+        kind.CURRENCY: 70, kind.INT_VALUE: 70, kind.FLOAT_VALUE: 70, kind.STRING_VALUE: 70, kind.BOOL_VALUE: 70,
+        kind.CURRENCY_VALUE: 70, kind.LEFT_BRACKET: 70,
+    },
+    'typeCastingFactor_1': {
+        kind.INT: 71, kind.FLOAT: 71, kind.STRING: 71, kind.BOOL: 71, kind.CURRENCY: 71, kind.ID: 72,
+        kind.NEGATION_OPERATOR: 72, kind.INT_VALUE: 72, kind.FLOAT_VALUE: 72, kind.STRING_VALUE: 72,
+        kind.BOOL_VALUE: 72, kind.CURRENCY_VALUE: 72, kind.LEFT_BRACKET: 72,
+    },
+    'multiplyOperator': {
+        kind.MUL_OPERATOR: 73, kind.DIV_OPERATOR: 74, kind.MODULO_OPERATOR: 75,
+    },
+    'negationFactor': {
+        kind.ID: 76, kind.NEGATION_OPERATOR: 76, kind.INT_VALUE: 76, kind.FLOAT_VALUE: 76, kind.STRING_VALUE: 76,
+        kind.BOOL_VALUE: 76, kind.CURRENCY_VALUE: 76, kind.LEFT_BRACKET: 76,
+    },
+    'negationFactor_1': {
+        kind.NEGATION_OPERATOR: 77, kind.ID: 78, kind.INT_VALUE: 78, kind.FLOAT_VALUE: 78, kind.STRING_VALUE: 78,
+        kind.BOOL_VALUE: 78, kind.CURRENCY_VALUE: 78, kind.LEFT_BRACKET: 78,
+    },
+    'factor': {
+        kind.LEFT_BRACKET: 79, kind.ID: 80, kind.INT_VALUE: 81, kind.FLOAT_VALUE: 81, kind.STRING_VALUE: 81,
+        kind.BOOL_VALUE: 81, kind.CURRENCY_VALUE: 81,
+    },
+    'nestedExpression': {
+        kind.LEFT_BRACKET: 82,
+    },
+    'functionCallOrVariable': {
+        kind.ID: 83,
+    },
+    'functionCallOrVariable_1': {
+        kind.LEFT_BRACKET: 84, kind.AND_OPERATOR: 85, kind.OR_OPERATOR: 85, kind.ADD_OPERATOR: 85,
+        kind.SUB_OPERATOR: 85, kind.MUL_OPERATOR: 85, kind.DIV_OPERATOR: 85, kind.MODULO_OPERATOR: 85,
+        kind.EQUAL_OPERATOR: 85, kind.NOT_EQUAL_OPERATOR: 85, kind.LESS_THAN_OPERATOR: 85,
+        kind.GREATER_THAN_OPERATOR: 85, kind.LESS_THAN_OR_EQUAL_OPERATOR: 85, kind.GREATER_THAN_OPERATOR_OR_EQUAL: 85,
+        kind.RIGHT_BRACKET: 85, kind.COMMA: 85, kind.SEMICOLON: 85,
+    },
+    'constant': {
+        kind.INT_VALUE: 86, kind.FLOAT_VALUE: 86, kind.STRING_VALUE: 86, kind.BOOL_VALUE: 86, kind.CURRENCY_VALUE: 86,
+    },
+    'constant_1': {
+        kind.CURRENCY: 87, kind.AND_OPERATOR: 88, kind.OR_OPERATOR: 88, kind.ADD_OPERATOR: 88, kind.SUB_OPERATOR: 88,
+        kind.MUL_OPERATOR: 88, kind.DIV_OPERATOR: 88, kind.MODULO_OPERATOR: 88, kind.EQUAL_OPERATOR: 88,
+        kind.NOT_EQUAL_OPERATOR: 88, kind.LESS_THAN_OPERATOR: 88, kind.GREATER_THAN_OPERATOR: 88,
+        kind.LESS_THAN_OR_EQUAL_OPERATOR: 88, kind.GREATER_THAN_OPERATOR_OR_EQUAL: 88, kind.RIGHT_BRACKET: 88,
+        kind.COMMA: 88, kind.SEMICOLON: 88,
+    },
+    'value': {
+        kind.INT_VALUE: 89, kind.FLOAT_VALUE: 90, kind.STRING_VALUE: 91, kind.BOOL_VALUE: 92, kind.CURRENCY_VALUE: 93,
+    },
+}
+
+# kinds of tokens which can begin every rule
+FIRST = {
+    'program': frozenset({
+        kind.INT, kind.FLOAT, kind.STRING, kind.BOOL, kind.CURRENCY,
+    }),
+    'declaration': frozenset({
+        kind.INT, kind.FLOAT, kind.STRING, kind.BOOL, kind.CURRENCY,
+    }),
+    'type': frozenset({
+        kind.INT, kind.FLOAT, kind.STRING, kind.BOOL, kind.CURRENCY,
+    }),
+    'restOfDeclaration': frozenset({
+        kind.ID, kind.CURRENCY_DECLARATION_OPERATOR,
+    }),
+    'restOfCurrencyDeclaration': frozenset({
+        kind.CURRENCY_DECLARATION_OPERATOR,
+    }),
+    'restOfFunctionOrVariableDeclaration': frozenset({
+        kind.ID,
+    }),
+    'restOfFunctionDeclaration': frozenset({
+        kind.LEFT_BRACKET,
+    }),
+    'restOfVariableDeclaration': frozenset({
+        kind.ASSIGN_OPERATOR,
+    }),
+    'params': frozenset({
+        kind.INT, kind.FLOAT, kind.STRING, kind.BOOL, kind.CURRENCY,
+    }),
+    'statements': frozenset({
+        kind.ID, kind.INT, kind.FLOAT, kind.STRING, kind.BOOL, kind.CURRENCY, kind.IF_NAME, kind.RETURN_NAME,
+        kind.WHILE_NAME,
+    }),
+    'expression': frozenset({
+        kind.ID, kind.NEGATION_OPERATOR, kind.INT, kind.FLOAT, kind.STRING, kind.BOOL, kind.CURRENCY, kind.INT_VALUE,
+        kind.FLOAT_VALUE, kind.STRING_VALUE, kind.BOOL_VALUE, kind.CURRENCY_VALUE, kind.LEFT_BRACKET,
+    }),
+    'statement': frozenset({
+        kind.ID, kind.INT, kind.FLOAT, kind.STRING, kind.BOOL, kind.CURRENCY, kind.IF_NAME, kind.RETURN_NAME,
+        kind.WHILE_NAME,
+    }),
+    'andExpression': frozenset({
+        kind.ID, kind.NEGATION_OPERATOR, kind.INT, kind.FLOAT, kind.STRING, kind.BOOL, kind.CURRENCY, kind.INT_VALUE,
+        kind.FLOAT_VALUE, kind.STRING_VALUE, kind.BOOL_VALUE, kind.CURRENCY_VALUE, kind.LEFT_BRACKET,
+    }),
+    'simpleStatement': frozenset({
+        kind.ID, kind.INT, kind.FLOAT, kind.STRING, kind.BOOL, kind.CURRENCY, kind.RETURN_NAME,
+    }),
+    'whileStatement': frozenset({
+        kind.WHILE_NAME,
+    }),
+    'ifStatement': frozenset({
+        kind.IF_NAME,
+    }),
+    'relationshipExpression': frozenset({
+        kind.ID, kind.NEGATION_OPERATOR, kind.INT, kind.FLOAT, kind.STRING, kind.BOOL, kind.CURRENCY, kind.INT_VALUE,
+        kind.FLOAT_VALUE, kind.STRING_VALUE, kind.BOOL_VALUE, kind.CURRENCY_VALUE, kind.LEFT_BRACKET,
+    }),
+    'variableDeclaration': frozenset({
+        kind.INT, kind.FLOAT, kind.STRING, kind.BOOL, kind.CURRENCY,
+    }),
+    'assignmentOrFunctionCall': frozenset({
+        kind.ID,
+    }),
+    'returnStatement': frozenset({
+        kind.RETURN_NAME,
+    }),
+    'sumExpression': frozenset({
+        kind.ID, kind.NEGATION_OPERATOR, kind.INT, kind.FLOAT, kind.STRING, kind.BOOL, kind.CURRENCY, kind.INT_VALUE,
+        kind.FLOAT_VALUE, kind.STRING_VALUE, kind.BOOL_VALUE, kind.CURRENCY_VALUE, kind.LEFT_BRACKET,
+    }),
+    'relationshipOperator': frozenset({
+        kind.EQUAL_OPERATOR, kind.NOT_EQUAL_OPERATOR, kind.LESS_THAN_OPERATOR, kind.GREATER_THAN_OPERATOR,
+        kind.LESS_THAN_OR_EQUAL_OPERATOR, kind.GREATER_THAN_OPERATOR_OR_EQUAL,
+    }),
+    'restOfAssignment': frozenset({
+        kind.ASSIGN_OPERATOR,
+    }),
+    'restOfFunctionCall': frozenset({
+        kind.LEFT_BRACKET,
+    }),
+    'multiplyExpression': frozenset({
+        kind.ID, kind.NEGATION_OPERATOR, kind.INT, kind.FLOAT, kind.STRING, kind.BOOL, kind.CURRENCY, kind.INT_VALUE,
+        kind.FLOAT_VALUE, kind.STRING_VALUE, kind.BOOL_VALUE, kind.CURRENCY_VALUE, kind.LEFT_BRACKET,
+    }),
+    'sumOperator': frozenset({
+        kind.ADD_OPERATOR, kind.SUB_OPERATOR,
+    }),
+    'args': frozenset({
+        kind.ID, kind.NEGATION_OPERATOR, kind.INT, kind.FLOAT, kind.STRING, kind.BOOL, kind.CURRENCY, kind.INT_VALUE,
+        kind.FLOAT_VALUE, kind.STRING_VALUE, kind.BOOL_VALUE, kind.CURRENCY_VALUE, kind.LEFT_BRACKET,
+    }),
+    'typeCastingFactor': frozenset({
+        kind.ID, kind.NEGATION_OPERATOR, kind.INT, kind.FLOAT, kind.STRING, kind.BOOL, kind.CURRENCY, kind.INT_VALUE,
+        kind.FLOAT_VALUE, kind.STRING_VALUE, kind.BOOL_VALUE, kind.CURRENCY_VALUE, kind.LEFT_BRACKET,
+    }),
+    'multiplyOperator': frozenset({
+        kind.MUL_OPERATOR, kind.DIV_OPERATOR, kind.MODULO_OPERATOR,
+    }),
+    'negationFactor': frozenset({
+        kind.ID, kind.NEGATION_OPERATOR, kind.INT_VALUE, kind.FLOAT_VALUE, kind.STRING_VALUE, kind.BOOL_VALUE,
+        kind.CURRENCY_VALUE, kind.LEFT_BRACKET,
+    }),
+    'factor': frozenset({
+        kind.ID, kind.INT_VALUE, kind.FLOAT_VALUE, kind.STRING_VALUE, kind.BOOL_VALUE, kind.CURRENCY_VALUE,
+        kind.LEFT_BRACKET,
+    }),
+    'nestedExpression': frozenset({
+        kind.LEFT_BRACKET,
+    }),
+    'functionCallOrVariable': frozenset({
+        kind.ID,
+    }),
+    'constant': frozenset({
+        kind.INT_VALUE, kind.FLOAT_VALUE, kind.STRING_VALUE, kind.BOOL_VALUE, kind.CURRENCY_VALUE,
+    }),
+    'value': frozenset({
+        kind.INT_VALUE, kind.FLOAT_VALUE, kind.STRING_VALUE, kind.BOOL_VALUE, kind.CURRENCY_VALUE,
+    }),
+}
+
+# rule with which the alternative of a rule chosen at each kind of token begins
+ALTERNATIVES = {
+    'restOfDeclaration': {
+        kind.CURRENCY_DECLARATION_OPERATOR: 'restOfCurrencyDeclaration', kind.ID: 'restOfFunctionOrVariableDeclaration',
+    },
+    'statement': {
+        kind.ID: 'simpleStatement', kind.INT: 'simpleStatement', kind.FLOAT: 'simpleStatement',
+        kind.STRING: 'simpleStatement', kind.BOOL: 'simpleStatement', kind.CURRENCY: 'simpleStatement',
+        kind.RETURN_NAME: 'simpleStatement', kind.WHILE_NAME: 'whileStatement', kind.IF_NAME: 'ifStatement',
+    },
+    'simpleStatement': {
+        kind.INT: 'variableDeclaration', kind.FLOAT: 'variableDeclaration', kind.STRING: 'variableDeclaration',
+        kind.BOOL: 'variableDeclaration', kind.CURRENCY: 'variableDeclaration', kind.ID: 'assignmentOrFunctionCall',
+        kind.RETURN_NAME: 'returnStatement',
+    },
+    'factor': {
+        kind.LEFT_BRACKET: 'nestedExpression', kind.ID: 'functionCallOrVariable', kind.INT_VALUE: 'constant',
+        kind.FLOAT_VALUE: 'constant', kind.STRING_VALUE: 'constant', kind.BOOL_VALUE: 'constant',
+        kind.CURRENCY_VALUE: 'constant',
+    },
+}
@@ -1,389 +1,572 @@
-from typing import List, Union, Optional
+from typing import Callable, Dict, List, Union, Optional, Tuple
 
 from interpreter.lexer.lexer import Lexer
 from interpreter.models.constants import TOKEN_TYPE_INTO_RELATIONSHIP_OPERAND, TOKEN_TYPE_INTO_SUM_OPERATOR, \
-    token_type_into_mul_operator, TOKEN_TYPES_INTO_TYPES, CurrencyType, POSSIBLE_TOKEN_TYPES, \
+    token_type_into_mul_operator, TOKEN_TYPES_INTO_TYPES, CurrencyType, \
     CustomTypeOfTypes, CurrencyValue
 from interpreter.models.declarations import Declaration, CurrencyDeclaration, VariableDeclaration, \
     FunctionDeclaration, ParseTree
-from interpreter.models.base import FunctionCall, Constant, Variable, Factor, Assignment, Param
-from interpreter.models.expressions import Expression, AndExpression, RelationshipExpression, SumExpression, \
-    MultiplyExpression, TypeCastingFactor, NegationFactor
+from interpreter.models.base import FunctionCall, Constant, Variable, Assignment, Param
+from interpreter.models.expressions import ExpressionTypes
 from interpreter.models.statements import ReturnStatement, IfStatement, WhileStatement, \
     Statements, StatementsTypes
+from interpreter.parser import parse_tables
 from interpreter.parser.parser_error import ParserError
-from interpreter.token.token import Token
+from interpreter.parser.token_cursor import TokenCursor, LexerTokenCursor
+from interpreter.parser.tree_builder import ParseTreeBuilder
+from interpreter.token import token_kind as kind
+from interpreter.token.token_kind import TOKEN_TYPES
+from interpreter.token.token_table import TokenTable, TokenValue
 from interpreter.token.token_type import TokenType
 
 
+KIND_INTO_TYPES = {token_type.value: type for token_type, type in TOKEN_TYPES_INTO_TYPES.items()}
+KIND_INTO_RELATIONSHIP_OPERAND = {
+    token_type.value: operator for token_type, operator in TOKEN_TYPE_INTO_RELATIONSHIP_OPERAND.items()
+}
+KIND_INTO_SUM_OPERATOR = {token_type.value: operator for token_type, operator in TOKEN_TYPE_INTO_SUM_OPERATOR.items()}
+KIND_INTO_MUL_OPERATOR = {token_type.value: operator for token_type, operator in token_type_into_mul_operator.items()}
+TYPE_KINDS = parse_tables.FIRST['type']
+CONSTANT_KINDS = parse_tables.FIRST['constant']
+INVALID_FACTOR_MESSAGE = "Invalid factor, nested expression, constant, variable or function call expected"
+# levels of expressions from the loosest to the tightest binding operators, see Parser.parse_operators
+EXPRESSION_LEVEL = 0
+AND_LEVEL = 1
+RELATIONSHIP_LEVEL = 2
+SUM_LEVEL = 3
+MULTIPLY_LEVEL = 4
+
+
 class Parser:
-    def __init__(self, lexer: Lexer):
-        self.lexer = lexer
-        self.token = lexer.get_next_token()
-        self.previous_token = self.token
+    def __init__(self, tokens: Union[Lexer, TokenTable], builder=None, lazy_functions: bool = False):
+        """
+        tokens can be a lexer, then tokens are read one by one while parsing,
+        or a token table made in advance by Lexer.tokenize.
+        Nodes are made by builder, by default ParseTreeBuilder, with ArenaBuilder the program is parsed
+        straight into a TreeArena, and HashConsingBuilder finds identical expressions.
+        With lazy_functions bodies of functions are only matched by their braces, each of them is parsed
+        when the function is called for the first time, see FunctionBody. It needs a token table.
+        """
+        if isinstance(tokens, TokenTable):
+            self.cursor = TokenCursor(tokens)
+        elif lazy_functions:
+            raise ValueError("Functions can be parsed lazily only from a token table")
+        else:
+            self.cursor = LexerTokenCursor(tokens)
+        self.builder = ParseTreeBuilder() if builder is None else builder
+        self.lazy_functions = lazy_functions
+        self._kinds: Optional[bytes] = None
+        # types are immutable, so every currency has one type shared by all nodes
+        self.currency_types: Dict[str, CurrencyType] = {}
 
     def parse_program(self) -> ParseTree:
         """
         program = declaration, {declaration};
         """
         declarations = [self.parse_declaration()]
-        while self.token.type != TokenType.EOF:
+        while self.cursor.kind != kind.EOF:
             declarations.append(self.parse_declaration())
-        return ParseTree(declarations)
+        return self.builder.parse_tree(tuple(declarations))
 
     def next_token(self):
-        self.previous_token = self.token
-        self.token = self.lexer.get_next_token()
+        self.cursor.advance()
 
-    def expect_token(self, *args: TokenType) -> bool:
-        for token_type in args:
-            if self.token.type == token_type:
-                return True
-        raise ParserError(self.token.source_position, self.token.type, list(args))
+    def expect_token(self, *args: int) -> bool:
+        if self.cursor.kind in args:
+            return True
+        expected = [TOKEN_TYPES[token_kind] for token_kind in args]
+        raise ParserError(self.cursor.get_position(), self.cursor.type, expected)
 
-    def consume_token(self, *args: TokenType) -> Token:
+    def consume_token(self, *args: int) -> TokenValue:
         self.expect_token(*args)
-        token = self.token
-        self.next_token()
-        return token
+        return self.advance_token()
 
-    def advance_token(self) -> Token:
-        token = self.token
-        self.next_token()
-        return token
+    def advance_token(self) -> TokenValue:
+        value = self.cursor.value
+        self.cursor.advance()
+        return value
 
     def parse_declaration(self) -> Declaration:
         """
-        declaration = (varDeclaration | currencyDeclaration, ";") |  functionDeclaration;
+        declaration = type, restOfDeclaration;
+        restOfDeclaration = restOfCurrencyDeclaration | restOfFunctionOrVariableDeclaration;
         """
         var_type = self.parse_type_name()
-        declaration = self.parse_rest_of_currency_declaration(var_type) \
-                      or self.parse_rest_of_function_declaration_or_variable_declaration(var_type)
-
-        if type(declaration) is VariableDeclaration or type(declaration) is CurrencyDeclaration:
-            self.consume_token(TokenType.SEMICOLON)
-
-        if declaration is None:
+        parse_rest_of_declaration = DECLARATION_PARSERS.get(self.cursor.kind)
+        if parse_rest_of_declaration is None:
             raise ParserError(
-                self.token.source_position, self.token.type, [TokenType.CURRENCY] + list(TOKEN_TYPES_INTO_TYPES.keys())
+                self.cursor.get_position(), self.cursor.type, [TokenType.CURRENCY] + list(TOKEN_TYPES_INTO_TYPES.keys())
             )
-        return declaration
+        return parse_rest_of_declaration(self, var_type)
 
     def parse_rest_of_currency_declaration(self, currency: CustomTypeOfTypes) -> Optional[CurrencyDeclaration]:
         """
-        currencyDeclaration = currency_ID, ":=", float;
+        restOfCurrencyDeclaration = ":=", float, ";";
         """
-        if self.token.type != TokenType.CURRENCY_DECLARATION_OPERATOR:
+        if self.cursor.kind != kind.CURRENCY_DECLARATION_OPERATOR:
             return None
-        self.consume_token(TokenType.CURRENCY_DECLARATION_OPERATOR)
+        self.consume_token(kind.CURRENCY_DECLARATION_OPERATOR)
 
         currency_name = currency.name
-        value_token = self.consume_token(TokenType.FLOAT_VALUE)
-        currency_value = value_token.value
-        currency_declaration = CurrencyDeclaration(value_token.source_position, currency_name, currency_value)
+        currency_value = self.consume_token(kind.FLOAT_VALUE)
+        currency_declaration = self.builder.currency_declaration(
+            self.cursor.get_previous_position(), currency_name, currency_value
+        )
+        self.consume_token(kind.SEMICOLON)
         return currency_declaration
 
     def parse_rest_of_function_declaration_or_variable_declaration(self, type: CustomTypeOfTypes) \
             -> Optional[Union[FunctionDeclaration, VariableDeclaration]]:
         """
-        functionDeclaration = type, ID, "(", parms, ")", "{", statements, "}";
-        varDeclaration = type, ID, ['=', expression];
+        restOfFunctionOrVariableDeclaration = ID, (restOfFunctionDeclaration | restOfVariableDeclaration, ";");
         """
 
-        if self.token.type != TokenType.ID:
+        if self.cursor.kind != kind.ID:
             return None
-        id_token = self.consume_token(TokenType.ID)
-        id = id_token.value
+        id = self.consume_token(kind.ID)
 
-        declaration = self.parse_rest_of_function_declaration(type, id) \
-                      or self.parse_rest_of_variable_declaration(type, id)
+        declaration = self.parse_rest_of_function_declaration(type, id)
+        if declaration is None:
+            declaration = self.parse_rest_of_variable_declaration(type, id)
+            self.consume_token(kind.SEMICOLON)
         return declaration
 
     def parse_rest_of_function_declaration(self, type: CustomTypeOfTypes, id: str) -> Optional[FunctionDeclaration]:
         """
-        functionDeclaration = type, ID, "(", parms, ")", "{", statements, "}";
+        restOfFunctionDeclaration = "(", params, ")", "{", statements, "}";
         """
-        if self.token.type != TokenType.LEFT_BRACKET:
+        if self.cursor.kind != kind.LEFT_BRACKET:
             return None
-        self.consume_token(TokenType.LEFT_BRACKET)
+        self.consume_token(kind.LEFT_BRACKET)
         params = self.parse_params()
-        self.consume_token(TokenType.RIGHT_BRACKET)
-        self.consume_token(TokenType.LEFT_CURLY_BRACKET)
-        statements = self.parse_statements()
-        self.consume_token(TokenType.RIGHT_CURLY_BRACKET)
-        return FunctionDeclaration(self.previous_token.source_position, type, id, params, statements)
+        self.consume_token(kind.RIGHT_BRACKET)
+        self.consume_token(kind.LEFT_CURLY_BRACKET)
+        if self.lazy_functions:
+            statements = self.skip_function_body()
+        else:
+            statements = self.parse_statements()
+        self.consume_token(kind.RIGHT_CURLY_BRACKET)
+        return self.builder.function_declaration(self.cursor.get_previous_position(), type, id, params, statements)
+
+    def skip_function_body(self) -> 'FunctionBody':
+        """
+        Moves to the brace closing the body which begins at the current token, without parsing it.
+        Kinds of tokens are bytes, so braces are found by bytes.find instead of a loop over tokens.
+        """
+        if self._kinds is None:
+            self._kinds = self.cursor.table.kinds.tobytes()
+        kinds = self._kinds
+        start = self.cursor.index
+        next_open = kinds.find(kind.LEFT_CURLY_BRACKET, start)
+        next_close = kinds.find(kind.RIGHT_CURLY_BRACKET, start)
+        depth = 1
+        while True:
+            if next_close == -1:
+                self.cursor.seek(len(kinds) - 1)
+                self.expect_token(kind.RIGHT_CURLY_BRACKET)
+            if next_open != -1 and next_open < next_close:
+                depth += 1
+                next_open = kinds.find(kind.LEFT_CURLY_BRACKET, next_open + 1)
+                continue
+            depth -= 1
+            if depth == 0:
+                break
+            next_close = kinds.find(kind.RIGHT_CURLY_BRACKET, next_close + 1)
+        self.cursor.seek(next_close)
+        return FunctionBody(self.cursor.table, start, next_close, self.builder)
 
     def parse_variable_declaration(self) -> Optional[VariableDeclaration]:
-        if self.token.type not in TOKEN_TYPES_INTO_TYPES and self.token.type != TokenType.CURRENCY:
+        """
+        variableDeclaration = type, ID, restOfVariableDeclaration;
+        """
+        if self.cursor.kind not in TYPE_KINDS:
             return None
         type = self.parse_type_name()
-        id_token = self.consume_token(TokenType.ID)
-        return self.parse_rest_of_variable_declaration(type, id_token.value)
+        id = self.consume_token(kind.ID)
+        return self.parse_rest_of_variable_declaration(type, id)
 
     def parse_rest_of_variable_declaration(self, type: CustomTypeOfTypes, id: str) -> VariableDeclaration:
         """
-        varDeclaration = type, ID, '=', expression;
+        restOfVariableDeclaration = "=", expression;
         """
-        self.consume_token(TokenType.ASSIGN_OPERATOR)
+        self.consume_token(kind.ASSIGN_OPERATOR)
         expression = self.parse_expression()
-        return VariableDeclaration(self.previous_token.source_position, type, id, expression)
+        return self.builder.variable_declaration(self.cursor.get_previous_position(), type, id, expression)
 
     def parse_assignment_with_id(self, id: str) -> Optional[Assignment]:
         """
         restOfAssignment = "=", expression;
         """
-        if self.token.type != TokenType.ASSIGN_OPERATOR:
+        if self.cursor.kind != kind.ASSIGN_OPERATOR:
             return None
-        self.consume_token(TokenType.ASSIGN_OPERATOR)
+        self.consume_token(kind.ASSIGN_OPERATOR)
         expression = self.parse_expression()
-        return Assignment(self.previous_token.source_position, id, expression)
+        return self.builder.assignment(self.cursor.get_previous_position(), id, expression)
 
     def parse_statements(self) -> Statements:
         """
-        statements = {
-              ((
-                 varDeclaration
-                 | ID, (restOfAssignment | restOfFunctionCall)
-                 | returnStatement
-              ), ";")
-              | (
-                whileStatement
-                | if_statement
-              )
-        };
+        statements = {statement};
+        statement = simpleStatement, ";" | whileStatement | ifStatement;
+        Blocks of while and if statements are parsed without recursion, the statements around a block are kept
+        on a stack until its closing bracket, so any depth of nesting takes no Python stack.
         """
+        cursor = self.cursor
+        builder = self.builder
+        statement_parsers = STATEMENT_PARSERS
+        stack = []
         statements: List[StatementsTypes] = []
         while True:
-            statement = self.parse_variable_declaration() \
-                        or self.parse_assignment_or_function_call() \
-                        or self.parse_return_statement() \
-                        or self.parse_while_statement() \
-                        or self.parse_if_statement()
-            if type(statement) is WhileStatement or type(statement) is IfStatement:
-                statements.append(statement)
-            elif statement:
-                statements.append(statement)
-                self.consume_token(TokenType.SEMICOLON)
-            else:
-                break
-        return Statements(statements)
+            token_kind = cursor.kind
+            if token_kind == kind.WHILE_NAME or token_kind == kind.IF_NAME:
+                stack.append((statements, token_kind, self.parse_block_start()))
+                statements = []
+                continue
+            parse_statement = statement_parsers.get(token_kind)
+            if parse_statement is not None:
+                statements.append(parse_statement(self))
+                continue
+            if not stack:
+                return builder.statements(tuple(statements))
+
+            block_statements = builder.statements(tuple(statements))
+            self.consume_token(kind.RIGHT_CURLY_BRACKET)
+            statements, block_kind, expression = stack.pop()
+            build = builder.while_statement if block_kind == kind.WHILE_NAME else builder.if_statement
+            statements.append(build(cursor.get_previous_position(), expression, block_statements))
+
+    def parse_block_start(self) -> ExpressionTypes:
+        """
+        Start of a while or if statement, up to the opening bracket of its block
+        """
+        self.advance_token()
+        self.consume_token(kind.LEFT_BRACKET)
+
+        expression = self.parse_expression()
+
+        self.consume_token(kind.RIGHT_BRACKET)
+        self.consume_token(kind.LEFT_CURLY_BRACKET)
+        return expression
+
+    def parse_simple_statement(self) -> StatementsTypes:
+        """
+        simpleStatement = variableDeclaration | assignmentOrFunctionCall | returnStatement;
+        """
+        statement = SIMPLE_STATEMENT_PARSERS[self.cursor.kind](self)
+        self.consume_token(kind.SEMICOLON)
+        return statement
 
     def parse_assignment_or_function_call(self) -> Optional[Union[Assignment, FunctionCall]]:
-        if self.token.type != TokenType.ID:
+        """
+        assignmentOrFunctionCall = ID, (restOfAssignment | restOfFunctionCall);
+        """
+        if self.cursor.kind != kind.ID:
             return None
-        id_token = self.advance_token()
-        id = id_token.value
-        return self.parse_assignment_with_id(id) or self.parse_function_call(id)
+        id = self.advance_token()
+        # the builder can give nodes which are not objects, so they are compared with None only
+        assignment = self.parse_assignment_with_id(id)
+        if assignment is not None:
+            return assignment
+        function_call = self.parse_function_call(id)
+        if function_call is None:
+            raise ParserError(self.cursor.get_position(), self.cursor.type,
+                              [TokenType.ASSIGN_OPERATOR, TokenType.LEFT_BRACKET])
+        return function_call
 
     def parse_return_statement(self) -> Optional[ReturnStatement]:
         """
         returnStatement = "return", [expression];
         """
-        if self.token.type != TokenType.RETURN_NAME:
+        if self.cursor.kind != kind.RETURN_NAME:
             return None
 
-        self.consume_token(TokenType.RETURN_NAME)
-        if self.token.type == TokenType.SEMICOLON:
-            return ReturnStatement(self.previous_token.source_position, None)
+        self.consume_token(kind.RETURN_NAME)
+        if self.cursor.kind == kind.SEMICOLON:
+            return self.builder.return_statement(self.cursor.get_previous_position(), None)
         expression = self.parse_expression()
-        return ReturnStatement(self.previous_token.source_position, expression)
+        return self.builder.return_statement(self.cursor.get_previous_position(), expression)
 
     def parse_while_statement(self) -> Optional[WhileStatement]:
         """
         whileStatement = "while", "(", expression, ")", "{", statements, "}";
         """
-        if self.token.type != TokenType.WHILE_NAME:
+        if self.cursor.kind != kind.WHILE_NAME:
             return None
-        self.advance_token()
-        self.consume_token(TokenType.LEFT_BRACKET)
-
-        expression = self.parse_expression()
-
-        self.consume_token(TokenType.RIGHT_BRACKET)
-        self.consume_token(TokenType.LEFT_CURLY_BRACKET)
+        expression = self.parse_block_start()
 
         statements = self.parse_statements()
 
-        self.consume_token(TokenType.RIGHT_CURLY_BRACKET)
-        return WhileStatement(self.previous_token.source_position, expression, statements)
+        self.consume_token(kind.RIGHT_CURLY_BRACKET)
+        return self.builder.while_statement(self.cursor.get_previous_position(), expression, statements)
 
     def parse_if_statement(self) -> Optional[IfStatement]:
         """
-        if_statement = "if", "(", expression, ")", "{", statements, "}";
+        ifStatement = "if", "(", expression, ")", "{", statements, "}";
         """
-        if self.token.type != TokenType.IF_NAME:
+        if self.cursor.kind != kind.IF_NAME:
             return None
-        self.advance_token()
-        self.consume_token(TokenType.LEFT_BRACKET)
-
-        expression = self.parse_expression()
-
-        self.consume_token(TokenType.RIGHT_BRACKET)
-        self.consume_token(TokenType.LEFT_CURLY_BRACKET)
+        expression = self.parse_block_start()
 
         statements = self.parse_statements()
 
-        self.consume_token(TokenType.RIGHT_CURLY_BRACKET)
-        return IfStatement(self.previous_token.source_position, expression, statements)
+        self.consume_token(kind.RIGHT_CURLY_BRACKET)
+        return self.builder.if_statement(self.cursor.get_previous_position(), expression, statements)
 
-    def parse_expression(self) -> Optional[Expression]:
+    def parse_expression(self) -> ExpressionTypes:
         """
-        expression = andExpression, {"or", andExpression};
+        expression = andExpression, {"||", andExpression};
         """
-        and_expression = self.parse_and_expression()
-        if and_expression is None:
-            return None
+        return self.parse_operators(EXPRESSION_LEVEL)
 
-        and_expressions = [and_expression]
-        while self.token.type == TokenType.OR_OPERATOR:
-            self.next_token()
-            and_expressions.append(self.parse_and_expression())
-        return Expression(self.previous_token.source_position, and_expressions)
-
-    def parse_and_expression(self) -> Optional[AndExpression]:
+    def parse_and_expression(self) -> ExpressionTypes:
         """
-        andExpression = relationshipExpression, {"and", relationshipExpression};
+        andExpression = relationshipExpression, {"&&", relationshipExpression};
         """
-        relationship_expression = self.parse_relationship_expression()
-        if relationship_expression is None:
-            return None
+        return self.parse_operators(AND_LEVEL)
 
-        relationship_expressions = [relationship_expression]
-        while self.token.type == TokenType.AND_OPERATOR:
-            self.next_token()
-            relationship_expressions.append(self.parse_relationship_expression())
-        return AndExpression(self.previous_token.source_position, relationship_expressions)
-
-    def parse_relationship_expression(self) -> Optional[RelationshipExpression]:
+    def parse_relationship_expression(self) -> ExpressionTypes:
         """
-        relationshipExpression = sumExpression, [relationshipExpression, sumExpression];
+        relationshipExpression = sumExpression, [relationshipOperator, sumExpression];
         """
-        left_side = self.parse_sum_expression()
-        if left_side is None:
-            return None
+        return self.parse_operators(RELATIONSHIP_LEVEL)
 
-        if self.token.type in TOKEN_TYPE_INTO_RELATIONSHIP_OPERAND:
-            operator = TOKEN_TYPE_INTO_RELATIONSHIP_OPERAND[self.token.type]
-            self.next_token()
-            right_side = self.parse_sum_expression()
-            return RelationshipExpression(self.previous_token.source_position, left_side, operator, right_side)
-        return RelationshipExpression(self.previous_token.source_position, left_side)
-
-    def parse_sum_expression(self) -> Optional[SumExpression]:
+    def parse_sum_expression(self) -> ExpressionTypes:
         """
-        sumExpression = left_side, {sumOperand, left_side};
+        sumExpression = multiplyExpression, {sumOperator, multiplyExpression};
         """
-        left_side = self.parse_multiply_expression()
-        if left_side is None:
-            return None
-
-        right_side = []
-        while self.token.type in [TokenType.ADD_OPERATOR, TokenType.SUB_OPERATOR]:
-            add_operator = TOKEN_TYPE_INTO_SUM_OPERATOR[self.token.type]
-            self.next_token()
-            expression = self.parse_multiply_expression()
-            right_side.append((add_operator, expression))
-        return SumExpression(self.previous_token.source_position, left_side, right_side)
+        return self.parse_operators(SUM_LEVEL)
 
-    def parse_multiply_expression(self) -> Optional[MultiplyExpression]:
+    def parse_multiply_expression(self) -> ExpressionTypes:
         """
-        left_side = typeCastingFactor, {multiplyOperand, typeCastingFactor};
+        multiplyExpression = typeCastingFactor, {multiplyOperator, typeCastingFactor};
         """
-        left_side = self.parse_type_casting_factor()
-        if left_side is None:
-            return None
-
-        right_side = []
-        while self.token.type in [TokenType.MUL_OPERATOR, TokenType.DIV_OPERATOR, TokenType.MODULO_OPERATOR]:
-            mul_operator = token_type_into_mul_operator[self.token.type]
-            self.next_token()
-            expression = self.parse_type_casting_factor()
-            right_side.append((mul_operator, expression))
-        return MultiplyExpression(self.previous_token.source_position, left_side, right_side)
+        return self.parse_operators(MULTIPLY_LEVEL)
 
-    def parse_type_casting_factor(self) -> Optional[TypeCastingFactor]:
+    def parse_operators(self, level: int) -> ExpressionTypes:
         """
-        typeCastingFactor = [type], negationFactor;
+        Parses an expression of the given level with precedence climbing and without recursion.
+        Operands of every level are gathered until the token after an operand is not an operator of that level,
+        then the level is finished and its node becomes an operand of the level above.
+        Nested expressions and function call arguments keep the expression around them on a stack,
+        so any depth of nesting takes no Python stack.
+        Only nodes with an operator, a cast or a negation are made, so a level with a single operand
+        gives that operand, e.g. the expression "1" is parsed to the Constant alone.
         """
-        if self.token.type not in POSSIBLE_TOKEN_TYPES:
-            negation_factor = self.parse_negation_factor()
-            if negation_factor is None:
-                return None
+        cursor = self.cursor
+        builder = self.builder
+        stack = []
+        # finished operands and pending operators of every level of the expression being parsed
+        or_operands = []
+        and_operands = []
+        relationship_left = relationship_operator = None
+        sum_left = sum_operator = None
+        sum_right = []
+        mul_left = mul_operator = None
+        mul_right = []
+        while True:
+            cast_type = None
+            if cursor.kind in TYPE_KINDS:
+                cast_type = self.parse_type_name()
+            is_negated = cursor.kind == kind.NEGATION_OPERATOR
+            if is_negated:
+                cursor.advance()
+
+            token_kind = cursor.kind
+            call_id = None
+            if token_kind == kind.ID:
+                call_id = self.advance_token()
+                if cursor.kind != kind.LEFT_BRACKET:
+                    factor = builder.variable(cursor.get_previous_position(), call_id)
+                    call_id = None
+                else:
+                    cursor.advance()
+                    if cursor.kind == kind.RIGHT_BRACKET:
+                        cursor.advance()
+                        factor = builder.function_call(cursor.get_previous_position(), call_id, ())
+                        call_id = None
+            elif token_kind == kind.LEFT_BRACKET:
+                cursor.advance()
+            elif token_kind in CONSTANT_KINDS:
+                factor = self.parse_constant()
             else:
-                return TypeCastingFactor(self.previous_token.source_position, negation_factor)
+                raise ParserError(cursor.get_position(), cursor.type, [], INVALID_FACTOR_MESSAGE)
+
+            if call_id is not None or token_kind == kind.LEFT_BRACKET:
+                # arguments of a call are kept in the context, a nested expression has none
+                stack.append((
+                    or_operands, and_operands, relationship_left, relationship_operator, sum_left, sum_operator,
+                    sum_right, mul_left, mul_operator, mul_right, cast_type, is_negated, level,
+                    call_id, None if call_id is None else []
+                ))
+                level = EXPRESSION_LEVEL
+                or_operands = []
+                and_operands = []
+                relationship_left = sum_left = mul_left = None
+                sum_right = []
+                mul_right = []
+                continue
+
+            # finishes levels of the expression after the factor, up to the first one followed by its operator,
+            # a level with one operand and no operator adds no node and its operand goes to the level above
+            while True:
+                operand = factor
+                if is_negated:
+                    operand = builder.negation_factor(cursor.get_previous_position(), operand, True)
+                if cast_type is not None:
+                    operand = builder.type_casting_factor(cursor.get_previous_position(), operand, cast_type)
+                token_kind = cursor.kind
+                if token_kind in KIND_INTO_MUL_OPERATOR:
+                    if mul_left is None:
+                        mul_left = operand
+                    else:
+                        mul_right.append((mul_operator, operand))
+                    mul_operator = KIND_INTO_MUL_OPERATOR[token_kind]
+                    cursor.advance()
+                    break
+                if mul_left is not None:
+                    mul_right.append((mul_operator, operand))
+                    operand = builder.multiply_expression(cursor.get_previous_position(), mul_left, tuple(mul_right))
+                    mul_left = None
+                    mul_right = []
+                if level == MULTIPLY_LEVEL:
+                    return operand
+
+                if token_kind in KIND_INTO_SUM_OPERATOR:
+                    if sum_left is None:
+                        sum_left = operand
+                    else:
+                        sum_right.append((sum_operator, operand))
+                    sum_operator = KIND_INTO_SUM_OPERATOR[token_kind]
+                    cursor.advance()
+                    break
+                if sum_left is not None:
+                    sum_right.append((sum_operator, operand))
+                    operand = builder.sum_expression(cursor.get_previous_position(), sum_left, tuple(sum_right))
+                    sum_left = None
+                    sum_right = []
+                if level == SUM_LEVEL:
+                    return operand
+
+                if relationship_left is None:
+                    if token_kind in KIND_INTO_RELATIONSHIP_OPERAND:
+                        relationship_left = operand
+                        relationship_operator = KIND_INTO_RELATIONSHIP_OPERAND[token_kind]
+                        cursor.advance()
+                        break
+                else:
+                    operand = builder.relationship_expression(
+                        cursor.get_previous_position(), relationship_left, relationship_operator, operand
+                    )
+                    relationship_left = relationship_operator = None
+                if level == RELATIONSHIP_LEVEL:
+                    return operand
+
+                if token_kind == kind.AND_OPERATOR:
+                    and_operands.append(operand)
+                    cursor.advance()
+                    break
+                if and_operands:
+                    and_operands.append(operand)
+                    operand = builder.and_expression(cursor.get_previous_position(), tuple(and_operands))
+                    and_operands = []
+                if level == AND_LEVEL:
+                    return operand
+
+                if token_kind == kind.OR_OPERATOR:
+                    or_operands.append(operand)
+                    cursor.advance()
+                    break
+                if or_operands:
+                    or_operands.append(operand)
+                    operand = builder.expression(cursor.get_previous_position(), tuple(or_operands))
+                    or_operands = []
+                expression = operand
+                if not stack:
+                    return expression
+
+                context = stack[-1]
+                args = context[-1]
+                if args is not None:
+                    args.append(expression)
+                    if cursor.kind == kind.COMMA:
+                        cursor.advance()
+                        break
+                    if cursor.kind != kind.RIGHT_BRACKET:
+                        raise ParserError(cursor.get_position(), cursor.type, [TokenType.RIGHT_BRACKET])
+                stack.pop()
+                or_operands, and_operands, relationship_left, relationship_operator, sum_left, sum_operator, \
+                    sum_right, mul_left, mul_operator, mul_right, cast_type, is_negated, level, call_id, args = context
+                self.consume_token(kind.RIGHT_BRACKET)
+                if args is None:
+                    factor = expression
+                else:
+                    factor = builder.function_call(cursor.get_previous_position(), call_id, tuple(args))
+
+    def parse_type_casting_factor(self) -> ExpressionTypes:
+        """
+        typeCastingFactor = [type], negationFactor;
+        """
+        if self.cursor.kind not in TYPE_KINDS:
+            return self.parse_negation_factor()
 
         type = self.parse_type_name()
         negation_factor = self.parse_negation_factor()
-        return TypeCastingFactor(self.previous_token.source_position, negation_factor, type)
+        return self.builder.type_casting_factor(self.cursor.get_previous_position(), negation_factor, type)
 
-    def parse_negation_factor(self) -> Optional[NegationFactor]:
+    def parse_negation_factor(self) -> ExpressionTypes:
         """
         negationFactor = ["!"], factor;
         """
-        if self.token.type != TokenType.NEGATION_OPERATOR:
-            factor = self.parse_factor()
-            if factor is None:
-                return None
-            else:
-                return NegationFactor(self.previous_token.source_position, factor, False)
-        self.consume_token(TokenType.NEGATION_OPERATOR)
+        if self.cursor.kind != kind.NEGATION_OPERATOR:
+            return self.parse_factor()
+        self.consume_token(kind.NEGATION_OPERATOR)
         factor = self.parse_factor()
-        return NegationFactor(self.previous_token.source_position, factor, True)
+        return self.builder.negation_factor(self.cursor.get_previous_position(), factor, True)
 
-    def parse_factor(self) -> Factor:
+    def parse_factor(self) -> ExpressionTypes:
         """
-        factor =
-           "(", expression, ")"
-           | (ID, [restOfFunctionCall]) (*variable or function call*)
-           | constant
-        ;
+        factor = nestedExpression | functionCallOrVariable | constant;
         """
-        factor = self.parse_nested_expression() or self.parse_function_call_or_variable() or self.parse_constant()
-        if factor is None:
-            raise ParserError(
-                self.token.source_position, self.token.type, [],
-                "Invalid factor, nested expression, constant, variable or function call expected"
-            )
-        return factor
+        parse_factor = FACTOR_PARSERS.get(self.cursor.kind)
+        if parse_factor is None:
+            raise ParserError(self.cursor.get_position(), self.cursor.type, [], INVALID_FACTOR_MESSAGE)
+        return parse_factor(self)
 
-    def parse_nested_expression(self) -> Optional[Expression]:
+    def parse_nested_expression(self) -> Optional[ExpressionTypes]:
         """
-        "(", expression, ")"
+        nestedExpression = "(", expression, ")";
         """
-        if self.token.type != TokenType.LEFT_BRACKET:
+        if self.cursor.kind != kind.LEFT_BRACKET:
             return None
 
-        self.consume_token(TokenType.LEFT_BRACKET)
+        self.consume_token(kind.LEFT_BRACKET)
         expression = self.parse_expression()
-        self.consume_token(TokenType.RIGHT_BRACKET)
+        self.consume_token(kind.RIGHT_BRACKET)
         return expression
 
-    def parse_function_call_or_variable(self) -> Optional[Expression]:
+    def parse_function_call_or_variable(self) -> Optional[Union[FunctionCall, Variable]]:
         """
-        (ID, [restOfFunctionCall]) (*variable or function call*)
+        functionCallOrVariable = ID, [restOfFunctionCall];
         """
-        if self.token.type != TokenType.ID:
+        if self.cursor.kind != kind.ID:
             return None
-        id_token = self.consume_token(TokenType.ID)
-        id = id_token.value
-        return self.parse_function_call(id) or Variable(self.previous_token.source_position, id)
+        id = self.consume_token(kind.ID)
+        function_call = self.parse_function_call(id)
+        if function_call is None:
+            return self.builder.variable(self.cursor.get_previous_position(), id)
+        return function_call
 
     def parse_constant(self) -> Optional[Constant]:
-        if self.token.type not in [TokenType.INT_VALUE,
-                                   TokenType.FLOAT_VALUE,
-                                   TokenType.STRING_VALUE,
-                                   TokenType.BOOL_VALUE,
-                                   TokenType.CURRENCY_VALUE]:
+        if self.cursor.kind not in CONSTANT_KINDS:
             return None
-        source_position = self.token.source_position
-        value = self.token.value
+        source_position = self.cursor.get_position()
+        value = self.cursor.value
 
         self.next_token()
-        if self.token.type == TokenType.CURRENCY:
-            constant = Constant(self.token.source_position, CurrencyValue(self.token.value, value))
+        if self.cursor.kind == kind.CURRENCY:
+            constant = self.builder.constant(self.cursor.get_position(), CurrencyValue(self.cursor.value, value))
             self.next_token()
             return constant
-        return Constant(source_position, value)
+        return self.builder.constant(source_position, value)
 
     def parse_function_call(self, id: str) -> Optional[FunctionCall]:
         """
@@ -391,47 +574,44 @@ class Parser:
         restOfFunctionCall = "(", args, ")";
         args = [expression, {",", expression}];
         """
-        if self.token.type != TokenType.LEFT_BRACKET:
+        if self.cursor.kind != kind.LEFT_BRACKET:
             return None
 
         expressions = []
-        self.consume_token(TokenType.LEFT_BRACKET)
-        while self.token.type != TokenType.RIGHT_BRACKET:
-            while expression := self.parse_expression():
-                expressions.append(expression)
-                if self.token.type != TokenType.COMMA:
-                    if self.token.type == TokenType.RIGHT_BRACKET:
+        self.consume_token(kind.LEFT_BRACKET)
+        if self.cursor.kind != kind.RIGHT_BRACKET:
+            while True:
+                expressions.append(self.parse_expression())
+                if self.cursor.kind != kind.COMMA:
+                    if self.cursor.kind == kind.RIGHT_BRACKET:
                         break
                     else:
-                        raise ParserError(self.token.source_position, self.token.type, [TokenType.RIGHT_BRACKET])
+                        raise ParserError(self.cursor.get_position(), self.cursor.type, [TokenType.RIGHT_BRACKET])
                 self.next_token()
 
         self.next_token()
-        return FunctionCall(self.previous_token.source_position, id, expressions)
+        return self.builder.function_call(self.cursor.get_previous_position(), id, tuple(expressions))
 
-    def parse_params(self) -> List[Param]:
+    def parse_params(self) -> Tuple[Param, ...]:
         """
-        parms = [type, ID, {",", type, ID}];
+        params = [type, ID, {",", type, ID}];
         """
         params = []
-        token_type = self.token.type
-
-        if token_type not in TOKEN_TYPES_INTO_TYPES and token_type != TokenType.CURRENCY:
-            return []
+        if self.cursor.kind not in TYPE_KINDS:
+            return ()
 
         type = self.parse_type_name()
-        id_token = self.consume_token(TokenType.ID)
-        id = id_token.value
-        params.append(Param(id_token.source_position, id, type))
+        id = self.consume_token(kind.ID)
+        params.append(self.builder.param(self.cursor.get_previous_position(), id, type))
 
-        while self.token.type == TokenType.COMMA:
+        while self.cursor.kind == kind.COMMA:
             self.next_token()
             type = self.parse_type_name()
-            self.expect_token(TokenType.ID)
-            id = self.token.value
-            params.append(Param(self.token.source_position, id, type))
+            self.expect_token(kind.ID)
+            id = self.cursor.value
+            params.append(self.builder.param(self.cursor.get_position(), id, type))
             self.next_token()
-        return params
+        return tuple(params)
 
     def parse_type_name(self) -> CustomTypeOfTypes:
         """
@@ -442,13 +622,77 @@ class Parser:
             | currency_ID
         ;
         """
-        if self.token.type in TOKEN_TYPES_INTO_TYPES:
-            type = TOKEN_TYPES_INTO_TYPES[self.token.type]
+        if self.cursor.kind in KIND_INTO_TYPES:
+            type = KIND_INTO_TYPES[self.cursor.kind]
             self.next_token()
             return type
-        elif self.token.type == TokenType.CURRENCY:
-            currency = CurrencyType(self.token.value)
+        elif self.cursor.kind == kind.CURRENCY:
+            name = self.cursor.value
+            currency = self.currency_types.get(name)
+            if currency is None:
+                currency = self.currency_types[name] = CurrencyType(name)
             self.next_token()
             return currency
-        raise ParserError(self.token.source_position, self.token.type,
+        raise ParserError(self.cursor.get_position(), self.cursor.type,
                           list(TOKEN_TYPES_INTO_TYPES.keys()) + [TokenType.CURRENCY])
+
+
+class FunctionBody:
+    """
+    Statements of a function parsed lazily: tokens between its braces, which are parsed the first time
+    the function is called, when Environment visits the body. A syntax error of the body is raised then.
+    """
+    __slots__ = ('tokens', 'start', 'end', 'builder', '_statements')
+
+    def __init__(self, tokens: TokenTable, start: int, end: int, builder):
+        self.tokens = tokens
+        self.start = start
+        self.end = end
+        self.builder = builder
+        self._statements: Optional[Statements] = None
+
+    def is_parsed(self) -> bool:
+        return self._statements is not None
+
+    def get_statements(self) -> Statements:
+        if self._statements is None:
+            parser = Parser(self.tokens, self.builder)
+            parser.cursor.seek(self.start)
+            statements = parser.parse_statements()
+            # statements stop only at the closing brace or at a token which is not a statement
+            if parser.cursor.index != self.end:
+                parser.expect_token(kind.RIGHT_CURLY_BRACKET)
+            self._statements = statements
+        return self._statements
+
+    def accept(self, visitor: 'Environment'):
+        return self.get_statements().accept(visitor)
+
+
+def get_dispatch_table(rule: str, parsers: Dict[str, Callable]) -> Dict[int, Callable]:
+    """
+    Parser method of the alternative of rule chosen at each kind of token, by tables generated from the grammar.
+    parsers are methods parsing rules with which alternatives begin.
+    """
+    return {token_kind: parsers[name] for token_kind, name in parse_tables.ALTERNATIVES[rule].items()}
+
+
+DECLARATION_PARSERS = get_dispatch_table('restOfDeclaration', {
+    'restOfCurrencyDeclaration': Parser.parse_rest_of_currency_declaration,
+    'restOfFunctionOrVariableDeclaration': Parser.parse_rest_of_function_declaration_or_variable_declaration,
+})
+STATEMENT_PARSERS = get_dispatch_table('statement', {
+    'simpleStatement': Parser.parse_simple_statement,
+    'whileStatement': Parser.parse_while_statement,
+    'ifStatement': Parser.parse_if_statement,
+})
+SIMPLE_STATEMENT_PARSERS = get_dispatch_table('simpleStatement', {
+    'variableDeclaration': Parser.parse_variable_declaration,
+    'assignmentOrFunctionCall': Parser.parse_assignment_or_function_call,
+    'returnStatement': Parser.parse_return_statement,
+})
+FACTOR_PARSERS = get_dispatch_table('factor', {
+    'nestedExpression': Parser.parse_nested_expression,
+    'functionCallOrVariable': Parser.parse_function_call_or_variable,
+    'constant': Parser.parse_constant,
+})
@@ -0,0 +1,119 @@
+"""
+Generates tables of the predictive parser from the grammar of the language.
+
+$ python -m interpreter.parser.parser_generator [--grammar docs/grammar.ebnf] [--output interpreter/parser/parse_tables.py]
+"""
+import argparse
+import os
+from typing import Iterable, List
+
+from interpreter.parser.grammar import Grammar
+from interpreter.token.token_kind import TOKEN_TYPES
+
+PACKAGE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+GRAMMAR_PATH = os.path.join(PACKAGE_DIRECTORY, '..', '..', 'docs', 'grammar.ebnf')
+TABLES_PATH = os.path.join(PACKAGE_DIRECTORY, 'parse_tables.py')
+# rules by which the parser chooses what to parse next, every alternative of them begins with a rule
+DISPATCH_RULES = ('restOfDeclaration', 'statement', 'simpleStatement', 'factor')
+LINE_LENGTH = 120
+
+HEADER = '''"""
+Tables of the predictive parser generated from docs/grammar.ebnf by
+$ python -m interpreter.parser.parser_generator
+Do not edit them, change the grammar and generate them again.
+"""
+from interpreter.token import token_kind as kind
+'''
+
+
+def kind_name(token_kind: int) -> str:
+    return f"kind.{TOKEN_TYPES[token_kind].name}"
+
+
+def symbol_source(symbol) -> str:
+    return repr(symbol) if type(symbol) is str else kind_name(symbol)
+
+
+def wrap(items: Iterable[str], indent: str) -> List[str]:
+    """
+    Lines of comma separated items, each of them no longer than LINE_LENGTH
+    """
+    lines = []
+    line = indent
+    for item in items:
+        if line != indent and len(line) + len(item) + 1 > LINE_LENGTH:
+            lines.append(line.rstrip())
+            line = indent
+        line += item + ', '
+    if line != indent:
+        lines.append(line.rstrip())
+    return lines
+
+
+def generate_tables(grammar_text: str) -> str:
+    """
+    Source of the module with tables of the grammar, raises GrammarError when it is not LL(1)
+    """
+    grammar = Grammar(grammar_text)
+    predict_table = grammar.predict_table()
+    lines = [HEADER, f"START = {grammar.start!r}", '']
+
+    lines.append('# productions of the grammar in BNF, terminals are kinds of tokens and nonterminals are names')
+    lines.append('PRODUCTIONS = (')
+    for index, (name, symbols) in enumerate(grammar.productions):
+        symbols_source = ', '.join(symbol_source(symbol) for symbol in symbols)
+        if len(symbols) == 1:
+            symbols_source += ','
+        line = f"    ({name!r}, ({symbols_source})),  # {index}"
+        if len(line) <= LINE_LENGTH:
+            lines.append(line)
+        else:
+            lines.append(f"    ({name!r}, (  # {index}")
+            lines += wrap((symbol_source(symbol) for symbol in symbols), ' ' * 8)
+            lines.append('    )),')
+    lines += [')', '']
+
+    lines.append('# index of the production of every nonterminal chosen at each kind of token')
+    lines.append('PREDICT = {')
+    for name in grammar.nonterminals:
+        items = [f"{kind_name(token_kind)}: {index}" for token_kind, index in predict_table[name].items()]
+        lines.append(f"    {name!r}: {{")
+        lines += wrap(items, ' ' * 8)
+        lines.append('    },')
+    lines += ['}', '']
+
+    lines.append('# kinds of tokens which can begin every rule')
+    lines.append('FIRST = {')
+    for name, kinds in grammar.get_first_sets().items():
+        lines.append(f"    {name!r}: frozenset({{")
+        lines += wrap((kind_name(token_kind) for token_kind in sorted(kinds)), ' ' * 8)
+        lines.append('    }),')
+    lines += ['}', '']
+
+    lines.append('# rule with which the alternative of a rule chosen at each kind of token begins')
+    lines.append('ALTERNATIVES = {')
+    for rule in DISPATCH_RULES:
+        items = [f"{kind_name(token_kind)}: {name!r}" for token_kind, name in grammar.alternatives_table(rule).items()]
+        lines.append(f"    {rule!r}: {{")
+        lines += wrap(items, ' ' * 8)
+        lines.append('    },')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description='generate tables of the parser from the grammar')
+    argument_parser.add_argument('--grammar', default=GRAMMAR_PATH, help='EBNF grammar (default: docs/grammar.ebnf)')
+    argument_parser.add_argument('--output', default=TABLES_PATH,
+                                 help='generated module (default: interpreter/parser/parse_tables.py)')
+    arguments = argument_parser.parse_args()
+
+    with open(arguments.grammar) as file:
+        source = generate_tables(file.read())
+    with open(arguments.output, 'w') as file:
+        file.write(source)
+    print(arguments.output)
+
+
+if __name__ == '__main__':
+    main()
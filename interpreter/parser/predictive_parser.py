@@ -0,0 +1,38 @@
+from interpreter.parser import parse_tables
+from interpreter.parser.parser_error import ParserError
+from interpreter.parser.token_cursor import TokenCursor
+from interpreter.token import token_kind as kind
+from interpreter.token.token_kind import TOKEN_TYPES
+from interpreter.token.token_table import TokenTable
+
+
+class PredictiveParser:
+    """
+    Checks tokens against the grammar with the tables of parse_tables alone, without making a tree.
+    Every nonterminal on the stack is replaced by the production chosen by the current token,
+    so the grammar and the tables can be checked apart from Parser.
+    """
+
+    def __init__(self, tokens: TokenTable):
+        self.cursor = TokenCursor(tokens)
+
+    def check_program(self):
+        """
+        Raises ParserError at the first token which does not match the grammar
+        """
+        cursor = self.cursor
+        productions = parse_tables.PRODUCTIONS
+        predict = parse_tables.PREDICT
+        stack = [kind.EOF, parse_tables.START]
+        while stack:
+            symbol = stack.pop()
+            if type(symbol) is int:
+                if cursor.kind != symbol:
+                    raise ParserError(cursor.get_position(), cursor.type, [TOKEN_TYPES[symbol]])
+                cursor.advance()
+                continue
+            production = predict[symbol].get(cursor.kind)
+            if production is None:
+                expected = [TOKEN_TYPES[token_kind] for token_kind in predict[symbol]]
+                raise ParserError(cursor.get_position(), cursor.type, expected)
+            stack.extend(reversed(productions[production][1]))
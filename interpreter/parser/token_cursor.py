@@ -0,0 +1,101 @@
+from typing import Optional
+
+from interpreter.lexer.lexer import Lexer
+from interpreter.source.source_position import SourcePosition
+from interpreter.token.token import Token
+from interpreter.token.token_kind import TOKEN_TYPES
+from interpreter.token.token_table import TokenTable, TokenValue
+from interpreter.token.token_type import TokenType
+
+
+class TokenCursor:
+    """
+    Current token of the parser in a token table.
+    kind and value are plain attributes, so they are cheap to compare in every production.
+    """
+
+    def __init__(self, table: TokenTable):
+        self.table = table
+        self._kinds = table.kinds
+        self._values = table.values
+        self._offsets = table.offsets
+        self._line_index = table.line_index
+        self._last_index = len(table) - 1
+        self.index = 0
+        self.kind: int = self._kinds[0]
+        self.value: TokenValue = self._values[0]
+        self._previous_index = 0
+        # positions are made on demand, once per token, as many tree nodes are given the same one
+        self._position: Optional[SourcePosition] = None
+        self._previous_position: Optional[SourcePosition] = None
+
+    @property
+    def type(self) -> TokenType:
+        return TOKEN_TYPES[self.kind]
+
+    def advance(self):
+        """
+        Moves to the next token, the cursor stays on the EOF token once it gets there.
+        """
+        index = self.index
+        self._previous_index = index
+        self._previous_position = self._position
+        if index < self._last_index:
+            index += 1
+            self.index = index
+            self.kind = self._kinds[index]
+            self.value = self._values[index]
+            self._position = None
+
+    def seek(self, index: int):
+        """
+        Moves to the token at index, as if all tokens before it were passed
+        """
+        self.index = index
+        self.kind = self._kinds[index]
+        self.value = self._values[index]
+        self._previous_index = max(index - 1, 0)
+        self._position = None
+        self._previous_position = None
+
+    def get_position(self) -> SourcePosition:
+        if self._position is None:
+            self._position = SourcePosition.from_offset(self._offsets[self.index], self._line_index)
+        return self._position
+
+    def get_previous_position(self) -> SourcePosition:
+        """
+        Position of the token passed by the last advance, or of the first token before any advance
+        """
+        if self._previous_position is None:
+            self._previous_position = SourcePosition.from_offset(self._offsets[self._previous_index], self._line_index)
+        return self._previous_position
+
+
+class LexerTokenCursor:
+    """
+    Interface of TokenCursor over tokens taken one by one from a lexer.
+    """
+
+    def __init__(self, lexer: Lexer):
+        self._lexer = lexer
+        self._token: Token = lexer.get_next_token()
+        self._previous_token: Token = self._token
+        self.kind: int = self._token.type.value
+        self.value: TokenValue = self._token.value
+
+    @property
+    def type(self) -> TokenType:
+        return self._token.type
+
+    def advance(self):
+        self._previous_token = self._token
+        self._token = token = self._lexer.get_next_token()
+        self.kind = token.type.value
+        self.value = token.value
+
+    def get_position(self) -> SourcePosition:
+        return self._token.source_position
+
+    def get_previous_position(self) -> SourcePosition:
+        return self._previous_token.source_position
@@ -0,0 +1,32 @@
+from interpreter.models.base import Constant, Variable, FunctionCall, Param, Assignment
+from interpreter.models.declarations import FunctionDeclaration, VariableDeclaration, CurrencyDeclaration, ParseTree
+from interpreter.models.expressions import Expression, AndExpression, RelationshipExpression, SumExpression, \
+    MultiplyExpression, TypeCastingFactor, NegationFactor
+from interpreter.models.statements import ReturnStatement, WhileStatement, IfStatement, Statements
+
+
+class ParseTreeBuilder:
+    """
+    Makes nodes for the parser, every method is the class of the node it makes.
+    Other builders, like ArenaBuilder of TreeArena, have methods with the same arguments.
+    """
+    constant = Constant
+    variable = Variable
+    function_call = FunctionCall
+    param = Param
+    assignment = Assignment
+    negation_factor = NegationFactor
+    type_casting_factor = TypeCastingFactor
+    multiply_expression = MultiplyExpression
+    sum_expression = SumExpression
+    relationship_expression = RelationshipExpression
+    and_expression = AndExpression
+    expression = Expression
+    return_statement = ReturnStatement
+    while_statement = WhileStatement
+    if_statement = IfStatement
+    statements = Statements
+    function_declaration = FunctionDeclaration
+    variable_declaration = VariableDeclaration
+    currency_declaration = CurrencyDeclaration
+    parse_tree = ParseTree
@@ -0,0 +1,59 @@
+import io
+import typing
+
+from .line_index import LineIndex
+from .source import Source, BLOCK_SIZE
+
+DEFAULT_CHUNK_SIZE = BLOCK_SIZE
+
+
+class BufferedSource(Source):
+    """
+    Source that reads the underlying stream in large chunks and walks them by index.
+    Position is kept as the character offset, see LineIndex.
+    """
+
+    def __init__(self, source: typing.Union[io.TextIOBase, io.StringIO], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.source = source
+        self._chunk_size = chunk_size
+        self._buffer = ''
+        self._buffer_length = 0
+        self._index = 0
+        self.line_index = LineIndex()
+        self.current_offset = -1
+        self.current_char = ''
+        self.next_char()
+
+    def next_char(self):
+        char = self.current_char
+        if char == 'EOF':
+            return
+
+        offset = self.current_offset + 1
+        if char == '\n':
+            self.line_index.add_line_start(offset)
+        self.current_offset = offset
+
+        index = self._index
+        if index >= self._buffer_length:
+            if not self._fill_buffer():
+                self.current_char = 'EOF'
+                self.line_index.end_offset = offset
+                return
+            index = 0
+
+        self.current_char = self._buffer[index]
+        self._index = index + 1
+
+    def _read_rest_of_block(self) -> str:
+        if self._index >= self._buffer_length:
+            self._fill_buffer()
+        rest = self._buffer[self._index:]
+        self._index = self._buffer_length
+        return rest
+
+    def _fill_buffer(self) -> bool:
+        self._buffer = self.source.read(self._chunk_size)
+        self._buffer_length = len(self._buffer)
+        self._index = 0
+        return self._buffer_length > 0
@@ -0,0 +1,40 @@
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+
+class LineIndex:
+    """
+    Offsets at which lines of the source start, filled while the source is read.
+    Turns character offsets into line and column only when they are needed.
+    """
+
+    def __init__(self):
+        self.line_starts: List[int] = [0]
+        self.end_offset: Optional[int] = None
+
+    def add_line_start(self, offset: int):
+        self.line_starts.append(offset)
+
+    def add_line_starts(self, text: str, offset: int):
+        """
+        Adds lines started by new line characters in text, which begins at the given offset.
+        """
+        line_starts = self.line_starts
+        index = text.find('\n')
+        while index != -1:
+            line_starts.append(offset + index + 1)
+            index = text.find('\n', index + 1)
+
+    def get_line_and_column(self, offset: int) -> Tuple[int, int]:
+        line = bisect_right(self.line_starts, offset)
+        if offset == self.end_offset:
+            return line + 1, 0
+        return line, offset - self.line_starts[line - 1] + 1
+
+    def get_offset(self, line: int, column: int) -> int:
+        """
+        Inverse of get_line_and_column
+        """
+        if column == 0:
+            return self.end_offset
+        return self.line_starts[line - 1] + column - 1
@@ -0,0 +1,93 @@
+import mmap
+import os
+
+from .line_index import LineIndex
+from .source import Source, BLOCK_SIZE
+
+ASCII_CHARS = tuple(chr(byte) for byte in range(128))
+CARRIAGE_RETURN = 0x0D
+LINE_FEED = 0x0A
+
+
+def utf8_sequence_length(lead_byte: int) -> int:
+    if lead_byte >= 0xF0:
+        return 4
+    elif lead_byte >= 0xE0:
+        return 3
+    elif lead_byte >= 0xC0:
+        return 2
+    return 1
+
+
+class MmapSource(Source):
+    """
+    Source reading characters straight from a memory-mapped file.
+    ASCII bytes are turned into characters through a lookup table, multi-byte UTF-8 sequences are decoded
+    one character at a time, so the input is never copied as a whole.
+    Line endings are translated like in text mode ('\\r\\n' and '\\r' become '\\n').
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self._length = size
+        self._index = 0
+        self.line_index = LineIndex()
+        self.current_offset = -1
+        self.current_char = ''
+        self.next_char()
+
+    def next_char(self):
+        char = self.current_char
+        if char == 'EOF':
+            return
+
+        offset = self.current_offset + 1
+        if char == '\n':
+            self.line_index.add_line_start(offset)
+        self.current_offset = offset
+
+        index = self._index
+        if index >= self._length:
+            self.current_char = 'EOF'
+            self.line_index.end_offset = offset
+            return
+
+        byte = self._map[index]
+        if byte < 0x80:
+            if byte == CARRIAGE_RETURN:
+                if index + 1 < self._length and self._map[index + 1] == LINE_FEED:
+                    index += 1
+                byte = LINE_FEED
+            self.current_char = ASCII_CHARS[byte]
+            self._index = index + 1
+        else:
+            end = index + utf8_sequence_length(byte)
+            self.current_char = self._map[index:end].decode('utf-8')
+            self._index = end
+
+    def _read_rest_of_block(self) -> str:
+        index = self._index
+        end = min(index + BLOCK_SIZE, self._length)
+        while end < self._length and 0x80 <= self._map[end] < 0xC0:
+            end -= 1
+        if end < self._length and self._map[end - 1] == CARRIAGE_RETURN and self._map[end] == LINE_FEED:
+            end += 1
+        self._index = end
+
+        text = self._map[index:end].decode('utf-8')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> 'MmapSource':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,27 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from .buffered_source import BufferedSource
+from .mmap_source import MmapSource
+from .source import Source
+
+STREAM_SOURCE_CLASSES = {
+    'stream': Source,
+    'buffered': BufferedSource,
+}
+SOURCE_KINDS = list(STREAM_SOURCE_CLASSES.keys()) + ['mmap']
+
+
+@contextmanager
+def open_source(path: str, kind: str = 'mmap') -> Iterator[Source]:
+    """
+    Opens file as one of SOURCE_KINDS and closes it when leaving the context.
+    """
+    if kind == 'mmap':
+        with MmapSource(path) as source:
+            yield source
+    elif kind in STREAM_SOURCE_CLASSES:
+        with open(path, 'r') as file:
+            yield STREAM_SOURCE_CLASSES[kind](file)
+    else:
+        raise ValueError(f"Unknown source kind {kind}, expected one of {SOURCE_KINDS}")
@@ -1,36 +1,60 @@
 import io
 import typing
 
+from .line_index import LineIndex
 from .source_position import SourcePosition
 
+BLOCK_SIZE = 64 * 1024
+
 
 class Source:
     def __init__(self, source: typing.Union[io.TextIOBase, io.StringIO]):
-        self.current_position = SourcePosition(1, 0)
-        self.next_position = SourcePosition(1, 1)
-        self.current_char = 'EOF'
+        self.line_index = LineIndex()
+        self.current_offset = -1
+        self.current_char = ''
         self.source = source
         self.next_char()
 
     def next_char(self):
-        char = self.source.read(1)
+        current_char = self.current_char
+        if current_char == 'EOF':
+            return
+
+        offset = self.current_offset + 1
+        if current_char == '\n':
+            self.line_index.add_line_start(offset)
+        self.current_offset = offset
 
+        char = self.source.read(1)
         if not char:
             self.current_char = 'EOF'
-            self.current_position = SourcePosition(self.next_position.line + 1, 0)
-
-        elif char == '\n':
-            self.current_char = char
-            self.current_position = self.next_position
-            self.next_position = self.current_position.next_line()
-
+            self.line_index.end_offset = offset
         else:
             self.current_char = char
-            self.current_position = self.next_position
-            self.next_position = self.current_position.advance()
+
+    def read_block(self) -> str:
+        """
+        Returns text from the current character on, one block at a time, and moves the source past it.
+        Empty string means that the whole source was read.
+        """
+        if self.current_char == 'EOF':
+            return ''
+
+        block = self.current_char + self._read_rest_of_block()
+        self.line_index.add_line_starts(block[:-1], self.current_offset)
+        self.current_offset += len(block) - 1
+        self.current_char = block[-1]
+        self.next_char()
+        return block
+
+    def _read_rest_of_block(self) -> str:
+        return self.source.read(BLOCK_SIZE)
 
     def get_char(self) -> str:
         return self.current_char
 
+    def get_offset(self) -> int:
+        return self.current_offset
+
     def get_position(self) -> SourcePosition:
-        return self.current_position
+        return SourcePosition.from_offset(self.current_offset, self.line_index)
@@ -1,13 +1,65 @@
-from dataclasses import dataclass
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from interpreter.source.line_index import LineIndex
 
 
-@dataclass(frozen=True)
 class SourcePosition:
-    line: int
-    column: int
+    """
+    Line and column of a character in the source.
+    Positions made by from_offset keep only the character offset and ask the LineIndex for line and column
+    when one of them is read for the first time, i.e. when an error is formatted.
+    """
+    __slots__ = ('_line', '_column', 'offset', '_line_index')
+
+    def __init__(self, line: int, column: int):
+        self._line = line
+        self._column = column
+        self.offset: Optional[int] = None
+        self._line_index = None
+
+    @classmethod
+    def from_offset(cls, offset: int, line_index: 'LineIndex') -> 'SourcePosition':
+        position = cls.__new__(cls)
+        position._line = None
+        position._column = None
+        position.offset = offset
+        position._line_index = line_index
+        return position
+
+    @property
+    def line(self) -> int:
+        if self._line is None:
+            self._resolve()
+        return self._line
+
+    @property
+    def column(self) -> int:
+        if self._column is None:
+            self._resolve()
+        return self._column
+
+    def _resolve(self):
+        self._line, self._column = self._line_index.get_line_and_column(self.offset)
+        self._line_index = None
 
     def advance(self):
         return SourcePosition(self.line, self.column + 1)
 
     def next_line(self):
         return SourcePosition(self.line + 1, 1)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.line, self.column) == (other.line, other.column)
+
+    def __hash__(self):
+        return hash((self.line, self.column))
+
+    def __reduce__(self):
+        # lazy positions are pickled resolved, without the line index of the whole source
+        return SourcePosition, (self.line, self.column)
+
+    def __repr__(self):
+        return f"SourcePosition(line={self.line}, column={self.column})"
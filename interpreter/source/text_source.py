@@ -0,0 +1,37 @@
+import typing
+
+from .line_index import LineIndex
+from .source import Source, BLOCK_SIZE
+
+
+class TextSource(Source):
+    """
+    Source over text which is already in memory, read from the given offset on.
+    Line index is made for the whole text at once, or given when it is already known.
+    """
+
+    def __init__(self, text: str, offset: int = 0, line_index: typing.Optional[LineIndex] = None):
+        if line_index is None:
+            line_index = LineIndex()
+            line_index.add_line_starts(text, 0)
+            line_index.end_offset = len(text)
+        self.text = text
+        self.line_index = line_index
+        self.current_offset = offset
+        self.current_char = text[offset] if offset < len(text) else 'EOF'
+
+    def next_char(self):
+        if self.current_char == 'EOF':
+            return
+        offset = self.current_offset + 1
+        self.current_offset = offset
+        self.current_char = self.text[offset] if offset < len(self.text) else 'EOF'
+
+    def read_block(self) -> str:
+        if self.current_char == 'EOF':
+            return ''
+        offset = self.current_offset
+        block = self.text[offset:offset + BLOCK_SIZE]
+        self.current_offset = offset + len(block) - 1
+        self.next_char()
+        return block
@@ -1,14 +1,36 @@
 import typing
 
+from interpreter.source.line_index import LineIndex
 from interpreter.source.source_position import SourcePosition
 from interpreter.token.token_type import TokenType
 
 
 class Token:
-    def __init__(self, type: TokenType, value:  typing.Union[str, float, int], source_position: SourcePosition):
+    __slots__ = ('type', 'value', '_source_position', '_line_index')
+
+    def __init__(self, type: TokenType, value:  typing.Union[str, float, int],
+                 source_position: typing.Union[SourcePosition, int], line_index: typing.Optional[LineIndex] = None):
+        """
+        source_position can be given as the character offset together with the line_index of the source,
+        then SourcePosition is made only when it is asked for
+        """
         self.type = type
         self.value = value
-        self.source_position = source_position
+        self._source_position = source_position
+        self._line_index = line_index
+
+    @property
+    def source_position(self) -> SourcePosition:
+        if self._line_index is not None:
+            self._source_position = SourcePosition.from_offset(self._source_position, self._line_index)
+            self._line_index = None
+        return self._source_position
+
+    @property
+    def offset(self) -> int:
+        if self._line_index is not None:
+            return self._source_position
+        return self.source_position.offset
 
     def __str__(self):
         return f"position: {self.source_position.line}:{self.source_position.column} type: {self.type} value: {self.value}"
@@ -0,0 +1,57 @@
+from typing import List, Optional
+
+from interpreter.token.token_type import TokenType
+
+# small int codes of token types, used wherever tokens are kept in bulk or compared often
+
+ID = TokenType.ID.value
+
+# Operators
+CURRENCY_DECLARATION_OPERATOR = TokenType.CURRENCY_DECLARATION_OPERATOR.value
+ASSIGN_OPERATOR = TokenType.ASSIGN_OPERATOR.value
+AND_OPERATOR = TokenType.AND_OPERATOR.value
+OR_OPERATOR = TokenType.OR_OPERATOR.value
+ADD_OPERATOR = TokenType.ADD_OPERATOR.value
+SUB_OPERATOR = TokenType.SUB_OPERATOR.value
+MUL_OPERATOR = TokenType.MUL_OPERATOR.value
+DIV_OPERATOR = TokenType.DIV_OPERATOR.value
+MODULO_OPERATOR = TokenType.MODULO_OPERATOR.value
+NEGATION_OPERATOR = TokenType.NEGATION_OPERATOR.value
+EQUAL_OPERATOR = TokenType.EQUAL_OPERATOR.value
+NOT_EQUAL_OPERATOR = TokenType.NOT_EQUAL_OPERATOR.value
+LESS_THAN_OPERATOR = TokenType.LESS_THAN_OPERATOR.value
+GREATER_THAN_OPERATOR = TokenType.GREATER_THAN_OPERATOR.value
+LESS_THAN_OR_EQUAL_OPERATOR = TokenType.LESS_THAN_OR_EQUAL_OPERATOR.value
+GREATER_THAN_OPERATOR_OR_EQUAL = TokenType.GREATER_THAN_OPERATOR_OR_EQUAL.value
+
+# TYPES
+INT = TokenType.INT.value
+FLOAT = TokenType.FLOAT.value
+STRING = TokenType.STRING.value
+BOOL = TokenType.BOOL.value
+CURRENCY = TokenType.CURRENCY.value
+
+# VALUES
+INT_VALUE = TokenType.INT_VALUE.value
+FLOAT_VALUE = TokenType.FLOAT_VALUE.value
+STRING_VALUE = TokenType.STRING_VALUE.value
+BOOL_VALUE = TokenType.BOOL_VALUE.value
+CURRENCY_VALUE = TokenType.CURRENCY_VALUE.value
+
+# RESERVED NAMES AND CHARS
+LEFT_BRACKET = TokenType.LEFT_BRACKET.value
+RIGHT_BRACKET = TokenType.RIGHT_BRACKET.value
+COMMA = TokenType.COMMA.value
+LEFT_CURLY_BRACKET = TokenType.LEFT_CURLY_BRACKET.value
+RIGHT_CURLY_BRACKET = TokenType.RIGHT_CURLY_BRACKET.value
+SEMICOLON = TokenType.SEMICOLON.value
+IF_NAME = TokenType.IF_NAME.value
+ELSE_NAME = TokenType.ELSE_NAME.value
+RETURN_NAME = TokenType.RETURN_NAME.value
+WHILE_NAME = TokenType.WHILE_NAME.value
+EOF = TokenType.EOF.value
+
+
+TOKEN_TYPES: List[Optional[TokenType]] = [None] * (max(token_type.value for token_type in TokenType) + 1)
+for _token_type in TokenType:
+    TOKEN_TYPES[_token_type.value] = _token_type
@@ -0,0 +1,48 @@
+from array import array
+from typing import List, Union
+
+from interpreter.source.line_index import LineIndex
+from interpreter.source.source_position import SourcePosition
+from interpreter.token.token import Token
+from interpreter.token.token_kind import TOKEN_TYPES
+from interpreter.token.token_type import TokenType
+
+TokenValue = Union[str, float, int, bool]
+
+
+class TokenTable:
+    """
+    All tokens of a source kept column by column:
+    kinds[i] is the token kind (see token_kind), offsets[i] the offset of the last char of the token
+    and values[i] its value. Last row is always the EOF token.
+    """
+
+    def __init__(self, line_index: LineIndex):
+        self.kinds = array('B')
+        self.offsets = array('I')
+        self.values: List[TokenValue] = []
+        self.line_index = line_index
+
+    def append(self, kind: int, value: TokenValue, offset: int):
+        self.kinds.append(kind)
+        self.values.append(value)
+        self.offsets.append(offset)
+
+    def append_token(self, token: Token):
+        self.append(token.type.value, token.value, token.offset)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def get_type(self, index: int) -> TokenType:
+        return TOKEN_TYPES[self.kinds[index]]
+
+    def get_position(self, index: int) -> SourcePosition:
+        return SourcePosition.from_offset(self.offsets[index], self.line_index)
+
+    def get_token(self, index: int) -> Token:
+        return Token(self.get_type(index), self.values[index], self.offsets[index], self.line_index)
+
+    def get_tokens(self) -> List[Token]:
+        return [self.get_token(index) for index in range(len(self))]
+
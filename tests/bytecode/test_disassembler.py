@@ -0,0 +1,58 @@
+from interpreter.bytecode.disassembler import disassemble
+from interpreter.bytecode.virtual_machine import VirtualMachine
+from interpreter.lexer.lexer import Lexer
+from interpreter.parser.parser import Parser
+from interpreter.source.text_source import TextSource
+
+
+class TestDisassembler:
+    @staticmethod
+    def _get_virtual_machine(string: str) -> VirtualMachine:
+        return VirtualMachine(Parser(Lexer(TextSource(string)).tokenize()).parse_program())
+
+    @staticmethod
+    def _get_instructions(listing: str):
+        """
+        Opcode and description of the argument of every instruction of the listing, None when there is none
+        """
+        instructions = []
+        for line in listing.splitlines()[1:]:
+            _, _, name, _, *description = line.replace('>>', ' ').split(maxsplit=4)
+            instructions.append((name, description[0] if description else None))
+        return instructions
+
+    def test_function(self):
+        virtual_machine = self._get_virtual_machine('int main(){int a = 2; return a * 3;}')
+        listing = disassemble(virtual_machine.codes[0])
+        assert listing.splitlines()[0] == 'Disassembly of main:'
+        assert self._get_instructions(listing) == [
+            ('PREPARE_DECLARATION', '(a)'),
+            ('LOAD_CONST', '(2)'),
+            ('STORE', '(a)'),
+            ('LOAD_CONST', '(6)'),
+            ('TYPED_RETURN', None),
+            ('EXIT_IF_VALUE', None),
+            ('LOAD_CONST', '(None)'),
+            ('EXIT', None),
+        ]
+
+    def test_positions_of_instructions(self):
+        virtual_machine = self._get_virtual_machine('int main(){\n  return 1;\n}')
+        assert disassemble(virtual_machine.codes[0]).splitlines()[1].split()[0] == '2:10'
+
+    def test_jump_targets_are_marked(self):
+        virtual_machine = self._get_virtual_machine('int main(){int i = 0; while(i < 3){i = i + 1;} return i;}')
+        lines = disassemble(virtual_machine.codes[0]).splitlines()[1:]
+        jumps = [int(line.split()[-1]) for line in lines if 'JUMP' in line]
+        targets = [int(line.split()[2]) for line in lines if '>>' in line]
+        assert sorted(jumps) == targets
+
+    def test_constants_of_global_variables_and_currencies(self):
+        virtual_machine = self._get_virtual_machine(
+            'USD := 1.0; EUR := 2.0; string s = "a"; USD u = 1.0USD; EUR main(){return EUR u;}'
+        )
+        global_instructions = self._get_instructions(disassemble(virtual_machine.global_code))
+        assert global_instructions[:4] == [('LOAD_CONST', "('a')"), ('STORE_GLOBAL', '(s)'),
+                                           ('LOAD_CONST', '(1.0USD)'), ('STORE_GLOBAL', '(u)')]
+        # the cast of the global variable is folded by the rates of the currencies
+        assert self._get_instructions(disassemble(virtual_machine.codes[0]))[0] == ('LOAD_CONST', '(0.5EUR)')
@@ -0,0 +1,52 @@
+import io
+
+import pytest
+
+from interpreter.bytecode.virtual_machine import VirtualMachine
+from interpreter.environment.environment_errors import SemanticTypeError
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.constants import PossibleTypes, CurrencyValue
+from interpreter.parser.parser import Parser
+from interpreter.source.source import Source
+from interpreter.source.text_source import TextSource
+from tests.environment import test_environment
+
+
+class TestVirtualMachine(test_environment.TestEnvironment):
+    """
+    All tests of Environment, run by the virtual machine from bytecode compiled from the program
+    """
+
+    def test_lazy_function_is_compiled_at_first_call(self):
+        string = 'int f(){return 2;} int g(){return 3;} int main(){return f();}'
+        virtual_machine = VirtualMachine(Parser(Lexer(TextSource(string)).tokenize(),
+                                                lazy_functions=True).parse_program())
+        assert virtual_machine.codes[:2] == [None, None]
+        assert virtual_machine.run_main() == 2
+        assert virtual_machine.codes[0] is not None and virtual_machine.codes[1] is None
+
+    def test_constants_of_equal_values_of_different_types(self):
+        virtual_machine = VirtualMachine(Parser(Lexer(TextSource(
+            'USD := 4.0; float g(USD x){return float x;} float main(){USD a = 1USD; return g(1.0USD);}'
+        )).tokenize()).parse_program())
+        assert virtual_machine.run_main() == 1.0
+        assert [repr(constant) for constant in virtual_machine.codes[1].constants
+                if isinstance(constant, CurrencyValue)] == ["CurrencyValue(name='USD', value=1)",
+                                                            "CurrencyValue(name='USD', value=1.0)"]
+
+    def test_return_without_value_is_type_error(self):
+        with pytest.raises(SemanticTypeError):
+            self.get_result_of_main('int main(){return;}')
+
+    def test_frames_are_popped_by_returns(self):
+        string = 'int f(int n){if(n > 0){return f(n - 1);} return 0;} int main(){return f(5);}'
+        virtual_machine = VirtualMachine(Parser(Lexer(TextSource(string)).tokenize()).parse_program())
+        assert virtual_machine.run_main() == 0
+        assert virtual_machine.frames_stack == []
+
+    @staticmethod
+    def get_result_of_main(string) -> PossibleTypes:
+        source = Source(io.StringIO(string))
+        parser = Parser(Lexer(source))
+        env = VirtualMachine(parser.parse_program())
+        return env.run_main()
@@ -0,0 +1,43 @@
+from interpreter.cache.code_cache import CodeCache, CODE_SUFFIX
+from interpreter.cache.program_cache import CACHE_DIRECTORY
+
+SOURCE = 'def f(a):\n    return a + 1\n'
+FILENAME = '<curr f>'
+
+
+class TestCodeCache:
+    @staticmethod
+    def _get_function(code):
+        namespace = {}
+        exec(code, namespace)
+        return namespace['f']
+
+    def test_miss(self, tmp_path):
+        assert CodeCache(str(tmp_path)).load(SOURCE, FILENAME) is None
+
+    def test_compile_stores_and_loads(self, tmp_path):
+        code_cache = CodeCache(str(tmp_path / 'cache'))
+        code = code_cache.compile(SOURCE, FILENAME)
+        assert self._get_function(code)(1) == 2
+        assert [path.suffix for path in (tmp_path / 'cache').iterdir()] == [CODE_SUFFIX]
+
+        loaded_code = code_cache.load(SOURCE, FILENAME)
+        assert loaded_code == code
+        assert loaded_code.co_filename == FILENAME
+
+    def test_key_is_source_and_filename(self, tmp_path):
+        code_cache = CodeCache(str(tmp_path))
+        code_cache.compile(SOURCE, FILENAME)
+        assert code_cache.load(SOURCE.replace('1', '2'), FILENAME) is None
+        assert code_cache.load(SOURCE, '<curr g>') is None
+
+    def test_corrupted_code_is_not_loaded(self, tmp_path):
+        code_cache = CodeCache(str(tmp_path))
+        code_cache.compile(SOURCE, FILENAME)
+        with open(code_cache.get_path(SOURCE, FILENAME), 'wb') as file:
+            file.write(b'garbage')
+        assert code_cache.load(SOURCE, FILENAME) is None
+        assert self._get_function(code_cache.compile(SOURCE, FILENAME))(2) == 3
+
+    def test_next_to_source_file(self, tmp_path):
+        assert CodeCache.next_to(str(tmp_path / 'program.curr')).directory == str(tmp_path / CACHE_DIRECTORY)
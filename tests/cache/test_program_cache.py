@@ -0,0 +1,104 @@
+import os
+import pickle
+import shutil
+
+import pytest
+
+from interpreter.cache.program_cache import ProgramCache, CACHE_DIRECTORY, get_interpreter_version
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.declarations import ParseTree
+from interpreter.parser.parser import Parser
+from interpreter.source.source_position import SourcePosition
+from interpreter.source.text_source import TextSource
+
+PROGRAM = 'USD := 1.0;\nUSD main(){\n    return 2.0USD;\n}\n'
+
+
+class TestProgramCache:
+    @staticmethod
+    def _get_source_path(tmp_path, text=PROGRAM):
+        path = tmp_path / 'program.curr'
+        path.write_text(text)
+        return str(path)
+
+    @staticmethod
+    def _get_parse_tree(text=PROGRAM):
+        return Parser(Lexer(TextSource(text)).tokenize()).parse_program()
+
+    def test_miss(self, tmp_path):
+        assert ProgramCache(self._get_source_path(tmp_path)).load() is None
+
+    def test_store_and_load(self, tmp_path):
+        path = self._get_source_path(tmp_path)
+        ProgramCache(path).store(self._get_parse_tree())
+        parse_tree = ProgramCache(path).load()
+        assert isinstance(parse_tree, ParseTree)
+        assert parse_tree == self._get_parse_tree()
+        assert os.path.dirname(ProgramCache(path).path) == str(tmp_path / CACHE_DIRECTORY)
+
+    def test_positions_are_kept(self, tmp_path):
+        path = self._get_source_path(tmp_path)
+        ProgramCache(path).store(self._get_parse_tree())
+        return_statement = ProgramCache(path).load().declarations[1].statements.list_of_statements[0]
+        assert return_statement.source_position == SourcePosition(3, 17)
+
+    def test_changed_source_is_not_loaded(self, tmp_path):
+        path = self._get_source_path(tmp_path)
+        old_cache = ProgramCache(path)
+        old_cache.store(self._get_parse_tree())
+        changed_text = PROGRAM.replace('2.0', '3.0')
+        self._get_source_path(tmp_path, changed_text)
+        new_cache = ProgramCache(path)
+        assert new_cache.path != old_cache.path
+        assert new_cache.load() is None
+
+        new_cache.store(self._get_parse_tree(changed_text))
+        assert not os.path.exists(old_cache.path)
+        assert new_cache.load() == self._get_parse_tree(changed_text)
+
+    def test_other_sources_are_kept(self, tmp_path):
+        path = self._get_source_path(tmp_path)
+        other_path = str(tmp_path / 'other.curr')
+        shutil.copy(path, other_path)
+        ProgramCache(path).store(self._get_parse_tree())
+        ProgramCache(other_path).store(self._get_parse_tree())
+        assert ProgramCache(path).load() is not None
+        assert ProgramCache(other_path).load() is not None
+
+    def test_corrupted_program_is_not_loaded(self, tmp_path):
+        program_cache = ProgramCache(self._get_source_path(tmp_path))
+        program_cache.store(self._get_parse_tree())
+        with open(program_cache.path, 'wb') as file:
+            file.write(b'\x80\x05garbage')
+        assert program_cache.load() is None
+
+    @pytest.mark.parametrize('content', [
+        b'\x80\x04c__main__\nNope\n.',
+        b'\x80\x04cno_such_module\nNope\n.',
+        b'\x80\x04h\x05.',
+        b'\x80\x04\x95\x05\x00\x00\x00\x00\x00\x00\x00\xff.',
+    ])
+    def test_unreadable_program_is_removed(self, tmp_path, content):
+        program_cache = ProgramCache(self._get_source_path(tmp_path))
+        program_cache.store(self._get_parse_tree())
+        with open(program_cache.path, 'wb') as file:
+            file.write(content)
+        assert program_cache.load() is None
+        assert not os.path.exists(program_cache.path)
+
+    def test_other_object_is_not_loaded(self, tmp_path):
+        program_cache = ProgramCache(self._get_source_path(tmp_path))
+        program_cache.store(self._get_parse_tree())
+        with open(program_cache.path, 'wb') as file:
+            pickle.dump([1, 2, 3], file)
+        assert program_cache.load() is None
+
+    def test_interpreter_version(self):
+        assert get_interpreter_version() == get_interpreter_version()
+        assert len(get_interpreter_version()) == 64
+
+    def test_lazy_position_is_pickled_resolved(self):
+        position = Lexer(TextSource('\n\n  abc ')).get_next_token().source_position
+        copied = pickle.loads(pickle.dumps(position))
+        assert copied == SourcePosition(3, 5)
+        assert copied._line_index is None
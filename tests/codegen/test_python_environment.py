@@ -0,0 +1,58 @@
+import io
+
+import pytest
+
+from interpreter.cache.code_cache import CodeCache
+from interpreter.codegen.python_environment import PythonEnvironment
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.constants import PossibleTypes
+from interpreter.parser.parser import Parser
+from interpreter.source.source import Source
+from interpreter.source.text_source import TextSource
+from tests.environment import test_environment
+
+
+class TestPythonEnvironment(test_environment.TestEnvironment):
+    """
+    All tests of Environment, run by Python functions generated from the program
+    """
+
+    @staticmethod
+    def _get_parse_tree(string: str, lazy: bool = False):
+        return Parser(Lexer(TextSource(string)).tokenize(), lazy_functions=lazy).parse_program()
+
+    def test_lazy_function_is_compiled_at_first_call(self):
+        string = 'int f(){return 2;} int g(){return 3;} int main(){return f();}'
+        environment = PythonEnvironment(self._get_parse_tree(string, lazy=True))
+        assert environment.bodies[:2] == [None, None]
+        assert environment.run_main() == 2
+        assert environment.bodies[0] is not None and environment.bodies[1] is None
+
+    def test_error_of_python_operation_has_line_of_program(self):
+        environment = PythonEnvironment(self._get_parse_tree('float f(int a){\n  return 1 / a;\n}\n'
+                                                             'float main(){\n  return f(0);\n}'))
+        with pytest.raises(ZeroDivisionError) as error_info:
+            environment.run_main()
+        source_position = environment.get_source_position(error_info.value.__traceback__)
+        assert source_position.line == 2
+        if hasattr(error_info.value, 'add_note'):
+            assert error_info.value.__notes__ == [f"at line 2, column {source_position.column} of the program"]
+
+    def test_code_objects_are_loaded_from_cache(self, tmp_path):
+        string = 'int main(){int i = 0; while(i < 3){i = i + 1;} return i;}'
+        code_cache = CodeCache(str(tmp_path))
+        assert PythonEnvironment(self._get_parse_tree(string), code_cache).run_main() == 3
+        assert len(list(tmp_path.iterdir())) == 1
+
+        environment = PythonEnvironment(self._get_parse_tree(string), code_cache)
+        generated_function = environment.generated_functions['<curr main>']
+        assert code_cache.load(generated_function.source, generated_function.filename) is not None
+        assert environment.run_main() == 3
+        assert len(list(tmp_path.iterdir())) == 1
+
+    @staticmethod
+    def get_result_of_main(string) -> PossibleTypes:
+        source = Source(io.StringIO(string))
+        parser = Parser(Lexer(source))
+        env = PythonEnvironment(parser.parse_program())
+        return env.run_main()
@@ -0,0 +1,56 @@
+import io
+
+import pytest
+
+from interpreter.environment.arena_environment import ArenaEnvironment
+from interpreter.environment.environment import Environment
+from interpreter.environment.environment_errors import SemanticError, RunTimeEnvError
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.constants import PossibleTypes
+from interpreter.models.tree_arena import ArenaBuilder
+from interpreter.parser.parser import Parser
+from interpreter.source.source import Source
+from tests.environment import test_environment
+
+
+class TestArenaEnvironment(test_environment.TestEnvironment):
+    """
+    All tests of Environment, run on programs parsed into a TreeArena
+    """
+
+    @pytest.mark.parametrize('string, error', [
+        ('int main(){return x;}', SemanticError),
+        ('int main(){return f();}', SemanticError),
+        ('int main(){return 1EUR;}', SemanticError),
+        ('int main(){int a = 1; int a = 2; return a;}', SemanticError),
+        ('int f(int a){return a;}\nint main(){return f(1, 2);}', SemanticError),
+        ('int f(){return f();}\nint main(){\n    return f();\n}', RunTimeEnvError),
+        ('int main(){\n  int i = 0;\n  while(true) {\n    i = i + 1;\n  }\n  return i;\n}', RunTimeEnvError),
+    ])
+    def test_errors_are_the_same(self, string, error):
+        with pytest.raises(error) as expected:
+            self._get_environment(string, Environment).run_main()
+        with pytest.raises(error) as actual:
+            self._get_environment(string, ArenaEnvironment).run_main()
+        assert actual.value.error_code == expected.value.error_code
+        assert actual.value.position == expected.value.position
+
+    def test_global_variables(self):
+        string = 'USD := 4.0;\nint a = 2 * 3;\nUSD b = USD 8.0;\nint main(){return a;}'
+        assert self._get_environment(string, ArenaEnvironment).get_global_variables() == \
+            self._get_environment(string, Environment).get_global_variables()
+
+    @staticmethod
+    def _get_environment(string, environment_class):
+        source = Source(io.StringIO(string))
+        tokens = Lexer(source).tokenize()
+        if environment_class is ArenaEnvironment:
+            return ArenaEnvironment(Parser(tokens, ArenaBuilder(source.line_index)).parse_program())
+        return Environment(Parser(tokens).parse_program())
+
+    @staticmethod
+    def get_result_of_main(string) -> PossibleTypes:
+        source = Source(io.StringIO(string))
+        parser = Parser(Lexer(source), ArenaBuilder(source.line_index))
+        env = ArenaEnvironment(parser.parse_program())
+        return env.run_main()
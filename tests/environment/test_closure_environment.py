@@ -0,0 +1,30 @@
+import io
+
+from interpreter.environment.closure_environment import ClosureEnvironment
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.constants import PossibleTypes
+from interpreter.parser.parser import Parser
+from interpreter.source.source import Source
+from interpreter.source.text_source import TextSource
+from tests.environment import test_environment
+
+
+class TestClosureEnvironment(test_environment.TestEnvironment):
+    """
+    All tests of Environment, run by closures compiled from the program
+    """
+
+    def test_lazy_function_is_compiled_at_first_call(self):
+        string = 'int f(){return 2;} int g(){return 3;} int main(){return f();}'
+        environment = ClosureEnvironment(Parser(Lexer(TextSource(string)).tokenize(),
+                                                lazy_functions=True).parse_program())
+        assert environment.bodies[:2] == [None, None]
+        assert environment.run_main() == 2
+        assert environment.bodies[0] is not None and environment.bodies[1] is None
+
+    @staticmethod
+    def get_result_of_main(string) -> PossibleTypes:
+        source = Source(io.StringIO(string))
+        parser = Parser(Lexer(source))
+        env = ClosureEnvironment(parser.parse_program())
+        return env.run_main()
@@ -0,0 +1,87 @@
+import io
+
+import pytest
+
+from interpreter.environment.resolver import Resolver
+from interpreter.environment.type_checker import TypeChecker
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.base import Constant
+from interpreter.models.bound import LocalVariable, GlobalVariable
+from interpreter.models.constants import CurrencyValue
+from interpreter.models.expressions import MultiplyExpression, SumExpression, TypeCastingFactor
+from interpreter.models.typed import TypedConstant
+from interpreter.parser.parser import Parser
+from interpreter.source.source import Source
+
+
+class TestConstantFolder:
+    @staticmethod
+    def _get_type_checker(string: str) -> TypeChecker:
+        return TypeChecker(Resolver(Parser(Lexer(Source(io.StringIO(string)))).parse_program()))
+
+    @staticmethod
+    def _get_returned_expression(string: str, function_index: int = -1):
+        type_checker = TestConstantFolder._get_type_checker(string)
+        return type_checker.functions[function_index].statements.list_of_statements[-1].expression
+
+    @pytest.mark.parametrize('string, value', [
+        ('float main(){return 2 * 3.5;}', 7.0),
+        ('float main(){return float 10;}', 10.0),
+        ('float main(){return 7 - 2 * 3 % 4 + 10 / 5 - 1;}', 6.0),
+        ('bool main(){return 1 < 2 && !(3 >= 4) || false;}', True),
+        ('string main(){return "ab" * 2 + string 1;}', 'abab1'),
+        ('USD := 1.0; USD main(){return USD 2.0;}', CurrencyValue('USD', 2.0)),
+        # a value of a currency is cast into the rate of its currency to the other one
+        ('USD := 1.0; EUR := 2.0; EUR main(){return EUR 2.0USD;}', CurrencyValue('EUR', 0.5)),
+        ('int a = 2 * 3; int b = a + 1; int main(){return a * b;}', 42),
+        ('int main(){int a = 2; int b = a * 3; return a + b;}', 8),
+    ])
+    def test_constant_expressions_are_folded(self, string, value):
+        expression = self._get_returned_expression(string)
+        assert type(expression) is TypedConstant
+        assert expression.value == value
+
+    def test_declarations_of_global_variables_are_folded(self):
+        type_checker = self._get_type_checker('USD := 1.0; EUR := 2.0; EUR a = EUR 4.0USD; float b = 1.5 * 2; '
+                                              'int main(){return 1;}')
+        assert [declaration.expression for declaration in type_checker.global_declarations] == [
+            TypedConstant(declaration.expression.source_position, value)
+            for declaration, value in zip(type_checker.global_declarations, [CurrencyValue('EUR', 0.5), 3.0])
+        ]
+
+    def test_constant_of_currency_which_is_not_declared_is_not_typed(self):
+        expression = self._get_returned_expression('USD := 1.0; bool main(){return 1.0USD == 1.0XYZ;}')
+        assert type(expression.left_side) is TypedConstant
+        assert type(expression.right_side) is Constant
+
+    def test_constant_operands_at_the_start_are_folded(self):
+        expression = self._get_returned_expression('int f(){return 1;} int main(){return 1 + 2 + f() + 3;}')
+        assert type(expression) is SumExpression
+        assert expression.left_side.value == 3
+        assert len(expression.right_side) == 2
+
+    @pytest.mark.parametrize('string, expression_type', [
+        ('float main(){return 1 / 0;}', MultiplyExpression),
+        ('float main(){return 1 + 2 + 3 / 0;}', SumExpression),
+        ('int main(){return int "abc";}', TypeCastingFactor),
+        ('USD := 1.0; EUR := 2.0; EUR main(){return EUR 2.0GBP;}', TypeCastingFactor),
+        ('string main(){return "a" * 5000;}', MultiplyExpression),
+        # variables which can change are not propagated
+        ('int main(){int a = 2; a = 3; return a;}', LocalVariable),
+        ('int main(){if(true){int a = 2;} return a;}', LocalVariable),
+        # after a call of a function ending without a return its frame is the current one
+        ('int f(){int z = 1;} int main(){int a = 2; f(); return a;}', LocalVariable),
+        ('int f(){return b;} int a = f(); int b = 1; int main(){return b;}', GlobalVariable),
+    ])
+    def test_expressions_are_not_folded(self, string, expression_type):
+        assert type(self._get_returned_expression(string)) is expression_type
+
+    def test_local_variable_is_propagated_after_its_declaration(self):
+        type_checker = self._get_type_checker('int a = 1; int main(){int b = a; int a = 2; return a + b;}')
+        first_declaration, _, return_statement = type_checker.functions[0].statements.list_of_statements
+        # before its declaration the global variable is read
+        assert type(first_declaration.expression) is LocalVariable
+        assert return_statement.expression.left_side == \
+            TypedConstant(return_statement.expression.left_side.source_position, 2)
+        assert type(return_statement.expression.right_side[0][1]) is LocalVariable
+
@@ -0,0 +1,113 @@
+import io
+
+import pytest
+
+from interpreter.__main__ import ENGINES
+from interpreter.environment.environment import Environment
+from interpreter.environment.environment_errors import SemanticError, SemanticErrorCode
+from interpreter.environment.frame import NOT_DECLARED
+from interpreter.environment.resolver import Resolver
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.bound import NO_SLOT, LocalVariable, GlobalVariable, BoundAssignment, BoundFunctionCall
+from interpreter.models.declarations import ParseTree
+from interpreter.parser.parser import Parser
+from interpreter.source.source import Source
+from interpreter.source.text_source import TextSource
+
+
+class TestResolver:
+    @staticmethod
+    def _get_parse_tree(string: str) -> ParseTree:
+        return Parser(Lexer(Source(io.StringIO(string)))).parse_program()
+
+    @staticmethod
+    def _get_result_of_main(string: str):
+        return Environment(TestResolver._get_parse_tree(string)).run_main()
+
+    def test_slots(self):
+        resolver = Resolver(self._get_parse_tree(
+            'int g = 1; int h = 2; int f(int a, int b){int c = a; g = c; return f(b, h);} int main(){return 1;}'
+        ))
+        function = resolver.functions[resolver.function_indexes['f']]
+        declaration, assignment, return_statement = function.statements.list_of_statements
+        assert function.number_of_slots == 4
+        assert (declaration.slot, declaration.expression) == (2, LocalVariable(declaration.source_position, 'a', 0))
+        assert isinstance(assignment, BoundAssignment) and (assignment.slot, assignment.global_slot) == (3, 0)
+        call = return_statement.expression
+        assert isinstance(call, BoundFunctionCall) and call.function == resolver.function_indexes['f']
+        assert call.args[0] == LocalVariable(call.args[0].source_position, 'b', 1, NO_SLOT)
+        assert call.args[1] == GlobalVariable(call.args[1].source_position, 'h', 1)
+
+    @pytest.mark.parametrize('string, result', [
+        ('int a = 1; int main(){int b = a; int a = 2; return a + b;}', 3),
+        ('int a = 1; int main(){if(false){int a = 2;} return a;}', 1),
+        ('int a = 1; int f(){return a;} int main(){a = 5; return a + f();}', 6),
+        ('int a = 1; int main(){int i = 0; int r = 0; while(i < 2){if(i == 1){r = a;} i = i + 1; '
+         'if(i == 1){int a = 7;}} return r;}', 7),
+        ('int f(int a, int a){return a;} int main(){return f(1, 2);}', 2),
+    ])
+    def test_scoping_of_lookups_by_name(self, string, result):
+        assert self._get_result_of_main(string) == result
+
+    @pytest.mark.parametrize('string, error_code, name', [
+        ('int unused(){return b;} int main(){return 1;}', SemanticErrorCode.VAR_ID_NOT_FOUND, 'b'),
+        ('int main(){a = 1; return 1;}', SemanticErrorCode.VAR_ID_NOT_FOUND, 'a'),
+        ('int a = b; int main(){return 1;}', SemanticErrorCode.VAR_ID_NOT_FOUND, 'b'),
+        ('int unused(){return g();} int main(){return 1;}', SemanticErrorCode.FUN_ID_NOT_FOUND, 'g'),
+        ('int main(){return 1;} int a = 1; int a = 2;', SemanticErrorCode.DUPLICATE_ID, 'a'),
+    ])
+    def test_names_are_reported_before_running(self, string, error_code, name):
+        with pytest.raises(SemanticError) as error_info:
+            Resolver(self._get_parse_tree(string))
+        assert (error_info.value.error_code, error_info.value.name) == (error_code, name)
+
+    def test_variable_declared_on_path_not_taken(self):
+        with pytest.raises(SemanticError) as error_info:
+            self._get_result_of_main('int main(){if(false){int a = 2;} return a;}')
+        assert error_info.value.error_code == SemanticErrorCode.VAR_ID_NOT_FOUND
+
+    @pytest.mark.parametrize('engine', ENGINES.values())
+    @pytest.mark.parametrize('string, name, column', [
+        # a return statement in a loop pops the frame of its function, which goes on in the frame of its caller
+        ('float f(){ int k = 1; while (k > 0) { k = k - 1; return 0.0; } return 1.0; } float main(){ return f(); }',
+         'k', 30),
+        ('int f(){ int k = 1; while(k > 0){ k = k - 1; return 0; } return 7; } '
+         'int main(){ int a = 0; int b = 0; return f() + a; }', 'k', 27),
+        # a function ending without a return statement leaves its frame current for its caller
+        ('int f(){int z = 1;} int main(){int a = 2; f(); return a;}', 'a', 55),
+    ])
+    def test_variables_are_looked_up_by_names_in_frames_of_other_functions(self, engine, string, name, column):
+        with pytest.raises(SemanticError) as error_info:
+            engine(self._get_parse_tree(string)).run_main()
+        assert error_info.value.error_code == SemanticErrorCode.VAR_ID_NOT_FOUND
+        assert (error_info.value.name, error_info.value.position.column) == (name, column)
+
+    @pytest.mark.parametrize('engine', ENGINES.values())
+    @pytest.mark.parametrize('string, result', [
+        ('int f(){int a = 7;} int main(){int a = 2; f(); a = 3; return a;}', 3),
+        ('int g = 1; int f(){int g = 9;} int main(){f(); return g * 2;}', 18),
+        ('int h(){int q = 1;} int g(){h(); return 5;} int main(){int a = 0; a = g(); return a;}', 5),
+        ('int f(){int x = 1;} int g(){int x = 2; f(); return x;} int main(){return g();}', 1),
+    ])
+    def test_frames_of_other_functions_keep_variables_by_names(self, engine, string, result):
+        assert engine(self._get_parse_tree(string)).run_main() == result
+
+    def test_frames_hold_lists(self):
+        environment = Environment(self._get_parse_tree('int g = 3; int main(){int a = g; return a;}'))
+        assert environment.current_frame.local_variables == [NOT_DECLARED]
+        assert environment.global_variables == [3]
+        assert environment.get_global_variables() == {'g': 3}
+
+    def test_expressions_without_names_are_kept(self):
+        parse_tree = self._get_parse_tree('int main(){int a = 1 + 2 * 3; return a + 1;}')
+        declaration, return_statement = Resolver(parse_tree).functions[0].statements.list_of_statements
+        assert declaration.expression is parse_tree.declarations[0].statements.list_of_statements[0].expression
+        assert return_statement.expression is not parse_tree.declarations[0].statements.list_of_statements[1].expression
+
+    def test_lazy_function_is_bound_at_first_call(self):
+        tokens = Lexer(TextSource('int f(){return b;} int g(){return 2;} int main(){return g();}')).tokenize()
+        environment = Environment(Parser(tokens, lazy_functions=True).parse_program())
+        f, g, _ = environment.functions
+        assert f.statements is None and g.statements is None
+        assert environment.run_main() == 2
+        assert f.statements is None and g.statements is not None
@@ -0,0 +1,68 @@
+import io
+
+import pytest
+
+from benchmarks.programs import generate_evaluation_program, generate_program
+from interpreter.environment.environment import Environment
+from interpreter.environment.environment_errors import SemanticError, SemanticErrorCode
+from interpreter.environment.semantic_checker import SemanticChecker
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.declarations import ParseTree
+from interpreter.parser.parser import Parser
+from interpreter.source.source import Source
+
+
+class TestSemanticChecker:
+    @staticmethod
+    def _get_parse_tree(string: str) -> ParseTree:
+        return Parser(Lexer(Source(io.StringIO(string)))).parse_program()
+
+    def _get_error(self, string: str) -> SemanticError:
+        with pytest.raises(SemanticError) as error_info:
+            SemanticChecker(self._get_parse_tree(string)).check()
+        return error_info.value
+
+    def test_valid_programs(self):
+        SemanticChecker(self._get_parse_tree(generate_program(10000))).check()
+        SemanticChecker(self._get_parse_tree(generate_evaluation_program(5))).check()
+        SemanticChecker(self._get_parse_tree("""
+        USD := 1.0;
+        float rate = 0.5;
+        USD main(){
+            if(true) {
+                USD amount = 2.0USD;
+            }
+            amount = pay(amount);
+            return amount;
+        }
+        USD pay(USD amount){ return amount; }
+        """)).check()
+
+    @pytest.mark.parametrize('string, error_code, name', [
+        ('int main(){return 1;} int main(){return 2;}', SemanticErrorCode.DUPLICATE_ID, 'main'),
+        ('int a = 1; int a = 2; int main(){return 1;}', SemanticErrorCode.DUPLICATE_ID, 'a'),
+        ('int main(){int a = 1; if(true){int a = 2;} return a;}', SemanticErrorCode.DUPLICATE_ID, 'a'),
+        ('int f(){return 1;}', SemanticErrorCode.FUN_ID_NOT_FOUND, 'main'),
+        ('int main(int a){return a;}', SemanticErrorCode.WRONG_NUMBER_OF_PARAMS, 'main'),
+        ('int main(){return f();}', SemanticErrorCode.FUN_ID_NOT_FOUND, 'f'),
+        ('int f(int a){return a;} int main(){return f(1, 2);}', SemanticErrorCode.WRONG_NUMBER_OF_PARAMS, 'f'),
+        ('int main(){return a;}', SemanticErrorCode.VAR_ID_NOT_FOUND, 'a'),
+        ('int main(){a = 1; int a = 2; return a;}', SemanticErrorCode.VAR_ID_NOT_FOUND, 'a'),
+        ('USD main(){return 1.0USD;}', SemanticErrorCode.CURR_ID_NOT_FOUND, 'USD'),
+    ])
+    def test_semantic_errors(self, string, error_code, name):
+        error = self._get_error(string)
+        assert (error.error_code, error.name) == (error_code, name)
+
+    def test_error_of_unused_function(self):
+        string = 'int f(int a){return a;} int unused(){return f(1, 2);} int main(){return 1;}'
+        assert Environment(self._get_parse_tree(string)).run_main() == 1
+        assert self._get_error(string).error_code == SemanticErrorCode.WRONG_NUMBER_OF_PARAMS
+
+    def test_same_error_as_environment(self):
+        string = 'int main(){int a = 1; return a + f(a);}'
+        with pytest.raises(SemanticError) as error_info:
+            Environment(self._get_parse_tree(string)).run_main()
+        error = self._get_error(string)
+        assert (error.error_code, error.name, error.position) == \
+               (error_info.value.error_code, error_info.value.name, error_info.value.position)
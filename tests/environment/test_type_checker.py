@@ -0,0 +1,127 @@
+import io
+
+import pytest
+
+from interpreter.environment import frame
+from interpreter.environment.environment import Environment
+from interpreter.environment.environment_errors import SemanticTypeError
+from interpreter.environment.resolver import Resolver
+from interpreter.environment.type_checker import TypeChecker
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.bound import BoundAssignment
+from interpreter.models.constants import CurrencyType, CurrencyValue
+from interpreter.models.declarations import ParseTree
+from interpreter.models.statements import ReturnStatement
+from interpreter.models.typed import TypedVariableDeclaration, TypedAssignment, TypedWhileStatement, \
+    TypedReturnStatement, TypedFunctionCall, TypedRelationshipExpression
+from interpreter.parser.parser import Parser
+from interpreter.source.source import Source
+from interpreter.source.text_source import TextSource
+
+
+class TestTypeChecker:
+    @staticmethod
+    def _get_parse_tree(string: str) -> ParseTree:
+        return Parser(Lexer(Source(io.StringIO(string)))).parse_program()
+
+    @staticmethod
+    def _get_type_checker(string: str) -> TypeChecker:
+        return TypeChecker(Resolver(TestTypeChecker._get_parse_tree(string)))
+
+    def test_loop_of_compound_interest_is_typed(self):
+        with open('inputfile.curr') as file:
+            type_checker = self._get_type_checker(file.read())
+        compound_interest, main = type_checker.functions
+        first_declaration, second_declaration, while_statement, return_statement = \
+            compound_interest.statements.list_of_statements
+        assert isinstance(first_declaration, TypedVariableDeclaration)
+        assert isinstance(second_declaration, TypedVariableDeclaration)
+        assert isinstance(while_statement, TypedWhileStatement)
+        assert isinstance(while_statement.expression, TypedRelationshipExpression)
+        assert all(isinstance(statement, TypedAssignment)
+                   for statement in while_statement.statements.list_of_statements)
+        assert isinstance(return_statement, TypedReturnStatement)
+        main_return_statement, = main.statements.list_of_statements
+        assert isinstance(main_return_statement, TypedReturnStatement)
+        assert isinstance(main_return_statement.expression, TypedFunctionCall)
+
+    def test_compound_interest_runs_without_type_checks(self, monkeypatch):
+        checked_functions = []
+
+        def check_params(function_name, *args):
+            checked_functions.append(function_name)
+
+        def fail(*args):
+            raise AssertionError('type checked at run time')
+
+        monkeypatch.setattr(frame, 'check_params', check_params)
+        monkeypatch.setattr(frame.Frame, 'check_return_value', fail)
+        monkeypatch.setattr(Environment, 'check_type', staticmethod(fail))
+        with open('inputfile.curr') as file:
+            result = Environment(self._get_parse_tree(file.read())).run_main()
+        assert round(result.value, 4) == 16.1051
+        assert set(checked_functions) == {'main'}
+
+    @pytest.mark.parametrize('string, expected, actual', [
+        ('int main(){int a = "s"; return a;}', int, str),
+        ('int main(){int a = 1; a = 2.5; return a;}', int, float),
+        ('int main(){if(1){return 1;} return 2;}', bool, int),
+        ('int main(){int i = 0; while(i){i = i + 1;} return i;}', bool, int),
+        ('bool main(){return true || 1;}', bool, int),
+        ('bool main(){return 1 && true;}', bool, int),
+        ('bool main(){return 1 < 2.0;}', int, float),
+        ('bool main(){return !"s";}', bool, str),
+        ('int main(){return 1 / 2;}', int, float),
+        ('int unused(){return 1.5;} int main(){return 1;}', int, float),
+        ('USD := 1.0; EUR := 2.0; USD f(USD a){return a;} USD main(){return f(1.0EUR);}', CurrencyType('USD'),
+         CurrencyValue),
+        ('USD := 1.0; EUR := 2.0; EUR g = 1.0USD; int main(){return 1;}', CurrencyType('EUR'), CurrencyValue),
+    ])
+    def test_type_errors_are_reported_before_running(self, string, expected, actual):
+        with pytest.raises(SemanticTypeError) as error_info:
+            Environment(self._get_parse_tree(string))
+        assert (error_info.value.expected, error_info.value.actual) == (expected, actual)
+
+    def test_assignment_can_change_currency(self):
+        string = 'USD := 1.0; EUR := 2.0; USD main(){USD a = 1.0USD; a = 2.0EUR; return a;}'
+        main, = self._get_type_checker(string).functions
+        _, assignment, return_statement = main.statements.list_of_statements
+        assert isinstance(assignment, TypedAssignment)
+        assert type(return_statement) is ReturnStatement
+        with pytest.raises(SemanticTypeError):
+            Environment(self._get_parse_tree(string)).run_main()
+
+    def test_checks_which_are_not_proven_stay(self):
+        string = 'int a = 1; int main(){bool b = a < 2; string a = "s"; a = "t"; return 1;}'
+        main, = self._get_type_checker(string).functions
+        declaration, _, assignment, _ = main.statements.list_of_statements
+        # a is either the global int or the local string
+        assert type(declaration.expression) is not TypedRelationshipExpression
+        assert type(assignment) is BoundAssignment
+        assert Environment(self._get_parse_tree(string)).run_main() == 1
+
+    @pytest.mark.parametrize('string, returns_to_caller', [
+        ('int f(){return 1;}', True),
+        ('int f(){if(true){return 1;}}', False),
+        ('int f(){int i = 0; while(i < 1){return 1;} return 2;}', False),
+        ('int f(){g(); return 1;} int g(){return 2;}', False),
+        ('int f(){return f();}', True),
+        ('int f(){return g();} int g(){if(true){return 2;}}', False),
+    ])
+    def test_functions_returning_to_caller(self, string, returns_to_caller):
+        type_checker = self._get_type_checker(string + ' int main(){return 1;}')
+        assert type_checker.returns_to_caller[0] == returns_to_caller
+
+    def test_values_of_function_without_frame_are_not_typed(self):
+        string = 'int f(){if(true){return 1;}} int main(){int a = 1; f(); return a;}'
+        main = self._get_type_checker(string).functions[1]
+        return_statement = main.statements.list_of_statements[-1]
+        assert type(return_statement) is ReturnStatement
+        assert Environment(self._get_parse_tree(string)).run_main() == 1
+
+    def test_lazy_function_is_checked_at_first_call(self):
+        string = 'int f(){return "s";} int g(){return 2.5;} int main(){return f();}'
+        environment = Environment(Parser(Lexer(TextSource(string)).tokenize(), lazy_functions=True).parse_program())
+        with pytest.raises(SemanticTypeError) as error_info:
+            environment.run_main()
+        assert (error_info.value.expected, error_info.value.actual) == (int, str)
@@ -0,0 +1,82 @@
+import io
+from typing import List
+
+import pytest
+
+from benchmarks.programs import generate_program
+from interpreter.lexer.char_lexer import CharLexer
+from interpreter.lexer.lexer import Lexer, tokens_generator, MAX_STRING
+from interpreter.lexer.lexer_error import LexerError
+from interpreter.source.buffered_source import BufferedSource
+from interpreter.source.mmap_source import MmapSource
+from interpreter.source.source import Source
+from interpreter.token.token import Token
+from interpreter.token.token_type import TokenType
+
+PROGRAMS = [
+    open('inputfile.curr').read(),
+    generate_program(20000),
+    'int a = 1.05 + 3.0USD;\n\n  string b = "x\ny" ;/* a\n */ bool c = !true != false',
+    'EUR := 4.1; EUR f(int a, float b) { while(a >= 0 && b <= 2.0 || a == b) { a = a % 2 * 3 - 1; } }',
+    'ąb_ć = 3; ŻÓŁ x;',
+    'identifier_' * 90 + ' "' + 's' * MAX_STRING + '" ' + '9' * 100 + '.' + '9' * 100,
+]
+
+
+class TestLexerEngine:
+    @pytest.mark.parametrize('program', PROGRAMS)
+    def test_same_tokens_as_char_lexer(self, program):
+        assert self._get_tokens(Lexer(Source(io.StringIO(program)))) == \
+               self._get_tokens(CharLexer(Source(io.StringIO(program))))
+
+    @pytest.mark.parametrize('chunk_size', [1, 7, 100])
+    @pytest.mark.parametrize('program', PROGRAMS)
+    def test_tokens_crossing_blocks(self, program, chunk_size):
+        assert self._get_tokens(Lexer(BufferedSource(io.StringIO(program), chunk_size))) == \
+               self._get_tokens(Lexer(Source(io.StringIO(program))))
+
+    @pytest.mark.parametrize('program', PROGRAMS)
+    def test_mmap_source(self, tmp_path, program):
+        path = tmp_path / 'program.curr'
+        path.write_bytes(program.replace('\n', '\r\n').encode('utf-8'))
+        with MmapSource(str(path)) as source:
+            assert self._get_tokens(Lexer(source)) == self._get_tokens(Lexer(Source(io.StringIO(program))))
+
+    @pytest.mark.parametrize('program', [
+        '#', '1.x', '"' + 'a' * (MAX_STRING + 1) + '"', 'a' * (MAX_STRING + 1), '1' * 101, 'Us', '"abc'
+    ])
+    def test_same_errors_as_char_lexer(self, program):
+        with pytest.raises(LexerError) as expected:
+            self._get_tokens(CharLexer(Source(io.StringIO(program))))
+        with pytest.raises(LexerError) as actual:
+            self._get_tokens(Lexer(Source(io.StringIO(program))))
+        assert str(actual.value) == str(expected.value)
+
+    def test_unterminated_comment(self):
+        with pytest.raises(LexerError, match=r"unterminated comment"):
+            self._get_tokens(Lexer(BufferedSource(io.StringIO('a /* b ' + 'c' * 10000), 100)))
+
+    def test_single_ampersand(self):
+        with pytest.raises(LexerError):
+            self._get_tokens(Lexer(Source(io.StringIO('a = &b'))))
+
+    def test_comments_next_to_each_other(self):
+        tokens = self._get_tokens(Lexer(Source(io.StringIO('a /* b *//* c */ / /**/d'))))
+        assert [token.type for token in tokens] == [TokenType.ID, TokenType.DIV_OPERATOR, TokenType.ID, TokenType.EOF]
+
+    def test_division_followed_by_identifier(self):
+        tokens = self._get_tokens(Lexer(Source(io.StringIO('a/b'))))
+        assert [(token.type, token.value) for token in tokens] == [
+            (TokenType.ID, 'a'), (TokenType.DIV_OPERATOR, ''), (TokenType.ID, 'b'), (TokenType.EOF, '')
+        ]
+
+    @pytest.mark.parametrize('program', PROGRAMS)
+    def test_tokens_taken_one_by_one_and_in_batches(self, program):
+        lexer = Lexer(Source(io.StringIO(program)))
+        tokens = [lexer.get_next_token() for _ in range(3)]
+        tokens += self._get_tokens(lexer)
+        assert tokens == self._get_tokens(Lexer(Source(io.StringIO(program))))
+
+    @staticmethod
+    def _get_tokens(lexer) -> List[Token]:
+        return list(tokens_generator(lexer))
@@ -0,0 +1,40 @@
+import pytest
+
+from benchmarks.programs import generate_program
+from interpreter.lexer.lexer import Lexer
+from interpreter.lexer.lexer_error import LexerError
+from interpreter.lexer.parallel_lexer import ParallelLexer, find_chunk_starts, STRING_OR_COMMENT
+from interpreter.source.text_source import TextSource
+from interpreter.token.token_table import TokenTable
+
+PROGRAM = generate_program(20000) + 'string s = "a\n\n/* b";\n/* "x\n\n */ int a = 1;\n string t = "\n\n";'
+
+
+class TestParallelLexer:
+    @pytest.mark.parametrize('text', [PROGRAM, PROGRAM + '\n', open('inputfile.curr').read(), '', 'a'])
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_same_as_lexer(self, text, workers):
+        assert self._get_columns(ParallelLexer(text, workers, 8).tokenize()) == \
+               self._get_columns(Lexer(TextSource(text)).tokenize())
+
+    @pytest.mark.parametrize('count', [2, 10, 100, 1000])
+    def test_chunks_start_outside_strings_and_comments(self, count):
+        starts = find_chunk_starts(PROGRAM, count)
+        assert starts[0] == 0
+        assert starts == sorted(set(starts))
+        assert len(starts) > min(count, 100) // 2
+        for match in STRING_OR_COMMENT.finditer(PROGRAM):
+            assert not any(match.start() < start < match.end() for start in starts)
+        assert all(PROGRAM[start - 1] == '\n' for start in starts[1:])
+
+    @pytest.mark.parametrize('text', [PROGRAM + '/* unterminated', PROGRAM.replace('"a', '"' + 'a' * 2000), '#'])
+    def test_same_error_as_lexer(self, text):
+        with pytest.raises(LexerError) as expected:
+            Lexer(TextSource(text)).tokenize()
+        with pytest.raises(LexerError) as actual:
+            ParallelLexer(text, 2).tokenize()
+        assert str(actual.value) == str(expected.value)
+
+    @staticmethod
+    def _get_columns(table: TokenTable):
+        return table.kinds, table.offsets, table.values, table.line_index.line_starts, table.line_index.end_offset
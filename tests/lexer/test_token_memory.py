@@ -0,0 +1,61 @@
+import io
+import tracemalloc
+from typing import Callable, List
+
+from benchmarks.programs import generate_program
+from interpreter.lexer.lexer import Lexer, tokens_generator
+from interpreter.lexer.symbol_table import SymbolTable
+from interpreter.source.source import Source
+from interpreter.token.token import Token
+from interpreter.token.token_type import TokenType
+
+PROGRAM = generate_program(50000)
+
+
+class PlainToken:
+    """
+    Token as it was before slots and interning, kept to compare memory with
+    """
+
+    def __init__(self, type, value, offset, line_index):
+        self.type = type
+        self.value = value
+        self._source_position = offset
+        self._line_index = line_index
+
+
+class TestTokenMemory:
+    def test_less_memory_per_token(self):
+        fields = [(token.type, token.value, token.offset, token._line_index) for token in self._get_tokens()]
+        slotted_size = self._get_size_per_token(lambda: [Token(*token_fields) for token_fields in fields])
+        plain_size = self._get_size_per_token(lambda: [PlainToken(*token_fields) for token_fields in fields])
+        assert slotted_size < 0.75 * plain_size
+
+    def test_names_are_interned(self):
+        tokens = self._get_tokens()
+        names = {}
+        for token in tokens:
+            if token.type in (TokenType.ID, TokenType.CURRENCY):
+                assert names.setdefault(token.value, token.value) is token.value
+
+    def test_symbol_table_shared_between_lexers(self):
+        symbol_table = SymbolTable()
+        first = list(tokens_generator(Lexer(Source(io.StringIO('capital = 1;')), symbol_table)))
+        second = list(tokens_generator(Lexer(Source(io.StringIO('capital = 2;')), symbol_table)))
+        assert first[0].value is second[0].value
+        assert 'capital' in symbol_table and len(symbol_table) == 1
+
+    def test_token_has_no_dict(self):
+        assert not hasattr(self._get_tokens()[0], '__dict__')
+
+    @staticmethod
+    def _get_size_per_token(make_tokens: Callable[[], list]) -> float:
+        tracemalloc.start()
+        tokens = make_tokens()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return size / len(tokens)
+
+    @staticmethod
+    def _get_tokens() -> List[Token]:
+        return list(tokens_generator(Lexer(Source(io.StringIO(PROGRAM)))))
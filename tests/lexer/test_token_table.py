@@ -0,0 +1,59 @@
+import io
+from typing import List
+
+import pytest
+
+from benchmarks.programs import generate_program
+from interpreter.lexer.lexer import Lexer, tokens_generator
+from interpreter.lexer.lexer_error import LexerError
+from interpreter.source.buffered_source import BufferedSource
+from interpreter.source.source import Source
+from interpreter.token import token_kind as kind
+from interpreter.token.token import Token
+from interpreter.token.token_table import TokenTable
+from interpreter.token.token_type import TokenType
+
+PROGRAMS = [
+    '',
+    open('inputfile.curr').read(),
+    generate_program(20000),
+    'int a = 1.05 + 3.0USD;\n\n  string b = "x\ny" ;/* a\n */ bool c = !true != false',
+    'ąb_ć = 3; a/b',
+]
+
+
+class TestTokenTable:
+    @pytest.mark.parametrize('program', PROGRAMS)
+    def test_same_tokens_as_lexer(self, program):
+        table = self._get_table(program)
+        assert table.get_tokens() == self._get_tokens(program)
+
+    def test_columns(self):
+        table = self._get_table('int a = 3;\nreturn "x";')
+        assert list(table.kinds) == [
+            kind.INT, kind.ID, kind.ASSIGN_OPERATOR, kind.INT_VALUE, kind.SEMICOLON,
+            kind.RETURN_NAME, kind.STRING_VALUE, kind.SEMICOLON, kind.EOF
+        ]
+        assert list(table.offsets) == [2, 4, 6, 8, 9, 16, 20, 21, 22]
+        assert table.values == ['', 'a', '', 3, '', '', 'x', '', '']
+        assert table.get_type(6) == TokenType.STRING_VALUE
+        assert (table.get_position(6).line, table.get_position(6).column) == (2, 10)
+        assert (table.get_position(8).line, table.get_position(8).column) == (3, 0)
+
+    @pytest.mark.parametrize('chunk_size', [1, 7])
+    def test_tokens_crossing_blocks(self, chunk_size):
+        program = PROGRAMS[3]
+        table = Lexer(BufferedSource(io.StringIO(program), chunk_size)).tokenize()
+        assert table.get_tokens() == self._get_tokens(program)
+
+    def test_lexer_error(self):
+        with pytest.raises(LexerError):
+            self._get_table('int a = 3; #')
+
+    @staticmethod
+    def _get_table(string: str) -> TokenTable:
+        return Lexer(Source(io.StringIO(string))).tokenize()
+
+    @staticmethod
+    def _get_tokens(string: str) -> List[Token]:
+        return list(tokens_generator(Lexer(Source(io.StringIO(string)))))
@@ -0,0 +1,104 @@
+import io
+import os
+
+import pytest
+
+from benchmarks.programs import generate_program
+from interpreter.lexer.lexer import Lexer
+from interpreter.parser.grammar import Grammar, GrammarError, read_ebnf
+from interpreter.parser.parser import Parser
+from interpreter.parser.parser_error import ParserError
+from interpreter.parser.parser_generator import GRAMMAR_PATH, TABLES_PATH, generate_tables
+from interpreter.parser.predictive_parser import PredictiveParser
+from interpreter.source.source import Source
+from interpreter.token import token_kind as kind
+
+ROOT_DIRECTORY = os.path.join(os.path.dirname(__file__), '..', '..')
+
+
+class TestGrammar:
+    def test_tables_are_generated_from_grammar(self):
+        with open(GRAMMAR_PATH) as file:
+            grammar_text = file.read()
+        with open(TABLES_PATH) as file:
+            assert file.read() == generate_tables(grammar_text)
+
+    def test_read_ebnf(self):
+        rules = read_ebnf('a = "(", [b], {",", b} | ID; (* comment *) b = "int";')
+        assert rules == {
+            'a': [
+                [('terminal', '('), ('option', [[('name', 'b')]]),
+                 ('repetition', [[('terminal', ','), ('name', 'b')]])],
+                [('name', 'ID')],
+            ],
+            'b': [[('terminal', 'int')]],
+        }
+
+    def test_first_follow_and_nullable(self):
+        grammar = Grammar('program = list; list = "(", [item, {",", item}], ")"; item = ID | int;')
+        assert grammar.nullable == {'list_1', 'list_2'}
+        assert grammar.first['list'] == {kind.LEFT_BRACKET}
+        assert grammar.first['item'] == {kind.ID, kind.INT_VALUE}
+        assert grammar.first['list_1'] == {kind.ID, kind.INT_VALUE}
+        assert grammar.follow['list'] == {kind.EOF}
+        assert grammar.follow['item'] == {kind.COMMA, kind.RIGHT_BRACKET}
+        assert grammar.follow['list_1'] == {kind.RIGHT_BRACKET}
+
+    def test_predict_table(self):
+        grammar = Grammar('program = item, {item}; item = ID | int;')
+        table = grammar.predict_table()
+        productions = grammar.productions
+        assert productions[table['program_1'][kind.ID]] == ('program_1', ('item', 'program_1'))
+        assert productions[table['program_1'][kind.EOF]] == ('program_1', ())
+        assert productions[table['item'][kind.INT_VALUE]] == ('item', (kind.INT_VALUE,))
+
+    def test_grammar_which_is_not_ll1(self):
+        grammar = Grammar('program = ID, "=", int | ID, "(", ")";')
+        with pytest.raises(GrammarError):
+            grammar.predict_table()
+
+    def test_undefined_rule(self):
+        with pytest.raises(GrammarError):
+            Grammar('program = statement;')
+
+    def test_terminal_which_is_not_token(self):
+        with pytest.raises(GrammarError):
+            Grammar('program = "begin", ID;')
+
+    def test_invalid_ebnf(self):
+        with pytest.raises(GrammarError):
+            read_ebnf('program = ID')
+
+
+class TestPredictiveParser:
+    def test_program_file(self):
+        with open(os.path.join(ROOT_DIRECTORY, 'inputfile.curr')) as file:
+            text = file.read()
+        Parser(self._get_tokens(text)).parse_program()
+        PredictiveParser(self._get_tokens(text)).check_program()
+
+    def test_generated_program(self):
+        text = generate_program(50)
+        Parser(self._get_tokens(text)).parse_program()
+        PredictiveParser(self._get_tokens(text)).check_program()
+
+    @pytest.mark.parametrize('text', [
+        'int main()',
+        'main(){}',
+        'int main() {a = 3}',
+        'int main(){while(true); {}}',
+        'int main(){3 = a;}',
+        'int main(){EUR := 3;}',
+        'int main(){a;}',
+        'int a = 3',
+        'USD := 1.0',
+    ])
+    def test_invalid_programs(self, text):
+        with pytest.raises(ParserError):
+            Parser(self._get_tokens(text)).parse_program()
+        with pytest.raises(ParserError):
+            PredictiveParser(self._get_tokens(text)).check_program()
+
+    @staticmethod
+    def _get_tokens(text: str):
+        return Lexer(Source(io.StringIO(text))).tokenize()
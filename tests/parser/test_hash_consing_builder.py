@@ -0,0 +1,105 @@
+import io
+
+import pytest
+
+from benchmarks.programs import generate_evaluation_program
+from interpreter.__main__ import ENGINES
+from interpreter.environment.environment import Environment
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.constants import PossibleTypes
+from interpreter.models.declarations import ParseTree
+from interpreter.parser.hash_consing_builder import HashConsingBuilder
+from interpreter.parser.parser import Parser
+from interpreter.source.source import Source
+from tests.environment import test_environment
+
+
+class TestHashConsingBuilder:
+    @staticmethod
+    def _get_parse_tree(string: str, builder: HashConsingBuilder = None) -> ParseTree:
+        return Parser(Lexer(Source(io.StringIO(string))), builder).parse_program()
+
+    @staticmethod
+    def _get_return_expression(parse_tree: ParseTree):
+        return parse_tree.declarations[-1].statements.list_of_statements[-1].expression
+
+    def test_identical_expressions_have_one_first_occurrence(self):
+        builder = HashConsingBuilder()
+        parse_tree = self._get_parse_tree('int main(){int a = 1; return (1 + a) * (1 + a);}', builder)
+        expression = self._get_return_expression(parse_tree)
+        left, right = expression.left_side, expression.right_side[0][1]
+        assert left is not right
+        assert builder.get_first_occurrence(right) is left
+        assert builder.get_occurrences(left) == builder.get_occurrences(right) == 2
+        assert builder.get_occurrences(expression) == 1
+        # 1 in the declaration and twice in the sum, a twice in the sum
+        assert builder.get_occurrences(right.left_side) == 3
+        assert builder.get_shared_nodes() == [
+            builder.get_first_occurrence(left.left_side), left.right_side[0][1], left
+        ]
+        assert builder.repeated_nodes == 4
+
+    def test_function_calls_are_not_shared(self):
+        builder = HashConsingBuilder()
+        expression = self._get_return_expression(self._get_parse_tree('int main(){return f(1) + f(1);}', builder))
+        left, right = expression.left_side, expression.right_side[0][1]
+        assert builder.get_first_occurrence(right) is right
+        assert builder.get_first_occurrence(right.args[0]) is builder.get_first_occurrence(left.args[0])
+        assert builder.get_occurrences(expression) == 1
+
+    def test_equal_values_of_different_types(self):
+        builder = HashConsingBuilder()
+        expression = self._get_return_expression(
+            self._get_parse_tree('bool main(){return 1 == true && 1 == 1.0;}', builder)
+        )
+        left, right = expression.relationship_expressions
+        assert builder.get_first_occurrence(right.left_side) is left.left_side
+        assert builder.get_first_occurrence(right.right_side) is right.right_side
+        assert type(left.right_side.value) is bool and type(right.right_side.value) is float
+
+    def test_equal_amounts_of_currency_of_different_types(self):
+        string = 'USD := 1.0; string main(){string a = string 1USD; return string 1.0USD;}'
+        builder = HashConsingBuilder()
+        parse_tree = self._get_parse_tree(string, builder)
+        assert Environment(parse_tree).run_main() == '1.0USD'
+        declaration, return_statement = parse_tree.declarations[1].statements.list_of_statements
+        assert builder.get_occurrences(return_statement.expression.negation_factor) == 1
+
+    def test_values_of_constants_are_kept_once(self):
+        expression = self._get_return_expression(
+            self._get_parse_tree('USD := 1.0; bool main(){return 1.0USD == 1.0USD;}', HashConsingBuilder())
+        )
+        assert expression.left_side is not expression.right_side
+        assert expression.left_side.value is expression.right_side.value
+
+    @pytest.mark.parametrize('engine', ENGINES.values(), ids=ENGINES.keys())
+    @pytest.mark.parametrize('string, line', [
+        ('int f(){int b = 1; return b;}\nint main(){\nreturn b;}', 3),
+        ('EUR f(){return EUR 1.0XYZ;}\nEUR main(){\nreturn EUR 1.0XYZ;}', 3),
+        ('bool f(){bool a = true; return !a;}\nbool main(){int a = 1;\nreturn !a;}', 3),
+    ])
+    def test_error_of_later_occurrence_has_its_position(self, engine, string, line):
+        with pytest.raises(Exception) as error:
+            engine(self._get_parse_tree(string, HashConsingBuilder())).run_main()
+        with pytest.raises(Exception) as expected:
+            engine(self._get_parse_tree(string)).run_main()
+        assert error.value.position == expected.value.position
+        assert error.value.position.line == line
+
+    def test_generated_program(self):
+        string = generate_evaluation_program(5)
+        builder = HashConsingBuilder()
+        parse_tree = self._get_parse_tree(string, builder)
+        assert builder.repeated_nodes > 0
+        assert Environment(parse_tree).run_main() == Environment(self._get_parse_tree(string)).run_main()
+
+
+class TestHashConsedEnvironment(test_environment.TestEnvironment):
+    """
+    All tests of Environment, run on programs with shared subtrees
+    """
+
+    @staticmethod
+    def get_result_of_main(string) -> PossibleTypes:
+        parser = Parser(Lexer(Source(io.StringIO(string))), HashConsingBuilder())
+        return Environment(parser.parse_program()).run_main()
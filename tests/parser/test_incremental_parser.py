@@ -0,0 +1,99 @@
+import io
+
+import pytest
+
+from benchmarks.programs import generate_program
+from interpreter.lexer.lexer import Lexer
+from interpreter.lexer.lexer_error import LexerError
+from interpreter.models.declarations import ParseTree
+from interpreter.parser.incremental_parser import IncrementalParser
+from interpreter.parser.parser import Parser
+from interpreter.parser.parser_error import ParserError
+from interpreter.source.source import Source
+
+PROGRAM = generate_program(1500) + 'int x = 3; /* comment */ string s = "a\nb";\nEUR := 4.0;\n'
+
+
+class TestIncrementalParser:
+    @pytest.mark.parametrize('old, new', [
+        ('sum = sum', 'sxm = sum'),
+        ('i - 1', 'i - 7'),
+        ('i - 1', 'i -  1'),
+        ('i - 1', 'i - 1\n'),
+        ('i - 1', 'i\n\n- 1'),
+        ('once per', 'once\nper'),
+        ('int x = 3;', ''),
+        ('int x = 3;', 'int x = 3; int y = x;\n'),
+        ('"a\nb"', '"a b"'),
+        ('USD := 4.0;', 'USD := 4.0; GBP := 5.0;'),
+        ('int i = number_of_times;', 'int i = number_of_times * 2;'),
+        ('sum = sum * (1 + interest_rate)', 'sum = sum * (1 + interest_rate) / 2'),
+    ])
+    def test_same_as_full_parse(self, old, new):
+        parser = IncrementalParser(PROGRAM)
+        start = PROGRAM.index(old)
+        tree = parser.apply_edit(start, start + len(old), new)
+        text = PROGRAM.replace(old, new, 1)
+        assert parser.text == text
+        assert tree == self._parse(text)
+        assert parser.tokens.get_tokens() == Lexer(Source(io.StringIO(text))).tokenize().get_tokens()
+
+    def test_edits_in_a_row(self):
+        parser = IncrementalParser(PROGRAM)
+        text = PROGRAM
+        for old, new in [('sum', 'total'), ('\n', '\n\n'), ('int x = 3;', 'int x = 4;'), ('total', 'sum'),
+                         ('\n\n', '\n'), ('int x = 4;', 'int x = 3;')]:
+            start = text.index(old)
+            tree = parser.apply_edit(start, start + len(old), new)
+            text = text[:start] + new + text[start + len(old):]
+            assert tree == self._parse(text)
+
+    def test_declarations_after_edit_are_reused(self):
+        parser = IncrementalParser(PROGRAM)
+        old_tree = parser.tree
+        start = PROGRAM.index('i - 1')
+        tree = parser.apply_edit(start, start + len('i - 1'), 'i - 11')
+        assert all(new is old for new, old in zip(tree.declarations[:2], old_tree.declarations[:2]))
+        assert tree.declarations[2] is not old_tree.declarations[2]
+        assert all(new is old for new, old in zip(tree.declarations[3:], old_tree.declarations[3:]))
+        assert old_tree == self._parse(PROGRAM)
+
+    def test_declarations_after_new_lines_are_moved(self):
+        parser = IncrementalParser(PROGRAM)
+        old_tree = parser.tree
+        start = PROGRAM.index('i - 1')
+        tree = parser.apply_edit(start, start + len('i - 1'), 'i - 1\n\n')
+        assert all(new is old for new, old in zip(tree.declarations[:2], old_tree.declarations[:2]))
+        assert all(new is not old for new, old in zip(tree.declarations[2:], old_tree.declarations[2:]))
+        assert old_tree == self._parse(PROGRAM)
+
+    def test_unterminated_comment(self):
+        parser = IncrementalParser(PROGRAM)
+        start = PROGRAM.rindex('EUR := 4.0;')
+        with pytest.raises(LexerError):
+            parser.apply_edit(start, start, '/*')
+        assert parser.tree is None
+        assert parser.apply_edit(start, start + 2, '') == self._parse(PROGRAM)
+
+    def test_declarations_merged(self):
+        parser = IncrementalParser(PROGRAM)
+        start = PROGRAM.index('}\n\nUSD fn_b')
+        with pytest.raises(ParserError) as actual:
+            parser.apply_edit(start, start + 1, '')
+        with pytest.raises(ParserError) as expected:
+            self._parse(PROGRAM[:start] + PROGRAM[start + 1:])
+        assert str(actual.value) == str(expected.value)
+
+    def test_edit_at_both_ends(self):
+        parser = IncrementalParser(PROGRAM)
+        text = 'EUR := 3.0;\n' + PROGRAM + 'int z = 1;'
+        parser.apply_edit(0, 0, 'EUR := 3.0;\n')
+        assert parser.apply_edit(len(parser.text), len(parser.text), 'int z = 1;') == self._parse(text)
+
+    def test_edit_out_of_text(self):
+        with pytest.raises(ValueError):
+            IncrementalParser(PROGRAM).apply_edit(0, len(PROGRAM) + 1, '')
+
+    @staticmethod
+    def _parse(text: str) -> ParseTree:
+        return Parser(Lexer(Source(io.StringIO(text))).tokenize()).parse_program()
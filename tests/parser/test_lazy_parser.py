@@ -0,0 +1,64 @@
+import io
+
+import pytest
+
+from benchmarks.programs import generate_evaluation_program
+from interpreter.environment.environment import Environment
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.declarations import ParseTree, FunctionDeclaration
+from interpreter.parser.parser import Parser, FunctionBody
+from interpreter.parser.parser_error import ParserError
+from interpreter.source.source import Source
+from interpreter.token.token_table import TokenTable
+
+
+class TestLazyParser:
+    @staticmethod
+    def _get_tokens(string: str) -> TokenTable:
+        return Lexer(Source(io.StringIO(string))).tokenize()
+
+    def _get_parse_tree(self, string: str, lazy_functions: bool = True) -> ParseTree:
+        return Parser(self._get_tokens(string), lazy_functions=lazy_functions).parse_program()
+
+    def test_bodies_are_parsed_when_called(self):
+        parse_tree = self._get_parse_tree('int f(){ if(true){ while(false){} } return 1; }\n'
+                                          'int g(){ return 2; }\nint main(){ return f(); }')
+        bodies = [declaration.statements for declaration in parse_tree.declarations]
+        assert all(isinstance(body, FunctionBody) and not body.is_parsed() for body in bodies)
+
+        assert Environment(parse_tree).run_main() == 1
+        assert [body.is_parsed() for body in bodies] == [True, False, True]
+
+    def test_same_tree_as_eager_parser(self):
+        string = generate_evaluation_program(3)
+        eager_tree = self._get_parse_tree(string, lazy_functions=False)
+        lazy_tree = self._get_parse_tree(string)
+        for eager_declaration, lazy_declaration in zip(eager_tree.declarations, lazy_tree.declarations):
+            if isinstance(lazy_declaration, FunctionDeclaration):
+                assert lazy_declaration.source_position == eager_declaration.source_position
+                assert lazy_declaration.statements.get_statements() == eager_declaration.statements
+            else:
+                assert lazy_declaration == eager_declaration
+        assert Environment(lazy_tree).run_main() == Environment(eager_tree).run_main()
+
+    def test_error_in_unused_function(self):
+        string = 'int f(){ a = 3 } int main(){ return 1; }'
+        with pytest.raises(ParserError):
+            self._get_parse_tree(string, lazy_functions=False)
+        assert Environment(self._get_parse_tree(string)).run_main() == 1
+
+    @pytest.mark.parametrize('string', [
+        'int main(){ return f(); } int f(){ a = 3 }',
+        'int main(){ return f(); } int f(){ 3; }',
+        'int main(){ return f(); } int f(){ return 1;',
+    ])
+    def test_same_error_as_eager_parser(self, string):
+        with pytest.raises(ParserError) as eager_error:
+            self._get_parse_tree(string, lazy_functions=False)
+        with pytest.raises(ParserError) as lazy_error:
+            Environment(self._get_parse_tree(string)).run_main()
+        assert str(lazy_error.value) == str(eager_error.value)
+
+    def test_lexer_is_not_supported(self):
+        with pytest.raises(ValueError):
+            Parser(Lexer(Source(io.StringIO('int main(){ return 1; }'))), lazy_functions=True)
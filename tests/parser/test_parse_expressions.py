@@ -1,15 +1,18 @@
 import io
 
+import pytest
+
 from interpreter.lexer.lexer import Lexer
-from interpreter.models.base import Constant
+from interpreter.models.base import Constant, FunctionCall, Variable
 from interpreter.models.constants import CurrencyType, MulOperator, SumOperator, RelationshipOperator
 from interpreter.models.expressions import NegationFactor, TypeCastingFactor, MultiplyExpression, SumExpression, \
     RelationshipExpression, AndExpression, Expression
 from interpreter.parser.parser import Parser
+from interpreter.parser.parser_error import ParserError
 from interpreter.source.source import Source
 from interpreter.source.source_position import SourcePosition
-from tests.parser.utils import mul_expression_factory, and_expression_factory, \
-    relationship_expression_factory, type_casting_factor_factory, sum_expression_factory
+from interpreter.token.token_type import TokenType
+from tests.parser.utils import constant_factory
 
 
 class TestParserConstructions:
@@ -21,37 +24,26 @@ class TestParserConstructions:
     def test_parse_negation_factor_2(self):
         parser = self._get_parser('true')
         negation_factor = parser.parse_negation_factor()
-        assert negation_factor == NegationFactor(SourcePosition(1, 4), Constant(SourcePosition(1, 4), True), False)
+        assert negation_factor == Constant(SourcePosition(1, 4), True)
 
     def test_parse_type_casting_factor_1(self):
         parser = self._get_parser('true')
         factor = parser.parse_type_casting_factor()
-        assert factor == TypeCastingFactor(SourcePosition(1, 4),
-                                           NegationFactor(SourcePosition(1, 4),
-                                                          Constant(SourcePosition(1, 4), True),
-                                                          False))
+        assert factor == Constant(SourcePosition(1, 4), True)
 
     def test_parse_type_casting_factor_2(self):
         string = 'EUR true'
         parser = self._get_parser(string)
         factor = parser.parse_type_casting_factor()
         source_position = SourcePosition(1, len(string))
-        assert factor == \
-               TypeCastingFactor(source_position,
-                                 NegationFactor(source_position,
-                                                Constant(SourcePosition(1, len(string)), True), False),
-                                 CurrencyType('EUR'))
+        assert factor == TypeCastingFactor(source_position, Constant(source_position, True), CurrencyType('EUR'))
 
     def test_parse_type_casting_factor_3(self):
         string = 'int true'
         parser = self._get_parser(string)
         factor = parser.parse_type_casting_factor()
         source_position = SourcePosition(1, len(string))
-        assert factor == \
-               TypeCastingFactor(source_position,
-                                 NegationFactor(source_position,
-                                                Constant(SourcePosition(1, len(string)), True), False),
-                                 int)
+        assert factor == TypeCastingFactor(source_position, Constant(source_position, True), int)
 
     def test_multiply_expression(self):
         string = '4 * 4 / 5 % 3'
@@ -59,12 +51,12 @@ class TestParserConstructions:
         expression = parser.parse_multiply_expression()
         assert expression == MultiplyExpression(
             SourcePosition(1, len(string)),
-            type_casting_factor_factory(4, 1),
-            [
-                (MulOperator.MUL, type_casting_factor_factory(4, 5)),
-                (MulOperator.DIV, type_casting_factor_factory(5, 9)),
-                (MulOperator.MODULO, type_casting_factor_factory(3, 13)),
-            ]
+            constant_factory(4, 1),
+            (
+                (MulOperator.MUL, constant_factory(4, 5)),
+                (MulOperator.DIV, constant_factory(5, 9)),
+                (MulOperator.MODULO, constant_factory(3, 13)),
+            )
         )
 
     def test_sum_expression(self):
@@ -73,11 +65,11 @@ class TestParserConstructions:
         expression = parser.parse_sum_expression()
         assert expression == SumExpression(
             SourcePosition(1, len(string)),
-            mul_expression_factory(4, 1),
-            [
-                (SumOperator.ADD, mul_expression_factory(3, 5)),
-                (SumOperator.SUB, mul_expression_factory(3, 9)),
-            ]
+            constant_factory(4, 1),
+            (
+                (SumOperator.ADD, constant_factory(3, 5)),
+                (SumOperator.SUB, constant_factory(3, 9)),
+            )
         )
 
     def test_sum_and_mul_expression(self):
@@ -88,12 +80,12 @@ class TestParserConstructions:
             SourcePosition(1, len(string)),
             MultiplyExpression(
                 SourcePosition(1, 5),
-                type_casting_factor_factory(4, 1),
-                [(MulOperator.MUL, type_casting_factor_factory(3, 5))]
+                constant_factory(4, 1),
+                ((MulOperator.MUL, constant_factory(3, 5)),)
             ),
-            [
-                (SumOperator.SUB, mul_expression_factory(3, 9)),
-            ]
+            (
+                (SumOperator.SUB, constant_factory(3, 9)),
+            )
         )
 
     def relationship_expression_test_factory(self, relationship_operand_string: str,
@@ -104,9 +96,9 @@ class TestParserConstructions:
         source_position = SourcePosition(1, len(string))
         assert expression == RelationshipExpression(
             source_position,
-            sum_expression_factory(1, 1),
+            constant_factory(1, 1),
             relationship_operand_type,
-            sum_expression_factory(2, len(string))
+            constant_factory(2, len(string))
         )
 
     def test_relationship_expression(self):
@@ -124,11 +116,11 @@ class TestParserConstructions:
         source_position = SourcePosition(1, len(string))
         assert expression == AndExpression(
             source_position,
-            [
-                relationship_expression_factory(True, 4),
-                relationship_expression_factory(False, len(string)),
+            (
+                constant_factory(True, 4),
+                constant_factory(False, len(string)),
 
-            ]
+            )
         )
 
     def test_or_expression(self):
@@ -138,12 +130,69 @@ class TestParserConstructions:
         source_position = SourcePosition(1, len(string))
         assert expression == Expression(
             source_position,
-            [
-                and_expression_factory(True, 4),
-                and_expression_factory(False, len(string)),
-            ]
+            (
+                constant_factory(True, 4),
+                constant_factory(False, len(string)),
+            )
         )
 
+    def test_deeply_nested_expression(self):
+        depth = 100000
+        expression = self._get_parser('(' * depth + 'a' + ')' * depth).parse_expression()
+        assert expression == Variable(SourcePosition(1, depth + 1), 'a')
+
+    def test_deeply_nested_sum_expression(self):
+        depth = 100000
+        expression = self._get_parser('(1 + ' * depth + '1' + ')' * depth).parse_expression()
+        for _ in range(depth):
+            assert type(expression) is SumExpression and expression.left_side.value == 1
+            expression = expression.right_side[0][1]
+        assert expression == Constant(SourcePosition(1, 5 * depth + 1), 1)
+
+    def test_deeply_nested_function_call(self):
+        depth = 100000
+        expression = self._get_parser('f(' * depth + '1' + ')' * depth).parse_expression()
+        for _ in range(depth):
+            assert type(expression) is FunctionCall and len(expression.args) == 1
+            expression = expression.args[0]
+        assert expression == Constant(SourcePosition(1, 2 * depth + 1), 1)
+
+    def test_operators_in_nested_expression(self):
+        string = '(1 + 2) * !(a || b && c)'
+        expression = self._get_parser(string).parse_multiply_expression()
+        assert expression == MultiplyExpression(
+            SourcePosition(1, 24),
+            SumExpression(SourcePosition(1, 6), constant_factory(1, 2), ((SumOperator.ADD, constant_factory(2, 6)),)),
+            ((MulOperator.MUL, NegationFactor(
+                SourcePosition(1, 24),
+                Expression(SourcePosition(1, 23), (
+                    Variable(SourcePosition(1, 13), 'a'),
+                    AndExpression(SourcePosition(1, 23), (
+                        Variable(SourcePosition(1, 18), 'b'), Variable(SourcePosition(1, 23), 'c')
+                    ))
+                )),
+                True
+            )),)
+        )
+
+    def test_missing_right_bracket(self):
+        with pytest.raises(ParserError) as error:
+            self._get_parser('((1 + 2)').parse_expression()
+        assert error.value.expected == [TokenType.RIGHT_BRACKET]
+        assert error.value.actual == TokenType.EOF
+
+    def test_missing_comma_between_arguments(self):
+        with pytest.raises(ParserError) as error:
+            self._get_parser('f(1, (2) 3)').parse_expression()
+        assert error.value.expected == [TokenType.RIGHT_BRACKET]
+        assert error.value.position == SourcePosition(1, 10)
+
+    def test_missing_factor(self):
+        with pytest.raises(ParserError) as error:
+            self._get_parser('f(1, (2 + ))').parse_expression()
+        assert error.value.expected == []
+        assert error.value.position == SourcePosition(1, 11)
+
     @staticmethod
     def _get_parser(string: str) -> Parser:
         source = Source(io.StringIO(string))
@@ -9,7 +9,6 @@ from interpreter.parser.parser import Parser
 from interpreter.parser.parser_error import ParserError
 from interpreter.source.source import Source
 from interpreter.source.source_position import SourcePosition
-from tests.parser.utils import simple_expression_factory
 
 
 class TestParserConstructions:
@@ -25,7 +24,7 @@ class TestParserConstructions:
         return_statement = parser.parse_return_statement()
         assert return_statement == ReturnStatement(
             SourcePosition(1, 8),
-            simple_expression_factory(Variable(SourcePosition(1, 8), 'a'))
+            Variable(SourcePosition(1, 8), 'a')
         )
 
     def test_parse_if_statement_1(self):
@@ -34,10 +33,10 @@ class TestParserConstructions:
         if_statement = parser.parse_if_statement()
         assert if_statement == IfStatement(
             SourcePosition(1, 13),
-            simple_expression_factory(Variable(SourcePosition(1, 4), 'a')),
+            Variable(SourcePosition(1, 4), 'a'),
             Statements(
-                [Assignment(SourcePosition(1, 11), 'a',
-                            simple_expression_factory(Constant(SourcePosition(1, 11), 3)))])
+                (Assignment(SourcePosition(1, 11), 'a',
+                            Constant(SourcePosition(1, 11), 3)),))
         )
 
     def test_parse_if_statement_2(self):
@@ -46,8 +45,8 @@ class TestParserConstructions:
         if_statement = parser.parse_if_statement()
         assert if_statement == IfStatement(
             SourcePosition(1, 7),
-            simple_expression_factory(Variable(SourcePosition(1, 4), 'a')),
-            Statements([])
+            Variable(SourcePosition(1, 4), 'a'),
+            Statements(())
         )
 
     def test_parse_if_statement_3(self):
@@ -62,10 +61,10 @@ class TestParserConstructions:
         while_statement = parser.parse_while_statement()
         assert while_statement == WhileStatement(
             SourcePosition(1, 16),
-            simple_expression_factory(Variable(SourcePosition(1, 7), 'a')),
+            Variable(SourcePosition(1, 7), 'a'),
             Statements(
-                [Assignment(SourcePosition(1, 14), 'a',
-                            simple_expression_factory(Constant(SourcePosition(1, 14), 3)))])
+                (Assignment(SourcePosition(1, 14), 'a',
+                            Constant(SourcePosition(1, 14), 3)),))
         )
 
     def test_parse_while_statement_2(self):
@@ -74,8 +73,8 @@ class TestParserConstructions:
         while_statement = parser.parse_while_statement()
         assert while_statement == WhileStatement(
             SourcePosition(1, 10),
-            simple_expression_factory(Variable(SourcePosition(1, 7), 'a')),
-            Statements([])
+            Variable(SourcePosition(1, 7), 'a'),
+            Statements(())
         )
 
     def test_parse_while_statement_3(self):
@@ -88,12 +87,12 @@ class TestParserConstructions:
         string = 'a=3; a();'
         parser = self._get_parser(string)
         statement = parser.parse_statements()
-        assert statement == Statements([
+        assert statement == Statements((
             Assignment(
-                SourcePosition(1, 3), 'a', simple_expression_factory(Constant(SourcePosition(1, 3), 3))
+                SourcePosition(1, 3), 'a', Constant(SourcePosition(1, 3), 3)
             ),
-            FunctionCall(SourcePosition(1, 8), 'a', [])
-        ])
+            FunctionCall(SourcePosition(1, 8), 'a', ())
+        ))
 
     @staticmethod
     def _get_parser(string: str) -> Parser:
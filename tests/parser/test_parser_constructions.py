@@ -5,7 +5,6 @@ from interpreter.models.base import Constant, Variable, FunctionCall, Assignment
 from interpreter.parser.parser import Parser
 from interpreter.source.source import Source
 from interpreter.source.source_position import SourcePosition
-from tests.parser.utils import simple_expression_factory
 
 
 class TestParserConstructions:
@@ -22,21 +21,21 @@ class TestParserConstructions:
     def test_function_call(self):
         parser = self._get_parser('abc(a, b)')
         function_call = parser.parse_factor()
-        assert function_call == FunctionCall(SourcePosition(1, 9), 'abc', [
-            simple_expression_factory(Variable(SourcePosition(1, 5), 'a')),
-            simple_expression_factory(Variable(SourcePosition(1, 8), 'b')),
-        ])
+        assert function_call == FunctionCall(SourcePosition(1, 9), 'abc', (
+            Variable(SourcePosition(1, 5), 'a'),
+            Variable(SourcePosition(1, 8), 'b'),
+        ))
 
     def test_nested_expression(self):
         parser = self._get_parser('(a)')
         nested_expression = parser.parse_factor()
-        assert nested_expression == simple_expression_factory(Variable(SourcePosition(1, 2), 'a'))
+        assert nested_expression == Variable(SourcePosition(1, 2), 'a')
 
     def test_parse_assignment(self):
         parser = self._get_parser('= 3')
         assigment = parser.parse_assignment_with_id('a')
         assert assigment == Assignment(SourcePosition(1, 3), 'a',
-                                       simple_expression_factory(Constant(SourcePosition(1, 3), 3)))
+                                       Constant(SourcePosition(1, 3), 3))
 
     @staticmethod
     def _get_parser(string: str) -> Parser:
@@ -2,6 +2,7 @@ import io
 from typing import List
 import pytest
 
+from interpreter.__main__ import ENGINES
 from interpreter.lexer.lexer import Lexer
 from interpreter.lexer.lexer_error import LexerError
 from interpreter.models.declarations import Declaration, ParseTree
@@ -61,6 +62,13 @@ class TestParserNegative:
         with pytest.raises(ParserError):
             self.parse_program(string)
 
+    @pytest.mark.parametrize('engine', ENGINES.values(), ids=ENGINES.keys())
+    def test_deeply_nested_blocks(self, engine):
+        depth = 1500
+        string = 'int main(){int a = 0;' + 'if(true){while(a < 1){' * depth + 'a = a + 1;' + '}}' * depth + \
+                 'return a;}'
+        assert engine(self.parse_program(string)).run_main() == 1
+
     @staticmethod
     def parse_program(string: str) -> ParseTree:
         source = Source(io.StringIO(string))
@@ -10,7 +10,6 @@ from interpreter.parser.parser import Parser
 from interpreter.parser.parser_error import ParserError
 from interpreter.source.source import Source
 from interpreter.source.source_position import SourcePosition
-from tests.parser.utils import simple_expression_factory
 
 
 class TestParserDeclarations:
@@ -41,7 +40,7 @@ class TestParserDeclarations:
         declarations = self._get_program_declarations(string)
         declaration = declarations[0]
         assert declaration == VariableDeclaration(SourcePosition(1, 12), int, 'a',
-                                                  simple_expression_factory(Constant(SourcePosition(1, 12), 4.92)))
+                                                  Constant(SourcePosition(1, 12), 4.92))
 
     def test_variable_declaration_2(self):
         string = 'int a;'
@@ -54,10 +53,10 @@ class TestParserDeclarations:
         declaration = declarations[0]
         assert declaration == FunctionDeclaration(
             SourcePosition(1, len(string)), int, 'a',
-            [Param(SourcePosition(1, 11), 'b', int), Param(SourcePosition(1, 18), 'c', int)],
+            (Param(SourcePosition(1, 11), 'b', int), Param(SourcePosition(1, 18), 'c', int)),
             Statements(
-                [ReturnStatement(SourcePosition(1, 28),
-                                 simple_expression_factory(Variable(SourcePosition(1, 28), 'b')))]))
+                (ReturnStatement(SourcePosition(1, 28),
+                                 Variable(SourcePosition(1, 28), 'b')),)))
 
     def test_function_declaration_2(self):
         string = 'int a(){}'
@@ -65,8 +64,8 @@ class TestParserDeclarations:
         declaration = declarations[0]
         assert declaration == FunctionDeclaration(
             SourcePosition(1, len(string)), int, 'a',
-            [],
-            Statements([]))
+            (),
+            Statements(()))
 
     @staticmethod
     def _get_program_declarations(string: str) -> List[Declaration]:
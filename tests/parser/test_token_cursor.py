@@ -0,0 +1,45 @@
+import io
+
+import pytest
+
+from benchmarks.programs import generate_program
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.declarations import ParseTree
+from interpreter.parser.parser import Parser
+from interpreter.parser.parser_error import ParserError
+from interpreter.parser.token_cursor import TokenCursor
+from interpreter.source.source import Source
+from interpreter.token import token_kind as kind
+
+
+class TestTokenCursor:
+    @pytest.mark.parametrize('program', [
+        open('inputfile.curr').read(),
+        generate_program(20000),
+        'EUR := 4.1; int a = 3; EUR main() { a = (1 + 2) * a; b(a, 2.0EUR); while (a < 3 || !c) { return; } }',
+    ])
+    def test_same_tree_as_lexer(self, program):
+        assert self._parse_table(program) == Parser(Lexer(Source(io.StringIO(program)))).parse_program()
+
+    @pytest.mark.parametrize('program', ['int a = 3', 'int main( { }', 'int a = 3 + ;'])
+    def test_same_error_as_lexer(self, program):
+        with pytest.raises(ParserError) as expected:
+            Parser(Lexer(Source(io.StringIO(program)))).parse_program()
+        with pytest.raises(ParserError) as actual:
+            self._parse_table(program)
+        assert str(actual.value) == str(expected.value)
+        assert actual.value.position == expected.value.position
+
+    def test_cursor_stays_on_eof(self):
+        cursor = TokenCursor(Lexer(Source(io.StringIO('a;'))).tokenize())
+        assert (cursor.kind, cursor.value) == (kind.ID, 'a')
+        cursor.advance()
+        cursor.advance()
+        cursor.advance()
+        assert cursor.kind == kind.EOF
+        assert (cursor.get_position().line, cursor.get_position().column) == (2, 0)
+        assert (cursor.get_previous_position().line, cursor.get_previous_position().column) == (2, 0)
+
+    @staticmethod
+    def _parse_table(string: str) -> ParseTree:
+        return Parser(Lexer(Source(io.StringIO(string))).tokenize()).parse_program()
@@ -0,0 +1,16 @@
+import pytest
+
+from benchmarks.bench_adversarial import ADVERSARIAL_INPUTS, EXPECTED_OUTCOMES, get_growth_exponent, lex_and_parse
+
+
+class TestAdversarialInputs:
+    @pytest.mark.parametrize('name', ADVERSARIAL_INPUTS)
+    def test_input_ends_with_syntax_error_or_parses(self, name):
+        for size in (100, 10000):
+            assert lex_and_parse(ADVERSARIAL_INPUTS[name](size)) in EXPECTED_OUTCOMES
+
+    def test_growth_exponent(self):
+        assert get_growth_exponent([10, 20, 40], [1.0, 2.0, 4.0]) == pytest.approx(1.0)
+        assert get_growth_exponent([10, 20, 40], [1.0, 4.0, 16.0]) == pytest.approx(2.0)
+        assert get_growth_exponent([10, 40], [0.001, 0.002], minimum=0.005) == 0.0
+        assert get_growth_exponent([10, 40], [0, 0]) == 0.0
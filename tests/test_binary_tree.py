@@ -0,0 +1,65 @@
+import pickle
+
+import pytest
+
+from benchmarks.programs import generate_evaluation_program
+from interpreter.environment.environment import Environment
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.binary_tree import BinaryTree, BinaryTreeError, encode_tree, write_tree, MAGIC, VERSION
+from interpreter.models.declarations import ParseTree
+from interpreter.parser.parser import Parser
+from interpreter.source.text_source import TextSource
+from tests.test_tree_arena import PROGRAM
+
+
+class TestBinaryTree:
+    @staticmethod
+    def _get_parse_tree(text=PROGRAM) -> ParseTree:
+        return Parser(Lexer(TextSource(text)).tokenize()).parse_program()
+
+    def test_round_trip(self):
+        parse_tree = self._get_parse_tree(PROGRAM + generate_evaluation_program(3).replace('main', 'other'))
+        assert BinaryTree(encode_tree(parse_tree)).to_parse_tree() == parse_tree
+
+    def test_constants(self):
+        text = 'string s = "zażółć x";\nint a = 123456789012345678901234567890;\nfloat b = 0.5;\n' \
+               'bool c = false;\nUSD d = 12.25USD;\nUSD e = 3USD;\nint main(){return int 1.5 - 300;}'
+        parse_tree = self._get_parse_tree(text)
+        # repr tells apart values which are equal, like False and 0
+        assert repr(BinaryTree(encode_tree(parse_tree)).to_parse_tree()) == repr(parse_tree)
+
+    @pytest.mark.parametrize('text, result', [
+        ('string main(){return string 3USD;}', '3USD'),
+        ('string main(){return string 3.0USD;}', '3.0USD'),
+    ])
+    def test_amount_of_currency_keeps_its_type(self, text, result):
+        parse_tree = BinaryTree(encode_tree(self._get_parse_tree('USD := 1.0; ' + text))).to_parse_tree()
+        assert Environment(parse_tree).run_main() == result
+
+    def test_smaller_than_pickle(self):
+        parse_tree = self._get_parse_tree(generate_evaluation_program(20))
+        assert len(encode_tree(parse_tree)) * 2 < len(pickle.dumps(parse_tree, pickle.HIGHEST_PROTOCOL))
+
+    def test_declarations_are_decoded_lazily(self, tmp_path):
+        parse_tree = self._get_parse_tree()
+        path = str(tmp_path / 'program.tree')
+        write_tree(parse_tree, path)
+        with BinaryTree.open(path) as binary_tree:
+            assert len(binary_tree) == len(parse_tree.declarations)
+            assert binary_tree.get_declaration(3) == parse_tree.declarations[3]
+            assert binary_tree._declarations.count(None) == len(parse_tree.declarations) - 1
+        assert binary_tree.get_declaration(3) == parse_tree.declarations[3]
+
+    def test_deep_expression(self):
+        depth = 100000
+        parse_tree = self._get_parse_tree('int main(){return ' + '(' * depth + '1' + ')' * depth + ' + 1;}')
+        assert BinaryTree(encode_tree(parse_tree)).to_parse_tree() == parse_tree
+
+    def test_invalid_data(self):
+        data = encode_tree(self._get_parse_tree())
+        with pytest.raises(BinaryTreeError):
+            BinaryTree(b'CURX' + data[len(MAGIC):])
+        with pytest.raises(BinaryTreeError):
+            BinaryTree(MAGIC + bytes([VERSION + 1]) + data[len(MAGIC) + 1:])
+        with pytest.raises(BinaryTreeError):
+            BinaryTree(data[:-1])
@@ -0,0 +1,54 @@
+import io
+
+import pytest
+
+from interpreter.lexer.lexer import Lexer, tokens_generator
+from interpreter.source.buffered_source import BufferedSource
+from interpreter.source.source import Source
+from interpreter.source.source_position import SourcePosition
+from tests.test_source import TestSource
+
+
+class TestBufferedSource:
+    def test_get_chars_from_string(self):
+        source = BufferedSource(io.StringIO("a\nbc\nc"))
+
+        char_list, position_list = TestSource.get_char_and_positions_from_source(source)
+
+        assert char_list == ['a', '\n', 'b', 'c', '\n', 'c', 'EOF']
+        assert position_list == [
+            SourcePosition(1, 1),
+            SourcePosition(1, 2),
+            SourcePosition(2, 1),
+            SourcePosition(2, 2),
+            SourcePosition(2, 3),
+            SourcePosition(3, 1),
+            SourcePosition(4, 0)
+        ]
+
+    def test_empty_string(self):
+        source = BufferedSource(io.StringIO(''))
+        assert source.get_char() == 'EOF'
+        assert source.get_position() == SourcePosition(2, 0)
+
+    def test_next_char_after_eof(self):
+        source = BufferedSource(io.StringIO('a\n'))
+        for _ in range(5):
+            source.next_char()
+        assert source.get_char() == 'EOF'
+        assert source.get_position() == SourcePosition(3, 0)
+
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 4096])
+    def test_same_as_source(self, chunk_size):
+        with open('inputfile.curr', 'r') as file:
+            expected = TestSource.get_char_and_positions_from_source(Source(file))
+        with open('inputfile.curr', 'r') as file:
+            actual = TestSource.get_char_and_positions_from_source(BufferedSource(file, chunk_size))
+        assert actual == expected
+
+    def test_same_tokens_as_source(self):
+        with open('inputfile.curr', 'r') as file:
+            expected = list(tokens_generator(Lexer(Source(file))))
+        with open('inputfile.curr', 'r') as file:
+            actual = list(tokens_generator(Lexer(BufferedSource(file, 5))))
+        assert actual == expected
@@ -0,0 +1,105 @@
+import pytest
+
+from interpreter.__main__ import ENGINES
+from interpreter.environment.constant_folder import ConstantFolder
+from interpreter.environment.environment import Environment
+from interpreter.lexer.lexer import Lexer
+from interpreter.parser.parser import Parser
+from interpreter.source.text_source import TextSource
+
+# programs whose results and errors every engine gives the same as Environment visiting them without folding
+PROGRAMS = [
+    'int main(){return x;}',
+    'int main(){return 1EUR;}',
+    'int main(){int a = 1; int a = 2; return a;}',
+    'int main(){int a = 2; int a = 3; return a;}',
+    'int f(int a){return a;}\nint main(){return f(1, 2);}',
+    'int f(){return f();}\nint main(){\n    return f();\n}',
+    'int main(){\n  int i = 0;\n  while(true) {\n    i = i + 1;\n  }\n  return i;\n}',
+    'int main(){int a = 1; a = 2.5; return a;}',
+    'int main(){return 1 / 0;}',
+    'float main(){return 1 / 0;}',
+    'int main(){int a = 0; return 1 / a;}',
+    'int a = b; int b = 1; int main(){return a;}',
+    'int a = 1; int a = 2; int main(){return a;}',
+    'int main(){int c = "s"; return c;}',
+    'int main(){return int "abc";}',
+    'bool main(){return !1;}',
+    'USD := 1.0; EUR := 2.0; USD main(){USD a = 1.0USD; a = 2.0EUR; return a;}',
+    'USD := 1.0; EUR := 2.0; USD f(USD a){return a;} EUR main(){return EUR f(USD 2.0);}',
+    'USD := 1.0; EUR := 2.0; EUR main(){return EUR 2.0USD;}',
+    'USD := 1.0; EUR := 0.0; EUR main(){return EUR 2.0USD;}',
+    'USD := 1.0; EUR main(){return EUR 2.0USD;}',
+    'USD := 1.0; USD main(){return USD 2.0;}',
+    'USD := 1.0; bool main(){return 1.0USD < 2.0USD;}',
+    'USD := 1.0; USD main(){return 1.0USD + 2.0;}',
+    # amounts of currencies keep their types, equal amounts of different types are different constants
+    'USD := 4.0; float g(USD x){return float x;} float main(){USD a = 1USD; return g(1.0USD);}',
+    'USD := 1.0; USD f(){return 1USD;} USD main(){USD a = 1.0USD; return f();}',
+    'USD := 1.0; USD main(){USD a = 1USD; return a;}',
+    'USD := 1.0; USD main(){USD a = 1.0USD; USD b = 1USD; return b;}',
+    'USD := 1.0; USD main(){return 1USD + 1.0USD;}',
+    'USD := 1.0; bool main(){return 1USD == 1.0USD;}',
+    'USD := 1.0; string main(){USD a = 3USD; return string a;}',
+    'USD := 2.0; EUR := 4.0; EUR main(){return EUR 3USD;}',
+    'USD := 1.0; USD a = 2USD; USD main(){USD b = a; return b;}',
+    # a call as a statement returns its value from the caller, without the frame of the callee popped
+    'int f(){return 2;} int main(){f(); return 1;}',
+    'int f(int a){if(a > 0){return a;}} int main(){int b = 3; f(0); return b;}',
+    'int f(int a){if(a > 0){return a;}} int main(){int b = 3; int c = f(0); return b;}',
+    # a false value of the body of a loop ends only its iteration
+    'int f(){int i = 0; while(i < 3){i = i + 1; if(i == 2){return 0;}} return 5;} int main(){return f();}',
+    'int f(){int i = 0; while(i < 3){int j = 0; while(j < 2){j = j + 1; if(i == 1){return 0;}} '
+    'i = i + 1; if(i == 2){return 7;}} return 5;} int main(){return f();}',
+    'int main(){int i = 0; while(i < 3){int c = 4; i = i + 1;} return i;}',
+    # code going on in the frame of another function reads its variables by their names
+    'int f(){ int k = 1; while(k > 0){ k = k - 1; return 0; } return 7; } '
+    'int main(){ int a = 0; int b = 0; return f() + a; }',
+    'int f(){int a = 7;} int main(){int a = 2; f(); a = 3; return a;}',
+    'int g = 1; int f(){int g = 9;} int main(){f(); return g * 2;}',
+    'int a = 1; int main(){int b = a; int a = 2; return a + b;}',
+    'int a = 1; int main(){int x = a; int a = 5; int y = a; return x * 10 + y;}',
+    'bool x = true; int main(){int i = 0; while(x){i = i + 1; if(i == 1){int x = 0;}} return i;}',
+    'int a = 1; int main(){int i = 0; int r = 0; while(i < 2){if(i == 1){r = a;} i = i + 1; '
+    'if(i == 1){int a = 7;}} return r;}',
+    'bool main(){return true || 1 < 2 && !false;}',
+    'bool main(){return 1 < 2.0;}',
+    'int main(){return 7 - 2 * 3 % 4 + 10 / 5 - 1;}',
+    'int main(){return 1 + 2 + 3 / 0;}',
+    # all operands are evaluated before the first operation
+    'int f(){return f();} int main(){return 1 / 0 * f();}',
+    'string main(){return "a" + "b" * 2;}',
+]
+
+
+class TestEngines:
+    @staticmethod
+    def _run(string: str, engine, lazy: bool = False):
+        """
+        Result of main by its repr, which tells amounts of currencies of different types apart, or type
+        and message of the error, with its code and position when it has them
+        """
+        try:
+            return repr(engine(Parser(Lexer(TextSource(string)).tokenize(), lazy_functions=lazy).parse_program())
+                        .run_main())
+        except Exception as error:
+            return type(error), str(error), getattr(error, 'error_code', None), getattr(error, 'position', None)
+
+    @staticmethod
+    def _run_without_folding(string: str, monkeypatch, lazy: bool = False):
+        with monkeypatch.context() as patch:
+            patch.setattr(ConstantFolder, 'fold_global_declarations', lambda self, declarations: declarations)
+            patch.setattr(ConstantFolder, 'fold_function', lambda self, *args: None)
+            return TestEngines._run(string, Environment, lazy)
+
+    @pytest.mark.parametrize('engine', ENGINES.values(), ids=ENGINES.keys())
+    @pytest.mark.parametrize('string', PROGRAMS)
+    def test_results_and_errors_are_the_same(self, engine, string, monkeypatch):
+        assert self._run(string, engine) == self._run_without_folding(string, monkeypatch)
+        assert self._run(string, engine, lazy=True) == self._run_without_folding(string, monkeypatch, lazy=True)
+
+    # the virtual machine raises SemanticTypeError, see VirtualMachine
+    @pytest.mark.parametrize('engine', [engine for name, engine in ENGINES.items() if name != 'bytecode'])
+    def test_return_without_value(self, engine, monkeypatch):
+        string = 'int main(){return;}'
+        assert self._run(string, engine) == self._run_without_folding(string, monkeypatch)
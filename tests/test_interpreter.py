@@ -0,0 +1,182 @@
+import io
+import json
+import os
+import shutil
+
+import pytest
+
+from interpreter.__main__ import ENGINES, Interpreter, main
+from interpreter.cache.code_cache import CODE_SUFFIX
+from interpreter.cache.program_cache import ProgramCache
+from interpreter.models.constants import CurrencyValue
+from interpreter.parser.parser_error import ParserError
+from interpreter.source.open_source import SOURCE_KINDS
+from interpreter.source.source import Source
+
+
+class TestInterpreter:
+    @pytest.mark.parametrize('source_kind', SOURCE_KINDS)
+    def test_run_file(self, source_kind):
+        interpreter = Interpreter('inputfile.curr', source_kind)
+        assert round(interpreter.result.value, 4) == 16.1051
+
+    def test_run_file_in_parallel(self):
+        interpreter = Interpreter('inputfile.curr', jobs=2)
+        assert round(interpreter.result.value, 4) == 16.1051
+
+    def test_run_source(self):
+        interpreter = Interpreter(Source(io.StringIO('USD := 1.0; USD main(){return 2.0USD;}')))
+        assert interpreter.result == CurrencyValue('USD', 2.0)
+
+    @pytest.mark.parametrize('engine', ENGINES)
+    def test_run_file_by_engine(self, engine):
+        interpreter = Interpreter('inputfile.curr', engine=engine)
+        assert round(interpreter.result.value, 4) == 16.1051
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError):
+            Interpreter('inputfile.curr', engine='jit')
+
+    def test_unknown_source_kind(self):
+        with pytest.raises(ValueError):
+            Interpreter('inputfile.curr', 'socket')
+
+    @staticmethod
+    def _get_copied_file(tmp_path):
+        path = str(tmp_path / 'inputfile.curr')
+        shutil.copy('inputfile.curr', path)
+        return path
+
+    def test_run_cached_file(self, tmp_path):
+        path = self._get_copied_file(tmp_path)
+        assert round(Interpreter(path, use_cache=True).result.value, 4) == 16.1051
+        assert ProgramCache(path).load() is not None
+        assert round(Interpreter(path, use_cache=True).result.value, 4) == 16.1051
+
+    def test_cache_is_not_used_by_default(self, tmp_path):
+        path = self._get_copied_file(tmp_path)
+        Interpreter(path)
+        assert not os.path.exists(ProgramCache(path).path)
+
+    def test_compile_command(self, tmp_path, capsys):
+        path = self._get_copied_file(tmp_path)
+        main(['compile', path])
+        compiled_path = capsys.readouterr().out.strip()
+        assert compiled_path == ProgramCache(path).path
+        assert os.path.exists(compiled_path)
+
+        main([path])
+        assert capsys.readouterr().out.strip() == '16.105100000000004USD'
+
+    def test_compile_command_of_deeply_nested_program(self, tmp_path, capsys):
+        path = str(tmp_path / 'deep.curr')
+        with open(path, 'w') as file:
+            file.write('int main(){' + 'if(true){' * 1000 + '}' * 1000 + 'return 1;}')
+        with pytest.raises(SystemExit) as exit_info:
+            main(['compile', path])
+        assert exit_info.value.code == 1
+        assert 'nested too deeply' in capsys.readouterr().err
+        assert not os.path.exists(ProgramCache(path).path)
+
+        main([path])
+        assert capsys.readouterr().out.strip() == '1'
+
+    def test_run_command_without_cache(self, tmp_path, capsys):
+        path = self._get_copied_file(tmp_path)
+        main([path, '--no-cache'])
+        assert capsys.readouterr().out.strip() == '16.105100000000004USD'
+        assert not os.path.exists(ProgramCache(path).path)
+
+    def test_run_command_by_closure_engine(self, tmp_path, capsys):
+        path = self._get_copied_file(tmp_path)
+        main([path, '--engine', 'closure', '--lazy'])
+        assert capsys.readouterr().out.strip() == '16.105100000000004USD'
+
+    def test_run_command_by_python_engine_keeps_code_objects(self, tmp_path, capsys):
+        path = self._get_copied_file(tmp_path)
+        main([path, '--engine', 'python'])
+        assert capsys.readouterr().out.strip() == '16.105100000000004USD'
+        cache_directory = os.path.dirname(ProgramCache(path).path)
+        names = os.listdir(cache_directory)
+        assert any(name.endswith(CODE_SUFFIX) for name in names)
+
+        main([path, '--engine', 'python'])
+        assert capsys.readouterr().out.strip() == '16.105100000000004USD'
+        assert sorted(os.listdir(cache_directory)) == sorted(names)
+
+    def test_disassemble_command(self, tmp_path, capsys):
+        path = self._get_copied_file(tmp_path)
+        main(['disassemble', path])
+        listing = capsys.readouterr().out
+        assert 'Disassembly of <global>:' in listing
+        assert 'Disassembly of main:' in listing
+        assert not os.path.exists(ProgramCache(path).path)
+
+    @staticmethod
+    def _get_file_with_invalid_function(tmp_path):
+        path = str(tmp_path / 'library.curr')
+        with open(path, 'w') as file:
+            file.write('int unused(){ return 1 +; }\nint main(){ return 2; }')
+        return path
+
+    def test_run_file_lazily(self, tmp_path):
+        path = self._get_copied_file(tmp_path)
+        assert round(Interpreter(path, lazy=True).result.value, 4) == 16.1051
+        assert round(Interpreter(path, use_cache=True, lazy=True).result.value, 4) == 16.1051
+        assert not os.path.exists(ProgramCache(path).path)
+
+    def test_lazy_run_does_not_parse_unused_functions(self, tmp_path, capsys):
+        path = self._get_file_with_invalid_function(tmp_path)
+        with pytest.raises(ParserError):
+            Interpreter(path)
+        main([path, '--lazy', '--no-cache'])
+        assert capsys.readouterr().out.strip() == '2'
+
+    def test_check_command(self, tmp_path, capsys):
+        path = self._get_copied_file(tmp_path)
+        main([path, '--check'])
+        assert json.loads(capsys.readouterr().out) == {'path': path, 'ok': True}
+
+        path = self._get_file_with_invalid_function(tmp_path)
+        with pytest.raises(SystemExit) as exit_info:
+            main([path, '--check'])
+        assert exit_info.value.code == 1
+        assert json.loads(capsys.readouterr().out) == {
+            'path': path, 'ok': False, 'error': 'ParserError', 'line': 1, 'column': 25,
+            'message': 'Invalid factor, nested expression, constant, variable or function call expected'
+        }
+
+    def test_check_command_reports_type_errors(self, tmp_path, capsys):
+        path = str(tmp_path / 'typed.curr')
+        with open(path, 'w') as file:
+            file.write('int unused(){ return 1.5; }\nint main(){ return 2; }')
+        with pytest.raises(SystemExit):
+            main([path, '--check'])
+        result = json.loads(capsys.readouterr().out)
+        assert (result['error'], result['line']) == ('SemanticTypeError', 1)
+
+    @pytest.mark.parametrize('jobs', [1, 2])
+    def test_check_directories(self, tmp_path, capsys, jobs):
+        self._get_copied_file(tmp_path)
+        self._get_file_with_invalid_function(tmp_path)
+        os.mkdir(tmp_path / 'scripts')
+        (tmp_path / 'scripts' / 'undeclared.curr').write_text('int main(){ return f(); }')
+        (tmp_path / 'scripts' / 'notes.txt').write_text('not checked')
+        missing_path = str(tmp_path / 'missing.curr')
+        with pytest.raises(SystemExit):
+            main([str(tmp_path), missing_path, '--check', '--jobs', str(jobs)])
+        results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [(os.path.relpath(result['path'], tmp_path), result['ok'], result.get('error'))
+                for result in results] == [
+            ('inputfile.curr', True, None),
+            ('library.curr', False, 'ParserError'),
+            (os.path.join('scripts', 'undeclared.curr'), False, 'SemanticError'),
+            ('missing.curr', False, 'FileNotFoundError'),
+        ]
+        assert results[2]['line'] == 1 and 'f' in results[2]['message']
+
+    def test_run_command_takes_one_file(self, tmp_path):
+        path = self._get_copied_file(tmp_path)
+        with pytest.raises(SystemExit) as exit_info:
+            main([path, path])
+        assert exit_info.value.code == 2
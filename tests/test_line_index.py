@@ -0,0 +1,45 @@
+import io
+
+from interpreter.lexer.lexer import Lexer, tokens_generator
+from interpreter.source.line_index import LineIndex
+from interpreter.source.source import Source
+from interpreter.source.source_position import SourcePosition
+
+
+class TestLineIndex:
+    def test_line_and_column(self):
+        line_index = self._get_line_index("ab\n\ncd")
+        assert line_index.line_starts == [0, 3, 4]
+        assert line_index.get_line_and_column(0) == (1, 1)
+        assert line_index.get_line_and_column(2) == (1, 3)
+        assert line_index.get_line_and_column(3) == (2, 1)
+        assert line_index.get_line_and_column(5) == (3, 2)
+
+    def test_end_of_file(self):
+        assert self._get_line_index("").get_line_and_column(0) == (2, 0)
+        assert self._get_line_index("a\n").get_line_and_column(2) == (3, 0)
+
+    def test_offset_from_line_and_column(self):
+        line_index = self._get_line_index("ab\n\ncd")
+        for offset in range(len("ab\n\ncd") + 1):
+            assert line_index.get_offset(*line_index.get_line_and_column(offset)) == offset
+
+    def test_position_from_offset(self):
+        line_index = self._get_line_index("ab\ncd")
+        position = SourcePosition.from_offset(4, line_index)
+        assert position == SourcePosition(2, 2)
+        assert hash(position) == hash(SourcePosition(2, 2))
+        assert repr(position) == 'SourcePosition(line=2, column=2)'
+
+    def test_token_positions_are_resolved_lazily(self):
+        tokens = list(tokens_generator(Lexer(Source(io.StringIO("int a = 3;\nfloat b = 4.0;")))))
+        assert all(token.source_position.offset is not None for token in tokens)
+        assert all(token.source_position._line is None for token in tokens)
+        assert tokens[5].source_position == SourcePosition(2, 5)
+
+    @staticmethod
+    def _get_line_index(string: str) -> LineIndex:
+        source = Source(io.StringIO(string))
+        while source.get_char() != 'EOF':
+            source.next_char()
+        return source.line_index
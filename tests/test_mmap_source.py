@@ -0,0 +1,53 @@
+import pytest
+
+from interpreter.lexer.lexer import Lexer, tokens_generator
+from interpreter.source.mmap_source import MmapSource
+from interpreter.source.source import Source
+from interpreter.source.source_position import SourcePosition
+from tests.test_source import TestSource
+
+
+class TestMmapSource:
+    def test_get_chars_from_file(self):
+        with MmapSource('tests/data/test_source.curr') as source:
+            char_list, position_list = TestSource.get_char_and_positions_from_source(source)
+
+        assert char_list == ['a', ',', 'b', '\n', 'a', '\n', 'EOF']
+        assert position_list == [
+            SourcePosition(1, 1),
+            SourcePosition(1, 2),
+            SourcePosition(1, 3),
+            SourcePosition(1, 4),
+            SourcePosition(2, 1),
+            SourcePosition(2, 2),
+            SourcePosition(4, 0)
+        ]
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / 'empty.curr'
+        path.write_bytes(b'')
+        with MmapSource(str(path)) as source:
+            assert source.get_char() == 'EOF'
+            assert source.get_position() == SourcePosition(2, 0)
+
+    @pytest.mark.parametrize('content', [
+        'string main(){return "zażółć gęślą jaźń";}\n',
+        'a€b\n𝄞c',
+        'a\r\nb\rc\r\n',
+    ])
+    def test_same_as_text_mode_source(self, tmp_path, content):
+        path = tmp_path / 'program.curr'
+        path.write_bytes(content.encode('utf-8'))
+
+        with open(path, 'r', encoding='utf-8') as file:
+            expected = TestSource.get_char_and_positions_from_source(Source(file))
+        with MmapSource(str(path)) as source:
+            actual = TestSource.get_char_and_positions_from_source(source)
+        assert actual == expected
+
+    def test_same_tokens_as_source(self):
+        with open('inputfile.curr', 'r') as file:
+            expected = list(tokens_generator(Lexer(Source(file))))
+        with MmapSource('inputfile.curr') as source:
+            actual = list(tokens_generator(Lexer(source)))
+        assert actual == expected
@@ -0,0 +1,55 @@
+import dataclasses
+import pickle
+
+import pytest
+
+from interpreter.lexer.lexer import Lexer
+from interpreter.models.base import Constant
+from interpreter.models.constants import CurrencyType, CurrencyValue
+from interpreter.parser.parser import Parser
+from interpreter.source.source_position import SourcePosition
+from interpreter.source.text_source import TextSource
+
+PROGRAM = """USD := 4.0;
+USD fn_a(USD capital, float rate) {
+    int i = 2;
+    while(i != 0) {
+        capital = capital * (1 + rate);
+        i = i - 1;
+    }
+    return capital;
+}
+USD main(){
+    return fn_a(10USD, 0.1) + USD 1.0;
+}"""
+
+
+class TestModels:
+    @staticmethod
+    def _get_parse_tree():
+        return Parser(Lexer(TextSource(PROGRAM)).tokenize()).parse_program()
+
+    def test_nodes_are_frozen(self):
+        constant = Constant(SourcePosition(1, 1), 1)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            constant.value = 2
+        assert not hasattr(constant, '__dict__')
+
+    def test_parse_tree_is_hashable(self):
+        assert hash(self._get_parse_tree()) == hash(self._get_parse_tree())
+
+    def test_children_are_tuples(self):
+        function = self._get_parse_tree().declarations[1]
+        assert type(function.params) is tuple
+        assert type(function.statements.list_of_statements) is tuple
+
+    def test_currency_types_are_shared(self):
+        parse_tree = self._get_parse_tree()
+        function = parse_tree.declarations[1]
+        assert function.return_type is function.params[0].type
+        assert function.return_type == CurrencyType('USD')
+
+    def test_pickle(self):
+        parse_tree = self._get_parse_tree()
+        assert pickle.loads(pickle.dumps(parse_tree)) == parse_tree
+        assert pickle.loads(pickle.dumps(CurrencyValue('USD', 1.0))) == CurrencyValue('USD', 1.0)
@@ -0,0 +1,48 @@
+import io
+
+from interpreter.lexer.lexer import Lexer, tokens_generator
+from interpreter.source.source import Source
+from interpreter.source.source_position import SourcePosition
+from interpreter.source.text_source import TextSource
+from tests.test_source import TestSource
+
+
+class TestTextSource:
+    def test_get_chars_from_string(self):
+        source = TextSource("a\nbc\nc")
+
+        char_list, position_list = TestSource.get_char_and_positions_from_source(source)
+
+        assert char_list == ['a', '\n', 'b', 'c', '\n', 'c', 'EOF']
+        assert position_list == [
+            SourcePosition(1, 1),
+            SourcePosition(1, 2),
+            SourcePosition(2, 1),
+            SourcePosition(2, 2),
+            SourcePosition(2, 3),
+            SourcePosition(3, 1),
+            SourcePosition(4, 0)
+        ]
+
+    def test_empty_string(self):
+        source = TextSource('')
+        assert source.get_char() == 'EOF'
+        assert source.get_position() == SourcePosition(2, 0)
+
+    def test_start_at_offset(self):
+        source = TextSource("a\nbc\nc", 3)
+
+        char_list, position_list = TestSource.get_char_and_positions_from_source(source)
+
+        assert char_list == ['c', '\n', 'c', 'EOF']
+        assert position_list == [SourcePosition(2, 2), SourcePosition(2, 3), SourcePosition(3, 1), SourcePosition(4, 0)]
+
+    def test_same_tokens_as_source(self):
+        with open('inputfile.curr', 'r') as file:
+            text = file.read()
+        expected = list(tokens_generator(Lexer(Source(io.StringIO(text)))))
+        assert list(tokens_generator(Lexer(TextSource(text)))) == expected
+
+        start = text.index('USD compound_interest')
+        assert list(tokens_generator(Lexer(TextSource(text, start)))) == \
+               [token for token in expected if token.offset >= start]
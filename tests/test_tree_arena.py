@@ -0,0 +1,73 @@
+import pickle
+
+from benchmarks.programs import generate_evaluation_program
+from interpreter.lexer.lexer import Lexer
+from interpreter.models import tree_arena
+from interpreter.models.tree_arena import TreeArena, ArenaBuilder
+from interpreter.parser.parser import Parser
+from interpreter.source.text_source import TextSource
+
+PROGRAM = """USD := 4.0;
+EUR := 4.5;
+bool flag = !(1 < 2) || 2 >= 1 && true;
+USD fn_a(USD capital, float rate) {
+    int i = 2;
+    while(i != 0) {
+        capital = capital * (1 + rate) / 1 % 100;
+        i = i - 1 + 0;
+    }
+    if(flag) {
+        print("flag");
+    }
+    return capital;
+}
+USD main(){
+    return fn_a(10USD, 0.1) + USD 1.0EUR;
+}"""
+
+
+class TestTreeArena:
+    @staticmethod
+    def _get_tokens(text=PROGRAM):
+        return Lexer(TextSource(text)).tokenize()
+
+    def test_round_trip(self):
+        tokens = self._get_tokens()
+        parse_tree = Parser(tokens).parse_program()
+        assert TreeArena.from_parse_tree(parse_tree, tokens.line_index).to_parse_tree() == parse_tree
+
+    def test_parser_builds_the_same_arena(self):
+        tokens = self._get_tokens(generate_evaluation_program(3) + PROGRAM.replace('main', 'other'))
+        arena = Parser(tokens, ArenaBuilder(tokens.line_index)).parse_program()
+        converted = TreeArena.from_parse_tree(Parser(tokens).parse_program(), tokens.line_index)
+        for name in ['kinds', 'first_child', 'next_sibling', 'operators', 'offsets', 'value_indexes', 'values']:
+            assert getattr(arena, name) == getattr(converted, name)
+        assert arena.root == len(arena) - 1
+
+    def test_children_are_before_parents(self):
+        tokens = self._get_tokens()
+        arena = Parser(tokens, ArenaBuilder(tokens.line_index)).parse_program()
+        for node in range(len(arena)):
+            assert all(child < node for child in arena.children(node))
+        assert arena.kinds[arena.root] == tree_arena.PARSE_TREE
+        assert [arena.kinds[node] for node in arena.children(arena.root)] == [
+            tree_arena.CURRENCY_DECLARATION, tree_arena.CURRENCY_DECLARATION, tree_arena.VARIABLE_DECLARATION,
+            tree_arena.FUNCTION_DECLARATION, tree_arena.FUNCTION_DECLARATION
+        ]
+
+    def test_positions_of_unpickled_tree(self):
+        # unpickled positions have line and column only, they are turned into offsets by the line index
+        tokens = self._get_tokens()
+        parse_tree = Parser(tokens).parse_program()
+        unpickled = pickle.loads(pickle.dumps(parse_tree))
+        arena = TreeArena.from_parse_tree(unpickled, tokens.line_index)
+        assert arena.offsets == TreeArena.from_parse_tree(parse_tree, tokens.line_index).offsets
+        assert arena.to_parse_tree() == parse_tree
+
+    def test_deep_expression(self):
+        depth = 100000
+        tokens = self._get_tokens('int main(){return ' + '(' * depth + '1' + ')' * depth + ' + 1;}')
+        parse_tree = Parser(tokens).parse_program()
+        arena = Parser(tokens, ArenaBuilder(tokens.line_index)).parse_program()
+        assert arena.to_parse_tree() == parse_tree
+        assert TreeArena.from_parse_tree(parse_tree, tokens.line_index).offsets == arena.offsets